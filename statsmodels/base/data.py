@@ -5,6 +5,7 @@ results, and doing data cleaning
 from statsmodels.compat.python import reduce, iteritems, lmap, zip, range
 
 import numpy as np
+from scipy import sparse
 from pandas import DataFrame, Series, isnull, MultiIndex
 
 import statsmodels.tools.data as data_util
@@ -572,6 +573,70 @@ class PandasData(ModelData):
             return DataFrame(result, columns=self.ynames)
 
 
+class SparseData(ModelData):
+    """
+    Data handling class for a scipy.sparse design matrix
+
+    exog is stored as a CSR matrix of floats.  endog and the extra arrays
+    are handled as in ModelData.
+    """
+
+    @classmethod
+    def handle_missing(cls, endog, exog, missing, **kwargs):
+        # Rows of exog with a nan are found from the stored elements and
+        # passed to ModelData as a one-column indicator array.
+        exog = sparse.csr_matrix(exog)
+        nan_exog = np.zeros(exog.shape[0])
+        nan_exog[np.repeat(np.arange(exog.shape[0]),
+                           np.diff(exog.indptr))[np.isnan(exog.data)]] = np.nan
+        arrays, nan_idx = super(SparseData, cls).handle_missing(
+            endog, nan_exog, missing, **kwargs)
+        if len(nan_idx) > 0:
+            keep = np.ones(exog.shape[0], dtype=bool)
+            keep[nan_idx] = False
+            exog = exog[keep]
+        arrays['exog'] = exog
+        return arrays, nan_idx
+
+    def _get_xarr(self, exog):
+        return sparse.csr_matrix(exog, dtype=np.float64)
+
+    def _convert_endog_exog(self, endog, exog):
+        return self._get_yarr(endog), self._get_xarr(exog)
+
+    def _handle_constant(self, hasconst):
+        if hasconst is False:
+            self.k_constant = 0
+            self.const_idx = None
+            return
+
+        exog = self.exog
+        if not np.isfinite(exog.data).all():
+            raise MissingDataError('exog contains inf or nans')
+        xmax = exog.max(0).toarray().ravel()
+        xmin = exog.min(0).toarray().ravel()
+        const_idx = np.flatnonzero((xmax == xmin) & (xmax != 0))
+        if len(const_idx) > 0:
+            ones = const_idx[xmax[const_idx] == 1]
+            self.k_constant = 1
+            self.const_idx = ones[0] if len(ones) > 0 else const_idx[0]
+        elif hasconst:
+            self.k_constant = 1
+            self.const_idx = None
+        else:
+            # look for an implicit constant, e.g. a full set of dummies,
+            # by regressing a column of ones on exog
+            from scipy.sparse.linalg import lsqr
+            nobs = exog.shape[0]
+            rnorm = lsqr(exog, np.ones(nobs), atol=1e-12, btol=1e-12)[3]
+            self.k_constant = int(rnorm < 1e-6 * np.sqrt(nobs))
+            self.const_idx = None
+
+    def _check_integrity(self):
+        if self.exog.shape[0] != len(self.endog):
+            raise ValueError("endog and exog matrices are different sizes")
+
+
 def _make_endog_names(endog):
     if endog.ndim == 1 or endog.shape[1] == 1:
         ynames = ['y']
@@ -582,7 +647,11 @@ def _make_endog_names(endog):
 
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
+    if sparse.issparse(exog):
+        # the range is enough to find constant columns
+        exog_var = (exog.max(0) - exog.min(0)).toarray().ravel()
+    else:
+        exog_var = exog.var(0)
     if (exog_var == 0).any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
@@ -608,7 +677,9 @@ def handle_data_class_factory(endog, exog):
     """
     Given inputs
     """
-    if data_util._is_using_ndarray_type(endog, exog):
+    if sparse.issparse(exog):
+        klass = SparseData
+    elif data_util._is_using_ndarray_type(endog, exog):
         klass = ModelData
     elif data_util._is_using_pandas(endog, exog):
         klass = PandasData
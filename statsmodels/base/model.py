@@ -2,6 +2,7 @@ from __future__ import print_function
 from statsmodels.compat.python import lzip, range, reduce
 import numpy as np
 from scipy import stats
+from scipy import sparse
 from statsmodels.base.data import handle_data
 from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.tools import recipr, nan_dot
@@ -1010,7 +1011,9 @@ class Results(object):
                     exog = exog.reindex(exog_index)
             exog_index = exog.index
 
-        if exog is not None:
+        if sparse.issparse(exog):
+            exog = exog.tocsr()
+        elif exog is not None:
             exog = np.asarray(exog)
             if exog.ndim == 1 and (self.model.exog.ndim == 1 or
                                    self.model.exog.shape[1] == 1):
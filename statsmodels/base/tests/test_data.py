@@ -10,6 +10,7 @@ from statsmodels.regression.linear_model import OLS
 from statsmodels.genmod.generalized_linear_model import GLM
 from statsmodels.genmod import families
 from statsmodels.discrete.discrete_model import Logit
+from statsmodels.tools.sm_exceptions import MissingDataError
 
 
 #class TestDates(object):
@@ -940,3 +941,38 @@ def test_raise_nonfinite_exog():
     assert_raises(MissingDataError, OLS, y, x)
     x[1, 1] = np.nan
     assert_raises(MissingDataError, OLS, y, x)
+
+
+def test_sparse_exog():
+    from scipy import sparse
+    np.random.seed(2943)
+    x = np.random.randn(20, 3)
+    x[x < 0.5] = 0
+    x[:, 0] = 1
+    y = np.random.randn(20)
+    y[3] = np.nan
+    x[5, 2] = np.nan
+    x_sp = sparse.csr_matrix(x)
+
+    data = sm_data.handle_data(y, x_sp, missing='drop')
+    assert_(isinstance(data, sm_data.SparseData))
+    assert_(sparse.isspmatrix_csr(data.exog))
+    assert_equal(data.exog.shape, (18, 3))
+    keep = np.ones(20, bool)
+    keep[[3, 5]] = False
+    assert_equal(data.exog.toarray(), x[keep])
+    assert_equal(data.endog, y[keep])
+    assert_equal(data.k_constant, 1)
+    assert_equal(data.const_idx, 0)
+    assert_equal(data.xnames, ['const', 'x1', 'x2'])
+    assert_raises(MissingDataError, sm_data.handle_data, y, x_sp,
+                  missing='raise')
+
+    # implicit constant from a full set of dummies
+    groups = np.arange(20) % 4
+    dummies = sparse.csr_matrix((np.ones(20), (np.arange(20), groups)))
+    data = sm_data.handle_data(y[keep], dummies[keep])
+    assert_equal(data.k_constant, 1)
+    assert_(data.const_idx is None)
+    data = sm_data.handle_data(y[keep], dummies[keep][:, 1:])
+    assert_equal(data.k_constant, 0)
@@ -32,6 +32,7 @@ from scipy.stats import nbinom
 
 import statsmodels.tools.tools as tools
 from statsmodels.tools import data as data_tools
+from statsmodels.tools import _sparse
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
 from statsmodels.tools.numdiff import approx_fprime_cs
@@ -196,7 +197,7 @@ class DiscreteModel(base.LikelihoodModel):
         and should contain any preprocessing that needs to be done for a model.
         """
         # assumes constant
-        rank = np.linalg.matrix_rank(self.exog)
+        rank = _sparse.matrix_rank(self.exog)
         self.df_model = float(rank - 1)
         self.df_resid = float(self.exog.shape[0] - rank)
 
@@ -214,7 +215,8 @@ class DiscreteModel(base.LikelihoodModel):
 
     def _check_perfect_pred(self, params, *args):
         endog = self.endog
-        fittedvalues = self.cdf(np.dot(self.exog, params[:self.exog.shape[1]]))
+        fittedvalues = self.cdf(_sparse.dot(self.exog,
+                                            params[:self.exog.shape[1]]))
         if (self.raise_on_perfect_prediction and
                 np.allclose(fittedvalues - endog, 0)):
             msg = "Perfect separation detected, results not available"
@@ -476,9 +478,9 @@ class BinaryModel(DiscreteModel):
         if exog is None:
             exog = self.exog
         if not linear:
-            return self.cdf(np.dot(exog, params))
+            return self.cdf(_sparse.dot(exog, params))
         else:
-            return np.dot(exog, params)
+            return _sparse.dot(exog, params)
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -768,8 +770,9 @@ class CountModel(DiscreteModel):
         # promote dtype to float64 if needed
         dt = np.promote_types(self.endog.dtype, np.float64)
         self.endog = np.asarray(self.endog, dt)
-        dt = np.promote_types(self.exog.dtype, np.float64)
-        self.exog = np.asarray(self.exog, dt)
+        if not _sparse.issparse(self.exog):
+            dt = np.promote_types(self.exog.dtype, np.float64)
+            self.exog = np.asarray(self.exog, dt)
 
 
     def _check_inputs(self, offset, exposure, endog):
@@ -816,7 +819,7 @@ class CountModel(DiscreteModel):
         if exog is None:
             exog = self.exog
 
-        fitted = np.dot(exog, params[:exog.shape[1]])
+        fitted = _sparse.dot(exog, params[:exog.shape[1]])
         linpred = fitted + exposure + offset
         if not linear:
             return np.exp(linpred) # not cdf
@@ -1008,7 +1011,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = _sparse.dot(self.exog, params) + offset + exposure
         endog = self.endog
         return np.sum(-np.exp(XB) +  endog*XB - gammaln(endog+1))
 
@@ -1036,7 +1039,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = _sparse.dot(self.exog, params) + offset + exposure
         endog = self.endog
         #np.sum(stats.poisson.logpmf(endog, np.exp(XB)))
         return -np.exp(XB) +  endog*XB - gammaln(endog+1)
@@ -1186,8 +1189,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return np.dot(self.endog - L, X)
+        L = np.exp(_sparse.dot(X, params) + offset + exposure)
+        return _sparse.tdot(X, self.endog - L)
 
     def score_obs(self, params):
         """
@@ -1216,8 +1219,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return (self.endog - L)[:,None] * X
+        L = np.exp(_sparse.dot(X, params) + offset + exposure)
+        return _sparse.scale_rows(X, self.endog - L)
 
     def score_factor(self, params):
         """
@@ -1246,7 +1249,7 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
+        L = np.exp(_sparse.dot(X, params) + offset + exposure)
         return (self.endog - L)
 
 
@@ -1277,8 +1280,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + exposure + offset)
-        return -np.dot(L*X.T, X)
+        L = np.exp(_sparse.dot(X, params) + exposure + offset)
+        return -_sparse.gram(X, L)
 
     def hessian_factor(self, params):
         """
@@ -1307,7 +1310,7 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + exposure + offset)
+        L = np.exp(_sparse.dot(X, params) + exposure + offset)
         return L
 
 
@@ -1808,7 +1811,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.sum(np.log(self.cdf(q*np.dot(X,params))))
+        return np.sum(np.log(self.cdf(q*_sparse.dot(X, params))))
 
     def loglikeobs(self, params):
         """
@@ -1839,7 +1842,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.log(self.cdf(q*np.dot(X,params)))
+        return np.log(self.cdf(q*_sparse.dot(X, params)))
 
     def score(self, params):
         """
@@ -1863,8 +1866,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return np.dot(y - L,X)
+        L = self.cdf(_sparse.dot(X, params))
+        return _sparse.tdot(X, y - L)
 
     def score_obs(self, params):
         """
@@ -1891,8 +1894,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X, params))
-        return (y - L)[:,None] * X
+        L = self.cdf(_sparse.dot(X, params))
+        return _sparse.scale_rows(X, y - L)
 
     def hessian(self, params):
         """
@@ -1914,8 +1917,8 @@ class Logit(BinaryModel):
         .. math:: \\frac{\\partial^{2}\\ln L}{\\partial\\beta\\partial\\beta^{\\prime}}=-\\sum_{i}\\Lambda_{i}\\left(1-\\Lambda_{i}\\right)x_{i}x_{i}^{\\prime}
         """
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return -np.dot(L*(1-L)*X.T,X)
+        L = self.cdf(_sparse.dot(X, params))
+        return -_sparse.gram(X, L*(1-L))
 
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
@@ -2011,7 +2014,7 @@ class Probit(BinaryModel):
 
         q = 2*self.endog - 1
         X = self.exog
-        return np.sum(np.log(np.clip(self.cdf(q*np.dot(X,params)),
+        return np.sum(np.log(np.clip(self.cdf(q*_sparse.dot(X, params)),
             FLOAT_EPS, 1)))
 
     def loglikeobs(self, params):
@@ -2041,7 +2044,8 @@ class Probit(BinaryModel):
 
         q = 2*self.endog - 1
         X = self.exog
-        return np.log(np.clip(self.cdf(q*np.dot(X,params)), FLOAT_EPS, 1))
+        return np.log(np.clip(self.cdf(q*_sparse.dot(X, params)),
+                              FLOAT_EPS, 1))
 
 
     def score(self, params):
@@ -2068,11 +2072,11 @@ class Probit(BinaryModel):
         """
         y = self.endog
         X = self.exog
-        XB = np.dot(X,params)
+        XB = _sparse.dot(X, params)
         q = 2*y - 1
         # clip to get rid of invalid divide complaint
         L = q*self.pdf(q*XB)/np.clip(self.cdf(q*XB), FLOAT_EPS, 1 - FLOAT_EPS)
-        return np.dot(L,X)
+        return _sparse.tdot(X, L)
 
     def score_obs(self, params):
         """
@@ -2100,11 +2104,11 @@ class Probit(BinaryModel):
         """
         y = self.endog
         X = self.exog
-        XB = np.dot(X,params)
+        XB = _sparse.dot(X, params)
         q = 2*y - 1
         # clip to get rid of invalid divide complaint
         L = q*self.pdf(q*XB)/np.clip(self.cdf(q*XB), FLOAT_EPS, 1 - FLOAT_EPS)
-        return L[:,None] * X
+        return _sparse.scale_rows(X, L)
 
     def hessian(self, params):
         """
@@ -2132,10 +2136,10 @@ class Probit(BinaryModel):
         and :math:`q=2y-1`
         """
         X = self.exog
-        XB = np.dot(X,params)
+        XB = _sparse.dot(X, params)
         q = 2*self.endog - 1
         L = q*self.pdf(q*XB)/self.cdf(q*XB)
-        return np.dot(-L*(L+XB)*X.T,X)
+        return _sparse.gram(X, -L*(L+XB))
 
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
@@ -3504,7 +3508,8 @@ class DiscreteResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def fittedvalues(self):
-        return np.dot(self.model.exog, self.params[:self.model.exog.shape[1]])
+        return _sparse.dot(self.model.exog,
+                           self.params[:self.model.exog.shape[1]])
 
     @cache_readonly
     def resid_response(self):
@@ -3589,6 +3594,7 @@ class DiscreteResults(base.LikelihoodModelResults):
         per period, assuming that the model is loglinear.
         """
         from statsmodels.discrete.discrete_margins import DiscreteMargins
+        _sparse.check_dense(self.model.exog, 'get_margeff')
         return DiscreteMargins(self, (at, method, atexog, dummy, count))
 
     def summary(self, yname=None, xname=None, title=None, alpha=.05,
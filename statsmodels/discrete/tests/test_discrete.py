@@ -2362,3 +2362,44 @@ def test_unchanging_degrees_of_freedom():
     # Test that the call to `fit_regularized` didn't modify model.df_model inplace.
     assert_equal(res3.df_model, res1.df_model)
     assert_equal(res3.df_resid, res1.df_resid)
+
+
+@pytest.mark.parametrize('model_class', [Logit, Probit, Poisson])
+def test_sparse_exog(model_class):
+    from scipy import sparse
+    np.random.seed(98453)
+    nobs, n_groups = 600, 12
+    groups = np.random.randint(0, n_groups, size=nobs)
+    dummies = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                                shape=(nobs, n_groups))
+    exog = sparse.hstack((np.random.randn(nobs, 2), dummies)).tocsr()
+    lin_pred = exog.dot(np.r_[0.3, -0.2, 0.5 * np.random.randn(n_groups)])
+    if model_class is Poisson:
+        endog = np.random.poisson(np.exp(lin_pred))
+    else:
+        endog = (np.random.logistic(size=nobs) < lin_pred).astype(float)
+
+    res1 = model_class(endog, exog.toarray()).fit(disp=0)
+    res2 = model_class(endog, exog).fit(disp=0)
+    assert_equal(res2.df_model, res1.df_model)
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-8)
+    assert_allclose(res2.llf, res1.llf, rtol=1e-10)
+    assert_allclose(res2.llnull, res1.llnull, rtol=1e-10)
+    assert_allclose(res2.predict(exog[:5]),
+                    res1.predict(exog[:5].toarray()), rtol=1e-8)
+    score_obs1 = res1.model.score_obs(res1.params)
+    score_obs2 = res2.model.score_obs(res1.params)
+    assert_(sparse.issparse(score_obs2))
+    assert_allclose(score_obs2.toarray(), score_obs1, rtol=1e-10)
+
+    # robust covariances use a dense copy of the scores
+    for cov_type, cov_kwds in [('HC0', None),
+                               ('cluster', {'groups': groups})]:
+        res1 = model_class(endog, exog.toarray()).fit(
+            disp=0, cov_type=cov_type, cov_kwds=cov_kwds)
+        res2 = model_class(endog, exog).fit(disp=0, cov_type=cov_type,
+                                            cov_kwds=cov_kwds)
+        assert_equal(res2.bse.dtype, np.float64)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-6)
+    assert_raises(NotImplementedError, res2.get_margeff)
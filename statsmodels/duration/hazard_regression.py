@@ -135,12 +135,10 @@ class PHSurvivalTime(object):
                              "after event or censoring times")
 
         # Get the row indices for the cases in each stratum
-        stu = np.unique(strata)
-        #sth = {x: [] for x in stu} # needs >=2.7
-        sth = dict([(x, []) for x in stu])
-        for i,k in enumerate(strata):
-            sth[k].append(i)
-        stratum_rows = [np.asarray(sth[k], dtype=np.int32) for k in stu]
+        stu, strata_ix = np.unique(strata, return_inverse=True)
+        ii = np.argsort(strata_ix, kind='mergesort').astype(np.int32)
+        bounds = np.searchsorted(strata_ix[ii], np.arange(1, len(stu)))
+        stratum_rows = np.split(ii, bounds)
         stratum_names = stu
 
         # Remove strata with no events
@@ -159,22 +157,18 @@ class PHSurvivalTime(object):
             last_failure = max(time[ix][status[ix] == 1])
 
             # Stata uses < here, R uses <=
-            ii = [i for i,t in enumerate(entry[ix]) if
-                  t <= last_failure]
-            stratum_rows[stx] = stratum_rows[stx][ii]
+            stratum_rows[stx] = ix[entry[ix] <= last_failure]
 
         # Remove subjects who are censored before the first event in
         # their stratum.
         for stx,ix in enumerate(stratum_rows):
             first_failure = min(time[ix][status[ix] == 1])
 
-            ii = [i for i,t in enumerate(time[ix]) if
-                  t >= first_failure]
-            stratum_rows[stx] = stratum_rows[stx][ii]
+            stratum_rows[stx] = ix[time[ix] >= first_failure]
 
         # Order by time within each stratum
         for stx,ix in enumerate(stratum_rows):
-            ii = np.argsort(time[ix])
+            ii = np.argsort(time[ix], kind='mergesort')
             stratum_rows[stx] = stratum_rows[stx][ii]
 
         if offset is not None:
@@ -218,6 +212,20 @@ class PHSurvivalTime(object):
         self.ufailt_ix, self.risk_enter, self.risk_exit, self.ufailt =\
             [], [], [], []
 
+        # The same information in array form, used for the vectorized
+        # computation of the risk set sums:
+        #
+        # fail_ix[stx] are the indices of the subjects who fail,
+        # sorted by time, and fail_group[stx] is the position of their
+        # failure time in ufailt[stx]
+        #
+        # enter_ix[stx] and exit_ix[stx] are the positions in
+        # ufailt[stx] of the unique failure times at which each
+        # subject enters and exits the risk set.  A subject is at risk
+        # at the k^th failure time if exit_ix <= k <= enter_ix.
+        self.fail_ix, self.fail_group, self.enter_ix, self.exit_ix =\
+            [], [], [], []
+
         for stx in range(self.nstrat):
 
             # All failure times
@@ -228,32 +236,107 @@ class PHSurvivalTime(object):
             uft = np.unique(ft)
             nuft = len(uft)
 
-            # Indices of cases that fail at each unique failure time
-            #uft_map = {x:i for i,x in enumerate(uft)} # requires >=2.7
-            uft_map = dict([(x, i) for i,x in enumerate(uft)]) # 2.6
-            uft_ix = [[] for k in range(nuft)]
-            for ix,ti in zip(ift,ft):
-                uft_ix[uft_map[ti]].append(ix)
+            # Indices of cases that fail at each unique failure time,
+            # the failure times are sorted
+            fail_group = np.searchsorted(uft, ft)
+            bounds = np.arange(1, nuft)
+            uft_ix = np.split(ift.astype(np.int32),
+                              np.searchsorted(fail_group, bounds))
 
             # Indices of cases (failed or censored) that enter the
-            # risk set at each unique failure time.
-            risk_enter1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.time_s[stx]):
-                ix = np.searchsorted(uft, t, "right") - 1
-                if ix >= 0:
-                    risk_enter1[ix].append(i)
+            # risk set at each unique failure time.  All cases with
+            # times before the first failure have been removed.
+            enter_ix = np.searchsorted(uft, self.time_s[stx], "right") - 1
+            rows = np.arange(len(enter_ix), dtype=np.int32)
+            risk_enter1 = np.split(rows, np.searchsorted(enter_ix, bounds))
 
             # Indices of cases (failed or censored) that exit the
             # risk set at each unique failure time.
-            risk_exit1 = [[] for k in range(nuft)]
-            for i,t in enumerate(self.entry_s[stx]):
-                ix = np.searchsorted(uft, t)
-                risk_exit1[ix].append(i)
+            exit_ix = np.searchsorted(uft, self.entry_s[stx])
+            ii = np.argsort(exit_ix, kind='mergesort').astype(np.int32)
+            risk_exit1 = np.split(ii, np.searchsorted(exit_ix[ii], bounds))
 
             self.ufailt.append(uft)
-            self.ufailt_ix.append([np.asarray(x, dtype=np.int32) for x in uft_ix])
-            self.risk_enter.append([np.asarray(x, dtype=np.int32) for x in risk_enter1])
-            self.risk_exit.append([np.asarray(x, dtype=np.int32) for x in risk_exit1])
+            self.ufailt_ix.append(uft_ix)
+            self.risk_enter.append(risk_enter1)
+            self.risk_exit.append(risk_exit1)
+            self.fail_ix.append(ift)
+            self.fail_group.append(fail_group)
+            self.enter_ix.append(enter_ix)
+            self.exit_ix.append(exit_ix)
+
+    def risk_set_sums(self, stx, values):
+        """
+        Sum values over the risk set at each unique failure time.
+
+        Parameters
+        ----------
+        stx : int
+            The stratum.
+        values : ndarray
+            1d or 2d array with one row for each subject in the stratum.
+
+        Returns
+        -------
+        ndarray
+            Array with one row for each unique failure time in the
+            stratum.  Row k is the sum of the rows of `values` for the
+            subjects that are at risk at the k^th failure time.
+        """
+        nuft = len(self.ufailt[stx])
+        pos = np.arange(nuft)
+
+        # The subjects are sorted by time, so the subjects who have
+        # not failed or been censored before the k^th failure time
+        # are a tail of the rows.
+        enter_ix = self.enter_ix[stx]
+        csum = _reverse_cumsum(values)
+        sums = csum[np.searchsorted(enter_ix, pos)]
+
+        # Remove the subjects who enter the risk set after the k^th
+        # failure time.
+        exit_ix = self.exit_ix[stx]
+        if exit_ix.any():
+            ii = np.argsort(exit_ix, kind='mergesort')
+            csum = _reverse_cumsum(values[ii])
+            sums -= csum[np.searchsorted(exit_ix[ii], pos, "right")]
+
+        return sums
+
+    def risk_window_sums(self, stx, values):
+        """
+        Sum values over the failure times at which each subject is at
+        risk.
+
+        Parameters
+        ----------
+        stx : int
+            The stratum.
+        values : ndarray
+            1d array with one value for each unique failure time in
+            the stratum.
+
+        Returns
+        -------
+        ndarray
+            1d array with one value for each subject in the stratum.
+        """
+        csum = np.concatenate(([0.], np.cumsum(values)))
+        return csum[self.enter_ix[stx] + 1] - csum[self.exit_ix[stx]]
+
+
+def _group_sums(groups, values):
+    # Sums of the rows of values within consecutive groups, where
+    # groups is sorted and takes all values 0, 1, ..., ngroups - 1.
+    start = np.searchsorted(groups, np.arange(groups[-1] + 1))
+    return np.add.reduceat(values, start, axis=0)
+
+
+def _reverse_cumsum(values):
+    # Cumulative sums from the end, with a final row of zeros.
+    csum = np.cumsum(values[::-1], axis=0)[::-1]
+    zero = np.zeros((1,) + csum.shape[1:])
+    return np.concatenate((csum, zero))
 
 
 
@@ -557,6 +640,31 @@ class PHReg(model.LikelihoodModel):
         else:
             return self.efron_hessian(params)
 
+    def _linpred_s(self, stx, params):
+        # Linear predictor for a stratum, shifted to avoid overflow
+        surv = self.surv
+        linpred = np.dot(surv.exog_s[stx], params)
+        if surv.offset_s is not None:
+            linpred += surv.offset_s[stx]
+        linpred -= linpred.max()
+        return linpred
+
+    def _efron_terms(self, stx, e_linpred):
+        # Efron's correction for ties.  Each failure is assigned a
+        # fraction J of the failure set at its time, and
+        # c0 = xp0 - J * xp0f is its risk set denominator.
+        surv = self.surv
+        fail_group = surv.fail_group[stx]
+        nfail = np.bincount(fail_group)
+        start = np.concatenate(([0], np.cumsum(nfail)[:-1]))
+        J = np.arange(len(fail_group)) - start[fail_group]
+        J = J / nfail[fail_group].astype(np.float64)
+
+        xp0 = surv.risk_set_sums(stx, e_linpred)
+        xp0f = np.bincount(fail_group, e_linpred[surv.fail_ix[stx]])
+        c0 = xp0[fail_group] - J * xp0f[fail_group]
+        return J, c0
+
     def breslow_loglike(self, params):
         """
         Returns the value of the log partial likelihood function
@@ -571,32 +679,15 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            uft_ix = surv.ufailt_ix[stx]
-            exog_s = surv.exog_s[stx]
-            nuft = len(uft_ix)
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
+            linpred = self._linpred_s(stx, params)
             e_linpred = np.exp(linpred)
 
-            xp0 = 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += (linpred[ix] - np.log(xp0)).sum()
+            # Sums over the risk set at each unique failure time
+            xp0 = surv.risk_set_sums(stx, e_linpred)
+            nfail = np.bincount(surv.fail_group[stx])
 
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
+            like += linpred[surv.fail_ix[stx]].sum()
+            like -= np.dot(nfail, np.log(xp0))
 
         return like
 
@@ -614,37 +705,13 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # exog and linear predictor for this stratum
-            exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
+            linpred = self._linpred_s(stx, params)
             e_linpred = np.exp(linpred)
 
-            xp0 = 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
+            J, c0 = self._efron_terms(stx, e_linpred)
 
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                xp0 += e_linpred[ix].sum()
-                xp0f = e_linpred[uft_ix[i]].sum()
-
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                like += linpred[ix].sum()
-
-                m = len(ix)
-                J = np.arange(m, dtype=np.float64) / m
-                like -= np.log(xp0 - J*xp0f).sum()
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                xp0 -= e_linpred[ix].sum()
+            like += linpred[surv.fail_ix[stx]].sum()
+            like -= np.log(c0).sum()
 
         return like
 
@@ -661,43 +728,16 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # Indices of subjects in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # Unique failure times in the stratum
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
-            # exog and linear predictor for the stratum
             exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1 = 0., 0.
-
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
+            e_linpred = np.exp(self._linpred_s(stx, params))
 
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
+            # Sums over the risk set at each unique failure time
+            xp0 = surv.risk_set_sums(stx, e_linpred)
+            xp1 = surv.risk_set_sums(stx, e_linpred[:, None] * exog_s)
+            nfail = np.bincount(surv.fail_group[stx])
 
-                # Account for all cases that fail at this point.
-                ix = uft_ix[i]
-                grad += (exog_s[ix,:] - xp1 / xp0).sum(0)
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
+            grad += exog_s[surv.fail_ix[stx], :].sum(0)
+            grad -= np.dot(nfail / xp0, xp1)
 
         return grad
 
@@ -714,53 +754,21 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            # Indices of cases in the stratum
-            strat_ix = surv.stratum_rows[stx]
-
-            # exog and linear predictor of the stratum
             exog_s = surv.exog_s[stx]
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
+            e_linpred = np.exp(self._linpred_s(stx, params))
+            fail_ix = surv.fail_ix[stx]
+            fail_group = surv.fail_group[stx]
 
-            xp0, xp1 = 0., 0.
+            J, c0 = self._efron_terms(stx, e_linpred)
+            v = exog_s[fail_ix, :]
+            xp1 = surv.risk_set_sums(stx, e_linpred[:, None] * exog_s)
+            xp1f = _group_sums(fail_group, e_linpred[fail_ix][:, None] * v)
 
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 += e_linpred[ix].sum()
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-
-                    # Consider all cases that fail at this point.
-                    grad += v.sum(0)
-
-                    m = len(ixf)
-                    J = np.arange(m, dtype=np.float64) / m
-                    numer = xp1 - np.outer(J, xp1f)
-                    denom = xp0 - np.outer(J, xp0f)
-                    ratio = numer / denom
-                    rsum = ratio.sum(0)
-                    grad -= rsum
-
-                # Update for cases leaving the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    v = exog_s[ix,:]
-                    xp0 -= e_linpred[ix].sum()
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
+            # sum of (xp1 - J * xp1f) / c0 over the failures
+            a = np.bincount(fail_group, 1 / c0)
+            b = np.bincount(fail_group, J / c0)
+            grad += v.sum(0)
+            grad -= np.dot(a, xp1) - np.dot(b, xp1f)
 
         return grad
 
@@ -777,43 +785,19 @@ class PHReg(model.LikelihoodModel):
         # Loop over strata
         for stx in range(surv.nstrat):
 
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-
             exog_s = surv.exog_s[stx]
+            e_linpred = np.exp(self._linpred_s(stx, params))
 
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1, xp2 = 0., 0., 0.
+            xp0 = surv.risk_set_sums(stx, e_linpred)
+            xp1 = surv.risk_set_sums(stx, e_linpred[:, None] * exog_s)
+            nfail = np.bincount(surv.fail_group[stx])
 
-            # Iterate backward through the unique failure times.
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 += np.einsum("ij,ik,i->jk", v, v, elx)
+            # sum of nfail * xp2 / xp0 over the failure times, where
+            # xp2 is the risk set sum of e_linpred * x x'
+            w = e_linpred * surv.risk_window_sums(stx, nfail / xp0)
+            hess += np.dot(exog_s.T * w, exog_s)
+            hess -= np.dot(xp1.T * (nfail / xp0**2), xp1)
 
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                hess += m*(xp2 / xp0  - np.outer(xp1, xp1) / xp0**2)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 -= np.einsum("ij,ik,i->jk", v, v, elx)
         return -hess
 
     def efron_hessian(self, params):
@@ -831,54 +815,28 @@ class PHReg(model.LikelihoodModel):
         for stx in range(surv.nstrat):
 
             exog_s = surv.exog_s[stx]
-
-            linpred = np.dot(exog_s, params)
-            if surv.offset_s is not None:
-                linpred += surv.offset_s[stx]
-            linpred -= linpred.max()
-            e_linpred = np.exp(linpred)
-
-            xp0, xp1, xp2 = 0., 0., 0.
-
-            # Iterate backward through the unique failure times.
-            uft_ix = surv.ufailt_ix[stx]
-            nuft = len(uft_ix)
-            for i in range(nuft)[::-1]:
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_enter[stx][i]
-                if len(ix) > 0:
-                    xp0 += e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 += (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 += np.einsum("ij,ik,i->jk", v, v, elx)
-
-                ixf = uft_ix[i]
-                if len(ixf) > 0:
-                    v = exog_s[ixf,:]
-                    xp0f = e_linpred[ixf].sum()
-                    xp1f = (e_linpred[ixf][:,None] * v).sum(0)
-                    elx = e_linpred[ixf]
-                    xp2f = np.einsum("ij,ik,i->jk", v, v, elx)
-
-                # Account for all cases that fail at this point.
-                m = len(uft_ix[i])
-                J = np.arange(m, dtype=np.float64) / m
-                c0 = xp0 - J*xp0f
-                hess += xp2 * np.sum(1 / c0)
-                hess -= xp2f * np.sum(J / c0)
-                mat = (xp1[None, :] - np.outer(J, xp1f)) / c0[:, None]
-                hess -= np.einsum("ij,ik->jk", mat, mat)
-
-                # Update for new cases entering the risk set.
-                ix = surv.risk_exit[stx][i]
-                if len(ix) > 0:
-                    xp0 -= e_linpred[ix].sum()
-                    v = exog_s[ix,:]
-                    xp1 -= (e_linpred[ix][:,None] * v).sum(0)
-                    elx = e_linpred[ix]
-                    xp2 -= np.einsum("ij,ik,i->jk", v, v, elx)
+            e_linpred = np.exp(self._linpred_s(stx, params))
+            fail_ix = surv.fail_ix[stx]
+            fail_group = surv.fail_group[stx]
+
+            J, c0 = self._efron_terms(stx, e_linpred)
+            v = exog_s[fail_ix, :]
+            elx = e_linpred[fail_ix]
+            xp1 = surv.risk_set_sums(stx, e_linpred[:, None] * exog_s)
+            xp1f = _group_sums(fail_group, elx[:, None] * v)
+
+            # xp2 * sum(1 / c0) summed over the failure times
+            a = np.bincount(fail_group, 1 / c0)
+            w = e_linpred * surv.risk_window_sums(stx, a)
+            hess += np.dot(exog_s.T * w, exog_s)
+
+            # xp2f * sum(J / c0) summed over the failure times
+            b = np.bincount(fail_group, J / c0)
+            hess -= np.dot(v.T * (elx * b[fail_group]), v)
+
+            mat = xp1[fail_group] - J[:, None] * xp1f[fail_group]
+            mat /= c0[:, None]
+            hess -= np.dot(mat.T, mat)
 
         return -hess
 
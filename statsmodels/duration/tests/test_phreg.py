@@ -7,6 +7,7 @@ from numpy.testing import (assert_allclose,
                            assert_equal, assert_)
 import pandas as pd
 import pytest
+from statsmodels.tools.numdiff import approx_fprime
 
 # TODO: Include some corner cases: data sets with empty strata, strata
 #      with no events, entry times after censoring times, etc.
@@ -414,3 +415,24 @@ strata_f = (False, True)
                          list(itertools.product(fnames, ties, entry_f, strata_f)))
 def test_r(fname, ties, entry_f, strata_f):
     TestPHReg.do1(fname, ties, entry_f, strata_f)
+
+
+@pytest.mark.parametrize('ties', ["breslow", "efron"])
+def test_derivatives_ties(ties):
+    # many ties, left truncation, strata and offset
+    np.random.seed(3421)
+    n = 200
+    exog = np.random.normal(size=(n, 2))
+    time = np.random.randint(1, 10, size=n).astype(np.float64)
+    status = (np.random.uniform(size=n) < 0.7).astype(np.float64)
+    entry = time * np.random.uniform(size=n) * (np.random.uniform(size=n) < 0.3)
+    strata = np.random.randint(0, 3, size=n)
+    offset = 0.1 * np.random.normal(size=n)
+
+    mod = PHReg(time, exog, status=status, entry=entry, strata=strata,
+                offset=offset, ties=ties)
+    params = np.r_[0.3, -0.2]
+    score = approx_fprime(params, mod.loglike, centered=True)
+    assert_allclose(mod.score(params), score, rtol=1e-6)
+    hess = approx_fprime(params, mod.score, centered=True)
+    assert_allclose(mod.hessian(params), hess, rtol=1e-6)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Timing of lowess_batch against calling lowess for each column
+
+The batched version computes the kernel weights of a block of fit points
+once for all columns, and the local moments of all columns are matrix
+products.
+
+results on a single core, nobs=15000, frac=2/3
+----------------------------------------------
+
+k_endog it  batch   loop
+      2  0    3.4    5.8
+      2  3   12.6   22.0
+     20  0    7.0   55.6
+     20  3   27.1  238.9
+
+"""
+
+from __future__ import print_function
+import time
+
+import numpy as np
+from statsmodels.nonparametric.smoothers_lowess import lowess, lowess_batch
+
+
+np.random.seed(987125)
+nobs = 15000
+x = np.random.uniform(0, 10, size=nobs)
+
+print('k_endog it  batch   loop')
+for k_endog in [2, 20]:
+    y = np.sin(x)[:, None] + np.random.normal(size=(nobs, k_endog))
+    for it in [0, 3]:
+        t0 = time.time()
+        res = lowess_batch(y, x, frac=2. / 3, it=it)
+        t1 = time.time()
+        res_loop = np.column_stack([lowess(y[:, j], x, frac=2. / 3, it=it,
+                                           return_sorted=False)
+                                    for j in range(k_endog)])
+        t2 = time.time()
+        assert np.allclose(res, res_loop, rtol=1e-10, atol=1e-10)
+        print('%7d %2d %6.1f %6.1f' % (k_endog, it, t1 - t0, t2 - t1))
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Timing and memory of the OLS fit methods for a tall design matrix
+
+The "cholesky" method solves the normal equations with the Cholesky factor
+of the k x k matrix X'X, while "pinv" and "qr" create and store an nobs x k
+factor of the design matrix.  Each method is run in a separate process,
+so that the increase of the peak resident memory can be attributed to the
+fit. Linux only, because of the units of ru_maxrss.
+
+results on a single core, nobs=1e6, k_vars=50, fit and bse
+-----------------------------------------------------------
+
+method    time s  peak MB
+pinv        9.92     1161
+qr          6.36     1160
+cholesky    0.55       17
+
+"""
+
+from __future__ import print_function
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+from statsmodels.regression.linear_model import OLS
+
+
+nobs, k_vars = 10**6, 50
+
+
+def peak_memory():
+    # peak resident memory of this process in MB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.
+
+
+def run(method):
+    rs = np.random.RandomState(9876)
+    exog = rs.standard_normal((nobs, k_vars))
+    exog[:, 0] = 1
+    endog = exog.sum(1) + rs.standard_normal(nobs)
+    mem0 = peak_memory()
+    t0 = time.time()
+    res = OLS(endog, exog).fit(method=method)
+    res.bse
+    t1 = time.time()
+    print('%-9s %6.2f %8.0f' % (method, t1 - t0, peak_memory() - mem0))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        print('method    time s  peak MB')
+        for method in ['pinv', 'qr', 'cholesky']:
+            out = subprocess.check_output([sys.executable, __file__, method])
+            print(out.decode().strip())
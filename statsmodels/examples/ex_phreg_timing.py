@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Timing of the PHReg partial likelihood, score and hessian
+
+The risk-set sums of the Breslow and Efron partial likelihoods are
+computed with cumulative sums over the time-sorted observations, so the
+time is linear in the number of observations and does not depend on the
+number of distinct failure times.  30% of the observations enter late.
+
+results on a single core, k_vars=5, time of loglike + score + hessian
+----------------------------------------------------------------------
+
+    nobs  n_times  breslow  efron
+  100000     1000     0.10   0.11
+  100000   100000     0.10   0.13
+ 1000000     1000     1.38   1.51
+ 1000000   100000     1.42   1.91
+
+The previous implementation looped over the distinct failure times and
+took 0.15 and 0.27 seconds with 1000 and 3.47 and 8.03 seconds with 100000
+distinct times for nobs=100000.
+
+"""
+
+from __future__ import print_function
+import time
+
+import numpy as np
+from statsmodels.duration.hazard_regression import PHReg
+
+
+k_vars = 5
+rs = np.random.RandomState(7345)
+
+print('    nobs  n_times  breslow  efron')
+for nobs, n_times in [(10**5, 10**3), (10**5, 10**5), (10**6, 10**3),
+                      (10**6, 10**5)]:
+    exog = rs.standard_normal((nobs, k_vars))
+    time_ = rs.randint(1, n_times + 1, size=nobs).astype(float)
+    status = (rs.uniform(size=nobs) < 0.7).astype(float)
+    entry = np.where(rs.uniform(size=nobs) < 0.3,
+                     rs.uniform(size=nobs) * time_, 0)
+    params = rs.standard_normal(k_vars) * 0.1
+    out = []
+    for ties in ['breslow', 'efron']:
+        mod = PHReg(time_, exog, status=status, entry=entry, ties=ties)
+        t0 = time.time()
+        mod.loglike(params)
+        mod.score(params)
+        mod.hessian(params)
+        out.append(time.time() - t0)
+    print('%8d %8d %8.2f %6.2f' % ((nobs, n_times) + tuple(out)))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Timing and SSE of ExponentialSmoothing.fit with and without use_brute
+
+The default starts the optimizer at the best of a few candidate smoothing
+parameters and minimizes with the analytic gradient of the SSE.  use_brute
+first evaluates the SSE on a grid of 20 values for each smoothing
+parameter.
+
+results on a single core, housing data, seasonal_periods=12
+----------------------------------------------------------
+
+trend seas  damped   default        use_brute
+                     sse      time  sse      time
+add   add   False     83619 0.065    83619 0.098
+add   add   True      83611 0.048    83611 0.500
+add   mul   False     75816 0.026    75816 0.064
+add   mul   True      75816 0.032    75816 0.429
+add   None  False    209737 0.017   209737 0.018
+add   None  True     203075 0.023   203075 0.071
+mul   add   False     85777 0.083    87696 0.133
+mul   add   True      85264 0.057      nan 1.233
+mul   mul   False     75110 0.138    75110 0.275
+mul   mul   True      75110 0.179    75816 1.857
+mul   None  False    208790 0.030   208790 0.040
+mul   None  True     202280 0.048   202280 0.295
+None  add   False     83618 0.022    83618 0.024
+None  mul   False     75816 0.012    75816 0.016
+None  None  False    209737 0.005   209737 0.004
+
+"""
+
+from __future__ import print_function
+import os
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import statsmodels.tsa.tests
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+
+base = os.path.dirname(os.path.abspath(statsmodels.tsa.tests.__file__))
+y = pd.read_csv(os.path.join(base, 'results', 'housing-data.csv'))
+y = np.asarray(y.iloc[:, 1], dtype=np.double)
+n_rep = 5
+
+print('trend seas  damped   default        use_brute')
+print('                     sse      time  sse      time')
+for trend in ['add', 'mul', None]:
+    for seasonal in ['add', 'mul', None]:
+        for damped in ([False, True] if trend else [False]):
+            mod = ExponentialSmoothing(y, trend=trend, seasonal=seasonal,
+                                       damped=damped, seasonal_periods=12)
+            out = []
+            for use_brute in [False, True]:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    t0 = time.time()
+                    for _ in range(n_rep):
+                        res = mod.fit(use_brute=use_brute)
+                    t1 = time.time()
+                out.extend([res.sse, (t1 - t0) / n_rep])
+            print('%-5s %-5s %-6s %8.0f %5.3f %8.0f %5.3f'
+                  % ((trend, seasonal, damped) + tuple(out)))
@@ -10,6 +10,8 @@ License: BSD-3
 import numpy as np
 from scipy import stats
 
+from statsmodels.tools import _sparse
+
 
 # this is similar to ContrastResults after t_test, partially copied and adjusted
 class PredictionResults(object):
@@ -215,7 +217,7 @@ def get_prediction_glm(self, exog=None, transform=True, weights=None,
     covb = self.cov_params()
 
     link_deriv = self.model.family.link.inverse_deriv(linpred.predicted_mean)
-    var_pred_mean = link_deriv**2 * (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = link_deriv**2 * _sparse.quad_diag(exog, covb)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -178,6 +178,50 @@ class CovStruct(object):
         soln = [spl.cho_solve(vco, x) for x in rhs]
         return soln
 
+    def covariance_matrix_solve_stacked(self, expval, index, stdev, rhs):
+        """
+        Solves the matrix equations of `covariance_matrix_solve` for
+        several clusters of the same size at once.
+
+        Parameters
+        ----------
+        expval : ndarray
+            Array of shape (n_clust, m) containing the expected values
+            of endog, one row for each cluster.
+        index : ndarray
+            The indices of the n_clust clusters.
+        stdev : ndarray
+            Array of shape (n_clust, m) containing the standard
+            deviations of endog.
+        rhs : list/tuple of ndarray
+            A set of right-hand sides, each with shape (n_clust, m) or
+            (n_clust, m, q).
+
+        Returns
+        -------
+        soln : list of ndarray
+            The solutions to the matrix equations, with the same
+            shapes as `rhs`.
+
+        Notes
+        -----
+        Returns None if the solver fails.
+
+        This default implementation calls `covariance_matrix_solve`
+        for each cluster in turn.  Subclasses can reimplement it to
+        solve all systems with a few array operations.
+        """
+
+        soln = [np.empty(x.shape, dtype=np.float64) for x in rhs]
+        for j, i in enumerate(index):
+            rslt = self.covariance_matrix_solve(expval[j], i, stdev[j],
+                                                [x[j] for x in rhs])
+            if rslt is None:
+                return None
+            for y, r in zip(soln, rslt):
+                y[j] = r
+        return soln
+
     def summary(self):
         """
         Returns a text summary of the current estimate of the
@@ -186,6 +230,14 @@ class CovStruct(object):
         raise NotImplementedError
 
 
+def _stacked_sdev(stdev, x):
+    # Broadcast a (n_clust, m) array of standard deviations against a
+    # stacked right-hand side of shape (n_clust, m) or (n_clust, m, q).
+    if x.ndim == 2:
+        return stdev
+    return stdev[:, :, None]
+
+
 class Independence(CovStruct):
     """
     An independence working dependence structure.
@@ -209,9 +261,15 @@ class Independence(CovStruct):
                 rslt.append(x / v[:, None])
         return rslt
 
+    def covariance_matrix_solve_stacked(self, expval, index, stdev, rhs):
+        v = stdev ** 2
+        return [x / _stacked_sdev(v, x) for x in rhs]
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_stacked.__doc__ = (
+        CovStruct.covariance_matrix_solve_stacked.__doc__)
 
     def summary(self):
         return ("Observations within a cluster are modeled "
@@ -295,9 +353,28 @@ class Exchangeable(CovStruct):
 
         return rslt
 
+    def covariance_matrix_solve_stacked(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        c = self.dep_params / (1. - self.dep_params)
+        c /= 1. + self.dep_params * (k - 1)
+
+        rslt = []
+        for x in rhs:
+            sd = _stacked_sdev(stdev, x)
+            x1 = x / sd
+            y = x1 / (1. - self.dep_params)
+            y -= c * x1.sum(1)[:, None]
+            y /= sd
+            rslt.append(y)
+
+        return rslt
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_stacked.__doc__ = (
+        CovStruct.covariance_matrix_solve_stacked.__doc__)
 
     def summary(self):
         return ("The correlation between two observations in the " +
@@ -537,6 +614,7 @@ class Stationary(CovStruct):
         if not self.grid:
             time = self.model.time[:, 0].astype(np.int32)
             self.time = self.model.cluster_list(time)
+            self._time_stacked = np.concatenate(self.time)
 
     def update(self, params):
 
@@ -641,12 +719,62 @@ class Stationary(CovStruct):
 
         from statsmodels.tools.linalg import stationary_solve
         r = np.zeros(len(expval))
-        r[0:self.max_lag] = self.dep_params[1:]
-        return [stationary_solve(r, x) for x in rhs]
+        r[0:self.max_lag] = self.dep_params[1:len(r) + 1]
+
+        rslt = []
+        for x in rhs:
+            if x.ndim == 1:
+                y = stationary_solve(r, x / stdev) / stdev
+            else:
+                y = stationary_solve(r, x / stdev[:, None])
+                y /= stdev[:, None]
+            rslt.append(y)
+        return rslt
+
+    def covariance_matrix_solve_stacked(self, expval, index, stdev, rhs):
+
+        n_clust, m = expval.shape
+
+        if self.grid:
+            # All clusters of the same size share one Toeplitz matrix.
+            r = np.zeros(m)
+            r[0] = 1
+            r[1:self.max_lag + 1] = self.dep_params[1:m]
+            cmat = spl.toeplitz(r)
+            rslt = []
+            for x in rhs:
+                sd = _stacked_sdev(stdev, x)
+                x1 = np.moveaxis(x / sd, 1, 0).reshape(m, -1)
+                y = np.linalg.solve(cmat, x1).reshape((m, n_clust) +
+                                                      x.shape[2:])
+                rslt.append(np.moveaxis(y, 0, 1) / sd)
+            return rslt
+
+        time = self._time_stacked[self.model._cluster_start[index][:, None]
+                                  + np.arange(m)]
+        dx = np.abs(time[:, :, None] - time[:, None, :])
+        cmat = np.where(dx <= self.max_lag,
+                        self.dep_params[np.minimum(dx, self.max_lag)], 0.)
+        ii = np.arange(m)
+        cmat[:, ii, ii] = 1
+        vmat = cmat * stdev[:, :, None] * stdev[:, None, :]
+
+        # Clusters whose covariance matrix needs to be projected are
+        # handled one at a time.
+        try:
+            np.linalg.cholesky(vmat)
+        except np.linalg.LinAlgError:
+            return super(Stationary, self).covariance_matrix_solve_stacked(
+                expval, index, stdev, rhs)
+        self.cov_adjust.extend([0] * n_clust)
+
+        return [np.linalg.solve(vmat, x) for x in rhs]
 
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_stacked.__doc__ = (
+        CovStruct.covariance_matrix_solve_stacked.__doc__)
 
     def summary(self):
 
@@ -808,7 +936,8 @@ class Autoregressive(CovStruct):
 
         # LHS has 2 columns
         if k == 2:
-            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]])
+            mat = np.array([[1, -self.dep_params], [-self.dep_params, 1]],
+                           dtype=np.float64)
             mat /= (1. - self.dep_params ** 2)
             for x in rhs:
                 if x.ndim == 1:
@@ -838,13 +967,13 @@ class Autoregressive(CovStruct):
                 flatten = True
             x1 = x / stdev[:, None]
 
-            z0 = np.zeros((1, x.shape[1]))
-            rhs1 = np.concatenate((x[1:, :], z0), axis=0)
-            rhs2 = np.concatenate((z0, x[0:-1, :]), axis=0)
+            z0 = np.zeros((1, x1.shape[1]))
+            rhs1 = np.concatenate((x1[1:, :], z0), axis=0)
+            rhs2 = np.concatenate((z0, x1[0:-1, :]), axis=0)
 
-            y = c0 * x + c2 * rhs1 + c2 * rhs2
-            y[0, :] = c1 * x[0, :] + c2 * x[1, :]
-            y[-1, :] = c1 * x[-1, :] + c2 * x[-2, :]
+            y = c0 * x1 + c2 * rhs1 + c2 * rhs2
+            y[0, :] = c1 * x1[0, :] + c2 * x1[1, :]
+            y[-1, :] = c1 * x1[-1, :] + c2 * x1[-2, :]
 
             y /= stdev[:, None]
 
@@ -855,9 +984,38 @@ class Autoregressive(CovStruct):
 
         return soln
 
+    def covariance_matrix_solve_stacked(self, expval, index, stdev, rhs):
+
+        k = expval.shape[1]
+        if k == 1:
+            return [x / _stacked_sdev(stdev, x) ** 2 for x in rhs]
+
+        # The tri-diagonal inverse, with the same c0, c1 and c2 as in
+        # covariance_matrix_solve.  For k == 2 only c1 and c2 are used.
+        c0 = (1. + self.dep_params ** 2) / (1. - self.dep_params ** 2)
+        c1 = 1. / (1. - self.dep_params ** 2)
+        c2 = -self.dep_params / (1. - self.dep_params ** 2)
+        soln = []
+        for x in rhs:
+            sd = _stacked_sdev(stdev, x)
+            x1 = x / sd
+
+            y = c0 * x1
+            y[:, 1:] += c2 * x1[:, :-1]
+            y[:, :-1] += c2 * x1[:, 1:]
+            y[:, 0] = c1 * x1[:, 0] + c2 * x1[:, 1]
+            y[:, -1] = c1 * x1[:, -1] + c2 * x1[:, -2]
+
+            y /= sd
+            soln.append(y)
+
+        return soln
+
     update.__doc__ = CovStruct.update.__doc__
     covariance_matrix.__doc__ = CovStruct.covariance_matrix.__doc__
     covariance_matrix_solve.__doc__ = CovStruct.covariance_matrix_solve.__doc__
+    covariance_matrix_solve_stacked.__doc__ = (
+        CovStruct.covariance_matrix_solve_stacked.__doc__)
 
     def summary(self):
 
@@ -570,6 +570,7 @@ class GEE(base.Model):
             self.weights_li = np.asarray(self.weights_li)
 
         self.num_group = len(self.endog_li)
+        self._setup_cluster_blocks()
 
         # Time defaults to a 1d grid with equal spacing
         if self.time is not None:
@@ -733,6 +734,102 @@ class GEE(base.Model):
             return [np.array(array[self.group_indices[k], :])
                     for k in self.group_labels]
 
+    def _setup_cluster_blocks(self):
+        """
+        Group the clusters by size.
+
+        Sets `_cluster_start`, the position of the first observation of
+        each cluster in the concatenated cluster lists, and
+        `_cluster_blocks`, which contains a tuple (index, pos) for each
+        distinct cluster size m.  `index` holds the indices of the
+        clusters of size m and `pos` is a len(index) x m array with
+        the positions of their observations.
+        """
+
+        sizes = np.asarray([len(y) for y in self.endog_li])
+        self._cluster_start = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+        self._cluster_blocks = []
+        for m in np.unique(sizes):
+            index = np.flatnonzero(sizes == m)
+            pos = self._cluster_start[index][:, None] + np.arange(m)
+            self._cluster_blocks.append((index, pos))
+
+        if self.weights is not None:
+            self._weights_stacked = np.repeat(self.weights_li, sizes)
+
+    def _concat_clusters(self, name):
+        """
+        Returns the cluster list attribute `name`, e.g. "exog_li",
+        concatenated into one array.  The result is cached for as long
+        as the attribute refers to the same list.
+        """
+
+        cache = self.__dict__.setdefault("_concat_cache", {})
+        li = getattr(self, name)
+        if name not in cache or cache[name][0] is not li:
+            cache[name] = (li, np.concatenate(li))
+        return cache[name][1]
+
+    def _stacked_means(self):
+        """
+        Returns the cached means and linear predictors as arrays in
+        the order of the concatenated cluster lists.
+        """
+
+        stacked = getattr(self, "_cached_means_stacked", None)
+        if stacked is not None and stacked[0] is self.cached_means:
+            return stacked[1], stacked[2]
+
+        # cached_means was set directly, e.g. when restoring a
+        # previous state.
+        expval = np.concatenate([x[0] for x in self.cached_means])
+        lpr = np.concatenate([x[1] for x in self.cached_means])
+        return expval, lpr
+
+    def _stacked_score_terms(self):
+        """
+        Returns the weighted sum of the D_i' V_i^{-1} D_i matrices and
+        an array whose rows are the weighted cluster contributions
+        D_i' V_i^{-1} r_i to the score.
+
+        All clusters of the same size are solved at once using
+        `covariance_matrix_solve_stacked` of the dependence structure.
+        Returns (None, None) if the covariance solver fails.
+        """
+
+        exog = self._concat_clusters("exog_li")
+        k_exog = exog.shape[1]
+        expval_all, lpr_all = self._stacked_means()
+        sdev_all = np.sqrt(self.family.variance(expval_all))
+        resid_all = self._concat_clusters("endog_li") - expval_all
+
+        bmat = np.zeros((k_exog, k_exog))
+        scores = np.empty((self.num_group, k_exog))
+        for index, pos in self._cluster_blocks:
+            n_clust, m = pos.shape
+            ii = pos.ravel()
+            dmat = self.mean_deriv(exog[ii], lpr_all[ii])
+            dmat = dmat.reshape(n_clust, m, k_exog)
+
+            rslt = self.cov_struct.covariance_matrix_solve_stacked(
+                expval_all[pos], index, sdev_all[pos],
+                (dmat, resid_all[pos]))
+            if rslt is None:
+                return None, None
+            vinv_d, vinv_resid = tuple(rslt)
+
+            if self.weights is not None:
+                f = self.weights_li[index]
+                vinv_d = vinv_d * f[:, None, None]
+                vinv_resid = vinv_resid * f[:, None]
+
+            bmat += np.dot(dmat.reshape(-1, k_exog).T,
+                           vinv_d.reshape(-1, k_exog))
+            scores[index] = np.einsum('ijk,ij->ik', dmat, vinv_resid)
+
+        return bmat, scores
+
     def compare_score_test(self, submodel):
         """
         Perform a score test for the given submodel against this model.
@@ -861,27 +958,18 @@ class GEE(base.Model):
                                     _Multinomial)):
             return 1.
 
-        endog = self.endog_li
-        cached_means = self.cached_means
         nobs = self.nobs
-        varfunc = self.family.variance
-
-        scale = 0.
-        fsum = 0.
-        for i in range(self.num_group):
+        expval, _ = self._stacked_means()
+        sdev = np.sqrt(self.family.variance(expval))
+        resid = (self._concat_clusters("endog_li") - expval) / sdev
 
-            if len(endog[i]) == 0:
-                continue
-
-            expval, _ = cached_means[i]
-
-            f = self.weights_li[i] if self.weights is not None else 1.
-
-            sdev = np.sqrt(varfunc(expval))
-            resid = (endog[i] - expval) / sdev
-
-            scale += f * np.sum(resid ** 2)
-            fsum += f * len(endog[i])
+        if self.weights is not None:
+            f = self._weights_stacked
+            scale = np.sum(f * resid ** 2)
+            fsum = np.sum(f)
+        else:
+            scale = np.sum(resid ** 2)
+            fsum = len(resid)
 
         scale /= (fsum * (nobs - self.ddof_scale) / float(nobs))
 
@@ -954,31 +1042,10 @@ class GEE(base.Model):
             incorporate the scale.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-
-        cached_means = self.cached_means
-
-        varfunc = self.family.variance
-
-        bmat, score = 0, 0
-        for i in range(self.num_group):
-
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
-
-            rslt = self.cov_struct.covariance_matrix_solve(expval, i,
-                                                           sdev, (dmat, resid))
-            if rslt is None:
-                return None, None
-            vinv_d, vinv_resid = tuple(rslt)
-
-            f = self.weights_li[i] if self.weights is not None else 1.
-
-            bmat += f * np.dot(dmat.T, vinv_d)
-            score += f * np.dot(dmat.T, vinv_resid)
+        bmat, scores = self._stacked_score_terms()
+        if bmat is None:
+            return None, None
+        score = scores.sum(0)
 
         update = np.linalg.solve(bmat, score)
 
@@ -995,25 +1062,15 @@ class GEE(base.Model):
         keep the cached means up to date.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        offset = self.offset_li
-
-        linkinv = self.family.link.inverse
+        lpr = np.dot(self._concat_clusters("exog_li"), mean_params)
+        if self.offset_li is not None:
+            lpr += self._concat_clusters("offset_li")
+        expval = self.family.link.inverse(lpr)
 
-        self.cached_means = []
-
-        for i in range(self.num_group):
-
-            if len(endog[i]) == 0:
-                continue
-
-            lpr = np.dot(exog[i], mean_params)
-            if offset is not None:
-                lpr += offset[i]
-            expval = linkinv(lpr)
-
-            self.cached_means.append((expval, lpr))
+        split = self._cluster_start[1:]
+        self.cached_means = list(zip(np.split(expval, split),
+                                     np.split(lpr, split)))
+        self._cached_means_stacked = (self.cached_means, expval, lpr)
 
     def _covmat(self):
         """
@@ -1035,32 +1092,12 @@ class GEE(base.Model):
            obtaining score test results.
         """
 
-        endog = self.endog_li
-        exog = self.exog_li
-        varfunc = self.family.variance
-        cached_means = self.cached_means
-
         # Calculate the naive (model-based) and robust (sandwich)
         # covariances.
-        bmat, cmat = 0, 0
-        for i in range(self.num_group):
-
-            expval, lpr = cached_means[i]
-            resid = endog[i] - expval
-            dmat = self.mean_deriv(exog[i], lpr)
-            sdev = np.sqrt(varfunc(expval))
-
-            rslt = self.cov_struct.covariance_matrix_solve(
-                expval, i, sdev, (dmat, resid))
-            if rslt is None:
-                return None, None, None, None
-            vinv_d, vinv_resid = tuple(rslt)
-
-            f = self.weights_li[i] if self.weights is not None else 1.
-
-            bmat += f * np.dot(dmat.T, vinv_d)
-            dvinv_resid = f * np.dot(dmat.T, vinv_resid)
-            cmat += np.outer(dvinv_resid, dvinv_resid)
+        bmat, scores = self._stacked_score_terms()
+        if bmat is None:
+            return None, None, None, None
+        cmat = np.dot(scores.T, scores)
 
         scale = self.estimate_scale()
 
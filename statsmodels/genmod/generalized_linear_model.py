@@ -25,6 +25,7 @@ import statsmodels.base.model as base
 import statsmodels.regression.linear_model as lm
 import statsmodels.base.wrapper as wrap
 import statsmodels.regression._tools as reg_tools
+from statsmodels.tools import _sparse
 
 from statsmodels.graphics._regressionplots_doc import (
     _plot_added_variable_doc,
@@ -49,6 +50,23 @@ def _check_convergence(criterion, iteration, atol, rtol):
                        atol=atol, rtol=rtol)
 
 
+def _fit_group_irls(model, fit_kwds):
+    """
+    Fit a group submodel with IRLS and return the summary statistics.
+
+    Helper function for GLM.fit_grouped, defined at module level so that it
+    can be used with process based parallelization.
+    """
+    k_params = model.exog.shape[1]
+    try:
+        res = model._fit_irls(**fit_kwds)._results
+        return (res.params, res.bse, res.deviance, res.scale,
+                res.converged, res.fit_history['iteration'], None)
+    except (ValueError, LinAlgError, PerfectSeparationError) as exc:
+        nan = np.full(k_params, np.nan)
+        return nan, nan, np.nan, np.nan, False, 0, str(exc)
+
+
 class GLM(base.LikelihoodModel):
     __doc__ = """
     Generalized Linear Models class
@@ -325,7 +343,7 @@ class GLM(base.LikelihoodModel):
         """
         Initialize a generalized linear model.
         """
-        self.df_model = np.linalg.matrix_rank(self.exog) - 1
+        self.df_model = _sparse.matrix_rank(self.exog) - 1
 
         if (self.freq_weights is not None) and \
            (self.freq_weights.shape[0] == self.endog.shape[0]):
@@ -402,7 +420,7 @@ class GLM(base.LikelihoodModel):
         """
         Evaluate the log-likelihood for a generalized linear model.
         """
-        lin_pred = np.dot(self.exog, params) + self._offset_exposure
+        lin_pred = _sparse.dot(self.exog, params) + self._offset_exposure
         expval = self.family.link.inverse(lin_pred)
         if scale is None:
             scale = self.estimate_scale(expval)
@@ -431,7 +449,7 @@ class GLM(base.LikelihoodModel):
         """
 
         score_factor = self.score_factor(params, scale=scale)
-        return score_factor[:, None] * self.exog
+        return _sparse.scale_rows(self.exog, score_factor)
 
     def score(self, params, scale=None):
         """score, first derivative of the loglikelihood function
@@ -453,7 +471,7 @@ class GLM(base.LikelihoodModel):
 
         """
         score_factor = self.score_factor(params, scale=scale)
-        return np.dot(score_factor, self.exog)
+        return _sparse.tdot(self.exog, score_factor)
 
     def score_factor(self, params, scale=None):
         """weights for score for each observation
@@ -573,9 +591,11 @@ class GLM(base.LikelihoodModel):
             else:
                 observed = True
 
-        tmp = getattr(self, '_tmp_like_exog', np.empty_like(self.exog))
-
         factor = self.hessian_factor(params, scale=scale, observed=observed)
+        if _sparse.issparse(self.exog):
+            return -_sparse.gram(self.exog, factor)
+
+        tmp = getattr(self, '_tmp_like_exog', np.empty_like(self.exog))
         np.multiply(self.exog.T, factor, out=tmp.T)
         return -tmp.T.dot(self.exog)
 
@@ -599,10 +619,17 @@ class GLM(base.LikelihoodModel):
         The value of the derivative of the expected endog with respect
         to the parameter vector.
         """
+        return _sparse.scale_rows(self.exog,
+                                  self._deriv_mean_dparams_factor(params))
+
+    def _deriv_mean_dparams_factor(self, params):
+        """
+        Factor of exog in the derivative of the expected endog
+
+        ``_deriv_mean_dparams(params)`` is ``factor[:, None] * exog``.
+        """
         lin_pred = self.predict(params, linear=True)
-        idl = self.family.link.inverse_deriv(lin_pred)
-        dmat = self.exog * idl[:, None]
-        return dmat
+        return self.family.link.inverse_deriv(lin_pred)
 
     def _deriv_score_obs_dendog(self, params, scale=None):
         """derivative of score_obs w.r.t. endog
@@ -623,6 +650,16 @@ class GLM(base.LikelihoodModel):
             can is given by `score_factor0[:, None] * exog` where
             `score_factor0` is the score_factor without the residual.
 
+        """
+        score_factor = self._deriv_score_obs_dendog_factor(params,
+                                                           scale=scale)
+        return _sparse.scale_rows(self.exog, score_factor)
+
+    def _deriv_score_obs_dendog_factor(self, params, scale=None):
+        """
+        Factor of exog in the derivative of score_obs w.r.t. endog
+
+        ``_deriv_score_obs_dendog(params)`` is ``factor[:, None] * exog``.
         """
         mu = self.predict(params)
         if scale is None:
@@ -635,7 +672,7 @@ class GLM(base.LikelihoodModel):
         if not scale == 1:
             score_factor /= scale
 
-        return score_factor[:, None] * self.exog
+        return score_factor
 
     def score_test(self, params_constrained, k_constraints=None,
                    exog_extra=None, observed=True):
@@ -870,7 +907,7 @@ class GLM(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
 
-        linpred = np.dot(exog, params) + offset + exposure
+        linpred = _sparse.dot(exog, params) + offset + exposure
         if linear:
             return linpred
         else:
@@ -999,7 +1036,7 @@ class GLM(base.LikelihoodModel):
         tol_criterion : str, optional
             Defaults to ``'deviance'``. Can optionally be ``'params'``.
         wls_method : str, optional
-            options are 'lstsq', 'pinv' and 'qr'
+            options are 'lstsq', 'pinv', 'qr' and 'cholesky'
             specifies which linear algebra function to use for the irls
             optimization. Default is `lstsq` which uses the same underlying
             svd based approach as 'pinv', but is faster during iterations.
@@ -1007,6 +1044,12 @@ class GLM(base.LikelihoodModel):
             near-singular cases by truncating small singular values based
             on `rcond` of the respective numpy.linalg function. 'qr' is
             only valied for cases that are not singular nor near-singular.
+            'cholesky' solves the normal equations with the Cholesky
+            factorization of the k x k matrix X'WX. It is the fastest
+            option and needs the least memory when nobs is much larger
+            than the number of parameters, but it is less accurate if the
+            design is ill-conditioned.  If exog is a scipy.sparse matrix, then
+            'cholesky' is always used.
 
         If a scipy optimizer is used, the following additional parameter is
         available:
@@ -1035,7 +1078,8 @@ class GLM(base.LikelihoodModel):
                                   cov_kwds=cov_kwds, use_t=use_t, **kwargs)
         else:
             self._optim_hessian = kwargs.get('optim_hessian')
-            self._tmp_like_exog = np.empty_like(self.exog)
+            if not _sparse.issparse(self.exog):
+                self._tmp_like_exog = np.empty_like(self.exog)
             fit_ = self._fit_gradient(start_params=start_params,
                                       method=method,
                                       maxiter=maxiter,
@@ -1046,9 +1090,132 @@ class GLM(base.LikelihoodModel):
                                       max_start_irls=max_start_irls,
                                       **kwargs)
             del self._optim_hessian
-            del self._tmp_like_exog
+            if hasattr(self, '_tmp_like_exog'):
+                del self._tmp_like_exog
             return fit_
 
+    def _group_model(self, rows, scaletype=None):
+        """
+        Shallow copy of the model restricted to the observations in rows.
+
+        The data handling and formula processing of the full model are not
+        repeated. The copy does not reference the full data.
+        """
+        import copy
+        mod = copy.copy(self)
+        mod.data = None
+        mod.scaletype = scaletype
+        for attr in ['endog', 'exog', 'freq_weights', 'var_weights',
+                     'iweights', 'n_trials', 'offset', 'exposure']:
+            value = getattr(self, attr, None)
+            if value is not None and np.ndim(value) > 0:
+                setattr(mod, attr, value[rows])
+        if np.ndim(self._offset_exposure) > 0:
+            mod._offset_exposure = self._offset_exposure[rows]
+        for attr in ['weights', 'mu', 'scale']:
+            mod.__dict__.pop(attr, None)
+        mod.nobs = mod.endog.shape[0]
+        mod.initialize()
+        return mod
+
+    def fit_grouped(self, groups, start_params=None, maxiter=100, tol=1e-8,
+                    scale=None, n_jobs=1, backend='threading', **kwargs):
+        """
+        Fit the model separately for each group of observations with IRLS.
+
+        The design matrix of the full model is reused for all groups, so
+        that formula and data processing is done only once.
+
+        Parameters
+        ----------
+        groups : array-like
+            1d array with the group label of each observation. It needs to
+            align with the rows of `endog` after missing value handling. A
+            pandas Series is aligned with the index of the data if the model
+            was created with pandas data.
+        start_params : array-like, optional
+            Starting values used for each group.
+        maxiter : int, optional
+            Maximum number of IRLS iterations.  Default is 100.
+        tol : float
+            Convergence tolerance.  Default is 1e-8.
+        scale : string or float, optional
+            See `GLM.fit`.
+        n_jobs : int
+            Number of jobs to run in parallel if joblib is available. -1 uses
+            all available CPUs. The default 1 fits the groups sequentially.
+        backend : str
+            joblib backend, 'threading' (default) or 'multiprocessing'.
+            Threads avoid copying the group data to worker processes, and
+            most of the work in the IRLS iterations is done in numpy and
+            LAPACK.
+        **kwargs
+            Additional keywords for IRLS, see `GLM.fit`.
+
+        Returns
+        -------
+        DataFrame
+            One row per group. The columns have two levels, ('params', name)
+            and ('bse', name) for each explanatory variable and the scalar
+            columns 'nobs', 'deviance', 'scale', 'converged', 'iterations'
+            and 'error'.  Groups for which the estimation failed have nan
+            params and the error message in column 'error'.
+
+        Notes
+        -----
+        Only estimation by IRLS and the nonrobust covariance are supported.
+        The groups are fit with the same family, offset, exposure and
+        weights as the full model, restricted to the rows of each group.
+        """
+        import pandas as pd
+        from statsmodels.tools.parallel import parallel_func
+
+        row_labels = getattr(self.data, 'row_labels', None)
+        if isinstance(groups, pd.Series) and row_labels is not None:
+            groups = groups.loc[row_labels]
+        groups = np.asarray(groups)
+        if groups.ndim != 1 or groups.shape[0] != self.nobs:
+            raise ValueError('groups needs to be 1d with the same length '
+                             'as endog')
+
+        labels, group_idx = np.unique(groups, return_inverse=True)
+        order = np.argsort(group_idx, kind='mergesort')
+        bounds = np.searchsorted(group_idx[order],
+                                 np.arange(len(labels) + 1))
+
+        fit_kwds = dict(start_params=start_params, maxiter=maxiter,
+                        tol=tol, scale=scale, **kwargs)
+        submodels = (self._group_model(order[bounds[i]:bounds[i + 1]],
+                                       scaletype=scale)
+                     for i in range(len(labels)))
+
+        if n_jobs == 1:
+            res = [_fit_group_irls(mod, fit_kwds) for mod in submodels]
+        else:
+            parallel, p_func, n_jobs = parallel_func(
+                _fit_group_irls, n_jobs, verbose=0, backend=backend)
+            res = parallel(p_func(mod, fit_kwds) for mod in submodels)
+        params, bse, deviance, scale_, converged, iterations, errors = \
+            zip(*res)
+
+        names = self.exog_names
+        columns = pd.MultiIndex.from_tuples(
+            [('params', name) for name in names] +
+            [('bse', name) for name in names] +
+            [(name, '') for name in ['nobs', 'deviance', 'scale',
+                                     'converged', 'iterations', 'error']])
+        frame = pd.DataFrame(np.column_stack((params, bse)),
+                             index=pd.Index(labels, name='group'),
+                             columns=columns[:2 * len(names)])
+        frame['nobs'] = np.diff(bounds)
+        frame['deviance'] = deviance
+        frame['scale'] = scale_
+        frame['converged'] = converged
+        frame['iterations'] = iterations
+        frame['error'] = errors
+        frame.columns = columns
+        return frame
+
     def _fit_gradient(self, start_params=None, method="newton",
                       maxiter=100, tol=1e-8, full_output=True,
                       disp=True, scale=None, cov_type='nonrobust',
@@ -1136,12 +1303,15 @@ class GLM(base.LikelihoodModel):
 
         endog = self.endog
         wlsexog = self.exog
+        if _sparse.issparse(wlsexog):
+            wls_method = 'cholesky'
         if start_params is None:
             start_params = np.zeros(self.exog.shape[1], np.float)
             mu = self.family.starting_mu(self.endog)
             lin_pred = self.family.predict(mu)
         else:
-            lin_pred = np.dot(wlsexog, start_params) + self._offset_exposure
+            lin_pred = (_sparse.dot(wlsexog, start_params) +
+                        self._offset_exposure)
             mu = self.family.fitted(lin_pred)
         self.scale = self.estimate_scale(mu)
         dev = self.family.deviance(self.endog, mu, self.var_weights,
@@ -1163,16 +1333,19 @@ class GLM(base.LikelihoodModel):
             self.scale = self.estimate_scale(mu)
             wls_results = lm.RegressionResults(self, start_params, None)
             iteration = 0
+        workspace = None
         for iteration in range(maxiter):
+            if workspace is None:
+                # buffers for the whitened data are allocated only once
+                workspace = reg_tools._WLSWorkspace(wlsexog)
             self.weights = (self.iweights * self.n_trials *
                             self.family.weights(mu))
             wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
                         - self._offset_exposure)
-            wls_mod = reg_tools._MinimalWLS(wlsendog, wlsexog,
-                                            self.weights, check_endog=True,
-                                            check_weights=True)
-            wls_results = wls_mod.fit(method=wls_method)
-            lin_pred = np.dot(self.exog, wls_results.params)
+            wls_results = workspace.fit(wlsendog, self.weights,
+                                        method=wls_method, check_endog=True,
+                                        check_weights=True)
+            lin_pred = _sparse.dot(self.exog, wls_results.params)
             lin_pred += self._offset_exposure
             mu = self.family.fitted(lin_pred)
             history = self._update_history(wls_results, mu, history)
@@ -1186,13 +1359,20 @@ class GLM(base.LikelihoodModel):
                 break
         self.mu = mu
 
-        if maxiter > 0:  # Only if iterative used
+        if maxiter > 0 and attach_wls:
             wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
             wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
             wls_results = wls_model.fit(method=wls_method2)
+            normalized_cov_params = wls_results.normalized_cov_params
+        elif maxiter > 0:
+            # reuse the factorization of the last WLS iteration
+            normalized_cov_params = workspace.normalized_cov_params()
+        else:
+            normalized_cov_params = None
+        del workspace
 
         glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+                                 normalized_cov_params,
                                  self.scale,
                                  cov_type=cov_type, cov_kwds=cov_kwds,
                                  use_t=use_t)
@@ -1262,6 +1442,7 @@ class GLM(base.LikelihoodModel):
             Coefficients below this threshold are treated as zero.
         """
 
+        _sparse.check_dense(self.exog, 'fit_regularized')
         if kwargs.get("L1_wt", 1) == 0:
             return self._fit_ridge(alpha, start_params)
 
@@ -1679,7 +1860,7 @@ class GLMResults(base.LikelihoodModelResults):
 
     get_prediction.__doc__ = pred.get_prediction_glm.__doc__
 
-    def get_hat_matrix_diag(self, observed=True):
+    def get_hat_matrix_diag(self, observed=True, chunksize=None):
         """
         Compute the diagonal of the hat matrix
 
@@ -1689,6 +1870,9 @@ class GLMResults(base.LikelihoodModelResults):
             If true, then observed hessian is used in the hat matrix
             computation. If false, then the expected hessian is used.
             In the case of a canonical link function both are the same.
+        chunksize : int, optional
+            Number of observations that are processed at once. The default
+            limits the temporary nobs x k arrays to about 2**22 elements.
 
         Returns
         -------
@@ -1697,12 +1881,13 @@ class GLMResults(base.LikelihoodModelResults):
             or expected hessian.
         """
         weights = self.model.hessian_factor(self.params, observed=observed)
-        wexog = np.sqrt(weights)[:, None] * self.model.exog
-
-        hd = (wexog * np.linalg.pinv(wexog).T).sum(1)
+        exog = self.model.exog
+        # w_i x_i pinv(X'WX) x_i' without forming the weighted exog
+        xtwx_pinv = np.linalg.pinv(_sparse.gram(exog, weights))
+        hd = weights * _sparse.quad_diag(exog, xtwx_pinv, chunksize=chunksize)
         return hd
 
-    def get_influence(self, observed=True):
+    def get_influence(self, observed=True, chunksize=None, n_jobs=1):
         """
         Get an instance of GLMInfluence with influence and outlier measures
 
@@ -1712,6 +1897,13 @@ class GLMResults(base.LikelihoodModelResults):
             If true, then observed hessian is used in the hat matrix
             computation. If false, then the expected hessian is used.
             In the case of a canonical link function both are the same.
+        chunksize : int, optional
+            Number of observations that are processed at once in the
+            computation of the hat matrix diagonal and of the influence
+            measures.
+        n_jobs : int
+            Number of threads that process the chunks of observations in
+            the influence measures if joblib is available.
 
         Returns
         -------
@@ -1726,15 +1918,14 @@ class GLMResults(base.LikelihoodModelResults):
         from statsmodels.stats.outliers_influence import GLMInfluence
 
         weights = self.model.hessian_factor(self.params, observed=observed)
-        weights_sqrt = np.sqrt(weights)
-        wexog = weights_sqrt[:, None] * self.model.exog
-        wendog = weights_sqrt * self.model.endog
 
         # using get_hat_matrix_diag has duplicated computation
-        hat_matrix_diag = self.get_hat_matrix_diag(observed=observed)
-        infl = GLMInfluence(self, endog=wendog, exog=wexog,
-                         resid=self.resid_pearson,
-                         hat_matrix_diag=hat_matrix_diag)
+        hat_matrix_diag = self.get_hat_matrix_diag(observed=observed,
+                                                   chunksize=chunksize)
+        infl = GLMInfluence(self, weights=weights,
+                            resid=self.resid_pearson,
+                            hat_matrix_diag=hat_matrix_diag,
+                            chunksize=chunksize, n_jobs=n_jobs)
         return infl
 
     def remove_data(self):
@@ -1886,3 +1886,49 @@ def test_ql_diff(family):
     qle2, _, _ = model2.qic(result2.params, result2.scale, result2.cov_params())
 
     assert_allclose(qle1 - qle2, qldiff, rtol=1e-5, atol=1e-5)
+
+
+@pytest.mark.parametrize("cs", [cov_struct.Independence,
+                                cov_struct.Exchangeable,
+                                cov_struct.Autoregressive,
+                                lambda: cov_struct.Stationary(max_lag=2,
+                                                              grid=True),
+                                lambda: cov_struct.Stationary(max_lag=2)])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_stacked_solve(cs, weighted):
+    # The covariance solves for clusters grouped by size agree with
+    # solving the clusters one at a time.
+    np.random.seed(3423)
+    sizes = np.random.randint(1, 6, size=150)
+    groups = np.repeat(np.arange(150), sizes)
+    np.random.shuffle(groups)
+    n = len(groups)
+    time = np.zeros(n)
+    for g in range(150):
+        ii = np.flatnonzero(groups == g)
+        time[ii] = np.sort(np.random.choice(8, len(ii), replace=False))
+    exog = tools.add_constant(np.random.normal(size=(n, 2)))
+    endog = np.random.poisson(np.exp(0.2 * exog.sum(1)))
+    weights = np.random.uniform(1, 2, size=150)[groups] if weighted else None
+
+    cs1, cs2 = cs(), cs()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model1 = gee.GEE(endog, exog, groups, time=time,
+                         family=families.Poisson(), cov_struct=cs1,
+                         weights=weights)
+        result1 = model1.fit()
+        model2 = gee.GEE(endog, exog, groups, time=time,
+                         family=families.Poisson(), cov_struct=cs2,
+                         weights=weights)
+        cs2.covariance_matrix_solve_stacked = (
+            lambda *args: cov_struct.CovStruct.covariance_matrix_solve_stacked(
+                cs2, *args))
+        result2 = model2.fit()
+
+    assert_allclose(result1.params, result2.params, rtol=1e-10)
+    assert_allclose(result1.cov_robust, result2.cov_robust, rtol=1e-10)
+    assert_allclose(result1.cov_naive, result2.cov_naive, rtol=1e-10)
+    assert_allclose(result1.scale, result2.scale, rtol=1e-10)
+    if cs1.dep_params is not None:
+        assert_allclose(cs1.dep_params, cs2.dep_params, rtol=1e-10)
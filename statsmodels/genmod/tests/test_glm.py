@@ -7,6 +7,7 @@ from statsmodels.compat import range
 import warnings
 import os
 import numpy as np
+import pandas as pd
 from numpy.testing import (assert_almost_equal, assert_equal, assert_raises,
                            assert_allclose, assert_, assert_array_less)
 import pytest
@@ -2235,3 +2236,147 @@ def test_non_invertible_hessian_fails_summary():
         mod = sm.GLM(data.endog, data.exog, family=sm.families.Gamma())
         res = mod.fit(maxiter=1, method='bfgs', max_start_irls=0)
         res.summary()
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_fit_grouped(n_jobs):
+    np.random.seed(987125)
+    nobs, n_groups = 600, 6
+    groups = np.random.randint(n_groups, size=nobs)
+    exog = add_constant(np.random.randn(nobs, 2))
+    exposure = np.random.uniform(1, 2, size=nobs)
+    linpred = exog.dot([0.2, 0.3, -0.2]) + 0.1 * groups + np.log(exposure)
+    endog = np.random.poisson(np.exp(linpred))
+    df = pd.DataFrame(exog, columns=['const', 'a', 'b'],
+                      index=np.arange(nobs)[::-1])
+    groups = pd.Series(groups, index=df.index)
+
+    mod = GLM(endog, df, family=sm.families.Poisson(), exposure=exposure)
+    res = mod.fit_grouped(groups, n_jobs=n_jobs)
+    assert_equal(res.shape, (n_groups, 12))
+    assert_equal(list(res['params'].columns), ['const', 'a', 'b'])
+    assert_equal(res['nobs'].sum(), nobs)
+    assert_(res['converged'].all())
+
+    for g in range(n_groups):
+        mask = (groups == g).values
+        res1 = GLM(endog[mask], exog[mask], family=sm.families.Poisson(),
+                   exposure=exposure[mask]).fit()
+        assert_allclose(res['params'].loc[g].values.astype(float),
+                        res1.params, rtol=1e-10)
+        assert_allclose(res['bse'].loc[g].values.astype(float),
+                        res1.bse, rtol=1e-10)
+        assert_allclose(res['deviance'].loc[g], res1.deviance, rtol=1e-10)
+        assert_equal(res['iterations'].loc[g],
+                     res1.fit_history['iteration'])
+
+    # the full model is not changed by the group fits
+    res_full = mod.fit()
+    res_full2 = GLM(endog, df, family=sm.families.Poisson(),
+                    exposure=exposure).fit()
+    assert_allclose(res_full.params, res_full2.params, rtol=1e-10)
+
+
+def test_fit_grouped_scale():
+    np.random.seed(987125)
+    nobs = 200
+    groups = np.repeat([0, 1], nobs // 2)
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = exog.dot([1., 0.5, -0.5]) + np.random.randn(nobs)
+    mod = GLM(endog, exog)
+    res = mod.fit_grouped(groups, scale='dev')
+    for g in range(2):
+        mask = groups == g
+        res1 = GLM(endog[mask], exog[mask]).fit(scale='dev')
+        assert_allclose(res['scale'].loc[g], res1.scale, rtol=1e-10)
+
+    # the scale option does not change the state of the full model
+    assert_(mod.scaletype is None)
+
+
+def test_fit_grouped_failure():
+    np.random.seed(987125)
+    nobs = 100
+    exog = add_constant(np.random.randn(nobs, 2))
+    endog = (np.random.rand(nobs) < 0.5).astype(float)
+    groups = np.repeat([0, 1], nobs // 2)
+    # perfect separation in the second group
+    endog[50:] = (exog[50:, 1] > 0)
+    mod = GLM(endog, exog, family=sm.families.Binomial())
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        res = mod.fit_grouped(groups)
+    assert_(res['converged'].loc[0])
+    assert_(res['error'].loc[0] is None)
+    assert_(not res['converged'].loc[1])
+    assert_(np.isnan(res['params'].loc[1].values.astype(float)).all())
+    assert_('separation' in res['error'].loc[1])
+
+    assert_raises(ValueError, mod.fit_grouped, groups[:10])
+
+
+@pytest.mark.parametrize('wls_method', ['pinv', 'qr', 'cholesky'])
+def test_irls_wls_method(wls_method):
+    np.random.seed(987125)
+    nobs = 500
+    exog = add_constant(np.random.randn(nobs, 3))
+    endog = np.random.poisson(np.exp(exog.dot([0.5, 0.2, -0.3, 0.1])))
+    mod = GLM(endog, exog, family=sm.families.Poisson())
+    res1 = mod.fit()
+    res2 = mod.fit(wls_method=wls_method)
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-8)
+    assert_allclose(res2.deviance, res1.deviance, rtol=1e-10)
+    assert_equal(res2.fit_history['iteration'],
+                 res1.fit_history['iteration'])
+
+    res3 = mod.fit(wls_method=wls_method, attach_wls=True)
+    assert_allclose(res3.params, res1.params, rtol=1e-8)
+    assert_allclose(res3.bse, res1.bse, rtol=1e-8)
+    assert_allclose(res3.results_wls.params, res3.params, rtol=1e-8)
+
+
+@pytest.mark.parametrize('method', ['irls', 'newton'])
+def test_sparse_exog(method):
+    from scipy import sparse
+    np.random.seed(46325)
+    nobs, n_groups = 500, 15
+    groups = np.random.randint(0, n_groups, size=nobs)
+    dummies = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                                shape=(nobs, n_groups))
+    exog = sparse.hstack((np.random.randn(nobs, 2), dummies)).tocsr()
+    lin_pred = exog.dot(np.r_[0.2, -0.3, 0.5 * np.random.randn(n_groups)])
+    endog = np.random.poisson(np.exp(lin_pred))
+    offset = np.random.uniform(-0.1, 0.1, size=nobs)
+
+    mod1 = GLM(endog, exog.toarray(), family=sm.families.Poisson(),
+               offset=offset)
+    res1 = mod1.fit(method=method, tol=1e-12)
+    mod2 = GLM(endog, exog, family=sm.families.Poisson(), offset=offset)
+    res2 = mod2.fit(method=method, tol=1e-12)
+    assert_equal(res2.df_model, res1.df_model)
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-6)
+    assert_allclose(res2.llf, res1.llf, rtol=1e-10)
+    assert_allclose(res2.deviance, res1.deviance, rtol=1e-10)
+    assert_allclose(mod2.score(res1.params), mod1.score(res1.params),
+                    rtol=1e-10, atol=1e-10)
+    assert_allclose(mod2.hessian(res1.params), mod1.hessian(res1.params),
+                    rtol=1e-10)
+    assert_allclose(res2.predict(exog[:5], offset=offset[:5]),
+                    res1.predict(exog[:5].toarray(), offset=offset[:5]),
+                    rtol=1e-8)
+
+    if method == 'irls':
+        pred1 = res1.get_prediction()
+        pred2 = res2.get_prediction()
+        assert_allclose(pred2.predicted_mean, pred1.predicted_mean,
+                        rtol=1e-8)
+        assert_allclose(pred2.se_mean, pred1.se_mean, rtol=1e-6)
+        for cov_type, cov_kwds in [('HC0', None),
+                                   ('cluster', {'groups': groups})]:
+            res1 = mod1.fit(cov_type=cov_type, cov_kwds=cov_kwds, tol=1e-12)
+            res2 = mod2.fit(cov_type=cov_type, cov_kwds=cov_kwds, tol=1e-12)
+            assert_equal(res2.bse.dtype, np.float64)
+            assert_allclose(res2.bse, res1.bse, rtol=1e-6)
+        assert_raises(NotImplementedError, mod2.fit_regularized, alpha=0.1)
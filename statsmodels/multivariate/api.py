@@ -1,10 +1,11 @@
 __all__ = [
     "PCA", "MANOVA", "Factor", "FactorResults", "CanCorr",
-    "factor_rotation"
+    "factor_rotation", "MultiEndogOLS"
 ]
 
 from .pca import PCA
 from .manova import MANOVA
 from .factor import Factor, FactorResults
 from .cancorr import CanCorr
+from .multivariate_ols import MultiEndogOLS
 from . import factor_rotation
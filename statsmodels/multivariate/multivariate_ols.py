@@ -549,3 +549,306 @@ class MultivariateTestResults(object):
                 df = pd.DataFrame(self.results[key]['constant_C'])
                 summ.add_df(df)
         return summ
+
+
+class MultiEndogOLS(Model):
+    """
+    OLS of several dependent variables on the same explanatory variables
+
+    Each column of `endog` is regressed separately on `exog`.  The design
+    matrix is factorized only once and the estimates and inferential
+    statistics are computed for all equations with vectorized operations.
+
+    Parameters
+    ----------
+    endog : array_like
+        Dependent variables. A nobs x k_endog array where nobs is
+        the number of observations and k_endog is the number of dependent
+        variables
+    exog : array_like
+        Independent variables. A nobs x k_exog array where nobs is the
+        number of observations and k_exog is the number of independent
+        variables. An intercept is not included by default and should be
+        added by the user.
+
+    Attributes
+    ----------
+    endog : array
+        See Parameters.
+    exog : array
+        See Parameters.
+
+    Notes
+    -----
+    The results are the same as those of ``OLS(endog[:, j], exog).fit()``
+    for each column j.  In contrast to `_MultivariateOLS`, the cross-products
+    of the dependent variables are not computed, so that the memory
+    requirement is linear in k_endog.
+
+    Missing values need to be dropped jointly for all columns of `endog`.
+    """
+    def __init__(self, endog, exog, missing='none', hasconst=None, **kwargs):
+        super(MultiEndogOLS, self).__init__(endog, exog, missing=missing,
+                                            hasconst=hasconst, **kwargs)
+        if self.endog.ndim == 1:
+            self.endog = self.endog[:, None]
+        self.nobs, self.k_exog = self.exog.shape
+        self.k_endog = self.endog.shape[1]
+
+    def fit(self, cov_type='nonrobust', use_t=None, rcond=1e-15):
+        """
+        Fit all equations using the singular value decomposition of exog.
+
+        Parameters
+        ----------
+        cov_type : str
+            'nonrobust' or one of the heteroscedasticity robust covariances
+            'HC0', 'HC1', 'HC2' and 'HC3'.  The robust covariance is
+            computed separately for each column of endog.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution for the
+            p-values.  The default is True for 'nonrobust' and False for the
+            robust covariances, as in `OLS`.
+        rcond : float
+            Cutoff for small singular values relative to the largest, as in
+            `pinv_extended`.
+
+        Returns
+        -------
+        results : MultiEndogOLSResults
+        """
+        cov_type = cov_type.upper()
+        if cov_type not in ('NONROBUST', 'HC0', 'HC1', 'HC2', 'HC3'):
+            raise ValueError('cov_type has to be "nonrobust", "HC0", "HC1", '
+                             '"HC2" or "HC3"')
+        if use_t is None:
+            use_t = cov_type == 'NONROBUST'
+        x = self.exog
+        y = self.endog
+        u, s, vt = svd(x, full_matrices=False)
+        mask = s > rcond * s.max()
+        rank = mask.sum()
+        u = u[:, mask]
+        v_s = vt[mask].T / s[mask]
+
+        # coordinates of endog in the column space of exog
+        effects = u.T.dot(y)
+        params = v_s.dot(effects)
+        normalized_cov_params = v_s.dot(v_s.T)
+
+        ssr = (y**2).sum(0) - (effects**2).sum(0)
+        ssr = np.clip(ssr, 0, np.inf)
+        if self.k_constant:
+            centered = y - y.mean(0)
+            tss = (centered**2).sum(0)
+        else:
+            tss = (y**2).sum(0)
+
+        df_resid = self.nobs - rank
+        df_model = rank - self.k_constant
+        scale = ssr / df_resid
+
+        if cov_type == 'NONROBUST':
+            var_params = np.diag(normalized_cov_params)[:, None] * scale
+            cov_params = None
+        else:
+            hat_diag = (u**2).sum(1) if cov_type in ('HC2', 'HC3') else None
+            cov_params = self._hc_cov(params, normalized_cov_params,
+                                      cov_type, df_resid, hat_diag)
+            var_params = np.diagonal(cov_params, axis1=1, axis2=2).T
+
+        return MultiEndogOLSResults(
+            self, params, np.sqrt(var_params), scale=scale, ssr=ssr, tss=tss,
+            df_resid=df_resid, df_model=df_model, rank=rank,
+            normalized_cov_params=normalized_cov_params,
+            cov_params=cov_params, cov_type=cov_type, use_t=use_t)
+
+    def _hc_cov(self, params, normalized_cov_params, cov_type, df_resid,
+                hat_diag, max_elements=2**22):
+        """
+        Heteroscedasticity robust covariances of all equations.
+
+        The residuals are computed in blocks of columns of endog, and the
+        outer products of the rows of exog in blocks of rows, so that the
+        temporary arrays have at most about `max_elements` elements.
+        """
+        x = self.exog
+        nobs, k_exog = x.shape
+        col_block = max(1, max_elements // nobs)
+        row_block = max(1, max_elements // k_exog**2)
+        cov = np.empty((self.k_endog, k_exog, k_exog))
+        for start in range(0, self.k_endog, col_block):
+            sl = slice(start, start + col_block)
+            het_scale = (self.endog[:, sl] - x.dot(params[:, sl]))**2
+            if cov_type == 'HC1':
+                het_scale *= nobs / df_resid
+            elif cov_type == 'HC2':
+                het_scale /= (1 - hat_diag)[:, None]
+            elif cov_type == 'HC3':
+                het_scale /= ((1 - hat_diag)**2)[:, None]
+
+            # meat[j] = x' diag(het_scale[:, j]) x for all j in the block
+            meat = np.zeros((het_scale.shape[1], k_exog * k_exog))
+            for row in range(0, nobs, row_block):
+                rows = slice(row, row + row_block)
+                xx = (x[rows, :, None] * x[rows, None, :]).reshape(
+                    -1, k_exog * k_exog)
+                meat += het_scale[rows].T.dot(xx)
+            meat = meat.reshape(-1, k_exog, k_exog)
+            cov[sl] = np.matmul(np.matmul(normalized_cov_params, meat),
+                                normalized_cov_params)
+        return cov
+
+
+class MultiEndogOLSResults(object):
+    """
+    Results of MultiEndogOLS
+
+    All attributes are arrays with one column, or one element, per
+    dependent variable.
+
+    Attributes
+    ----------
+    params : ndarray
+        k_exog x k_endog array of parameter estimates
+    bse : ndarray
+        k_exog x k_endog array of standard errors of the parameters
+    tvalues : ndarray
+        k_exog x k_endog array of t-statistics
+    pvalues : ndarray
+        k_exog x k_endog array of two-sided p-values based on the t
+        distribution if `use_t` is True and on the normal distribution
+        otherwise
+    scale : ndarray
+        Residual variance `ssr / df_resid` of each equation.
+    ssr : ndarray
+        Sum of squared residuals of each equation.
+    rsquared : ndarray
+        Coefficient of determination of each equation, uncentered if the
+        model has no constant.
+    rsquared_adj : ndarray
+        Adjusted R-squared of each equation.
+    fvalue : ndarray
+        F-statistic for the hypothesis that all slope coefficients are zero.
+        With a robust cov_type this is the Wald F-statistic based on the
+        robust covariance of each equation.
+    f_pvalue : ndarray
+        p-value of the F-statistic.
+    cov_params_all : ndarray or None
+        k_endog x k_exog x k_exog array of heteroscedasticity robust
+        covariances, None if cov_type is 'nonrobust'.
+    normalized_cov_params : ndarray
+        (X'X)^{-1}, which is common to all equations.
+    df_resid : int
+    df_model : int
+    """
+    def __init__(self, model, params, bse, scale, ssr, tss, df_resid,
+                 df_model, rank, normalized_cov_params, cov_params, cov_type,
+                 use_t):
+        self.model = model
+        self.params = params
+        self.bse = bse
+        self.scale = scale
+        self.ssr = ssr
+        self.tss = tss
+        self.df_resid = df_resid
+        self.df_model = df_model
+        self.rank = rank
+        self.normalized_cov_params = normalized_cov_params
+        self.cov_params_all = cov_params
+        self.use_t = use_t
+        self.cov_type = cov_type.lower() if cov_type == 'NONROBUST' \
+            else cov_type
+        self.exog_names = model.exog_names
+        self.endog_names = model.endog_names
+        if not isinstance(self.endog_names, list):
+            self.endog_names = [self.endog_names]
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        if self.use_t:
+            return stats.t.sf(np.abs(self.tvalues), self.df_resid) * 2
+        return stats.norm.sf(np.abs(self.tvalues)) * 2
+
+    @property
+    def rsquared(self):
+        return 1 - self.ssr / self.tss
+
+    @property
+    def rsquared_adj(self):
+        return 1 - (np.divide(self.model.nobs - self.model.k_constant,
+                              self.df_resid) * (1 - self.rsquared))
+
+    @property
+    def fvalue(self):
+        if self.cov_params_all is not None:
+            return self._robust_wald_f()[0]
+        return ((self.tss - self.ssr) / self.df_model) / self.scale
+
+    @property
+    def f_pvalue(self):
+        if self.cov_params_all is not None:
+            fvalue, df_num = self._robust_wald_f()
+            return stats.f.sf(fvalue, df_num, self.df_resid)
+        return stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    def _robust_wald_f(self):
+        """
+        Wald F-statistic that all slope coefficients are zero based on the
+        robust covariances, as in `RegressionResults.fvalue`.
+        """
+        k_params = self.params.shape[0]
+        idx = list(range(k_params))
+        if self.model.data.k_constant == 1:
+            const_idx = self.model.data.const_idx
+            # an implicit constant gives nan, see #2444
+            if const_idx is None or k_params == 1:
+                return np.full(self.model.k_endog, np.nan), 0
+            idx.pop(const_idx)
+        params = self.params[idx].T
+        cov = self.cov_params_all[:, idx][:, :, idx]
+        stat = np.matmul(np.linalg.pinv(cov), params[:, :, None])[..., 0]
+        df_num = len(idx)
+        return (params * stat).sum(1) / df_num, df_num
+
+    def cov_params(self, column):
+        """
+        Covariance of the parameters of one equation
+
+        Parameters
+        ----------
+        column : int
+            Index of the dependent variable.
+
+        Returns
+        -------
+        cov : ndarray
+            k_exog x k_exog covariance matrix of the parameter estimates
+        """
+        if self.cov_params_all is not None:
+            return self.cov_params_all[column]
+        return self.normalized_cov_params * self.scale[column]
+
+    def summary_frame(self):
+        """
+        Return parameter estimates and inference as a long DataFrame
+
+        Returns
+        -------
+        frame : DataFrame
+            DataFrame with a (endog, exog) MultiIndex and columns params,
+            bse, tvalues and pvalues.
+        """
+        index = pd.MultiIndex.from_product([self.endog_names,
+                                            self.exog_names],
+                                           names=['endog', 'exog'])
+        data = {'params': self.params.T.ravel(),
+                'bse': self.bse.T.ravel(),
+                'tvalues': self.tvalues.T.ravel(),
+                'pvalues': self.pvalues.T.ravel()}
+        return pd.DataFrame(data, index=index,
+                            columns=['params', 'bse', 'tvalues', 'pvalues'])
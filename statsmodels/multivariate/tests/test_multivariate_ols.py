@@ -2,9 +2,14 @@
 
 import numpy as np
 import pandas as pd
-from statsmodels.multivariate.multivariate_ols import _MultivariateOLS
-from numpy.testing import assert_array_almost_equal, assert_raises
+from statsmodels.multivariate.multivariate_ols import (
+    _MultivariateOLS, MultiEndogOLS)
+from statsmodels.regression.linear_model import OLS
+from statsmodels.tools.tools import add_constant
+from numpy.testing import (assert_array_almost_equal, assert_raises,
+                           assert_allclose, assert_equal)
 import patsy
+import pytest
 
 data = pd.DataFrame([['Morphine', 'N', .04, .20, .10, .08],
                      ['Morphine', 'N', .02, .06, .02, .02],
@@ -199,3 +204,39 @@ def test_affine_hypothesis():
     assert_array_almost_equal(r0['test1']['stat'].values, a, decimal=4)
     r0.summary(show_contrast_L=True, show_transform_M=True,
                show_constant_C=True)
+
+
+@pytest.mark.parametrize('cov_type', ['nonrobust', 'HC0', 'HC1', 'HC2',
+                                      'HC3'])
+def test_multi_endog_ols(cov_type):
+    np.random.seed(987124)
+    nobs, k_exog, k_endog = 100, 4, 7
+    exog = add_constant(np.random.randn(nobs, k_exog - 1))
+    endog = (exog.dot(np.random.randn(k_exog, k_endog)) +
+             np.random.randn(nobs, k_endog) * (1 + np.abs(exog[:, 1:2])))
+    res = MultiEndogOLS(endog, exog).fit(cov_type=cov_type)
+    for j in range(k_endog):
+        res1 = OLS(endog[:, j], exog).fit(cov_type=cov_type)
+        for attr in ['params', 'bse', 'tvalues', 'pvalues']:
+            assert_allclose(getattr(res, attr)[:, j], getattr(res1, attr),
+                            rtol=1e-10, err_msg=attr)
+        for attr in ['scale', 'ssr', 'rsquared', 'rsquared_adj']:
+            assert_allclose(getattr(res, attr)[j], getattr(res1, attr),
+                            rtol=1e-10, err_msg=attr)
+        assert_allclose(res.cov_params(j), res1.cov_params(), rtol=1e-10)
+        assert_allclose(res.fvalue[j], res1.fvalue, rtol=1e-10)
+        assert_allclose(res.f_pvalue[j], res1.f_pvalue, rtol=1e-10)
+
+
+def test_multi_endog_ols_pandas():
+    df = data.copy()
+    endog_names = ['Histamine0', 'Histamine1', 'Histamine3', 'Histamine5']
+    exog = add_constant(df['Depleted'] == 'Y').astype(float)
+    res = MultiEndogOLS(df[endog_names], exog).fit()
+    frame = res.summary_frame()
+    assert_equal(frame.shape, (8, 4))
+    assert_equal(list(frame.index.levels[0]), endog_names)
+    res1 = OLS(df['Histamine3'], exog).fit()
+    assert_allclose(frame.loc['Histamine3', 'params'], res1.params,
+                    rtol=1e-10)
+    assert_allclose(frame.loc['Histamine3', 'bse'], res1.bse, rtol=1e-10)
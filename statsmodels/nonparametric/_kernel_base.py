@@ -247,6 +247,8 @@ class GenericKDE (object):
         self.efficient = defaults.efficient
         self.return_only_bw = defaults.return_only_bw
         self.n_jobs = defaults.n_jobs
+        self.evaluation = defaults.evaluation
+        self.gridsize = defaults.gridsize
 
     def _normal_reference(self):
         """
@@ -377,15 +379,39 @@ class EstimatorSettings(object):
         ``n_cores`` the number of available CPU cores.
         See the `joblib documentation
         <https://pythonhosted.org/joblib/parallel.html>`_ for more details.
+    evaluation : str, optional
+        How the kernel sums over the training data are evaluated by
+        `KDEMultivariate` and `KernelReg`.  If 'exact' (default), the sums
+        are computed directly in blocks of evaluation points.  If 'binned',
+        the continuous variables are linearly binned on a grid and the sums
+        are computed with the FFT, which is much faster for large samples
+        with few continuous variables, see Notes.
+    gridsize : int or array_like, optional
+        The number of grid points for each continuous variable if
+        ``evaluation='binned'``.  Default is a spacing of an eighth of the
+        normal reference bandwidth, with at most 2**12 points for each
+        variable and 2**18 in total.
 
     Examples
     --------
     >>> settings = EstimatorSettings(randomize=True, n_jobs=3)
     >>> k_dens = KDEMultivariate(data, var_type, defaults=settings)
 
+    Notes
+    -----
+    With ``evaluation='binned'``, the cost of evaluating the density, the
+    cdf, the regression fits and the cross-validation objectives at all
+    observations is of order ``nobs`` plus the cost of the FFT over the grid,
+    instead of ``nobs**2``, so that cross-validated bandwidths can be
+    computed for large samples.
+    The linear binning approximation error is of the order of the squared
+    ratio of grid spacing to bandwidth.  The exact evaluation is used if the
+    default grid is coarser than half of the bandwidth, which is usually the
+    case for more than three continuous variables.
     """
     def __init__(self, efficient=False, randomize=False, n_res=25, n_sub=50,
-                 return_median=True, return_only_bw=False, n_jobs=-1):
+                 return_median=True, return_only_bw=False, n_jobs=-1,
+                 evaluation='exact', gridsize=None):
         self.efficient = efficient
         self.randomize = randomize
         self.n_res = n_res
@@ -393,6 +419,10 @@ class EstimatorSettings(object):
         self.return_median = return_median
         self.return_only_bw = return_only_bw  # TODO: remove this?
         self.n_jobs = n_jobs
+        if evaluation not in ('exact', 'binned'):
+            raise ValueError("evaluation should be 'exact' or 'binned'")
+        self.evaluation = evaluation
+        self.gridsize = gridsize
 
 
 class LeaveOneOut(object):
@@ -518,3 +548,109 @@ def gpke(bw, data, data_predict, var_type, ckertype='gaussian',
         return dens.sum(axis=0)
     else:
         return dens
+
+
+def gpke_blocks(bw, data, data_predict, var_type, ckertype='gaussian',
+                okertype='wangryzin', ukertype='aitchisonaitken',
+                block_size=None):
+    """
+    Generalized Product Kernel Estimator in blocks of evaluation points
+
+    Parameters
+    ----------
+    bw: 1-D ndarray
+        The user-specified bandwidth parameters.
+    data: 2-D ndarray
+        The training data.
+    data_predict: 2-D ndarray
+        The evaluation points at which the kernel estimation is performed.
+    var_type: str, optional
+        The variable type (continuous, ordered, unordered).
+    ckertype: str, optional
+        The kernel used for the continuous variables.
+    okertype: str, optional
+        The kernel used for the ordered discrete variables.
+    ukertype: str, optional
+        The kernel used for the unordered discrete variables.
+    block_size : int, optional
+        The number of evaluation points in each block.  Default is chosen so
+        that each block holds about one million kernel values.
+
+    Yields
+    ------
+    index : slice
+        The rows of `data_predict` in the block.
+    dens : ndarray
+        Array of shape (n_block, nobs) with the product kernel of each
+        evaluation point in the block, the same as ``gpke(..., tosum=False)``.
+
+    Notes
+    -----
+    The kernels of the discrete variables only depend on the levels of the
+    variables, so they are evaluated once for each pair of levels.
+    """
+    kertypes = dict(c=ckertype, o=okertype, u=ukertype)
+    nobs = data.shape[0]
+    n_predict = data_predict.shape[0]
+    if block_size is None:
+        block_size = max(1, 2**20 // max(nobs, 1))
+
+    discrete = []
+    for ii, vtype in enumerate(var_type):
+        if vtype == 'c':
+            continue
+        func = kernel_func[kertypes[vtype]]
+        levels, data_codes = np.unique(data[:, ii], return_inverse=True)
+        values, predict_codes = np.unique(data_predict[:, ii],
+                                          return_inverse=True)
+        table = np.array([func(bw[ii], levels, x) for x in values])
+        discrete.append((table, predict_codes, data_codes))
+
+    iscontinuous = np.array([c == 'c' for c in var_type])
+    bw_cont_product = np.prod(bw[iscontinuous])
+    func = kernel_func[ckertype]
+    for start in range(0, n_predict, block_size):
+        index = slice(start, min(start + block_size, n_predict))
+        dens = np.ones((index.stop - index.start, nobs))
+        for ii in np.nonzero(iscontinuous)[0]:
+            dens *= func(bw[ii], data[:, ii], data_predict[index, ii, None])
+        for table, predict_codes, data_codes in discrete:
+            dens *= table[predict_codes[index]][:, data_codes]
+        yield index, dens / bw_cont_product
+
+
+def _gpke_sum(bw, data, data_predict, var_type, leave_out=None, **kertypes):
+    # Sum of the product kernel over the training data for each evaluation
+    # point, optionally leaving out observation leave_out[i] for point i
+    return _gpke_moments(bw, data, data_predict, var_type,
+                         leave_out=leave_out, **kertypes)[0][:, 0]
+
+
+def _gpke_moments(bw, data, data_predict, var_type, weights=None, degree=0,
+                  leave_out=None, **kertypes):
+    # Weighted sums over the training data of the product kernel times the
+    # differences data - data_predict and their outer products, see
+    # binned_kernel_moments for the shapes of the returned arrays
+    nobs, k_vars = data.shape
+    n_predict = data_predict.shape[0]
+    weights = (np.ones((nobs, 1)) if weights is None
+               else np.reshape(weights, (nobs, -1)))
+    n_cols = weights.shape[1]
+    moments = [np.empty((n_predict, n_cols)),
+               np.empty((n_predict, k_vars, n_cols)),
+               np.empty((n_predict, k_vars, k_vars, n_cols))][:degree + 1]
+    block_size = max(1, 2**20 // (nobs * (k_vars + 1 if degree else 1)))
+    for index, dens in gpke_blocks(bw, data, data_predict, var_type,
+                                   block_size=block_size, **kertypes):
+        if leave_out is not None:
+            dens[np.arange(dens.shape[0]), leave_out[index]] = 0
+        moments[0][index] = np.dot(dens, weights)
+        if degree > 0:
+            diff = data - data_predict[index, None, :]
+            dens_diff = (dens[..., None] * diff).transpose(0, 2, 1)
+            moments[1][index] = np.matmul(dens_diff, weights)
+        if degree > 1:
+            for i in range(n_cols):
+                moments[2][index, ..., i] = np.matmul(
+                    dens_diff * weights[:, i], diff)
+    return moments
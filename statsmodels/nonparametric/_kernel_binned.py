@@ -0,0 +1,361 @@
+"""
+Binned evaluation of generalized product kernel sums.
+
+The continuous variables of the training data are linearly binned on a
+regular grid, separately for each cell of the discrete variables.  The kernel
+sums at the grid points are the discrete convolution of the bin counts with
+the kernel, which is computed with the FFT, and they are linearly interpolated
+at the evaluation points.  The discrete kernels only depend on the levels of
+the variables, so the sums of the cells are combined with the product of the
+discrete kernels of each cell.
+
+The same convolutions give weighted sums and the moments of the differences
+``data - data_predict`` used by the local polynomial regressions, the kernel
+at lag ``u`` is then multiplied by the powers of ``-u``.
+
+The cost is of order ``nobs + n_predict + n_cells * G log(G)`` with ``G`` the
+number of grid points, instead of ``nobs * n_predict`` for the exact sums.
+"""
+from __future__ import division
+
+import itertools
+
+import numpy as np
+from scipy.fftpack import next_fast_len
+
+from scipy import sparse
+
+from ._kernel_base import kernel_func, _gpke_moments, _gpke_sum
+
+
+MAX_GRIDSIZE = 2**18
+MAX_GRIDSIZE_VARIABLE = 2**12
+
+
+def _grid(data, bw, gridsize):
+    # Regular grid spanning the data.  The default spacing is an eighth of the
+    # normal reference bandwidth, it does not depend on the bandwidth so that
+    # the cross-validation objectives are smooth in the bandwidth
+    nobs, k_vars = data.shape
+    lower = data.min(0)
+    upper = np.maximum(data.max(0), lower + np.abs(bw))
+    if gridsize is None:
+        bw_reference = 1.06 * data.std(0) * nobs**(-1. / (4 + k_vars))
+        gridsize = np.ceil(8 * (upper - lower) / bw_reference) + 1
+        gridsize = np.minimum(gridsize, min(MAX_GRIDSIZE**(1. / k_vars),
+                                            MAX_GRIDSIZE_VARIABLE))
+    shape = np.maximum(np.broadcast_to(gridsize, lower.shape), 2).astype(int)
+    delta = (upper - lower) / (shape - 1)
+    return lower, delta, tuple(shape)
+
+
+def _corners(points, lower, delta, shape):
+    # Linear binning weights and flat grid indices of the corners of the grid
+    # cell containing each point
+    pos = (points - lower) / delta
+    base = np.clip(np.floor(pos).astype(int), 0, np.array(shape) - 2)
+    frac = pos - base
+    bits = np.array(list(itertools.product([0, 1], repeat=len(shape))))
+    weights = np.where(bits, frac[:, None, :], 1 - frac[:, None, :]).prod(-1)
+    index = np.ravel_multi_index(
+        tuple(np.rollaxis(base[:, None, :] + bits, -1)), shape)
+    return weights, index, frac
+
+
+def _kernel_fft(func, bw, delta, shape, fshape, powers=None):
+    # FFT of the kernel at all lags between grid points, wrapped around so
+    # that the circular convolution of length fshape equals the linear one.
+    # The kernel of variable i is multiplied by (-lag)**powers[i], the
+    # difference between the training point and the evaluation point
+    kernel = np.ones(fshape)
+    for i, (n, m) in enumerate(zip(shape, fshape)):
+        lag = np.arange(m)
+        lag = np.where(lag < n, lag, lag - m)
+        values = func(bw[i], 0., lag * delta[i])
+        if powers is not None and powers[i]:
+            values = values * (-lag * delta[i])**powers[i]
+        values[np.abs(lag) >= n] = 0
+        kernel *= values.reshape((-1,) + (1,) * (len(shape) - i - 1))
+    return np.fft.rfftn(kernel)
+
+
+def binned_kernel_moments(bw, data, data_predict, var_type, weights=None,
+                          degree=0, loo=False, gridsize=None,
+                          ckertype='gaussian', okertype='wangryzin',
+                          ukertype='aitchisonaitken'):
+    """
+    Approximate weighted kernel sums and moments using binned data.
+
+    Parameters
+    ----------
+    bw : 1-D ndarray
+        The bandwidth parameters.
+    data : 2-D ndarray
+        The training data, shape (nobs, k_vars).
+    data_predict : 2-D ndarray
+        The evaluation points.  If `loo` is True, this has to be `data`.
+    var_type : str
+        The variable type (continuous, ordered, unordered).
+    weights : ndarray, optional
+        The weights of the training data, shape (nobs,) or (nobs, n_cols).
+        Default is a single column of ones.
+    degree : {0, 1, 2}, optional
+        The highest moment of the differences that is returned.
+    loo : bool, optional
+        If True, observation i of the training data is left out of the sums
+        for the evaluation point i.
+    gridsize : int or array_like, optional
+        The number of grid points for each continuous variable, see
+        `binned_kernel_sum`.
+    ckertype, okertype, ukertype : str, optional
+        The kernels of the continuous, ordered discrete and unordered
+        discrete variables, see `gpke`.
+
+    Returns
+    -------
+    moments : list of ndarray
+        The first ``degree + 1`` of the weighted sums over the training data
+
+        - ``sum_j w_j K_j``, shape (n_predict, n_cols)
+        - ``sum_j w_j K_j d_j``, shape (n_predict, k_vars, n_cols)
+        - ``sum_j w_j K_j d_j d_j'``, shape (n_predict, k_vars, k_vars,
+          n_cols)
+
+        where ``K_j`` is the product kernel divided by the product of the
+        continuous bandwidths and ``d_j = data[j] - data_predict[i]``.
+
+    Notes
+    -----
+    The differences of the discrete variables are exact, the differences of
+    the continuous variables are those between the grid points.  Evaluation
+    points outside of the grid are evaluated exactly.
+    """
+    kertypes = dict(ckertype=ckertype, okertype=okertype, ukertype=ukertype)
+    bw = np.asarray(bw, dtype=float)
+    nobs, k_vars = data.shape
+    n_predict = data_predict.shape[0]
+    weights = (np.ones((nobs, 1)) if weights is None
+               else np.reshape(weights, (nobs, -1)))
+    n_cols = weights.shape[1]
+    iscontinuous = np.array([c == 'c' for c in var_type])
+    leave_out = np.arange(n_predict) if loo else None
+
+    def exact(rows):
+        return _gpke_moments(bw, data, data_predict[rows], var_type,
+                             weights=weights, degree=degree,
+                             leave_out=leave_out[rows] if loo else None,
+                             **kertypes)
+
+    bw_cont = bw[iscontinuous]
+    if not np.all(np.isfinite(bw_cont)) or np.any(bw_cont == 0):
+        return exact(slice(None))
+
+    # Cells of the discrete variables, and the discrete kernels between each
+    # evaluation point and each cell
+    names = dict(o=okertype, u=ukertype)
+    disc = np.nonzero(~iscontinuous)[0]
+    data_codes = []
+    tables = []
+    predict_codes = []
+    levels_all = []
+    for ii in disc:
+        func = kernel_func[names[var_type[ii]]]
+        levels, codes = np.unique(data[:, ii], return_inverse=True)
+        values, pcodes = np.unique(data_predict[:, ii], return_inverse=True)
+        data_codes.append(codes)
+        tables.append(np.array([func(bw[ii], levels, x) for x in values]))
+        predict_codes.append(pcodes)
+        levels_all.append(levels)
+    if tables:
+        cells, cell_index = np.unique(np.column_stack(data_codes), axis=0,
+                                      return_inverse=True)
+    else:
+        cells = np.zeros((1, 0), dtype=int)
+        cell_index = np.zeros(nobs, dtype=int)
+
+    # Bin the continuous variables on a common grid
+    cont = np.nonzero(iscontinuous)[0]
+    k_cont = len(cont)
+    if k_cont:
+        predict_cont = data_predict[:, cont]
+        lower, delta, shape = _grid(data[:, cont], bw_cont, gridsize)
+        if gridsize is None and np.any(delta > np.abs(bw_cont) / 2):
+            return exact(slice(None))
+        pos = (predict_cont - lower) / delta
+        inside = np.all((pos > -1e-8) & (pos < np.array(shape) - 1 + 1e-8),
+                        axis=1)
+        b_weights, b_index, _ = _corners(data[:, cont], lower, delta, shape)
+        p_weights, p_index, p_frac = _corners(predict_cont[inside], lower,
+                                              delta, shape)
+        fshape = tuple(next_fast_len(2 * n - 1) for n in shape)
+    else:
+        shape = fshape = ()
+        inside = np.ones(n_predict, dtype=bool)
+        b_weights = np.ones((nobs, 1))
+        b_index = np.zeros((nobs, 1), dtype=int)
+        p_weights = np.ones((n_predict, 1))
+        p_index = np.zeros((n_predict, 1), dtype=int)
+    size = int(np.prod(shape))
+    n_inside = inside.sum()
+    predict_disc = data_predict[inside][:, disc]
+
+    # Kernels for the powers of the continuous differences
+    func = kernel_func[ckertype]
+    powers = [a for a in itertools.product(range(degree + 1), repeat=k_cont)
+              if sum(a) <= degree]
+    kernels = dict((a, _kernel_fft(func, bw_cont, delta, shape, fshape, a))
+                   for a in powers if k_cont)
+    axes = tuple(range(1, k_cont + 1))
+    grid_slice = (slice(None),) + tuple(slice(0, n) for n in shape)
+    # Bound the memory of the convolutions and of the interpolation
+    chunk = max(1, 2**22 // max(int(np.prod(fshape)),
+                                n_inside * p_index.shape[1]))
+
+    def terms(variables):
+        # Power of each continuous variable and the discrete variables in a
+        # moment given by a sequence of variable indices
+        power = [0] * k_cont
+        discrete = []
+        for s in variables:
+            if iscontinuous[s]:
+                power[list(cont).index(s)] += 1
+            else:
+                discrete.append(list(disc).index(s))
+        return tuple(power), discrete
+
+    moment_vars = [list(itertools.product(range(k_vars), repeat=d))
+                   for d in range(degree + 1)]
+    moments = [np.zeros((n_inside,) + (k_vars,) * d + (n_cols,))
+               for d in range(degree + 1)]
+    for c, cell in enumerate(cells):
+        dens_disc = np.ones(n_inside)
+        for s, table in enumerate(tables):
+            dens_disc *= table[predict_codes[s][inside], cell[s]]
+        diff_disc = np.array([levels_all[s][cell[s]]
+                              for s in range(len(disc))]) - predict_disc
+        member = np.nonzero(cell_index == c)[0]
+        binning = sparse.csr_matrix(
+            (b_weights[member].ravel(),
+             (b_index[member].ravel(),
+              np.repeat(np.arange(len(member)), b_index.shape[1]))),
+            shape=(size, len(member)))
+
+        # Sums of the weights smoothed with each moment kernel
+        sums = dict((a, np.empty((n_inside, n_cols))) for a in powers)
+        for start in range(0, n_cols, chunk):
+            cols = slice(start, min(start + chunk, n_cols))
+            counts = np.asarray(binning.dot(weights[member, cols])).T
+            if not k_cont:
+                sums[()][:, cols] = counts[:, p_index[:, 0]].T
+                continue
+            counts_fft = np.fft.rfftn(counts.reshape((-1,) + shape), fshape,
+                                      axes=axes)
+            for a in powers:
+                smoothed = np.fft.irfftn(counts_fft * kernels[a], fshape,
+                                         axes=axes)[grid_slice]
+                smoothed = smoothed.reshape(-1, size)
+                sums[a][:, cols] = (smoothed[:, p_index] *
+                                    p_weights).sum(-1).T
+
+        for d, variables in enumerate(moment_vars):
+            moment = moments[d].reshape(n_inside, k_vars**d, n_cols)
+            for m, var in enumerate(variables):
+                power, discrete = terms(var)
+                factor = dens_disc * np.prod(diff_disc[:, discrete], axis=1)
+                moment[:, m] += factor[:, None] * sums[power]
+
+    if loo:
+        # Binned contribution of each observation to its own sums, the
+        # discrete differences are zero
+        own = np.ones(n_predict)
+        for s, table in enumerate(tables):
+            own *= table[predict_codes[s], data_codes[s]]
+        own_cont = {}
+        for i in range(k_cont):
+            k_zero, k_delta, k_minus = func(
+                bw_cont[i], 0., np.array([0, delta[i], -delta[i]]))
+            w1 = p_frac[:, i]
+            w0 = 1 - w1
+            for q in range(degree + 1):
+                own_cont[i, q] = ((w0**2 + w1**2) * k_zero * 0.**q +
+                                  w0 * w1 * (k_delta * (-delta[i])**q +
+                                             k_minus * delta[i]**q))
+        for d, variables in enumerate(moment_vars):
+            moment = moments[d].reshape(n_inside, k_vars**d, n_cols)
+            for m, var in enumerate(variables):
+                power, discrete = terms(var)
+                if discrete:
+                    continue
+                factor = own.copy()
+                for i, q in enumerate(power):
+                    factor *= own_cont[i, q]
+                moment[:, m] -= factor[:, None] * weights
+
+    prod_bw = np.prod(bw_cont)
+    if inside.all():
+        return [moment / prod_bw for moment in moments]
+    outside = exact(~inside)
+    result = []
+    for moment, moment_out in zip(moments, outside):
+        full = np.empty((n_predict,) + moment.shape[1:])
+        full[inside] = moment / prod_bw
+        full[~inside] = moment_out
+        result.append(full)
+    return result
+
+
+def binned_kernel_sum(bw, data, data_predict, var_type, loo=False,
+                      gridsize=None, ckertype='gaussian', okertype='wangryzin',
+                      ukertype='aitchisonaitken'):
+    """
+    Approximate sums of the generalized product kernel using binned data.
+
+    Parameters
+    ----------
+    bw : 1-D ndarray
+        The bandwidth parameters.
+    data : 2-D ndarray
+        The training data.
+    data_predict : 2-D ndarray
+        The evaluation points.  If `loo` is True, this has to be `data`.
+    var_type : str
+        The variable type (continuous, ordered, unordered).
+    loo : bool, optional
+        If True, observation i of the training data is left out of the sum
+        for the evaluation point i.
+    gridsize : int or array_like, optional
+        The number of grid points for each continuous variable.  Default is
+        a spacing of an eighth of the normal reference bandwidth, with at
+        most `MAX_GRIDSIZE_VARIABLE` points for each variable and
+        `MAX_GRIDSIZE` points in total.  In that case, if the grid spacing is
+        larger than half of the bandwidth the sums are evaluated exactly.
+    ckertype, okertype, ukertype : str, optional
+        The kernels of the continuous, ordered discrete and unordered
+        discrete variables, see `gpke`.  The kernels have to be nonnegative.
+
+    Returns
+    -------
+    dens_sum : ndarray
+        The sum of the product kernel over the training data for each
+        evaluation point, approximating ``gpke`` with ``tosum=True``.
+
+    Notes
+    -----
+    The leave-one-out sums subtract the contribution of the binned
+    observation itself, so they are the binned sums of the remaining
+    observations.  Evaluation points outside of the grid and points where
+    the binned sum is negligible relative to the largest sum are evaluated
+    exactly.
+    """
+    kertypes = dict(ckertype=ckertype, okertype=okertype, ukertype=ukertype)
+    dens_sum = binned_kernel_moments(bw, data, data_predict, var_type,
+                                     loo=loo, gridsize=gridsize,
+                                     **kertypes)[0][:, 0]
+
+    # Exact sums where the binned sums are unreliable
+    exact = dens_sum <= 1e-10 * dens_sum.max()
+    if exact.any():
+        leave_out = np.nonzero(exact)[0] if loo else None
+        dens_sum[exact] = _gpke_sum(bw, data, data_predict[exact], var_type,
+                                    leave_out=leave_out, **kertypes)
+    return np.maximum(dens_sum, 0)
@@ -1,11 +1,11 @@
 __all__ = [
-    "KDEUnivariate",
+    "KDEUnivariate", "KDEUnivariateSketch",
     "KDEMultivariate", "KDEMultivariateConditional", "EstimatorSettings",
     "KernelReg", "KernelCensoredReg",
-    "lowess", "bandwidths"
+    "lowess", "lowess_batch", "bandwidths"
 ]
-from .kde import KDEUnivariate
-from .smoothers_lowess import lowess
+from .kde import KDEUnivariate, KDEUnivariateSketch
+from .smoothers_lowess import lowess, lowess_batch
 from . import bandwidths
 
 from .kernel_density import \
@@ -18,8 +18,8 @@ from scipy import integrate, stats
 from statsmodels.sandbox.nonparametric import kernels
 from statsmodels.tools.decorators import cache_readonly
 from . import bandwidths
-from .kdetools import (forrt, revrt, silverman_transform)
-from .linbin import fast_linbin
+from .kdetools import (forrt, revrt, silverman_transform, kernel_transform,
+                       weighted_linbin)
 
 #### Kernels Switch for estimators ####
 
@@ -111,11 +111,18 @@ class KDEUnivariate(object):
 
         fft : bool
             Whether or not to use FFT. FFT implementation is more
-            computationally efficient. However, only the Gaussian kernel
-            is implemented. If FFT is False, then a 'nobs' x 'gridsize'
-            intermediate array is created.
+            computationally efficient. If FFT is False, then a 'nobs' x
+            'gridsize' intermediate array is created.
+        weights : array or None
+            Optional weights of the observations, e.g. frequency or sampling
+            weights.  They are normalized to sum to one.  The bandwidth rules
+            use the unweighted observations, as in Stata's kdensity, so a
+            float `bw` should be given if the weights change the scale of
+            the distribution.
         gridsize : int
-            If gridsize is None, max(len(X), 50) is used.
+            If gridsize is None, max(len(X), 50) is used without FFT and
+            max(len(X), 512) with FFT.  For large samples a smaller
+            gridsize limits the memory of the FFT.
         cut : float
             Defines the length of the grid past the lowest and highest values
             of X so that the kernel goes to zero. The end points are
@@ -131,12 +138,6 @@ class KDEUnivariate(object):
         endog = self.endog
 
         if fft:
-            if kernel != "gau":
-                msg = "Only gaussian kernel is available for fft"
-                raise NotImplementedError(msg)
-            if weights is not None:
-                msg = "Weights are not implemented for fft"
-                raise NotImplementedError(msg)
             density, grid, bw = kdensityfft(endog, kernel=kernel, bw=bw,
                     adjust=adjust, weights=weights, gridsize=gridsize,
                     clip=clip, cut=cut)
@@ -152,7 +153,8 @@ class KDEUnivariate(object):
         # put here to ensure empty cache after re-fit with new options
         self.kernel.weights = weights
         if weights is not None:
-            self.kernel.weights /= weights.sum()
+            weights = np.asarray(weights, dtype=float)
+            self.kernel.weights = weights / weights.sum()
         self._cache = {}
 
     @cache_readonly
@@ -245,17 +247,364 @@ class KDEUnivariate(object):
         gridsize = len(self.density)
         return stats.mstats.mquantiles(self.endog, np.linspace(0, 1, gridsize))
 
+    def evaluate(self, point, method="exact"):
+        """
+        Evaluate density at a point or at an array of points.
+
+        Parameters
+        ----------
+        point : float or array_like
+            Point or 1-d array of points at which to evaluate the density.
+        method : {"exact", "interpolate"}
+            If "exact", the kernel density is computed from all observations,
+            in blocks of points.  If "interpolate", the fitted density is
+            linearly interpolated between the points of the support, which
+            is fast for large samples.  The density is zero outside of the
+            support.
+
+        Returns
+        -------
+        density : float or ndarray
+            The density at each point, a float for a single point.
+        """
+        _checkisfit(self)
+        scalar = np.ndim(point) == 0
+        point = np.atleast_1d(np.asarray(point, dtype=float))
+        if point.ndim > 1:
+            raise ValueError("point must be a float or a 1-d array")
+        if method == "interpolate":
+            density = np.interp(point, self.support, self.density, left=0,
+                                right=0)
+            return density[0] if scalar else density
+        elif method != "exact":
+            raise ValueError("method must be 'exact' or 'interpolate'")
+
+        kern = self.kernel
+        endog = np.ravel(self.endog)
+        if kern.weights is None:
+            weights = np.ones(len(endog)) / len(endog)
+        else:
+            weights = np.ravel(kern.weights)
+        h = kern.h
+        density = np.empty(len(point))
+        block = max(1, 2**20 // len(endog))
+        for start in range(0, len(point), block):
+            u = (endog - point[start:start + block, None]) / h
+            k = kern(u)
+            if kern.domain is not None:
+                k[(u < kern.domain[0]) | (u > kern.domain[1])] = 0
+            density[start:start + block] = np.dot(k, weights) / h
+        return density[0] if scalar else density
+
+
+class KDEUnivariateSketch(object):
+    """
+    Mergeable binned sketch for univariate kernel density estimation.
+
+    The observations are linearly binned on a fixed grid as they arrive, so
+    the memory is proportional to the size of the grid and not to the number
+    of observations.  Sketches with the same grid, e.g. from different
+    processes, can be merged.  The density is estimated from the binned
+    counts with the FFT.
+
+    Parameters
+    ----------
+    lower : float
+        The first grid point.
+    upper : float
+        The last grid point.
+    gridsize : int
+        The number of grid points.
+
+    Attributes
+    ----------
+    grid : ndarray
+        The grid points.
+    counts : ndarray
+        The weighted counts of the linearly binned observations.
+    nobs : int
+        The number of observations, including those outside of the grid.
+    sum_weights : float
+        The sum of the weights of all observations.
+    weight_below, weight_above : float
+        The sum of the weights of the observations below and above the grid.
+
+    Notes
+    -----
+    The range of the grid should cover the data with a margin of a few
+    bandwidths.  Observations outside of the grid are not binned, but they
+    are included in the normalization of the density, so the cdf starts at
+    the fraction of the weights below the grid.  The kernel mass beyond the
+    grid is lost.
+
+    The mean and the variance are updated with the pairwise formulas of
+    Chan, Golub and LeVeque (1979), and the interquartile range for the
+    bandwidth rules is computed from the binned counts.
+
+    Examples
+    --------
+    >>> sketch = KDEUnivariateSketch(0, 10, gridsize=2048)
+    >>> for chunk in chunks:
+    ...     sketch.update(chunk)
+    >>> sketch.merge(other_sketch)
+    >>> sketch.fit(kernel="epa")
+    >>> sketch.density, sketch.cdf, sketch.icdf
+    """
+
+    def __init__(self, lower, upper, gridsize=4096):
+        if not upper > lower:
+            raise ValueError("upper must be larger than lower")
+        if gridsize < 2:
+            raise ValueError("gridsize must be at least 2")
+        self.grid, self.delta = np.linspace(lower, upper, int(gridsize),
+                                            retstep=True)
+        self.counts = np.zeros(int(gridsize))
+        self.nobs = 0
+        self.sum_weights = 0.
+        self.weight_below = 0.
+        self.weight_above = 0.
+        self.mean = 0.
+        self._ssd = 0.  # weighted sum of squared deviations from the mean
+        self._cache = {}
+
+    def _add_moments(self, nobs, sum_weights, mean, ssd):
+        total = self.sum_weights + sum_weights
+        if total > 0:
+            diff = mean - self.mean
+            self.mean += diff * sum_weights / total
+            self._ssd += ssd + diff**2 * self.sum_weights * sum_weights / total
+        self.nobs += nobs
+        self.sum_weights = total
+
+    def update(self, endog, weights=None):
+        """
+        Add a chunk of observations to the sketch.
+
+        Parameters
+        ----------
+        endog : array_like
+            The 1-d chunk of observations.
+        weights : array_like, optional
+            The weights of the observations, e.g. frequency or sampling
+            weights.  Default is a weight of one for each observation.
+
+        Returns
+        -------
+        self : KDEUnivariateSketch
+        """
+        endog = np.ravel(np.asarray(endog, dtype=float))
+        if weights is None:
+            weights = np.ones(len(endog))
+        else:
+            weights = np.ravel(np.asarray(weights, dtype=float))
+            if len(weights) != len(endog):
+                msg = "The length of the weights must be the same as endog."
+                raise ValueError(msg)
+        if len(endog) == 0:
+            return self
+        lower, upper = self.grid[0], self.grid[-1]
+        self.counts += weighted_linbin(endog, lower, upper, len(self.grid),
+                                       weights)
+        self.weight_below += weights[endog < lower].sum()
+        self.weight_above += weights[endog > upper].sum()
+        sum_weights = weights.sum()
+        mean = np.dot(weights, endog) / sum_weights
+        ssd = np.dot(weights, (endog - mean)**2)
+        self._add_moments(len(endog), sum_weights, mean, ssd)
+        self._cache = {}
+        return self
+
+    def merge(self, other):
+        """
+        Add the observations of another sketch with the same grid.
+
+        Parameters
+        ----------
+        other : KDEUnivariateSketch
+            The sketch to merge into this one.
+
+        Returns
+        -------
+        self : KDEUnivariateSketch
+        """
+        if (len(other.grid) != len(self.grid) or
+                not np.allclose(other.grid[[0, -1]], self.grid[[0, -1]])):
+            raise ValueError("Only sketches with the same grid can be merged")
+        self.counts += other.counts
+        self.weight_below += other.weight_below
+        self.weight_above += other.weight_above
+        self._add_moments(other.nobs, other.sum_weights, other.mean,
+                          other._ssd)
+        self._cache = {}
+        return self
+
+    def quantile(self, q):
+        """
+        Quantiles of the binned observations.
+
+        The binned mass is interpolated linearly between the grid points,
+        the observations outside of the grid are at the end points.
+
+        Parameters
+        ----------
+        q : float or array_like
+            The probabilities.
+        """
+        cum = np.r_[self.weight_below,
+                    self.weight_below + np.cumsum(self.counts)]
+        grid = np.r_[self.grid[0], self.grid]
+        return np.interp(np.asarray(q) * self.sum_weights, cum, grid)
+
+    @property
+    def std(self):
+        """
+        The weighted standard deviation of the observations, with the
+        degrees of freedom correction for ``nobs``.
+        """
+        return np.sqrt(self._ssd / self.sum_weights *
+                       self.nobs / (self.nobs - 1.))
+
+    def _select_bandwidth(self, bw, kern):
+        # The rule of thumb bandwidths of the bandwidths module
+        constants = dict(scott=1.059, silverman=.9,
+                         normal_reference=kern.normal_reference_constant)
+        bw = bw.lower()
+        if bw not in constants:
+            raise ValueError("Bandwidth %s not understood" % bw)
+        IQR = np.subtract(*self.quantile([.75, .25])) / 1.349
+        A = min(self.std, IQR) if IQR > 0 else self.std
+        return constants[bw] * A * self.nobs ** (-0.2)
+
+    def fit(self, kernel="gau", bw="normal_reference", adjust=1):
+        """
+        Estimate the density at the grid points from the binned counts.
+
+        Parameters
+        ----------
+        kernel : str
+            The Kernel to be used, see `KDEUnivariate.fit`.
+        bw : str, float
+            The bandwidth or the bandwidth rule, "scott", "silverman" or
+            "normal_reference", see `KDEUnivariate.fit`.  The standard
+            deviation and the interquartile range are those of the sketch.
+        adjust : float
+            An adjustment factor for the bw. Bandwidth becomes bw * adjust.
+
+        Returns
+        -------
+        self : KDEUnivariateSketch
+        """
+        if self.sum_weights <= 0:
+            raise ValueError("The sketch has no observations")
+        kern = kernel_switch[kernel]()
+        try:
+            bw = float(bw)
+            self.bw_method = "user-given"
+        except ValueError:
+            self.bw_method = bw
+            bw = self._select_bandwidth(bw, kern)
+        bw *= adjust
+
+        # Pad the grid with the reach of the kernel, so that the circular
+        # convolution does not wrap around
+        M = len(self.grid)
+        reach = 8. if kern.domain is None else max(np.abs(kern.domain))
+        pad = min(int(np.ceil(reach * bw / self.delta)) + 1, M)
+        L = int(2**np.ceil(np.log2(M + pad)))
+        kern_est = kernel_transform(kern, bw, L, self.delta)[:L // 2 + 1]
+        smoothed = np.fft.irfft(np.fft.rfft(self.counts, L) * kern_est, L)
+        density = smoothed[:M] / (self.delta * self.sum_weights)
+        self.density = np.maximum(density, 0)
+        self.support = self.grid
+        self.bw = bw
+        self.kernel = kernel_switch[kernel](h=bw)
+        self._cache = {}
+        return self
+
+    @cache_readonly
+    def cdf(self):
+        """
+        Returns the cumulative distribution function evaluated at the support.
+
+        Notes
+        -----
+        Will not work if fit has not been called.  Integrates the density
+        with the trapezoidal rule, starting at the fraction of the weights
+        below the grid.
+        """
+        _checkisfit(self)
+        mass = (self.density[1:] + self.density[:-1]) * self.delta / 2
+        return (self.weight_below / self.sum_weights +
+                np.r_[0, np.cumsum(mass)])
+
+    @cache_readonly
+    def cumhazard(self):
+        """
+        Returns the hazard function evaluated at the support.
+
+        Notes
+        -----
+        Will not work if fit has not been called.
+        """
+        _checkisfit(self)
+        return -np.log(self.sf)
+
+    @cache_readonly
+    def sf(self):
+        """
+        Returns the survival function evaluated at the support.
+
+        Notes
+        -----
+        Will not work if fit has not been called.
+        """
+        _checkisfit(self)
+        return 1 - self.cdf
+
+    @cache_readonly
+    def entropy(self):
+        """
+        Returns the differential entropy of the density on the support.
+
+        Notes
+        -----
+        Will not work if fit has not been called. 1e-12 is added to each
+        probability to ensure that log(0) is not called.
+        """
+        _checkisfit(self)
+        entr = self.density * np.log(self.density + 1e-12)
+        return -np.sum((entr[1:] + entr[:-1]) * self.delta / 2)
+
+    @cache_readonly
+    def icdf(self):
+        """
+        Inverse Cumulative Distribution (Quantile) Function
+
+        Notes
+        -----
+        Will not work if fit has not been called.  Inverts the cdf at the
+        support by linear interpolation, at ``len(density)`` probabilities
+        between 0 and 1 as `KDEUnivariate.icdf`.
+        """
+        _checkisfit(self)
+        probs = np.linspace(0, 1, len(self.density))
+        cdf = np.maximum.accumulate(self.cdf)
+        return np.interp(probs, cdf, self.support)
+
     def evaluate(self, point):
         """
-        Evaluate density at a single point.
+        Evaluate the density at a point or an array of points.
+
+        The fitted density is linearly interpolated between the grid points,
+        and it is zero outside of the grid.
 
         Parameters
         ----------
-        point : float
-            Point at which to evaluate the density.
+        point : float or array_like
+            The points at which to evaluate the density.
         """
         _checkisfit(self)
-        return self.kernel.density(self.endog, point)
+        return np.interp(point, self.support, self.density, left=0, right=0)
 
 
 #### Kernel Density Estimator Functions ####
@@ -383,26 +732,26 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
     X : array-like
         The variable for which the density estimate is desired.
     kernel : str
-        ONLY GAUSSIAN IS CURRENTLY IMPLEMENTED.
-        "bi" for biweight
-        "cos" for cosine
-        "epa" for Epanechnikov, default
-        "epa2" for alternative Epanechnikov
-        "gau" for Gaussian.
-        "par" for Parzen
-        "rect" for rectangular
-        "tri" for triangular
+        The Kernel to be used. Choices are
+        - "biw" for biweight
+        - "cos" for cosine
+        - "cos2" for an alternative cosine kernel
+        - "epa" for Epanechnikov
+        - "gau" for Gaussian.
+        - "tri" for triangular
+        - "triw" for triweight
+        - "uni" for uniform
     bw : str, float
         "scott" - 1.059 * A * nobs ** (-1/5.), where A is min(std(X),IQR/1.34)
         "silverman" - .9 * A * nobs ** (-1/5.), where A is min(std(X),IQR/1.34)
         If a float is given, it is the bandwidth.
     weights : array or None
-        WEIGHTS ARE NOT CURRENTLY IMPLEMENTED.
         Optional  weights. If the X value is clipped, then this weight is
         also dropped.
     gridsize : int
-        If gridsize is None, min(len(X), 512) is used. Note that the provided
-        number is rounded up to the next highest power of 2.
+        If gridsize is None, max(len(X), 512) is used. Note that the
+        provided number is rounded up to the next highest power of 2. For
+        large samples a smaller gridsize limits the memory of the FFT.
     adjust : float
         An adjustment factor for the bw. Bandwidth becomes bw * adjust.
         clip : tuple
@@ -424,12 +773,14 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
 
     Notes
     -----
-    Only the default kernel is implemented. Weights aren't implemented yet.
     This follows Silverman (1982) with changes suggested by Jones and Lotwick
-    (1984). However, the discretization step is replaced by linear binning
-    of Fan and Marron (1994). This should be extended to accept the parts
-    that are dependent only on the data to speed things up for
-    cross-validation.
+    (1984). However, the discretization step is replaced by weighted linear
+    binning of Fan and Marron (1994). The Fourier transform of the Gaussian
+    kernel is computed in closed form, the other kernels are evaluated on
+    the grid and transformed with the FFT. The binning processes the data
+    in chunks, so that large samples only need memory for the data and the
+    grid. This should be extended to accept the parts that are dependent
+    only on the data to speed things up for cross-validation.
 
     References
     ----------
@@ -444,8 +795,20 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
         Series C. 31.2, 93-9.
     """
     X = np.asarray(X)
-    X = X[np.logical_and(X > clip[0], X < clip[1])] # won't work for two columns.
-                                                # will affect underlying data?
+    clip_x = np.logical_and(X > clip[0], X < clip[1])
+    # won't work for two columns.
+    # will affect underlying data?
+    X = X[clip_x]
+
+    if weights is None:
+        q = len(X)
+    else:
+        weights = np.asarray(weights)
+        if len(weights) != len(clip_x):
+            msg = "The length of the weights must be the same as the given X."
+            raise ValueError(msg)
+        weights = weights[clip_x]
+        q = weights.sum()
 
     # Get kernel object corresponding to selection
     kern = kernel_switch[kernel]()
@@ -460,7 +823,7 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
 
     # 1 Make grid and discretize the data
     if gridsize is None:
-        gridsize = np.max((nobs, 512.))
+        gridsize = max(nobs, 512.)
     gridsize = 2**np.ceil(np.log2(gridsize)) # round to next power of 2
 
     a = np.min(X) - cut * bw
@@ -484,7 +847,7 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
 #    binned /= (nobs)*delta**2 # normalize binned to sum to 1/delta
 
 #NOTE: THE ABOVE IS WRONG, JUST TRY WITH LINEAR BINNING
-    binned = fast_linbin(X, a, b, gridsize) / (delta * nobs)
+    binned = weighted_linbin(X, a, b, gridsize, weights) / (delta * q)
 
     # step 2 compute FFT of the weights, using Munro (1976) FFT convention
     y = forrt(binned)
@@ -493,9 +856,14 @@ def kdensityfft(X, kernel="gau", bw="normal_reference", weights=None, gridsize=N
     # don't have to redo the above if just changing bw, ie., for cross val
 
 #NOTE: silverman_transform is the closed form solution of the FFT of the
-#gaussian kernel. Not yet sure how to generalize it.
-    zstar = silverman_transform(bw, gridsize, RANGE)*y # 3.49 in Silverman
-                                                    # 3.50 w Gaussian kernel
+#gaussian kernel. The other kernels are transformed numerically.
+    if kernel == "gau":
+        kern_est = silverman_transform(bw, gridsize, RANGE)
+    else:
+        kern_est = kernel_transform(kern, bw, gridsize, delta)
+    # 3.49 in Silverman
+    # 3.50 w Gaussian kernel
+    zstar = kern_est*y
     f = revrt(zstar)
     if retgrid:
         return f, grid, bw
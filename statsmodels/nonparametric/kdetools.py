@@ -38,6 +38,82 @@ def silverman_transform(bw, M, RANGE):
     kern_est = np.r_[FAC, FAC[1:-1]]
     return kern_est
 
+def kernel_transform(kern, bw, M, delta):
+    """
+    FFT of a kernel on the grid, in the order of `forrt`.
+
+    The kernel is evaluated at the circular lags between the `M` grid points
+    and normalized to unit mass on the grid, so that this generalizes
+    `silverman_transform` to kernels without a closed form transform.
+
+    Parameters
+    ----------
+    kern : CustomKernel instance
+        The kernel, with bandwidth 1.
+    bw : float
+        The bandwidth.
+    M : int
+        The number of grid points.
+    delta : float
+        The distance between grid points.
+    """
+    M = int(M)
+    J = np.arange(M)
+    lag = np.minimum(J, M - J) * delta / bw
+    kern_vals = np.asarray(kern(lag), dtype=float)
+    if kern.domain is not None:
+        kern_vals[(lag < kern.domain[0]) | (lag > kern.domain[1])] = 0
+    kern_vals[kern_vals < 0] = 0
+    FAC = np.fft.rfft(kern_vals).real / kern_vals.sum()
+    kern_est = np.r_[FAC, FAC[1:-1]]
+    return kern_est
+
+def weighted_linbin(X, a, b, M, weights=None):
+    """
+    Linear binning of the, optionally weighted, data on a regular grid.
+
+    Parameters
+    ----------
+    X : array_like
+        The 1-d data.
+    a, b : float
+        The first and the last grid point.
+    M : int
+        The number of grid points.
+    weights : array_like, optional
+        The weights of the observations.  Default is a weight of one for
+        each observation.
+
+    Returns
+    -------
+    gcnts : ndarray
+        The weighted grid counts.  Observations outside of `[a, b]` are
+        dropped.
+
+    Notes
+    -----
+    Each observation is split between the two closest grid points, see Fan
+    and Marron (1994).  The data is processed in chunks, so that the memory
+    does not depend on the number of observations.
+    """
+    X = np.asarray(X, dtype=float)
+    M = int(M)
+    delta = (b - a) / (M - 1)
+    gcnts = np.zeros(M)
+    chunksize = 2**20
+    for start in range(0, len(X), chunksize):
+        lxi = (X[start:start + chunksize] - a) / delta
+        inside = (lxi >= 0) & (lxi <= M - 1)
+        lxi = lxi[inside]
+        li = np.minimum(lxi.astype(int), M - 2)
+        rem = lxi - li
+        w = 1.
+        if weights is not None:
+            w = np.asarray(weights[start:start + chunksize])[inside]
+        gcnts += np.bincount(li, w * (1 - rem), minlength=M)
+        gcnts += np.bincount(li + 1, w * rem, minlength=M)
+    return gcnts
+
 def counts(x, v):
     """
     Counts the number of elements of x that fall within the grid points v
@@ -33,14 +33,24 @@ from __future__ import division
 from statsmodels.compat.python import range, next
 import numpy as np
 
-from . import kernels
 from ._kernel_base import GenericKDE, EstimatorSettings, gpke, \
-    LeaveOneOut, _adjust_shape
+    LeaveOneOut, _adjust_shape, _gpke_sum
+from ._kernel_binned import binned_kernel_sum
 
 
 __all__ = ['KDEMultivariate', 'KDEMultivariateConditional', 'EstimatorSettings']
 
 
+_kernel_types = dict(
+    pdf=dict(ckertype='gaussian', okertype='wangryzin',
+             ukertype='aitchisonaitken'),
+    cdf=dict(ckertype='gaussian_cdf', okertype='wangryzin_cdf',
+             ukertype='aitchisonaitken_cdf'),
+    convolution=dict(ckertype='gauss_convolution',
+                     okertype='wangryzin_convolution',
+                     ukertype='aitchisonaitken_convolution'))
+
+
 class KDEMultivariate(GenericKDE):
     """
     Multivariate kernel density estimator.
@@ -75,7 +85,8 @@ class KDEMultivariate(GenericKDE):
             - cv_ls: cross validation least squares
 
     defaults: EstimatorSettings instance, optional
-        The default values for (efficient) bandwidth estimation.
+        The default values for (efficient) bandwidth estimation and for the
+        evaluation of the kernel sums.
 
     Attributes
     ----------
@@ -153,13 +164,7 @@ class KDEMultivariate(GenericKDE):
         .. math:: K_{h}(X_{i},X_{j}) =
             \prod_{s=1}^{q}h_{s}^{-1}k\left(\frac{X_{is}-X_{js}}{h_{s}}\right)
         """
-        LOO = LeaveOneOut(self.data)
-        L = 0
-        for i, X_not_i in enumerate(LOO):
-            f_i = gpke(bw, data=-X_not_i, data_predict=-self.data[i, :],
-                       var_type=self.var_type)
-            L += func(f_i)
-
+        L = np.sum(func(self._kernel_sum(bw, self.data, loo=True)))
         return -L
 
     def pdf(self, data_predict=None):
@@ -189,12 +194,7 @@ class KDEMultivariate(GenericKDE):
         else:
             data_predict = _adjust_shape(data_predict, self.k_vars)
 
-        pdf_est = []
-        for i in range(np.shape(data_predict)[0]):
-            pdf_est.append(gpke(self.bw, data=self.data,
-                                data_predict=data_predict[i, :],
-                                var_type=self.var_type) / self.nobs)
-
+        pdf_est = self._kernel_sum(self.bw, data_predict) / self.nobs
         pdf_est = np.squeeze(pdf_est)
         return pdf_est
 
@@ -234,15 +234,8 @@ class KDEMultivariate(GenericKDE):
         else:
             data_predict = _adjust_shape(data_predict, self.k_vars)
 
-        cdf_est = []
-        for i in range(np.shape(data_predict)[0]):
-            cdf_est.append(gpke(self.bw, data=self.data,
-                                data_predict=data_predict[i, :],
-                                var_type=self.var_type,
-                                ckertype="gaussian_cdf",
-                                ukertype="aitchisonaitken_cdf",
-                                okertype='wangryzin_cdf') / self.nobs)
-
+        cdf_est = self._kernel_sum(self.bw, data_predict,
+                                   kernel='cdf') / self.nobs
         cdf_est = np.squeeze(cdf_est)
         return cdf_est
 
@@ -281,59 +274,29 @@ class KDEMultivariate(GenericKDE):
         .. [2] Racine, J., Li, Q. "Nonparametric Estimation of Distributions
                 with Categorical and Continuous Data." Working Paper. (2000)
         """
-        #F = 0
-        #for i in range(self.nobs):
-        #    k_bar_sum = gpke(bw, data=-self.data,
-        #                     data_predict=-self.data[i, :],
-        #                     var_type=self.var_type,
-        #                     ckertype='gauss_convolution',
-        #                     okertype='wangryzin_convolution',
-        #                     ukertype='aitchisonaitken_convolution')
-        #    F += k_bar_sum
-        ## there is a + because loo_likelihood returns the negative
-        #return (F / self.nobs**2 + self.loo_likelihood(bw) * \
-        #        2 / ((self.nobs) * (self.nobs - 1)))
-
-        # The code below is equivalent to the commented-out code above.  It's
-        # about 20% faster due to some code being moved outside the for-loops
-        # and shared by gpke() and loo_likelihood().
-        F = 0
-        kertypes = dict(c=kernels.gaussian_convolution,
-                        o=kernels.wang_ryzin_convolution,
-                        u=kernels.aitchison_aitken_convolution)
-        nobs = self.nobs
-        data = -self.data
-        var_type = self.var_type
-        ix_cont = np.array([c == 'c' for c in var_type])
-        _bw_cont_product = bw[ix_cont].prod()
-        Kval = np.empty(data.shape)
-        for i in range(nobs):
-            for ii, vtype in enumerate(var_type):
-                Kval[:, ii] = kertypes[vtype](bw[ii],
-                                              data[:, ii],
-                                              data[i, ii])
-
-            dens = Kval.prod(axis=1) / _bw_cont_product
-            k_bar_sum = dens.sum(axis=0)
-            F += k_bar_sum  # sum of prod kernel over nobs
-
-        kertypes = dict(c=kernels.gaussian,
-                        o=kernels.wang_ryzin,
-                        u=kernels.aitchison_aitken)
-        LOO = LeaveOneOut(self.data)
-        L = 0   # leave-one-out likelihood
-        Kval = np.empty((data.shape[0]-1, data.shape[1]))
-        for i, X_not_i in enumerate(LOO):
-            for ii, vtype in enumerate(var_type):
-                Kval[:, ii] = kertypes[vtype](bw[ii],
-                                              -X_not_i[:, ii],
-                                              data[i, ii])
-            dens = Kval.prod(axis=1) / _bw_cont_product
-            L += dens.sum(axis=0)
-
         # CV objective function, eq. (2.4) of Ref. [3]
+        nobs = self.nobs
+        F = self._kernel_sum(bw, self.data, kernel='convolution').sum()
+        L = self._kernel_sum(bw, self.data, loo=True).sum()
         return (F / nobs**2 - 2 * L / (nobs * (nobs - 1)))
 
+    def _kernel_sum(self, bw, data_predict, kernel='pdf', loo=False):
+        """
+        Sum of the product kernel over the training data at each point.
+
+        If `loo` is True, `data_predict` is the training data and observation
+        i is left out of the sum for point i.
+        """
+        bw = np.asarray(bw)
+        kertypes = _kernel_types[kernel]
+        if self.evaluation == 'binned':
+            return binned_kernel_sum(bw, self.data, data_predict,
+                                     self.var_type, loo=loo,
+                                     gridsize=self.gridsize, **kertypes)
+        leave_out = np.arange(self.nobs) if loo else None
+        return _gpke_sum(bw, self.data, data_predict, self.var_type,
+                         leave_out=leave_out, **kertypes)
+
     def _get_class_vars_type(self):
         """Helper method to be able to pass needed vars to _compute_subset."""
         class_type = 'KDEMultivariate'
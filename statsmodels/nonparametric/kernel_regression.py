@@ -31,20 +31,157 @@ References
 from __future__ import division
 # TODO: make default behavior efficient=True above a certain n_obs
 
-from statsmodels.compat.python import range, string_types, next
+from statsmodels.compat.python import range, string_types
 import copy
 
 import numpy as np
 from scipy import optimize
 from scipy.stats.mstats import mquantiles
 
+from statsmodels.tools.parallel import parallel_func
 from ._kernel_base import GenericKDE, EstimatorSettings, gpke, \
-    LeaveOneOut, _get_type_pos, _adjust_shape, _compute_min_std_IQR
+    _get_type_pos, _adjust_shape, _compute_min_std_IQR, _gpke_moments, \
+    kernel_func
+from ._kernel_binned import binned_kernel_moments
 
 
 __all__ = ['KernelReg', 'KernelCensoredReg']
 
 
+def _kernel_reg_fit(bw, endog, exog, data_predict, var_type, reg_type,
+                    W=None, loo=False, mfx=True, evaluation='exact',
+                    gridsize=None, **kertypes):
+    """
+    Local constant or local linear regression at all evaluation points.
+
+    Parameters
+    ----------
+    bw : array_like
+        The bandwidth parameters.
+    endog : ndarray
+        The dependent variable, shape (nobs,) or (nobs, n_cols).  Each column
+        is a separate regression with the same kernel weights.
+    exog : ndarray
+        The independent variables, shape (nobs, k_vars).
+    data_predict : ndarray
+        The evaluation points, shape (n_predict, k_vars).  If `loo` is True,
+        this has to be `exog`.
+    var_type : str
+        The variable types.
+    reg_type : {'lc', 'll'}
+        Local constant or local linear regression.
+    W : ndarray, optional
+        Weights of the observations, shape (nobs, 1).
+    loo : bool, optional
+        If True, observation i is left out of the regression at point i.
+    mfx : bool, optional
+        If False, the marginal effects are not computed.
+    evaluation : {'exact', 'binned'}, optional
+        Whether the kernel sums are computed exactly in blocks of points or
+        with binned data, see `EstimatorSettings`.
+    gridsize : int or array_like, optional
+        The number of grid points if `evaluation` is 'binned'.
+    **kertypes
+        The kernels of the discrete variables, see `gpke`.
+
+    Returns
+    -------
+    mean : ndarray
+        The conditional mean, shape (n_predict, n_cols).
+    mfx : ndarray or None
+        The marginal effects, shape (n_predict, k_vars, n_cols).
+
+    Notes
+    -----
+    The results are the same as those of `KernelReg._est_loc_linear` and
+    `KernelReg._est_loc_constant` at each point, but the kernel sums are
+    computed for blocks of evaluation points and all columns of `endog` at
+    once.
+    """
+    bw = np.asarray(bw, dtype=float)
+    nobs, k_vars = exog.shape
+    endog = np.reshape(endog, (nobs, -1))
+    W = np.ones((nobs, 1)) if W is None else np.reshape(W, (nobs, 1))
+
+    def moments(weights, degree, **kwargs):
+        kwargs = dict(kertypes, **kwargs)
+        if evaluation == 'binned':
+            return binned_kernel_moments(bw, exog, data_predict, var_type,
+                                         weights=weights, degree=degree,
+                                         loo=loo, gridsize=gridsize, **kwargs)
+        leave_out = np.arange(nobs) if loo else None
+        return _gpke_moments(bw, exog, data_predict, var_type,
+                             weights=weights, degree=degree,
+                             leave_out=leave_out, **kwargs)
+
+    weights = np.column_stack((W, W * endog))
+    if reg_type == 'lc':
+        sums = moments(weights, 0)[0]
+        G_denom = sums[:, :1]
+        G_numer = sums[:, 1:]
+        mean = G_numer / G_denom
+        if not mfx:
+            return mean, None
+        # The derivative of the product kernel, with the sign of the
+        # estimates of the derivatives of f(x) and m(x)f(x)
+        sums_d = -moments(weights, 0, ckertype='d_gaussian')[0] / nobs
+        d_fx = sums_d[:, :1]
+        d_mx = sums_d[:, 1:]
+        B_x = (G_numer * d_fx - G_denom * d_mx) / G_denom**2
+        return mean, np.repeat(B_x[:, None, :], k_vars, axis=1)
+
+    # Local linear, see _est_loc_linear
+    ker_sum, ker_diff, ker_outer = moments(W, 2)
+    M = np.empty((data_predict.shape[0], k_vars + 1, k_vars + 1))
+    M[:, 0, 0] = ker_sum[:, 0]
+    M[:, 0, 1:] = ker_diff[..., 0]
+    M[:, 1:, 0] = ker_diff[..., 0]
+    M[:, 1:, 1:] = ker_outer[..., 0]
+    V_sum, V_diff = moments(weights[:, 1:], 1)
+    V = np.concatenate((V_sum[:, None, :], V_diff), axis=1)
+    mean_mfx = np.matmul(np.linalg.pinv(M), V)
+    return mean_mfx[:, 0, :], mean_mfx[:, 1:, :] if mfx else None
+
+
+def _bootstrap_stats(func, draw, nboot, nobs, n_jobs=1, chunk_size=None):
+    """
+    Bootstrap distribution of a test statistic, optionally in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Returns the statistics of a chunk of replicates as a 1-D array.
+    draw : callable
+        ``draw(size)`` returns the tuple of arguments of `func` for the next
+        `size` replicates.  It is called in order in the main process, so
+        the replicates drawn from the global random state do not depend on
+        `n_jobs`.
+    nboot : int
+        The number of bootstrap replicates.
+    nobs : int
+        The number of observations, used to bound the size of the chunks.
+    n_jobs : int, optional
+        The number of jobs for ``joblib.Parallel``.  Default is 1, which
+        computes the chunks sequentially without joblib.
+    chunk_size : int, optional
+        The maximum number of replicates in a chunk.
+
+    Returns
+    -------
+    stats : ndarray
+        The statistic of each replicate.
+    """
+    if n_jobs == 1:
+        parallel, p_func = list, func
+    else:
+        parallel, p_func, n_jobs = parallel_func(func, n_jobs, verbose=0)
+    size = max(1, min(2**22 // nobs, -(-nboot // max(n_jobs, 1))))
+    if chunk_size is not None:
+        size = min(size, chunk_size)
+    sizes = [min(size, nboot - start) for start in range(0, nboot, size)]
+    return np.concatenate(parallel(p_func(*draw(k)) for k in sizes))
+
+
 class KernelReg(GenericKDE):
     """
     Nonparametric kernel regression class.
@@ -259,21 +396,31 @@ class KernelReg(GenericKDE):
         See ch.2 in [1] and p.35 in [2].
 
         """
-        H = np.empty((self.nobs, self.nobs))
-        for j in range(self.nobs):
-            H[:, j] = gpke(bw, data=self.exog, data_predict=self.exog[j,:],
-                           var_type=self.var_type, tosum=False)
-
-        denom = H.sum(axis=1)
-        H = H / denom
-        gx = KernelReg(endog=self.endog, exog=self.exog, var_type=self.var_type,
-                       reg_type=self.reg_type, bw=bw,
-                       defaults=EstimatorSettings(efficient=False)).fit()[0]
-        gx = np.reshape(gx, (self.nobs, 1))
+        # Only the trace of the smoother matrix H is needed, the diagonal of
+        # the kernel matrix divided by its row sums
+        bw = np.asarray(bw, dtype=float)
+        ix_cont = _get_type_pos(self.var_type)[0]
+        names = dict(c='gaussian', o='wangryzin', u='aitchisonaitken')
+        ker_diag = np.ones(self.nobs)
+        for ii, vtype in enumerate(self.var_type):
+            x = self.exog[:, ii]
+            ker_diag *= kernel_func[names[vtype]](bw[ii], x, x)
+        ker_diag /= np.prod(bw[ix_cont])
+        if self.evaluation == 'binned':
+            denom = binned_kernel_moments(bw, self.exog, self.exog,
+                                          self.var_type,
+                                          gridsize=self.gridsize)[0]
+        else:
+            denom = _gpke_moments(bw, self.exog, self.exog, self.var_type)[0]
+        trace_H = (ker_diag / denom[:, 0]).sum()
+        gx = _kernel_reg_fit(bw, self.endog, self.exog, self.exog,
+                             self.var_type, self.reg_type, mfx=False,
+                             evaluation=self.evaluation,
+                             gridsize=self.gridsize)[0]
         sigma = ((self.endog - gx)**2).sum(axis=0) / float(self.nobs)
 
-        frac = (1 + np.trace(H) / float(self.nobs)) / \
-               (1 - (np.trace(H) + 2) / float(self.nobs))
+        frac = (1 + trace_H / float(self.nobs)) / \
+               (1 - (trace_H + 2) / float(self.nobs))
         #siga = np.dot(self.endog.T, (I - H).T)
         #sigb = np.dot((I - H), self.endog)
         #sigma = np.dot(siga, sigb) / float(self.nobs)
@@ -310,16 +457,9 @@ class KernelReg(GenericKDE):
         and :math:`h` is the vector of bandwidths
 
         """
-        LOO_X = LeaveOneOut(self.exog)
-        LOO_Y = LeaveOneOut(self.endog).__iter__()
-        L = 0
-        for ii, X_not_i in enumerate(LOO_X):
-            Y = next(LOO_Y)
-            G = func(bw, endog=Y, exog=-X_not_i,
-                     data_predict=-self.exog[ii, :])[0]
-            L += (self.endog[ii] - G) ** 2
-
-        # Note: There might be a way to vectorize this. See p.72 in [1]
+        reg_type = 'lc' if func == self._est_loc_constant else 'll'
+        G = self._fit(bw, loo=True, mfx=False, reg_type=reg_type)[0]
+        L = ((self.endog - G) ** 2).sum(axis=0)
         return L / self.nobs
 
     def r_squared(self):
@@ -365,25 +505,29 @@ class KernelReg(GenericKDE):
             The marginal effects, i.e. the partial derivatives of the mean.
 
         """
-        func = self.est[self.reg_type]
-        if data_predict is None:
-            data_predict = self.exog
-        else:
+        if data_predict is not None:
             data_predict = _adjust_shape(data_predict, self.k_vars)
+        mean, mfx = self._fit(self.bw, data_predict=data_predict)
+        return mean[:, 0], mfx[..., 0]
 
-        N_data_predict = np.shape(data_predict)[0]
-        mean = np.empty((N_data_predict,))
-        mfx = np.empty((N_data_predict, self.k_vars))
-        for i in range(N_data_predict):
-            mean_mfx = func(self.bw, self.endog, self.exog,
-                            data_predict=data_predict[i, :])
-            mean[i] = mean_mfx[0]
-            mfx_c = np.squeeze(mean_mfx[1])
-            mfx[i, :] = mfx_c
-
-        return mean, mfx
+    def _fit(self, bw, endog=None, data_predict=None, loo=False, mfx=True,
+             reg_type=None, **kwargs):
+        """
+        Mean and marginal effects at all points, see `_kernel_reg_fit`.
 
-    def sig_test(self, var_pos, nboot=50, nested_res=25, pivot=False):
+        `endog` can have several columns, default is the dependent variable.
+        `data_predict` default is the training data.
+        """
+        endog = self.endog if endog is None else endog
+        data_predict = self.exog if data_predict is None else data_predict
+        reg_type = self.reg_type if reg_type is None else reg_type
+        return _kernel_reg_fit(bw, endog, self.exog, data_predict,
+                               self.var_type, reg_type, loo=loo, mfx=mfx,
+                               evaluation=self.evaluation,
+                               gridsize=self.gridsize, **kwargs)
+
+    def sig_test(self, var_pos, nboot=50, nested_res=25, pivot=False,
+                 n_jobs=1):
         """
         Significance test for the variables in the regression.
 
@@ -391,6 +535,15 @@ class KernelReg(GenericKDE):
         ----------
         var_pos: sequence
             The position of the variable in exog to be tested.
+        nboot: int, optional
+            The number of bootstrap replications.
+        nested_res: int, optional
+            The number of nested resamples for the pivot statistic.
+        pivot: bool, optional
+            Whether to pivot the test statistic of continuous variables.
+        n_jobs: int, optional
+            The number of jobs to compute the bootstrap replications with
+            ``joblib.Parallel``, -1 uses all cores.  Default is 1.
 
         Returns
         -------
@@ -409,9 +562,10 @@ class KernelReg(GenericKDE):
             if np.any(ix_ord[var_pos]) or np.any(ix_unord[var_pos]):
                 raise ValueError("Discrete variable in hypothesis. Must be continuous")
 
-            Sig = TestRegCoefC(self, var_pos, nboot, nested_res, pivot)
+            Sig = TestRegCoefC(self, var_pos, nboot, nested_res, pivot,
+                               n_jobs=n_jobs)
         else:
-            Sig = TestRegCoefD(self, var_pos, nboot)
+            Sig = TestRegCoefD(self, var_pos, nboot, n_jobs=n_jobs)
 
         return Sig.sig
 
@@ -597,75 +751,18 @@ class KernelCensoredReg(KernelReg):
         return mean, mfx
 
 
-    def cv_loo(self, bw, func):
-        r"""
-        The cross-validation function with leave-one-out
-        estimator
-
-        Parameters
-        ----------
-        bw: array_like
-            Vector of bandwidth values
-        func: callable function
-            Returns the estimator of g(x).
-            Can be either ``_est_loc_constant`` (local constant) or
-            ``_est_loc_linear`` (local_linear).
-
-        Returns
-        -------
-        L: float
-            The value of the CV function
-
-        Notes
-        -----
-        Calculates the cross-validation least-squares
-        function. This function is minimized by compute_bw
-        to calculate the optimal value of bw
-
-        For details see p.35 in [2]
-
-        .. math:: CV(h)=n^{-1}\sum_{i=1}^{n}(Y_{i}-g_{-i}(X_{i}))^{2}
-
-        where :math:`g_{-i}(X_{i})` is the leave-one-out estimator of g(X)
-        and :math:`h` is the vector of bandwidths
-
-        """
-        LOO_X = LeaveOneOut(self.exog)
-        LOO_Y = LeaveOneOut(self.endog).__iter__()
-        LOO_W = LeaveOneOut(self.W_in).__iter__()
-        L = 0
-        for ii, X_not_i in enumerate(LOO_X):
-            Y = next(LOO_Y)
-            w = next(LOO_W)
-            G = func(bw, endog=Y, exog=-X_not_i,
-                     data_predict=-self.exog[ii, :], W=w)[0]
-            L += (self.endog[ii] - G) ** 2
-
-        # Note: There might be a way to vectorize this. See p.72 in [1]
-        return L / self.nobs
-
-    def fit(self, data_predict=None):
-        """
-        Returns the marginal effects at the data_predict points.
-        """
-        func = self.est[self.reg_type]
-        if data_predict is None:
-            data_predict = self.exog
-        else:
-            data_predict = _adjust_shape(data_predict, self.k_vars)
-
-        N_data_predict = np.shape(data_predict)[0]
-        mean = np.empty((N_data_predict,))
-        mfx = np.empty((N_data_predict, self.k_vars))
-        for i in range(N_data_predict):
-            mean_mfx = func(self.bw, self.endog, self.exog,
-                            data_predict=data_predict[i, :],
-                            W=self.W_in)
-            mean[i] = mean_mfx[0]
-            mfx_c = np.squeeze(mean_mfx[1])
-            mfx[i, :] = mfx_c
-
-        return mean, mfx
+    def _fit(self, bw, endog=None, data_predict=None, loo=False, mfx=True,
+             reg_type=None):
+        # The observations are weighted by W_in, and the local linear
+        # estimator uses the regression kernels for the discrete variables
+        reg_type = self.reg_type if reg_type is None else reg_type
+        kertypes = {}
+        if reg_type == 'll':
+            kertypes = dict(okertype='wangryzin_reg',
+                            ukertype='aitchison_aitken_reg')
+        return super(KernelCensoredReg, self)._fit(
+            bw, endog=endog, data_predict=data_predict, loo=loo, mfx=mfx,
+            reg_type=reg_type, W=self.W_in, **kertypes)
 
 
 class TestRegCoefC(object):
@@ -695,6 +792,9 @@ class TestRegCoefC(object):
         Significantly increases computational time. But pivot statistics
         have more desirable properties
         (See references)
+    n_jobs: int
+        The number of jobs to compute the bootstrap replications with
+        ``joblib.Parallel``, -1 uses all cores.  Default is 1.
 
     Attributes
     ----------
@@ -711,6 +811,11 @@ class TestRegCoefC(object):
     This class allows testing of joint hypothesis as long as all variables
     are continuous.
 
+    The regressions of the bootstrap replications without pivoting share the
+    kernel weights, so they are computed together in chunks of replications.
+    The replications are drawn from the global random state in the main
+    process, so the results do not depend on `n_jobs`.
+
     References
     ----------
     Racine, J.: "Consistent Significance Testing for Nonparametric Regression"
@@ -722,7 +827,7 @@ class TestRegCoefC(object):
     # Racine: Consistent Significance Testing for Nonparametric Regression
     # Journal of Business & Economics Statistics
     def __init__(self, model, test_vars, nboot=400, nested_res=400,
-                 pivot=False):
+                 pivot=False, n_jobs=1):
         self.nboot = nboot
         self.nres = nested_res
         self.test_vars = test_vars
@@ -735,55 +840,66 @@ class TestRegCoefC(object):
         self.gx = model.est[model.reg_type]
         self.test_vars = test_vars
         self.pivot = pivot
+        self.n_jobs = n_jobs
         self.run()
 
     def run(self):
-        self.test_stat = self._compute_test_stat(self.endog, self.exog)
+        self.test_stat = self._compute_test_stat(self.endog, self.exog)[0]
         self.sig = self._compute_sig()
 
-    def _compute_test_stat(self, Y, X):
+    def _fit(self, Y, X, data_predict=None, mfx=True):
+        """
+        Regression of the columns of Y on X with the bandwidth of the model.
+        """
+        data_predict = X if data_predict is None else data_predict
+        return _kernel_reg_fit(self.bw, Y, X, data_predict, self.var_type,
+                               self.model.reg_type, mfx=mfx,
+                               evaluation=self.model.evaluation,
+                               gridsize=self.model.gridsize)
+
+    def _compute_test_stat(self, Y, X, random_state=None):
         """
         Computes the test statistic.  See p.371 in [8].
+
+        Returns the statistic for each column of `Y`.
         """
         lam = self._compute_lambda(Y, X)
         t = lam
         if self.pivot:
-            se_lam = self._compute_se_lambda(Y, X)
-            t = lam / float(se_lam)
+            se_lam = self._compute_se_lambda(Y, X, random_state)
+            t = lam / se_lam
 
         return t
 
     def _compute_lambda(self, Y, X):
         """Computes only lambda -- the main part of the test statistic"""
         n = np.shape(X)[0]
-        Y = _adjust_shape(Y, 1)
+        Y = np.reshape(Y, (n, -1))
         X = _adjust_shape(X, self.k_vars)
-        b = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
-                        defaults = EstimatorSettings(efficient=False)).fit()[1]
+        b = self._fit(Y, X)[1]
 
-        b = b[:, self.test_vars]
-        b = np.reshape(b, (n, len(self.test_vars)))
+        b = np.reshape(b[:, self.test_vars], (n, -1, Y.shape[1]))
         #fct = np.std(b)  # Pivot the statistic by dividing by SE
         fct = 1.  # Don't Pivot -- Bootstrapping works better if Pivot
-        lam = ((b / fct) ** 2).sum() / float(n)
+        lam = ((b / fct) ** 2).sum(axis=(0, 1)) / float(n)
         return lam
 
-    def _compute_se_lambda(self, Y, X):
+    def _compute_se_lambda(self, Y, X, random_state=None):
         """
         Calculates the SE of lambda by nested resampling
         Used to pivot the statistic.
         Bootstrapping works better with estimating pivotal statistics
         but slows down computation significantly.
         """
+        random_state = np.random if random_state is None else random_state
         n = np.shape(Y)[0]
-        lam = np.empty(shape=(self.nres,))
+        Y = np.reshape(Y, (n, -1))
+        lam = np.empty(shape=(self.nres, Y.shape[1]))
         for i in range(self.nres):
-            ind = np.random.randint(0, n, size=(n, 1))
-            Y1 = Y[ind, 0]
-            X1 = X[ind, :]
-            lam[i] = self._compute_lambda(Y1, X1)
+            ind = random_state.randint(0, n, size=n)
+            lam[i] = self._compute_lambda(Y[ind], X[ind])
 
-        se_lambda = np.std(lam)
+        se_lambda = np.std(lam, axis=0)
         return se_lambda
 
     def _compute_sig(self):
@@ -794,23 +910,30 @@ class TestRegCoefC(object):
         bootstrapping the sample.  The null hypothesis is rejected if the test
         statistic is larger than the 90, 95, 99 percentiles.
         """
-        t_dist = np.empty(shape=(self.nboot, ))
         Y = self.endog
         X = copy.deepcopy(self.exog)
         n = np.shape(Y)[0]
 
         X[:, self.test_vars] = np.mean(X[:, self.test_vars], axis=0)
         # Calculate the restricted mean. See p. 372 in [8]
-        M = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
-                      defaults=EstimatorSettings(efficient=False)).fit()[0]
-        M = np.reshape(M, (n, 1))
+        M = self._fit(Y, X, mfx=False)[0]
         e = Y - M
         e = e - np.mean(e)  # recenter residuals
-        for i in range(self.nboot):
-            ind = np.random.randint(0, n, size=(n, 1))
-            e_boot = e[ind, 0]
-            Y_boot = M + e_boot
-            t_dist[i] = self._compute_test_stat(Y_boot, self.exog)
+
+        def draw(size):
+            # Residual bootstrap, each column is a replication
+            ind = np.random.randint(0, n, size=(size, n))
+            Y_boot = M + e[ind.T, 0]
+            if not self.pivot:
+                return Y_boot, self.exog
+            # The nested resamples of each replication use their own random
+            # state so that they do not depend on the order of execution
+            seed = np.random.randint(2**31 - 1)
+            return Y_boot, self.exog, np.random.RandomState(seed)
+
+        t_dist = _bootstrap_stats(self._compute_test_stat, draw, self.nboot,
+                                  n, n_jobs=self.n_jobs,
+                                  chunk_size=1 if self.pivot else None)
 
         self.t_dist = t_dist
         sig = "Not Significant"
@@ -841,6 +964,9 @@ class TestRegCoefD(TestRegCoefC):
     nboot: int
         Number of bootstrap samples used to determine the distribution
         of the test statistic in a finite sample. Default is 400
+    n_jobs: int
+        The number of jobs to compute the bootstrap replications with
+        ``joblib.Parallel``, -1 uses all cores.  Default is 1.
 
     Attributes
     ----------
@@ -862,24 +988,24 @@ class TestRegCoefD(TestRegCoefC):
     See [9] and chapter 12 in [1].
     """
 
+    def run(self):
+        self.test_stat = self._compute_test_stat(self.endog, self.exog)
+        self.sig = self._compute_sig()
+
     def _compute_test_stat(self, Y, X):
-        """Computes the test statistic"""
+        """Computes the test statistic for each column of `Y`"""
 
         dom_x = np.sort(np.unique(self.exog[:, self.test_vars]))
 
         n = np.shape(X)[0]
-        model = KernelReg(Y, X, self.var_type, self.model.reg_type, self.bw,
-                          defaults = EstimatorSettings(efficient=False))
         X1 = copy.deepcopy(X)
         X1[:, self.test_vars] = 0
 
-        m0 = model.fit(data_predict=X1)[0]
-        m0 = np.reshape(m0, (n, 1))
-        I = np.zeros((n, 1))
+        m0 = self._fit(Y, X, X1, mfx=False)[0]
+        I = np.zeros(m0.shape)
         for i in dom_x[1:] :
             X1[:, self.test_vars] = i
-            m1 = model.fit(data_predict=X1)[0]
-            m1 = np.reshape(m1, (n, 1))
+            m1 = self._fit(Y, X, X1, mfx=False)[0]
             I += (m1 - m0) ** 2
 
         I = I.sum(axis=0) / float(n)
@@ -899,15 +1025,16 @@ class TestRegCoefD(TestRegCoefC):
         u1 = fct1 * u
         u2 = fct2 * u
         r = fct2 / (5 ** 0.5)
-        I_dist = np.empty((self.nboot,1))
-        for j in range(self.nboot):
-            u_boot = copy.deepcopy(u2)
 
-            prob = np.random.uniform(0,1, size = (n,1))
-            ind = prob < r
-            u_boot[ind] = u1[ind]
+        def draw(size):
+            # Wild bootstrap, each column is a replication
+            prob = np.random.uniform(0, 1, size=(size, n)).T
+            u_boot = np.where(prob < r, u1, u2)
             Y_boot = m + u_boot
-            I_dist[j] = self._compute_test_stat(Y_boot, X)
+            return Y_boot, X
+
+        I_dist = _bootstrap_stats(self._compute_test_stat, draw, self.nboot,
+                                  n, n_jobs=self.n_jobs)
 
         sig = "Not Significant"
         if self.test_stat > mquantiles(I_dist, 0.9):
@@ -186,3 +186,306 @@ def lowess(endog, exog, frac=2.0/3.0, it=3, delta=0.0, is_sorted=False,
 
         # we don't need to return exog anymore
         return yfitted
+
+
+def _lowess_plan(x, delta):
+    """Points at which a regression is fit and how the others are filled
+
+    Replays the index updates of the compiled lowess, which depend only on
+    the sorted exog, so that the plan can be shared by all endog columns,
+    fractions and robustifying iterations.
+
+    Returns
+    -------
+    fit_idx : ndarray
+        Indices of the points at which a local regression is run.
+    tie_idx, tie_src : ndarray
+        Points tied with a previously fit point and the index they copy.
+    interp_idx, interp_left, interp_right : ndarray
+        Points obtained by linear interpolation and the fitted points
+        they are interpolated between.
+    """
+    n = x.shape[0]
+    fit_idx, tie_idx, tie_src = [], [], []
+    interp_idx, interp_left, interp_right = [], [], []
+    i = 0
+    last_fit_i = -1
+    while True:
+        fit_idx.append(i)
+        if last_fit_i < i - 1:
+            skipped = range(last_fit_i + 1, i)
+            interp_idx.extend(skipped)
+            interp_left.extend([last_fit_i] * len(skipped))
+            interp_right.extend([i] * len(skipped))
+        last_fit_i = i
+        k = last_fit_i
+        cutpoint = x[last_fit_i] + delta
+        for k in range(last_fit_i + 1, n):
+            if x[k] > cutpoint:
+                break
+            if x[k] == x[last_fit_i]:
+                tie_idx.append(k)
+                tie_src.append(last_fit_i)
+                last_fit_i = k
+        i = max(k - 1, last_fit_i + 1)
+        if last_fit_i >= n - 1:
+            break
+
+    return tuple(np.asarray(idx, dtype=np.intp)
+                 for idx in (fit_idx, tie_idx, tie_src,
+                             interp_idx, interp_left, interp_right))
+
+
+def _lowess_sorted(y, x, frac, it, plan, chunksize=2**20):
+    """Lowess fit of all columns of y on sorted x for one fraction"""
+    n, k_endog = y.shape
+    if not 0 <= frac <= 1:
+        raise ValueError("Lowess `frac` must be in the range [0,1]!")
+    # same number of neighbors as the compiled lowess
+    k = min(max(int(frac * n + 1e-10), 2), n)
+    fit_idx, tie_idx, tie_src, interp_idx, interp_left, interp_right = plan
+    n_fit = len(fit_idx)
+
+    # The neighborhood of x[i] is the window of k points starting at the
+    # first left end whose window midpoint is not below x[i].
+    midpoints = (x[:n - k] + x[k:]) / 2.
+    left = np.searchsorted(midpoints, x[fit_idx], side='left')
+    radius = np.maximum(x[fit_idx] - x[left], x[left + k - 1] - x[fit_idx])
+
+    if interp_idx.size:
+        a = ((x[interp_idx] - x[interp_left]) /
+             (x[interp_right] - x[interp_left]))[:, None]
+
+    # Blocks of consecutive fit points. The kernel weights of a block are a
+    # dense (points, span) array over the union of their windows, so that
+    # the local moments of all columns are matrix products. The number of
+    # elements of the block arrays is limited by chunksize.
+    blocks = []
+    start = 0
+    while start < n_fit:
+        stop = min(start + max(chunksize // k, 1), n_fit)
+        while (stop - start > 1 and (stop - start) *
+               (left[stop - 1] - left[start] + k) > chunksize):
+            stop = start + (stop - start) // 2
+        blocks.append(slice(start, stop))
+        start = stop
+
+    resid_weights = np.ones((n, k_endog))
+    for robiter in range(it + 1):
+        y_fit = np.empty((n, k_endog))
+        ry = resid_weights * y
+        nonzero = (resid_weights != 0).astype(float)
+        all_nonzero = nonzero.all()
+        for sl in blocks:
+            lo = left[sl.start]
+            hi = left[sl.stop - 1] + k
+            x_i = x[fit_idx[sl]][:, None]
+            # x centered at the fit point and the tricube weights of the
+            # distance, zero outside of the window of each fit point
+            x_j = x[lo:hi] - x_i
+            first = (left[sl] - lo)[:, None]
+            cols = np.arange(hi - lo)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                weights = np.abs(x_j)
+                weights /= radius[sl, None]
+                np.minimum(weights, 1, out=weights)
+                weights *= weights * weights
+                np.subtract(1, weights, out=weights)
+                weights *= weights * weights
+                # the windows differ only in the first and last columns
+                weights[:, :first[-1, 0]] *= cols[:first[-1, 0]] >= first
+                weights[:, k:] *= cols[k:] < first + k
+                # moments weighted by the kernel times the residual weights
+                s0 = weights.dot(resid_weights[lo:hi])
+                if all_nonzero:
+                    n_pos = np.count_nonzero(weights, 1)[:, None]
+                else:
+                    n_pos = (weights != 0).astype(float).dot(nonzero[lo:hi])
+                reg_ok = ~((s0 <= 0) | (n_pos == 1))
+                sy = weights.dot(ry[lo:hi])
+                weights *= x_j
+                sx = weights.dot(resid_weights[lo:hi])
+                sxy = weights.dot(ry[lo:hi])
+                weights *= x_j
+                sxx = weights.dot(resid_weights[lo:hi])
+                xbar = sx / s0
+                sqdev = sxx / s0 - xbar**2
+                ybar = sy / s0
+                sxy = sxy / s0 - xbar * ybar
+                # local constant fit if the neighbors with positive weight
+                # all have the same exog value
+                fitted = ybar - xbar * np.where(sqdev > 0, sxy / sqdev, 0)
+            y_fit[fit_idx[sl]] = np.where(reg_ok, fitted, y[fit_idx[sl]])
+
+        # ties are in increasing order, so their sources are already set
+        for dst, src in zip(tie_idx, tie_src):
+            y_fit[dst] = y_fit[src]
+        if interp_idx.size:
+            y_fit[interp_idx] = (a * y_fit[interp_right] +
+                                 (1 - a) * y_fit[interp_left])
+
+        if robiter < it:
+            std_resid = np.abs(y - y_fit)
+            median = np.median(std_resid, axis=0)
+            std_resid = np.where(median == 0, (std_resid > 0).astype(float),
+                                 std_resid / (6. * np.where(median == 0, 1,
+                                                            median)))
+            std_resid = np.minimum(std_resid, 1.)
+            resid_weights = (1. - std_resid**2)**2
+
+    return y_fit
+
+
+def lowess_batch(endog, exog, frac=2.0/3.0, it=3, delta=0.0, xvals=None,
+                 is_sorted=False, missing='drop', n_jobs=1):
+    '''LOWESS of several series on a common exog and for several fractions
+
+    Vectorized version of `lowess` for smoothing the columns of a 2-D
+    endog that share one exog, optionally for a sequence of `frac` values
+    at once, e.g. to compare or cross-validate the amount of smoothing.
+
+    Parameters
+    ----------
+    endog : array_like
+        The y-values of the observed points, 1-D or 2-D with one series
+        in each column.
+    exog : 1-D array_like
+        The x-values of the observed points, shared by all columns of
+        endog.
+    frac : float or array_like
+        Between 0 and 1. The fraction of the data used when estimating
+        each y-value. If a sequence is given, the smoother is computed for
+        each fraction.
+    it : int
+        The number of residual-based reweightings to perform.
+    delta : float
+        Distance within which to use linear-interpolation instead of
+        weighted regression.
+    xvals : 1-D array_like, optional
+        If given, the smoothed values are linearly interpolated at these
+        points instead of being returned at exog. Points outside the range
+        of exog are nan.
+    is_sorted : bool
+        If False (default), then the data will be sorted by exog before
+        calculating lowess. If True, then it is assumed that the data is
+        already sorted by exog.
+    missing : str
+        Available options are 'none', 'drop', and 'raise'. If 'drop', any
+        observation with a nan in exog or in any column of endog is
+        dropped. If 'raise', an error is raised. Default is 'drop'.
+    n_jobs : int
+        Number of threads used to smooth blocks of columns and the
+        fractions in parallel. The computations are numpy array operations
+        that release the GIL. Requires joblib for n_jobs other than 1.
+
+    Returns
+    -------
+    out : ndarray
+        The fitted values in the order of the input observations, with nan
+        for dropped observations, or the values at `xvals` if given. The
+        shape is that of endog, with ``nobs`` replaced by ``len(xvals)``
+        if given, and with a leading axis for the fractions if `frac` is
+        a sequence.
+
+    See Also
+    --------
+    lowess
+
+    Notes
+    -----
+    The results agree with `lowess` column by column. The sort order of
+    exog, the points at which a local regression is run when `delta` is
+    positive and the neighborhood of each of these points are computed
+    once and shared by all columns and robustifying iterations, and the
+    local regressions are computed for many points and columns at once.
+
+    If all neighbors with positive weight have the same exog value, the
+    local regression is replaced by the weighted mean of their endog. In
+    this case `lowess` can return unstable values or nan for the series.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from statsmodels.nonparametric.smoothers_lowess import lowess_batch
+    >>> x = np.random.uniform(low=-2*np.pi, high=2*np.pi, size=500)
+    >>> y = np.sin(x)[:, None] + np.random.normal(size=(len(x), 10))
+    >>> fitted = lowess_batch(y, x, frac=[0.1, 0.2, 0.4])
+    >>> fitted.shape
+    (3, 500, 10)
+    '''
+    endog = np.asarray(endog, float)
+    exog = np.asarray(exog, float)
+    fracs = np.asarray(frac, float)
+
+    if exog.ndim != 1:
+        raise ValueError('exog must be a vector')
+    if endog.ndim not in [1, 2]:
+        raise ValueError('endog must be 1-D or 2-D')
+    if fracs.ndim > 1:
+        raise ValueError('frac must be a scalar or a vector')
+    if endog.shape[0] != exog.shape[0]:
+        raise ValueError('exog and endog must have same length')
+
+    y = endog.reshape(endog.shape[0], -1)
+    if missing in ['drop', 'raise']:
+        mask_valid = np.isfinite(exog) & np.isfinite(y).all(1)
+        all_valid = np.all(mask_valid)
+        if not all_valid and missing == 'raise':
+            raise ValueError('nan or inf found in data')
+    elif missing == 'none':
+        mask_valid = np.ones(exog.shape[0], bool)
+        all_valid = True
+    else:
+        raise ValueError("missing can only be 'none', 'drop' or 'raise'")
+    x = exog[mask_valid]
+    y = y[mask_valid]
+
+    if not is_sorted:
+        sort_index = np.argsort(x)
+        x = x[sort_index]
+        y = y[sort_index]
+    plan = _lowess_plan(x, delta)
+
+    if n_jobs == 1:
+        parallel, p_func = list, _lowess_sorted
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_lowess_sorted, n_jobs,
+                                                 verbose=0,
+                                                 backend='threading')
+    # one task for each fraction and block of columns
+    col_blocks = np.array_split(np.arange(y.shape[1]),
+                                min(max(n_jobs, 1), y.shape[1]))
+    results = parallel(p_func(y[:, cols], x, f, it, plan)
+                       for f in fracs.ravel() for cols in col_blocks)
+
+    n_blocks = len(col_blocks)
+    fitted = [np.column_stack(results[j:j + n_blocks])
+              for j in range(0, len(results), n_blocks)]
+
+    out = []
+    for y_fit in fitted:
+        if xvals is not None:
+            xvals_ = np.asarray(xvals, float)
+            # ties share the same fitted value
+            x_unique, first = np.unique(x, return_index=True)
+            y_fit = np.column_stack([np.interp(xvals_, x_unique, col,
+                                               left=np.nan, right=np.nan)
+                                     for col in y_fit[first].T])
+            y_fit = y_fit.reshape(xvals_.shape + endog.shape[1:])
+        else:
+            if not is_sorted:
+                y_fit_ = np.empty_like(y_fit)
+                y_fit_[sort_index] = y_fit
+                y_fit = y_fit_
+            if not all_valid:
+                y_fit_ = np.empty((endog.shape[0], y_fit.shape[1]))
+                y_fit_.fill(np.nan)
+                y_fit_[mask_valid] = y_fit
+                y_fit = y_fit_
+            y_fit = y_fit.reshape(endog.shape)
+        out.append(y_fit)
+
+    if fracs.ndim == 0:
+        return out[0]
+    return np.array(out)
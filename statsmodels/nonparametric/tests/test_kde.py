@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 from statsmodels.distributions.mixture_rvs import mixture_rvs
 from statsmodels.nonparametric.kde import KDEUnivariate as KDE
+from statsmodels.nonparametric.kde import KDEUnivariateSketch
 import statsmodels.sandbox.nonparametric.kernels as kernels
 from scipy import stats
 
@@ -42,19 +43,21 @@ class TestKDEExceptions(object):
         with pytest.raises(ValueError):
             self.kde.evaluate(0)
 
-    def test_non_weighted_fft_exception(self):
-        with pytest.raises(NotImplementedError):
-            self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_200,
-                         fft=True, bw="silverman")
-
     def test_wrong_weight_length_exception(self):
         with pytest.raises(ValueError):
             self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_100,
                          fft=False, bw="silverman")
 
-    def test_non_gaussian_fft_exception(self):
-        with pytest.raises(NotImplementedError):
-            self.kde.fit(kernel="epa", gridsize=50, fft=True, bw="silverman")
+    def test_wrong_weight_length_fft_exception(self):
+        with pytest.raises(ValueError):
+            self.kde.fit(kernel="gau", gridsize=50, weights=self.weights_100,
+                         fft=True, bw="silverman")
+
+    def test_evaluate_method_exception(self):
+        kde = KDE(Xi)
+        kde.fit()
+        with pytest.raises(ValueError):
+            kde.evaluate(0, method="grid")
 
 class CheckKDE(object):
 
@@ -187,6 +190,116 @@ class TestKDEGaussFFT(CheckKDE):
         rfname2 = os.path.join(curdir,'results','results_kde_fft.csv')
         cls.res_density = np.genfromtxt(open(rfname2, 'rb'))
 
+@pytest.mark.parametrize('kernel', ['gau', 'epa', 'uni', 'tri', 'biw',
+                                    'triw', 'cos', 'cos2'])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_fft_kernels(kernel, weighted):
+    weights = np.linspace(1, 100, 200) if weighted else None
+    kde = KDE(Xi)
+    kde.fit(kernel=kernel, fft=True, weights=weights, bw="silverman")
+    res = KDE(Xi)
+    res.fit(kernel=kernel, fft=False, weights=weights, bw="silverman",
+            gridsize=len(kde.support))
+    npt.assert_allclose(res.support, kde.support, rtol=1e-12)
+    # linear binning error, the uniform kernel is discontinuous
+    tol = 0.1 if kernel == 'uni' else 5e-3
+    npt.assert_allclose(kde.density, res.density,
+                        atol=tol * res.density.max())
+    npt.assert_allclose(kde.evaluate(kde.support), res.density, rtol=1e-10,
+                        atol=1e-14)
+
+
+def test_fft_frequency_weights():
+    # Integer frequency weights are the same as repeated observations
+    x = np.round(Xi, 1)
+    values, freq = np.unique(x, return_counts=True)
+    kde = KDE(values)
+    kde.fit(kernel="epa", bw=0.3, weights=freq)
+    res = KDE(x)
+    res.fit(kernel="epa", bw=0.3)
+    npt.assert_allclose(kde.support, res.support, rtol=1e-12)
+    npt.assert_allclose(kde.density, res.density, rtol=1e-8, atol=1e-12)
+
+
+def test_evaluate_array():
+    kde = KDE(Xi)
+    kde.fit(kernel="gau", bw="silverman")
+    points = np.linspace(-4, 4, 21)
+    desired = np.squeeze([kde.evaluate(xi) for xi in points])
+    npt.assert_allclose(kde.evaluate(points), desired, rtol=1e-12)
+    npt.assert_equal(np.ndim(kde.evaluate(0.5)), 0)
+    npt.assert_equal(kde.evaluate([0.5]).shape, (1,))
+    npt.assert_allclose(kde.evaluate(0.5), kde.evaluate([0.5])[0])
+
+    dens = kde.evaluate(points, method="interpolate")
+    npt.assert_allclose(dens, desired, atol=1e-3)
+    npt.assert_equal(kde.evaluate([-1e3, 1e3], method="interpolate"), 0)
+    npt.assert_equal(np.ndim(kde.evaluate(0.5, method="interpolate")), 0)
+
+
+def test_fft_gridsize():
+    # The default grid has at least one point per observation
+    x = np.random.RandomState(1234).standard_normal(70000)
+    kde = KDE(x)
+    kde.fit()
+    npt.assert_equal(len(kde.support), 2**17)
+    kde.fit(gridsize=2**12)
+    npt.assert_equal(len(kde.support), 2**12)
+
+
+@pytest.mark.parametrize('kernel', ['gau', 'epa'])
+def test_sketch(kernel):
+    kde = KDE(Xi)
+    kde.fit(kernel=kernel, fft=False, gridsize=1024, bw="silverman")
+
+    sketch = KDEUnivariateSketch(-5, 5, gridsize=2048)
+    other = KDEUnivariateSketch(-5, 5, gridsize=2048)
+    for chunk in np.array_split(Xi[:150], 4):
+        sketch.update(chunk)
+    other.update(Xi[150:])
+    sketch.merge(other)
+    npt.assert_equal(sketch.nobs, len(Xi))
+    npt.assert_allclose(sketch.std, Xi.std(ddof=1), rtol=1e-12)
+
+    sketch.fit(kernel=kernel, bw=kde.bw)
+    npt.assert_allclose(sketch.evaluate(kde.support), kde.density, atol=2e-3)
+    npt.assert_allclose(sketch.cdf[-1], 1, rtol=1e-6)
+    if kernel == 'gau':
+        # the integrals of KDEUnivariate need a kernel without domain
+        npt.assert_allclose(sketch.entropy, kde.entropy, rtol=1e-3)
+        cdf = np.interp(kde.support, sketch.support, sketch.cdf)
+        npt.assert_allclose(cdf, kde.cdf, atol=1e-3)
+    npt.assert_allclose(sketch.sf, 1 - sketch.cdf)
+    median = sketch.icdf[len(sketch.icdf) // 2]
+    npt.assert_allclose(np.interp(median, sketch.support, sketch.cdf), 0.5,
+                        atol=1e-3)
+
+    sketch.fit(kernel=kernel, bw="silverman")
+    npt.assert_allclose(sketch.bw, kde.bw, rtol=0.05)
+
+
+def test_sketch_weights():
+    weights = np.linspace(1, 100, 200)
+    kde = KDE(Xi)
+    kde.fit(kernel="gau", weights=weights, bw=0.3)
+    sketch = KDEUnivariateSketch(kde.support[0], kde.support[-1],
+                                 gridsize=len(kde.support))
+    sketch.update(Xi, weights).fit(bw=0.3)
+    npt.assert_allclose(sketch.density, kde.density, atol=1e-3)
+
+    # Observations outside of the grid are part of the normalization
+    sketch = KDEUnivariateSketch(-1, 5, gridsize=1024)
+    sketch.update(Xi, weights).fit(bw=0.3)
+    below = weights[Xi < -1].sum() / weights.sum()
+    npt.assert_allclose(sketch.weight_below / sketch.sum_weights, below)
+    npt.assert_allclose(sketch.cdf[0], below)
+
+    with pytest.raises(ValueError):
+        sketch.merge(KDEUnivariateSketch(-1, 4, gridsize=1024))
+    with pytest.raises(ValueError):
+        KDEUnivariateSketch(-1, 5).fit()
+
+
 class CheckKDEWeights(object):
 
     @classmethod
@@ -261,6 +261,62 @@ class TestKDEMultivariate(KDETestBase):
                                                           n_sub=100))
         npt.assert_equal(dens.bw, bw_user)
 
+    @pytest.mark.parametrize('var_type', ['c', 'cc', 'cou', 'ou'])
+    def test_binned(self, var_type):
+        nobs = 500
+        np.random.seed(12345)
+        data = dict(c=np.random.normal(size=(nobs, 2)),
+                    o=np.random.binomial(3, 0.4, size=(nobs, 1)),
+                    u=np.random.binomial(1, 0.3, size=(nobs, 1)))
+        data = np.column_stack([data[v][:, :var_type.count(v)]
+                                for v in 'cou'])
+        bw = np.array([dict(c=0.3, o=0.3, u=0.2)[v] for v in var_type])
+        dens = nparam.KDEMultivariate(data, var_type, bw=bw)
+        dens_binned = nparam.KDEMultivariate(
+            data, var_type, bw=bw,
+            defaults=nparam.EstimatorSettings(evaluation='binned'))
+
+        # Includes evaluation points outside of the grid
+        data_predict = data[:20] * 1.5
+        assert_allclose(dens_binned.pdf(data_predict),
+                        dens.pdf(data_predict), rtol=1e-2)
+        assert_allclose(dens_binned.cdf(data_predict),
+                        dens.cdf(data_predict), rtol=1e-2)
+        assert_allclose(dens_binned.loo_likelihood(bw, np.log),
+                        dens.loo_likelihood(bw, np.log), rtol=1e-3)
+        assert_allclose(dens_binned.imse(bw), dens.imse(bw), rtol=1e-3)
+
+    @pytest.mark.parametrize('var_type', ['c', 'co'])
+    def test_binned_all_outside(self, var_type):
+        # No evaluation point is on the grid
+        np.random.seed(12345)
+        data = np.column_stack([np.random.normal(size=200),
+                                np.random.binomial(3, 0.4, size=200)])
+        data = data[:, :len(var_type)]
+        bw = np.array([0.3, 0.3])[:len(var_type)]
+        dens = nparam.KDEMultivariate(data, var_type, bw=bw)
+        dens_binned = nparam.KDEMultivariate(
+            data, var_type, bw=bw,
+            defaults=nparam.EstimatorSettings(evaluation='binned'))
+        data_predict = np.array([[-50., 1.], [20., 2.]])[:, :len(var_type)]
+        assert_allclose(dens_binned.pdf(data_predict),
+                        dens.pdf(data_predict))
+        assert_allclose(dens_binned.cdf(data_predict),
+                        dens.cdf(data_predict))
+
+    @pytest.mark.slow
+    def test_binned_cv_ml(self):
+        nobs = 1000
+        np.random.seed(12345)
+        C1 = np.random.normal(size=(nobs, ))
+        O = np.random.binomial(3, 0.4, size=(nobs, ))
+        dens = nparam.KDEMultivariate(data=[C1, O], var_type='co',
+                                      bw='cv_ml')
+        dens_binned = nparam.KDEMultivariate(
+            data=[C1, O], var_type='co', bw='cv_ml',
+            defaults=nparam.EstimatorSettings(evaluation='binned'))
+        assert_allclose(dens_binned.bw, dens.bw, rtol=1e-2)
+
 
 class TestKDEMultivariateConditional(KDETestBase):
     @pytest.mark.slow
@@ -329,6 +329,97 @@ class TestKernelReg(KernelRegressionTestBase):
         # Bandwidth
         npt.assert_equal(model.bw, bw_user)
 
+    @pytest.mark.parametrize('reg_type', ['lc', 'll'])
+    def test_fit_per_point(self, reg_type):
+        exog = np.column_stack((self.c1, self.o, self.c2))
+        model = nparam.KernelReg(endog=[self.y2], exog=exog, var_type='coc',
+                                 reg_type=reg_type, bw=[0.5, 0.2, 0.8])
+        func = model.est[reg_type]
+        mean, mfx = model.fit()
+        for i in range(0, len(exog), 7):
+            mean_i, mfx_i = func(model.bw, model.endog, model.exog, exog[i])
+            npt.assert_allclose(mean[i], np.squeeze(mean_i), rtol=1e-10)
+            npt.assert_allclose(mfx[i], np.squeeze(mfx_i), rtol=1e-8,
+                                atol=1e-12)
+
+        # Leave-one-out fits of the cross-validation function
+        L = 0
+        for i in range(len(exog)):
+            not_i = np.arange(len(exog)) != i
+            mean_i = func(model.bw, model.endog[not_i], exog[not_i], exog[i])
+            L += (model.endog[i] - mean_i[0])**2
+        npt.assert_allclose(model.cv_loo(model.bw, func), L / len(exog),
+                            rtol=1e-10)
+
+    def test_censored_fit_per_point(self):
+        Y = np.minimum(self.y2[:, 0], 40)
+        exog = np.column_stack((self.c1, self.o))
+        model = nparam.KernelCensoredReg(endog=[Y], exog=exog,
+                                         var_type='co', reg_type='ll',
+                                         bw=[0.5, 0.2], censor_val=40)
+        mean, mfx = model.fit()
+        for i in range(0, len(exog), 7):
+            mean_i, mfx_i = model._est_loc_linear(
+                model.bw, model.endog, model.exog, model.exog[i],
+                W=model.W_in)
+            npt.assert_allclose(mean[i], np.squeeze(mean_i), rtol=1e-10)
+            npt.assert_allclose(mfx[i], np.squeeze(mfx_i), rtol=1e-8)
+
+    @pytest.mark.parametrize('reg_type', ['lc', 'll'])
+    def test_binned(self, reg_type):
+        nobs = 2000
+        np.random.seed(1234)
+        C1 = np.random.normal(size=nobs)
+        O = np.random.binomial(2, 0.5, size=nobs)
+        Y = np.sin(C1) + 0.5 * O + np.random.normal(scale=0.3, size=nobs)
+        bw = [0.2, 0.3]
+        res = []
+        for evaluation in ['exact', 'binned']:
+            settings = nparam.EstimatorSettings(evaluation=evaluation)
+            model = nparam.KernelReg(endog=[Y], exog=[C1, O], var_type='co',
+                                     reg_type=reg_type, bw=bw,
+                                     defaults=settings)
+            cv = model.cv_loo(model.bw, model.est[reg_type])
+            res.append((model.fit()[0], cv, model.aic_hurvich(model.bw)))
+        (mean, cv, aic), (mean_binned, cv_binned, aic_binned) = res
+        npt.assert_allclose(mean_binned, mean, rtol=1e-2, atol=1e-3)
+        npt.assert_allclose(cv_binned, cv, rtol=5e-3)
+        npt.assert_allclose(aic_binned, aic, rtol=5e-3)
+
+    def test_significance_n_jobs(self):
+        from statsmodels.nonparametric.kernel_regression import (
+            TestRegCoefC, TestRegCoefD)
+        exog = np.column_stack((self.c1, self.c3, self.o))
+        model = nparam.KernelReg(endog=[self.y2], exog=exog, var_type='cco',
+                                 reg_type='ll', bw=[0.5, 1.5, 0.2])
+        for n_jobs in [1, 2]:
+            np.random.seed(1234)
+            res = TestRegCoefC(model, [1], nboot=20, n_jobs=n_jobs)
+            res_pivot = TestRegCoefC(model, [0], nboot=4, nested_res=5,
+                                     pivot=True, n_jobs=n_jobs)
+            res_d = TestRegCoefD(model, [2], nboot=10, n_jobs=n_jobs)
+            npt.assert_equal(np.shape(res_d.test_stat), (1,))
+            if n_jobs == 1:
+                desired = res.t_dist, res_pivot.t_dist, res_d.sig
+            else:
+                npt.assert_allclose(res.t_dist, desired[0], rtol=1e-12)
+                npt.assert_allclose(res_pivot.t_dist, desired[1], rtol=1e-12)
+                npt.assert_equal(res_d.sig, desired[2])
+
+        # The batched replications are the same as the sequential ones
+        np.random.seed(1234)
+        n = len(exog)
+        t_dist = []
+        X = exog.copy()
+        X[:, 1] = X[:, 1].mean()
+        M = res._fit(model.endog, X, mfx=False)[0]
+        e = model.endog - M
+        e = e - e.mean()
+        for i in range(20):
+            ind = np.random.randint(0, n, size=(n, 1))
+            t_dist.append(res._compute_test_stat(M + e[ind, 0], exog)[0])
+        npt.assert_allclose(desired[0], t_dist, rtol=1e-10)
+
 
 def test_invalid_bw():
     # GH4873
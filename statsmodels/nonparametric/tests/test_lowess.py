@@ -13,9 +13,9 @@ import os
 
 import numpy as np
 from numpy.testing import (assert_almost_equal, assert_, assert_raises,
-                           assert_equal)
+                           assert_equal, assert_allclose)
 
-from statsmodels.nonparametric.smoothers_lowess import lowess
+from statsmodels.nonparametric.smoothers_lowess import lowess, lowess_batch
 
 # Number of decimals to test equality with.
 # The default is 7.
@@ -154,3 +154,78 @@ def test_returns_inputs():
     x = np.arange(20)
     result = lowess(y, x, frac=.4)
     assert_almost_equal(result, np.column_stack((x, y)))
+
+
+def test_batch():
+    # columns and fractions agree with separate calls to lowess, the delta
+    # file includes tied exog values
+    data = np.genfromtxt(os.path.join(rpath, 'test_lowess_delta.csv'),
+                         delimiter=',', names=True)
+    x = data['x']
+    np.random.seed(1234)
+    endog = data['y'][:, None] + np.random.standard_t(3, size=(len(x), 4))
+    perm_idx = np.random.permutation(len(x))
+    endog, x = endog[perm_idx], x[perm_idx]
+    fracs = [0.1, 0.3]
+    for delta in [0, .01 * np.ptp(x), 1 + 1e-10]:
+        for it in [0, 3]:
+            res = lowess_batch(endog, x, frac=fracs, it=it, delta=delta)
+            assert_equal(res.shape, (2,) + endog.shape)
+            for j, frac in enumerate(fracs):
+                for col in range(endog.shape[1]):
+                    desired = lowess(endog[:, col], x, frac=frac, it=it,
+                                     delta=delta, return_sorted=False)
+                    assert_allclose(res[j, :, col], desired, rtol=1e-10,
+                                    atol=1e-10)
+
+    # small blocks of fit points give the same result
+    from statsmodels.nonparametric.smoothers_lowess import (_lowess_plan,
+                                                            _lowess_sorted)
+    sort_index = np.argsort(x)
+    plan = _lowess_plan(x[sort_index], 0)
+    res = _lowess_sorted(endog[sort_index], x[sort_index], 0.3, 3, plan)
+    res_small = _lowess_sorted(endog[sort_index], x[sort_index], 0.3, 3,
+                               plan, chunksize=500)
+    assert_allclose(res_small, res, rtol=1e-12, atol=1e-12)
+
+    # threads give the same result
+    res = lowess_batch(endog, x, frac=fracs, n_jobs=2)
+    assert_allclose(res, lowess_batch(endog, x, frac=fracs), rtol=1e-13)
+
+    # 1-D endog and scalar frac
+    res = lowess_batch(endog[:, 0], x, frac=0.2)
+    assert_equal(res.shape, x.shape)
+    assert_allclose(res, lowess(endog[:, 0], x, frac=0.2,
+                                return_sorted=False), rtol=1e-10)
+
+
+def test_batch_options():
+    rfile = os.path.join(rpath, 'test_lowess_simple.csv')
+    test_data = np.genfromtxt(rfile, delimiter=',', names=True)
+    y, x = test_data['y'], test_data['x']
+    assert_almost_equal(lowess_batch(y, x), test_data['out'], 7)
+    endog = np.column_stack((y, 2 * y + 1))
+
+    # interpolation at new points, nan outside of the data
+    fitted = lowess_batch(endog, x)
+    xvals = np.array([x.min() - 1, x[3], (x[3] + x[4]) / 2., x.max() + 1])
+    res = lowess_batch(endog, x, xvals=xvals)
+    assert_equal(res.shape, (4, 2))
+    assert_(np.isnan(res[[0, -1]]).all())
+    assert_allclose(res[1], fitted[3], rtol=1e-13)
+    assert_allclose(res[2], fitted[3:5].mean(0), rtol=1e-13)
+
+    # missing values drop the observation for all columns
+    endog[5, 1] = np.nan
+    x = x.copy()
+    x[3] = np.nan
+    mask_valid = np.isfinite(x) & np.isfinite(endog).all(1)
+    res = lowess_batch(endog, x)
+    assert_(np.isnan(res[~mask_valid]).all())
+    assert_allclose(res[mask_valid],
+                    lowess_batch(endog[mask_valid], x[mask_valid],
+                                 is_sorted=True, missing='none'),
+                    rtol=1e-13)
+    assert_raises(ValueError, lowess_batch, endog, x, missing='raise')
+    assert_raises(ValueError, lowess_batch, endog, x, frac=1.5)
+    assert_raises(ValueError, lowess_batch, endog[:3], x)
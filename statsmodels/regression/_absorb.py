@@ -0,0 +1,179 @@
+"""
+Within transformation for absorbed fixed effects.
+
+The fixed effects of one or more factor variables are projected out of the
+data by the method of alternating projections, i.e. by repeatedly
+subtracting the (weighted) group means of each factor until the data are
+orthogonal to all sets of dummy variables.  The dummy variables are never
+created as dense arrays.
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from statsmodels.tools import _sparse
+from statsmodels.tools.sm_exceptions import (ConvergenceWarning,
+                                             MissingDataError, ValueWarning)
+
+
+def _factorize_absorb(absorb):
+    """
+    Convert the factor variables to integer codes.
+
+    Parameters
+    ----------
+    absorb : array-like
+        1d or 2d array, Series or DataFrame with one column for each factor.
+        The levels can have any hashable type.
+
+    Returns
+    -------
+    codes : ndarray
+        2d integer array, nobs x n_factors, where the levels of each factor
+        are coded as consecutive integers starting at 0.
+    """
+    if isinstance(absorb, pd.DataFrame):
+        columns = [absorb.iloc[:, j] for j in range(absorb.shape[1])]
+    elif isinstance(absorb, pd.Series):
+        columns = [absorb]
+    else:
+        absorb = np.asarray(absorb)
+        if absorb.ndim == 1:
+            absorb = absorb[:, None]
+        elif absorb.ndim != 2:
+            raise ValueError("absorb must be 1d or 2d")
+        columns = [absorb[:, j] for j in range(absorb.shape[1])]
+
+    codes = np.column_stack([pd.factorize(col)[0] for col in columns])
+    if (codes < 0).any():
+        raise MissingDataError("absorb contains missing values")
+    return codes
+
+
+class _Absorber(object):
+    """
+    Alternating projections onto the complement of several sets of dummies.
+
+    Parameters
+    ----------
+    codes : ndarray
+        2d integer array, nobs x n_factors, of consecutive integer codes as
+        returned by `_factorize_absorb`.
+    weights : ndarray, optional
+        1d array of weights.  The data are demeaned with weighted group
+        means, so that a WLS regression of the demeaned data gives the WLS
+        estimates of the model that includes the dummy variables.
+    tol : float
+        Convergence tolerance for the largest absolute change in a sweep
+        over all factors, relative to the largest absolute value of the data.
+    maxiter : int
+        Maximum number of sweeps over all factors.
+    max_rank_levels : int
+        The largest total number of levels for which the rank of the dummy
+        variables of three or more factors, that are not nested in each
+        other, is computed from their dense cross-product.  Above it the
+        upper bound of the rank is used and a warning is issued.
+
+    Attributes
+    ----------
+    k_absorb : int
+        The number of linearly independent dummy variables that are
+        absorbed, i.e. the degrees of freedom used by the fixed effects.
+    """
+
+    def __init__(self, codes, weights=None, tol=1e-10, maxiter=1000,
+                 max_rank_levels=2000):
+        codes = np.asarray(codes)
+        nobs = codes.shape[0]
+        self.tol = tol
+        self.maxiter = maxiter
+        self.max_rank_levels = max_rank_levels
+        self.weights = (np.ones(nobs) if weights is None else
+                        np.asarray(weights, dtype=np.float64))
+        self.n_levels = codes.max(0) + 1
+
+        self.dummies = []
+        self.wsums = []
+        rows = np.arange(nobs)
+        for j in range(codes.shape[1]):
+            dummy = sparse.csr_matrix((np.ones(nobs), (rows, codes[:, j])),
+                                      shape=(nobs, self.n_levels[j]))
+            self.dummies.append(dummy)
+            self.wsums.append(dummy.T.dot(self.weights))
+
+        self.k_absorb = self._count_absorbed(codes)
+
+    def _count_absorbed(self, codes):
+        # A factor whose levels are unions of the levels of another factor
+        # has dummy variables in the span of the finer factor and adds no
+        # rank, e.g. firm if firm x product is also absorbed.
+        keep = list(range(codes.shape[1]))
+        for j in range(codes.shape[1]):
+            for i in keep:
+                if i == j:
+                    continue
+                pairs = np.unique(codes[:, [i, j]], axis=0)
+                if len(pairs) == self.n_levels[i]:
+                    keep.remove(j)
+                    break
+
+        # The first factor has no redundant levels.  Between two factors
+        # there is one redundancy for each connected component of the
+        # bipartite graph of their levels.  With more factors the rank of
+        # the stacked dummy variables is computed.
+        n_levels = self.n_levels[keep]
+        if len(keep) == 1:
+            return int(n_levels[0])
+        if len(keep) == 2:
+            from scipy.sparse.csgraph import connected_components
+            graph = self.dummies[keep[0]].T.dot(self.dummies[keep[1]])
+            adj = sparse.bmat([[None, graph], [graph.T, None]])
+            n_comp = connected_components(adj, directed=False)[0]
+            return int(n_levels.sum() - n_comp)
+        if n_levels.sum() <= self.max_rank_levels:
+            dummies = sparse.hstack([self.dummies[j] for j in keep])
+            return _sparse.matrix_rank(dummies)
+        # Each dummy set contains the constant, so this is an upper bound
+        k_absorb = n_levels.sum() - len(keep) + 1
+        warnings.warn("The rank of the absorbed fixed effects is not "
+                      "computed for more than %d levels of factors that are "
+                      "not nested, k_absorb=%d is an upper bound"
+                      % (self.max_rank_levels, k_absorb), ValueWarning)
+        return int(k_absorb)
+
+    def demean(self, x):
+        """
+        Project the fixed effects out of x.
+
+        Parameters
+        ----------
+        x : array-like
+            1d or 2d array with nobs rows.
+
+        Returns
+        -------
+        ndarray
+            The residuals of the weighted regression of x on all dummy
+            variables, with the same shape as x.
+        """
+        x = np.array(x, dtype=np.float64)
+        if x.size == 0:
+            return x
+        w = self.weights if x.ndim == 1 else self.weights[:, None]
+        scale = max(np.abs(x).max(), 1.)
+        for iteration in range(self.maxiter):
+            change = 0.
+            for dummy, wsum in zip(self.dummies, self.wsums):
+                wsum = wsum if x.ndim == 1 else wsum[:, None]
+                means = dummy.T.dot(w * x) / np.where(wsum == 0, 1, wsum)
+                step = dummy.dot(means)
+                x -= step
+                change = max(change, np.abs(step).max())
+            if len(self.dummies) == 1 or change <= self.tol * scale:
+                break
+        else:
+            warnings.warn("Alternating projections did not converge in %d "
+                          "iterations" % self.maxiter, ConvergenceWarning)
+        return x
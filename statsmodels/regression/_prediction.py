@@ -10,6 +10,8 @@ License: BSD-3
 import numpy as np
 from scipy import stats
 
+from statsmodels.tools import _sparse
+
 
 # this is similar to ContrastResults after t_test, partially copied and adjusted
 class PredictionResults(object):
@@ -161,7 +163,7 @@ def get_prediction(self, exog=None, transform=True, weights=None,
     predicted_mean = self.model.predict(self.params, exog, **pred_kwds)
 
     covb = self.cov_params()
-    var_pred_mean = (exog * np.dot(covb, exog.T).T).sum(1)
+    var_pred_mean = _sparse.quad_diag(exog, covb)
     var_resid = self.scale  # self.mse_resid / weights
 
     # TODO: check that we have correct scale, Refactor scale #???
@@ -1,5 +1,6 @@
 import numpy as np
 from statsmodels.tools.tools import Bunch
+from statsmodels.tools import _sparse
 
 
 class _MinimalWLS(object):
@@ -109,3 +110,199 @@ class _MinimalWLS(object):
 
         return Bunch(params=params, fittedvalues=fitted_values, resid=resid,
                      model=self, scale=scale)
+
+
+def _gram_solve(xtx, xty, method='cholesky'):
+    """
+    Solve the normal equations given the cross-product matrices.
+
+    Parameters
+    ----------
+    xtx : ndarray
+        k x k cross-product matrix of the (whitened) design, X'X.
+    xty : ndarray
+        k (or k x m) cross-product of design and response, X'y.
+    method : str, optional
+        "cholesky" uses the Cholesky factorization of X'X if it has full
+        rank, "pinv" always uses the eigendecomposition based
+        pseudoinverse.
+
+    Returns
+    -------
+    params : ndarray
+        The least squares estimates.
+    normalized_cov_params : ndarray
+        The (pseudo-)inverse of X'X.
+    singular_values : ndarray
+        Singular values of the design matrix, i.e. the square roots of the
+        eigenvalues of X'X.
+    rank : int
+        Numerical rank of X'X.
+
+    Notes
+    -----
+    The rank is determined from the eigenvalues of X'X using the same
+    tolerance as ``np.linalg.matrix_rank``.  If X'X is rank deficient, the
+    solution is the minimum norm solution computed from the eigenvalues
+    above the tolerance, which is also used if the Cholesky factorization
+    fails.
+    """
+    from scipy import linalg
+
+    xtx = np.asarray(xtx)
+    eigvals, eigvecs = np.linalg.eigh(xtx)
+    eigvals = eigvals[::-1]
+    eigvecs = eigvecs[:, ::-1]
+    tol = eigvals.max() * xtx.shape[0] * np.finfo(xtx.dtype).eps
+    mask = eigvals > tol
+    rank = int(mask.sum())
+
+    singular_values = np.sqrt(np.clip(eigvals, 0, np.inf))
+    if method == 'cholesky' and rank == xtx.shape[0]:
+        try:
+            cho = linalg.cho_factor(xtx, lower=False, check_finite=False)
+        except linalg.LinAlgError:
+            pass
+        else:
+            params = linalg.cho_solve(cho, xty, check_finite=False)
+            normalized_cov_params = linalg.cho_solve(
+                cho, np.eye(xtx.shape[0]), check_finite=False)
+            return params, normalized_cov_params, singular_values, rank
+    elif method not in ('cholesky', 'pinv'):
+        raise ValueError('method has to be "cholesky" or "pinv"')
+
+    vecs = eigvecs[:, mask]
+    normalized_cov_params = np.dot(vecs / eigvals[mask], vecs.T)
+    params = np.dot(normalized_cov_params, xty)
+    return params, normalized_cov_params, singular_values, rank
+
+
+def _inverse_singular_values(s):
+    """
+    Reciprocal of the singular values with the cutoff of np.linalg.pinv.
+
+    Singular values below the cutoff are set to zero.
+    """
+    return np.divide(1., s, out=np.zeros_like(s), where=s > 1e-15 * s.max())
+
+
+class _WLSWorkspace(object):
+    """
+    Preallocated buffers for repeated WLS fits with the same exog.
+
+    Used in iterative estimators like IRLS where only endog and weights
+    change between iterations.  The whitened data are written into buffers
+    that are allocated once, and the factorization of the last fit is kept
+    so that the normalized covariance of the parameters can be computed
+    without refitting.
+
+    Parameters
+    ----------
+    exog : ndarray or sparse matrix
+        2d design matrix, nobs x k.  If exog is a scipy.sparse matrix, then
+        no whitened copy is allocated and all fits use "cholesky" with the
+        cross-products computed by sparse matrix products.
+    """
+
+    msg = _MinimalWLS.msg
+
+    def __init__(self, exog):
+        self.exog = exog
+        self._sparse = _sparse.issparse(exog)
+        if self._sparse:
+            self.wexog = None
+        else:
+            self.wexog = np.empty(exog.shape, dtype=np.float64)
+        self.wendog = np.empty(exog.shape[0], dtype=np.float64)
+        self.w_half = np.empty(exog.shape[0], dtype=np.float64)
+        self._factor = None
+
+    def fit(self, endog, weights, method='lstsq', check_endog=False,
+            check_weights=False):
+        """
+        Fit WLS for the given endog and weights.
+
+        Parameters
+        ----------
+        endog : ndarray
+            1d response variable.
+        weights : ndarray
+            1d array of weights.
+        method : str
+            "lstsq", "pinv", "qr" or "cholesky".  "cholesky" solves the
+            normal equations with the Cholesky factorization of
+            wexog.T wexog and does not allocate any nobs x k arrays.
+        check_endog : bool, optional
+            Flag indicating whether to check for inf/nan in endog.
+            If True and any are found, ValueError is raised.
+        check_weights : bool, optional
+            Flag indicating whether to check for inf/nan in weights.
+            If True and any are found, ValueError is raised.
+
+        Returns
+        -------
+        results : Bunch
+            Bunch with attribute params.
+        """
+        w_half = np.sqrt(weights, out=self.w_half)
+        if check_weights and not np.all(np.isfinite(w_half)):
+            raise ValueError(self.msg.format('weights'))
+        if check_endog and not np.all(np.isfinite(endog)):
+            raise ValueError(self.msg.format('endog'))
+
+        if self._sparse:
+            xtx = _sparse.gram(self.exog, weights)
+            xty = _sparse.tdot(self.exog, weights * endog)
+            params, ncp, _, _ = _gram_solve(xtx, xty)
+            self._factor = ('cov', ncp)
+            return Bunch(params=params)
+
+        wexog = np.multiply(self.exog, w_half[:, None], out=self.wexog)
+        wendog = np.multiply(endog, w_half, out=self.wendog)
+
+        if method == 'lstsq':
+            params = np.linalg.lstsq(wexog, wendog, rcond=-1)[0]
+            self._factor = None
+        elif method == 'pinv':
+            u, s, vt = np.linalg.svd(wexog, full_matrices=False)
+            s_inv = _inverse_singular_values(s)
+            params = np.dot(vt.T, s_inv * np.dot(u.T, wendog))
+            self._factor = ('svd', s_inv, vt)
+        elif method == 'qr':
+            Q, R = np.linalg.qr(wexog)
+            params = np.linalg.solve(R, np.dot(Q.T, wendog))
+            self._factor = ('qr', R)
+        elif method == 'cholesky':
+            xtx = np.dot(wexog.T, wexog)
+            xty = np.dot(wexog.T, wendog)
+            params, ncp, _, _ = _gram_solve(xtx, xty)
+            self._factor = ('cov', ncp)
+        else:
+            raise ValueError('method has to be "lstsq", "pinv", "qr" or '
+                             '"cholesky"')
+        return Bunch(params=params)
+
+    def normalized_cov_params(self):
+        """
+        (wexog.T wexog)^{-1} of the last fit, a pseudoinverse if singular.
+
+        If the last fit did not keep a factorization, i.e. for "lstsq", then
+        the R factor of the QR decomposition is computed by overwriting the
+        whitened exog buffer.
+        """
+        if self._factor is None:
+            from scipy import linalg
+            R = linalg.qr(self.wexog, mode='r', overwrite_a=True,
+                          check_finite=False)[0][:self.wexog.shape[1]]
+            _, s, vt = np.linalg.svd(R)
+            s_inv = _inverse_singular_values(s)
+            self._factor = ('svd', s_inv, vt)
+        kind = self._factor[0]
+        if kind == 'svd':
+            s_inv, vt = self._factor[1:]
+            v_s = vt.T * s_inv
+            return np.dot(v_s, v_s.T)
+        elif kind == 'qr':
+            R = self._factor[1]
+            return np.linalg.inv(np.dot(R.T, R))
+        return self._factor[1]
@@ -0,0 +1,563 @@
+"""
+Least squares estimation from chunked data
+
+The models in this module estimate OLS and WLS regressions from an iterable
+of data chunks.  The cross-product matrices X'WX, X'Wy and y'Wy are
+accumulated in a single pass over the chunks, so that memory requirements
+are of order k**2 and do not depend on the number of observations.
+
+Heteroscedasticity robust covariances HC0 and HC1 need the residuals and
+require a second pass over the data.  They are only available if the chunks
+can be iterated over more than once, e.g. if a list or a callable that
+returns a new iterator is provided.
+"""
+import numpy as np
+
+import statsmodels.base.model as base
+from statsmodels.base.data import handle_data
+from statsmodels.regression._tools import _gram_solve
+from statsmodels.regression.linear_model import (
+    RegressionModel, RegressionResults, RegressionResultsWrapper)
+from statsmodels.tools.decorators import cache_readonly, cache_writable
+from statsmodels.tools.sm_exceptions import MissingDataError
+
+__all__ = ['ChunkedOLS', 'ChunkedWLS']
+
+
+def _iter_chunks(chunks):
+    if callable(chunks):
+        return iter(chunks())
+    return iter(chunks)
+
+
+def _split_chunk(chunk):
+    if len(chunk) == 2:
+        endog, exog = chunk
+        weights = None
+    elif len(chunk) == 3:
+        endog, exog, weights = chunk
+    else:
+        raise ValueError('chunks must be tuples of (endog, exog) or '
+                         '(endog, exog, weights)')
+    return endog, exog, weights
+
+
+def _as_float_arrays(endog, exog, weights):
+    endog = np.asarray(endog, dtype=np.float64)
+    if endog.ndim == 2 and endog.shape[1] == 1:
+        endog = endog[:, 0]
+    exog = np.asarray(exog, dtype=np.float64)
+    if exog.ndim == 1:
+        exog = exog[:, None]
+    if endog.ndim != 1 or exog.shape[0] != endog.shape[0]:
+        raise ValueError('endog and exog of a chunk must have the same '
+                         'number of observations and endog must be 1-d')
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim == 0:
+            weights = np.repeat(weights, endog.shape[0])
+        if weights.shape != endog.shape:
+            raise ValueError('Weights must be scalar or same length as '
+                             'endog in each chunk')
+    return endog, exog, weights
+
+
+class _CrossProducts(object):
+    """
+    Accumulator of the sufficient statistics of a least squares regression.
+
+    The weighted mean and centered sum of squares of endog are updated
+    with the pairwise algorithm of Chan, Golub and LeVeque to avoid the
+    cancellation of the one-pass formula.
+    """
+
+    def __init__(self, k_exog):
+        self.k_exog = k_exog
+        self.nobs = 0
+        self.xtx = np.zeros((k_exog, k_exog))
+        self.xty = np.zeros(k_exog)
+        self.yty = 0.
+        self.xtw = np.zeros(k_exog)
+        self.sum_weights = 0.
+        self.sum_log_weights = 0.
+        self.mean_endog = 0.
+        self.m2_endog = 0.
+        self.exog_min = np.full(k_exog, np.inf)
+        self.exog_max = np.full(k_exog, -np.inf)
+
+    def update(self, endog, exog, weights=None):
+        if exog.shape[1] != self.k_exog:
+            raise ValueError('all chunks must have the same number of '
+                             'columns in exog')
+        nobs = endog.shape[0]
+        if nobs == 0:
+            return
+        if not (np.isfinite(exog).all() and np.isfinite(endog).all()):
+            raise MissingDataError('chunk contains inf or nans')
+
+        if weights is None:
+            wexog, wendog = exog, endog
+            sum_w = float(nobs)
+            xtw = exog.sum(0)
+            mean = endog.mean()
+            m2 = np.dot(endog - mean, endog - mean)
+        else:
+            if not np.isfinite(weights).all() or (weights <= 0).any():
+                raise ValueError('weights must be finite and positive')
+            w_half = np.sqrt(weights)
+            wexog = w_half[:, None] * exog
+            wendog = w_half * endog
+            sum_w = weights.sum()
+            xtw = np.dot(weights, exog)
+            mean = np.dot(weights, endog) / sum_w
+            m2 = np.dot(weights, (endog - mean)**2)
+            self.sum_log_weights += np.log(weights).sum()
+
+        self.xtx += np.dot(wexog.T, wexog)
+        self.xty += np.dot(wexog.T, wendog)
+        self.yty += np.dot(wendog, wendog)
+        self.xtw += xtw
+
+        total_w = self.sum_weights + sum_w
+        delta = mean - self.mean_endog
+        self.mean_endog += delta * sum_w / total_w
+        self.m2_endog += m2 + delta**2 * self.sum_weights * sum_w / total_w
+        self.sum_weights = total_w
+        self.nobs += nobs
+
+        np.minimum(self.exog_min, exog.min(0), out=self.exog_min)
+        np.maximum(self.exog_max, exog.max(0), out=self.exog_max)
+
+
+class ChunkedWLS(RegressionModel):
+    __doc__ = """
+    Weighted least squares estimated from chunks of data
+
+    Parameters
+    ----------
+    chunks : iterable or callable
+        Iterable of tuples ``(endog, exog)`` or ``(endog, exog, weights)``,
+        or a callable that returns such an iterable.  Each chunk holds a
+        block of observations; all chunks need to have the same columns in
+        `exog`.  If `chunks` is a one-shot iterator, then the
+        heteroscedasticity robust covariances are not available.
+    %(extra_params)s
+
+    Attributes
+    ----------
+    nobs : float
+        Total number of observations in all chunks.
+    xtx : ndarray
+        The cross-product of the whitened design, X'WX.
+    xty : ndarray
+        The cross-product of whitened design and response, X'Wy.
+
+    See Also
+    --------
+    statsmodels.regression.linear_model.WLS
+
+    Notes
+    -----
+    The data is processed in a single pass when the model is created.  Only
+    the k x k cross-products and a few scalars are kept, so that memory use
+    does not depend on the number of observations.  The data itself, and
+    therefore residuals and fitted values, is not stored.
+
+    The parameters are computed from the normal equations.  This is less
+    accurate than using the pseudoinverse or QR decomposition of the design
+    matrix if the design is ill-conditioned.
+
+    Missing values are not supported; chunks that contain nan or inf raise
+    a MissingDataError.
+
+    Examples
+    --------
+    >>> def chunks():
+    ...     for path in files:
+    ...         df = pd.read_csv(path)
+    ...         yield df['y'], df[['const', 'x1', 'x2']]
+    >>> res = ChunkedOLS(chunks).fit(cov_type='HC1')
+    """ % {'extra_params': base._extra_param_doc.strip()}
+
+    _allow_weights = True
+
+    def __init__(self, chunks, hasconst=None):
+        self.chunks = chunks
+        self._reiterable = (callable(chunks) or
+                            iter(chunks) is not chunks)
+
+        stats_ = None
+        for chunk in _iter_chunks(chunks):
+            endog, exog, weights = _split_chunk(chunk)
+            if weights is not None and not self._allow_weights:
+                raise ValueError('%s does not accept weights' %
+                                 self.__class__.__name__)
+            if stats_ is None:
+                # keep the first row to get names and data type of the data
+                self.data = handle_data(endog[:1], exog[:1], hasconst=False)
+                stats_ = _CrossProducts(self.data.exog.shape[1])
+            stats_.update(*_as_float_arrays(endog, exog, weights))
+
+        if stats_ is None or stats_.nobs == 0:
+            raise ValueError('chunks do not contain any observations')
+
+        self._stats = stats_
+        self._handle_constant(hasconst)
+        self.exog = self.data.exog
+        self.endog = self.data.endog
+        self._data_attr = []
+        self._init_keys = []
+        if hasconst is not None:
+            self.hasconst = hasconst
+            self._init_keys.append('hasconst')
+
+        self.nobs = float(stats_.nobs)
+        self.xtx = stats_.xtx
+        self.xty = stats_.xty
+        self._df_model = None
+        self._df_resid = None
+        self.rank = None
+
+    def _handle_constant(self, hasconst):
+        # this mirrors ModelData._handle_constant using the column range
+        # and cross-products instead of the data
+        stats_ = self._stats
+        const_idx = None
+        k_constant = 0
+        if hasconst is not False:
+            const_cols = np.nonzero(stats_.exog_max == stats_.exog_min)[0]
+            values = stats_.exog_max[const_cols]
+            if (values == 1).any():
+                const_idx = const_cols[np.argmax(values == 1)]
+            elif (values != 0).any():
+                const_idx = const_cols[np.argmax(values != 0)]
+
+            if const_idx is not None:
+                k_constant = 1
+            elif hasconst:
+                k_constant = 1
+            else:
+                # look for implicit constant using the augmented
+                # cross-product, rank([w, W X]) == rank(W X) for w > 0
+                k = stats_.k_exog
+                augm = np.empty((k + 1, k + 1))
+                augm[0, 0] = stats_.sum_weights
+                augm[0, 1:] = augm[1:, 0] = stats_.xtw
+                augm[1:, 1:] = stats_.xtx
+                rank_augm = np.linalg.matrix_rank(augm, hermitian=True)
+                rank_orig = np.linalg.matrix_rank(stats_.xtx, hermitian=True)
+                k_constant = int(rank_orig == rank_augm)
+
+        self.data.k_constant = self.k_constant = k_constant
+        self.data.const_idx = const_idx
+
+    def initialize(self):
+        pass
+
+    @property
+    def df_model(self):
+        """
+        The model degree of freedom, defined as the rank of the regressor
+        matrix minus 1 if a constant is included.
+        """
+        if self._df_model is None:
+            if self.rank is None:
+                self.rank = np.linalg.matrix_rank(self.xtx, hermitian=True)
+            self._df_model = float(self.rank - self.k_constant)
+        return self._df_model
+
+    @df_model.setter
+    def df_model(self, value):
+        self._df_model = value
+
+    @property
+    def df_resid(self):
+        """
+        The residual degree of freedom, defined as the number of observations
+        minus the rank of the regressor matrix.
+        """
+        if self._df_resid is None:
+            if self.rank is None:
+                self.rank = np.linalg.matrix_rank(self.xtx, hermitian=True)
+            self._df_resid = self.nobs - self.rank
+        return self._df_resid
+
+    @df_resid.setter
+    def df_resid(self, value):
+        self._df_resid = value
+
+    def whiten(self, X):
+        raise NotImplementedError('the data of chunked models is not '
+                                  'stored, whitening is not available')
+
+    def fit(self, method='cholesky', cov_type='nonrobust', cov_kwds=None,
+            use_t=None, **kwargs):
+        """
+        Fit the model from the accumulated cross-products.
+
+        Parameters
+        ----------
+        method : str, optional
+            "cholesky" (default) solves the normal equations with the
+            Cholesky decomposition of X'WX, and falls back to the
+            pseudoinverse if X'WX is singular. "pinv" always uses the
+            pseudoinverse computed from the eigendecomposition of X'WX.
+        cov_type : str, optional
+            "nonrobust", "HC0" or "HC1". The heteroscedasticity robust
+            covariances require another pass over the chunks.
+        cov_kwds : None
+            Not used, heteroscedasticity robust covariances do not take
+            keywords.
+        use_t : bool, optional
+            Flag indicating to use the Student's t distribution when computing
+            p-values.  Default behavior depends on cov_type.
+
+        Returns
+        -------
+        ChunkedRegressionResults instance
+        """
+        if cov_type.upper() not in ('NONROBUST', 'HC0', 'HC1'):
+            raise ValueError('cov_type has to be "nonrobust", "HC0" or '
+                             '"HC1" for chunked models')
+        params, normalized_cov_params, sing_vals, rank = _gram_solve(
+            self.xtx, self.xty, method=method)
+        self.normalized_cov_params = normalized_cov_params
+        self.wexog_singular_values = sing_vals
+        self.rank = rank
+        if self._df_model is None:
+            self._df_model = float(self.rank - self.k_constant)
+        if self._df_resid is None:
+            self.df_resid = self.nobs - self.rank
+
+        res = ChunkedRegressionResults(
+            self, params, normalized_cov_params=normalized_cov_params,
+            cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t, **kwargs)
+        return RegressionResultsWrapper(res)
+
+    def ssr(self, params):
+        """
+        Sum of squared whitened residuals computed from the cross-products.
+
+        Parameters
+        ----------
+        params : array-like
+            The coefficients at which the residuals are evaluated.
+
+        Returns
+        -------
+        ssr : float
+        """
+        params = np.asarray(params)
+        ssr = (self._stats.yty - 2 * np.dot(params, self.xty) +
+               np.dot(params, np.dot(self.xtx, params)))
+        return max(ssr, 0.)
+
+    def loglike(self, params, scale=None):
+        """
+        The Gaussian log-likelihood function at params.
+
+        Parameters
+        ----------
+        params : array-like
+            The coefficients with which to estimate the log-likelihood.
+        scale : float or None
+            If None, return the profile (concentrated) log likelihood
+            (profiled over the scale parameter), else return the
+            log-likelihood using the given scale value.
+
+        Returns
+        -------
+        The likelihood function evaluated at params.
+        """
+        nobs2 = self.nobs / 2.0
+        ssr = self.ssr(params)
+        if scale is None:
+            llf = -nobs2 * np.log(2 * np.pi) - nobs2 * np.log(ssr / self.nobs)
+            llf -= nobs2
+        else:
+            llf = -nobs2 * np.log(2 * np.pi * scale) - ssr / (2 * scale)
+        llf += 0.5 * self._stats.sum_log_weights
+        return llf
+
+    def predict(self, params, exog=None):
+        """
+        Return linear predicted values from a design matrix.
+
+        Parameters
+        ----------
+        params : array-like
+            Parameters of a linear model
+        exog : array-like
+            Design / exogenous data. Required, because the data used in the
+            estimation is not stored.
+
+        Returns
+        -------
+        An array of fitted values
+        """
+        if exog is None:
+            raise ValueError('exog is required, chunked models do not store '
+                             'the estimation data')
+        return np.dot(exog, params)
+
+    def _hc_meat(self, params):
+        """
+        Outer product of the whitened scores, requires a pass over the data.
+        """
+        if not self._reiterable:
+            raise ValueError('heteroscedasticity robust covariances require '
+                             'a second pass over the data, but chunks is a '
+                             'one-shot iterator. Provide a list or a '
+                             'callable that returns a new iterator.')
+        meat = np.zeros_like(self.xtx)
+        for chunk in _iter_chunks(self.chunks):
+            endog, exog, weights = _as_float_arrays(*_split_chunk(chunk))
+            resid = endog - np.dot(exog, params)
+            if weights is None:
+                scale = resid**2
+            else:
+                scale = weights**2 * resid**2
+            meat += np.dot(exog.T * scale, exog)
+        return meat
+
+
+class ChunkedOLS(ChunkedWLS):
+    __doc__ = ChunkedWLS.__doc__.replace(
+        'Weighted least squares', 'Ordinary least squares').replace(
+        ' or ``(endog, exog, weights)``', '').replace(
+        'X\'WX', 'X\'X').replace('X\'Wy', 'X\'y')
+
+    _allow_weights = False
+
+
+class ChunkedRegressionResults(RegressionResults):
+    """
+    Results class for least squares models estimated from chunked data.
+
+    The statistics that are based on the sums of squares are computed from
+    the accumulated cross-products.  Attributes that require the full data,
+    such as residuals, fitted values and HC2 or HC3 covariances, are not
+    available.
+
+    See Also
+    --------
+    RegressionResults
+    """
+
+    @cache_readonly
+    def nobs(self):
+        return self.model.nobs
+
+    @cache_readonly
+    def ssr(self):
+        return self.model.ssr(self.params)
+
+    @cache_writable()
+    def scale(self):
+        return self.ssr / self.df_resid
+
+    @cache_readonly
+    def centered_tss(self):
+        return self.model._stats.m2_endog
+
+    @cache_readonly
+    def uncentered_tss(self):
+        return self.model._stats.yty
+
+    @cache_readonly
+    def llf(self):
+        return self.model.loglike(self.params)
+
+    @cache_readonly
+    def eigenvals(self):
+        """
+        Return eigenvalues sorted in decreasing order.
+        """
+        return np.sort(self._wexog_singular_values ** 2)[::-1]
+
+    def _not_available(self, *args, **kwargs):
+        raise NotImplementedError('not available for models estimated '
+                                  'from chunked data')
+
+    fittedvalues = resid = wresid = resid_pearson = property(_not_available)
+    cov_HC2 = cov_HC3 = HC2_se = HC3_se = property(_not_available)
+    get_influence = outlier_test = get_prediction = _not_available
+
+    @cache_readonly
+    def cov_HC0(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        meat = self.model._hc_meat(self.params)
+        ncp = self.normalized_cov_params
+        return np.dot(ncp, np.dot(meat, ncp))
+
+    @cache_readonly
+    def cov_HC1(self):
+        """
+        See statsmodels.RegressionResults
+        """
+        return self.nobs / self.df_resid * self.cov_HC0
+
+    def summary(self, yname=None, xname=None, title=None, alpha=.05):
+        """Summarize the Regression Results
+
+        Parameters
+        ----------
+        yname : string, optional
+            Default is `y`
+        xname : list of strings, optional
+            Default is `var_##` for ## in p the number of regressors
+        title : string, optional
+            Title for the top table. If not None, then this replaces the
+            default title
+        alpha : float
+            significance level for the confidence intervals
+
+        Returns
+        -------
+        smry : Summary instance
+            this holds the summary tables and text, which can be printed or
+            converted to various output formats.
+
+        Notes
+        -----
+        Residual diagnostics are not included because the residuals are not
+        available for models estimated from chunked data.
+        """
+        top_left = [('Dep. Variable:', None),
+                    ('Model:', None),
+                    ('Method:', ['Least Squares']),
+                    ('Date:', None),
+                    ('Time:', None),
+                    ('No. Observations:', None),
+                    ('Df Residuals:', None),
+                    ('Df Model:', None),
+                    ('Covariance Type:', [self.cov_type]),
+                    ]
+
+        rsquared_type = '' if self.k_constant else ' (uncentered)'
+        top_right = [('R-squared' + rsquared_type + ':',
+                      ["%#8.3f" % self.rsquared]),
+                     ('Adj. R-squared' + rsquared_type + ':',
+                      ["%#8.3f" % self.rsquared_adj]),
+                     ('F-statistic:', ["%#8.4g" % self.fvalue]),
+                     ('Prob (F-statistic):', ["%#6.3g" % self.f_pvalue]),
+                     ('Log-Likelihood:', None),
+                     ('AIC:', ["%#8.4g" % self.aic]),
+                     ('BIC:', ["%#8.4g" % self.bic]),
+                     ('Cond. No.', ["%#8.3g" % self.condition_number]),
+                     ]
+
+        if title is None:
+            title = self.model.__class__.__name__ + ' ' + "Regression Results"
+
+        from statsmodels.iolib.summary import Summary
+        smry = Summary()
+        smry.add_table_2cols(self, gleft=top_left, gright=top_right,
+                             yname=yname, xname=xname, title=title)
+        smry.add_table_params(self, yname=yname, xname=xname, alpha=alpha,
+                              use_t=self.use_t)
+        etext = ["Warnings:", "[1] " + self.cov_kwds['description']]
+        smry.add_extra_txt(etext)
+        return smry
@@ -41,6 +41,7 @@ from scipy import stats
 from scipy import optimize
 
 from statsmodels.tools.tools import chain_dot, pinv_extended
+from statsmodels.tools import _sparse
 from statsmodels.tools.decorators import (cache_readonly,
                                           cache_writable)
 import statsmodels.base.model as base
@@ -192,6 +193,9 @@ class RegressionModel(base.LikelihoodModel):
 
     Intended for subclassing.
     """
+    # number of absorbed fixed effects that are not included in exog
+    k_absorb = 0
+
     def __init__(self, endog, exog, **kwargs):
         super(RegressionModel, self).__init__(endog, exog, **kwargs)
         self._data_attr.extend(['pinv_wexog', 'wendog', 'wexog', 'weights'])
@@ -214,7 +218,7 @@ class RegressionModel(base.LikelihoodModel):
         """
         if self._df_model is None:
             if self.rank is None:
-                self.rank = np.linalg.matrix_rank(self.exog)
+                self.rank = _sparse.matrix_rank(self.exog)
             self._df_model = float(self.rank - self.k_constant)
         return self._df_model
 
@@ -226,13 +230,14 @@ class RegressionModel(base.LikelihoodModel):
     def df_resid(self):
         """
         The residual degree of freedom, defined as the number of observations
-        minus the rank of the regressor matrix.
+        minus the rank of the regressor matrix and minus the number of
+        absorbed fixed effects.
         """
 
         if self._df_resid is None:
             if self.rank is None:
-                self.rank = np.linalg.matrix_rank(self.exog)
-            self._df_resid = self.nobs - self.rank
+                self.rank = _sparse.matrix_rank(self.exog)
+            self._df_resid = self.nobs - self.rank - self.k_absorb
         return self._df_resid
 
     @df_resid.setter
@@ -243,7 +248,7 @@ class RegressionModel(base.LikelihoodModel):
         raise NotImplementedError("Subclasses should implement.")
 
     def fit(self, method="pinv", cov_type='nonrobust', cov_kwds=None,
-            use_t=None, **kwargs):
+            use_t=None, cache_design=True, **kwargs):
         """
         Full fit of the model.
 
@@ -253,9 +258,12 @@ class RegressionModel(base.LikelihoodModel):
         Parameters
         ----------
         method : str, optional
-            Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
-            to solve the least squares problem. "qr" uses the QR
-            factorization.
+            Can be "pinv", "qr" or "cholesky".  "pinv" uses the Moore-Penrose
+            pseudoinverse to solve the least squares problem. "qr" uses the
+            QR factorization. "cholesky" solves the normal equations using
+            the Cholesky factorization of the k x k matrix wexog.T wexog and
+            falls back to its pseudoinverse if the design is rank deficient.
+            It does not create any arrays of size nobs x k.
         cov_type : str, optional
             See `regression.linear_model.RegressionResults` for a description
             of the available covariance estimators
@@ -267,6 +275,12 @@ class RegressionModel(base.LikelihoodModel):
             p-values.  Default behavior depends on cov_type. See
             `linear_model.RegressionResults.get_robustcov_results` for
             implementation details.
+        cache_design : bool, optional
+            If True (default), then the pseudoinverse `pinv_wexog` for method
+            "pinv", or the QR factors `exog_Q` and `exog_R` for method "qr",
+            are attached to the model and reused in later calls to fit.
+            If False, then these nobs x k arrays are deleted after the
+            results instance has been created.
 
         Returns
         -------
@@ -281,7 +295,22 @@ class RegressionModel(base.LikelihoodModel):
         -----
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
+
+        The "cholesky" method is faster and needs less memory than "pinv" and
+        "qr" for designs with many more observations than variables, but
+        it is numerically less accurate if the design is ill-conditioned.
+
+        If exog is a scipy.sparse matrix, then "cholesky" is always used.
+        The cross-product wexog.T wexog is computed with sparse products and
+        only the k x k matrices are dense.  "qr" is not available in this
+        case.
         """
+        if _sparse.issparse(self.wexog):
+            if method == "qr":
+                raise ValueError('method "qr" is not available for sparse '
+                                 'exog')
+            method = "cholesky"
+
         if method == "pinv":
             if not (hasattr(self, 'pinv_wexog') and
                     hasattr(self, 'normalized_cov_params') and
@@ -315,13 +344,20 @@ class RegressionModel(base.LikelihoodModel):
             # used in ANOVA
             self.effects = effects = np.dot(Q.T, self.wendog)
             beta = np.linalg.solve(R, effects)
+        elif method == "cholesky":
+            from statsmodels.regression._tools import _gram_solve
+            xtx = _sparse.gram(self.wexog)
+            xty = _sparse.tdot(self.wexog, self.wendog)
+            beta, self.normalized_cov_params, singular_values, self.rank = \
+                _gram_solve(xtx, xty)
+            self.wexog_singular_values = singular_values
         else:
-            raise ValueError('method has to be "pinv" or "qr"')
+            raise ValueError('method has to be "pinv", "qr" or "cholesky"')
 
         if self._df_model is None:
             self._df_model = float(self.rank - self.k_constant)
         if self._df_resid is None:
-            self.df_resid = self.nobs - self.rank
+            self.df_resid = self.nobs - self.rank - self.k_absorb
 
         if isinstance(self, OLS):
             lfit = OLSResults(
@@ -334,6 +370,11 @@ class RegressionModel(base.LikelihoodModel):
                 normalized_cov_params=self.normalized_cov_params,
                 cov_type=cov_type, cov_kwds=cov_kwds, use_t=use_t,
                 **kwargs)
+
+        if not cache_design:
+            for attr in ['pinv_wexog', 'exog_Q', 'exog_R']:
+                if hasattr(self, attr):
+                    delattr(self, attr)
         return RegressionResultsWrapper(lfit)
 
     def predict(self, params, exog=None):
@@ -361,7 +402,7 @@ class RegressionModel(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
 
-        return np.dot(exog, params)
+        return _sparse.dot(exog, params)
 
     def get_distribution(self, params, scale, exog=None, dist_class=None):
         """
@@ -548,7 +589,8 @@ class GLS(RegressionModel):
         """
         # TODO: combine this with OLS/WLS loglike and add _det_sigma argument
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog, params))**2, axis=0)
+        SSR = np.sum((self.wendog - _sparse.dot(self.wexog, params))**2,
+                     axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with likelihood constant
         if np.any(self.sigma):
@@ -594,6 +636,7 @@ class GLS(RegressionModel):
                         L1_wt=1., start_params=None, profile_scale=False,
                         refit=False, **kwargs):
         # Docstring attached below
+        _sparse.check_dense(self.exog, 'fit_regularized')
 
         # Need to adjust since RSS/n term in elastic net uses nominal
         # n in denominator
@@ -628,12 +671,17 @@ class WLS(RegressionModel):
         1d array of weights.  If you supply 1/W then the variables are
         pre- multiplied by 1/sqrt(W).  If no weights are supplied the
         default value is 1 and WLS results are the same as OLS.
+    absorb : array-like, optional
+        1d or 2d array, Series or DataFrame of factor variables, one column
+        for each factor, whose fixed effects are absorbed.  See Notes.
     %(extra_params)s
 
     Attributes
     ----------
     weights : array
         The stored weights supplied as an argument.
+    k_absorb : int
+        The number of absorbed fixed effects that are not included in exog.
 
     See regression.GLS
 
@@ -660,11 +708,35 @@ class WLS(RegressionModel):
     If the weights are a function of the data, then the post estimation
     statistics such as fvalue and mse_model might not be correct, as the
     package does not yet support no-constant regression.
+
+    If `absorb` is given, then the model includes a set of dummy variables
+    for each factor in `absorb` which are not estimated.  Instead, the
+    dummies are projected out of endog and exog, using weighted group
+    means and alternating projections for more than one factor, and the
+    projected data replace `endog` and `exog` of the model.  The original
+    data are still available in `data`.  The parameters and residuals are
+    the same as in the regression that includes all dummy variables.
+
+    If exog has a constant, then the weighted overall means are added back
+    to the projected data so that the intercept remains identified.
+    Otherwise k_constant is set to zero.  In both cases rsquared is the
+    within R-squared, fittedvalues and predictions do not include the
+    fixed effects, and df_resid accounts for the absorbed dummy variables.
+    The number of redundant dummy variables is computed exactly.  Factors
+    whose levels are unions of the levels of another factor are redundant,
+    and the remaining factors are counted from the connected components of
+    their levels for two factors or from the rank of the dummy variables
+    for more factors.  If three or more of these factors have more than
+    2000 levels in total, the rank is not computed, and an upper bound is
+    used with a warning.
     """ % {'params': base._model_params_doc,
            'extra_params': base._missing_param_doc + base._extra_param_doc}
 
     def __init__(self, endog, exog, weights=1., missing='none', hasconst=None,
-                 **kwargs):
+                 absorb=None, **kwargs):
+        # the fixed effects are absorbed in initialize, after missing values
+        # have been handled
+        self.absorb = absorb
         weights = np.array(weights)
         if weights.shape == ():
             if (missing == 'drop' and 'missing_idx' in kwargs and
@@ -680,6 +752,9 @@ class WLS(RegressionModel):
             weights = weights.squeeze()
         super(WLS, self).__init__(endog, exog, missing=missing,
                                   weights=weights, hasconst=hasconst, **kwargs)
+        if absorb is not None:
+            self._init_keys.append('absorb')
+            self._data_attr.extend(['absorb', '_absorber'])
         nobs = self.exog.shape[0]
         weights = self.weights
         # Experimental normalization of weights
@@ -687,6 +762,45 @@ class WLS(RegressionModel):
         if weights.size != nobs and weights.shape[0] != nobs:
             raise ValueError('Weights must be scalar or same length as design')
 
+    def initialize(self):
+        if self.absorb is not None and not hasattr(self, '_absorber'):
+            self._init_absorb()
+        super(WLS, self).initialize()
+
+    def _init_absorb(self):
+        """
+        Project the absorbed fixed effects out of endog and exog.
+        """
+        from statsmodels.regression._absorb import (_Absorber,
+                                                    _factorize_absorb)
+        if self.exog is None or _sparse.issparse(self.exog):
+            raise ValueError('absorb requires a dense exog')
+
+        codes = _factorize_absorb(self.absorb)
+        missing_row_idx = getattr(self.data, 'missing_row_idx', None)
+        if missing_row_idx is not None and len(missing_row_idx) > 0:
+            codes = np.delete(codes, missing_row_idx, axis=0)
+        if codes.shape[0] != self.exog.shape[0]:
+            raise ValueError('absorb must have the same number of rows as '
+                             'exog')
+        absorber = _Absorber(codes, weights=self.weights)
+
+        endog = absorber.demean(self.endog)
+        exog = absorber.demean(self.exog)
+        if self.data.const_idx is not None:
+            # add back the overall means, this keeps the intercept
+            # identified and the slopes unchanged
+            endog += np.average(self.endog, axis=0, weights=self.weights)
+            exog += np.average(self.exog, axis=0, weights=self.weights)
+            self.k_absorb = absorber.k_absorb - 1
+        else:
+            self.k_constant = 0
+            self.k_absorb = absorber.k_absorb
+
+        self.endog, self.exog = endog, exog
+        self.absorb = codes
+        self._absorber = absorber
+
     def whiten(self, X):
         """
         Whitener for WLS model, multiplies each column by sqrt(self.weights)
@@ -702,6 +816,8 @@ class WLS(RegressionModel):
             sqrt(weights)*X
         """
 
+        if _sparse.issparse(X):
+            return _sparse.scale_rows(X, np.sqrt(self.weights))
         X = np.asarray(X)
         if X.ndim == 1:
             return X * np.sqrt(self.weights)
@@ -732,7 +848,8 @@ class WLS(RegressionModel):
         where :math:`W` is a diagonal matrix
         """
         nobs2 = self.nobs / 2.0
-        SSR = np.sum((self.wendog - np.dot(self.wexog, params))**2, axis=0)
+        SSR = np.sum((self.wendog - _sparse.dot(self.wexog, params))**2,
+                     axis=0)
         llf = -np.log(SSR) * nobs2      # concentrated likelihood
         llf -= (1+np.log(np.pi/nobs2))*nobs2  # with constant
         llf += 0.5 * np.sum(np.log(self.weights))
@@ -766,6 +883,7 @@ class WLS(RegressionModel):
                         L1_wt=1., start_params=None, profile_scale=False,
                         refit=False, **kwargs):
         # Docstring attached below
+        _sparse.check_dense(self.exog, 'fit_regularized')
 
         # Need to adjust since RSS/n in elastic net uses nominal n in
         # denominator
@@ -856,7 +974,7 @@ class OLS(WLS):
         """
         nobs2 = self.nobs / 2.0
         nobs = float(self.nobs)
-        resid = self.endog - np.dot(self.exog, params)
+        resid = self.endog - _sparse.dot(self.exog, params)
         if hasattr(self, 'offset'):
             resid -= self.offset
         ssr = np.sum(resid**2)
@@ -916,8 +1034,8 @@ class OLS(WLS):
         if hasattr(self, 'offset'):
             y = y - self.offset
         self._wendog_xprod = np.sum(y * y)
-        self._wexog_xprod = np.dot(self.wexog.T, self.wexog)
-        self._wexog_x_wendog = np.dot(self.wexog.T, y)
+        self._wexog_xprod = _sparse.gram(self.wexog)
+        self._wexog_x_wendog = _sparse.tdot(self.wexog, y)
 
     def hessian(self, params, scale=None):
         """
@@ -980,6 +1098,7 @@ class OLS(WLS):
                         L1_wt=1., start_params=None, profile_scale=False,
                         refit=False, **kwargs):
         # Docstring attached below
+        _sparse.check_dense(self.exog, 'fit_regularized')
 
         # In the future we could add support for other penalties, e.g. SCAD.
         if method not in ("elastic_net", "sqrt_lasso"):
@@ -1732,12 +1851,14 @@ class RegressionResults(base.LikelihoodModelResults):
 
     @cache_readonly
     def aic(self):
-        return -2 * self.llf + 2 * (self.df_model + self.k_constant)
+        return -2 * self.llf + 2 * (self.df_model + self.k_constant +
+                                    self.model.k_absorb)
 
     @cache_readonly
     def bic(self):
         return (-2 * self.llf + np.log(self.nobs) * (self.df_model +
-                                                     self.k_constant))
+                                                     self.k_constant +
+                                                     self.model.k_absorb))
 
     @cache_readonly
     def eigenvals(self):
@@ -1747,8 +1868,8 @@ class RegressionResults(base.LikelihoodModelResults):
         if self._wexog_singular_values is not None:
             eigvals = self._wexog_singular_values ** 2
         else:
-            eigvals = np.linalg.linalg.eigvalsh(np.dot(self.model.wexog.T,
-                                                       self.model.wexog))
+            eigvals = np.linalg.linalg.eigvalsh(
+                _sparse.gram(self.model.wexog))
         return np.sort(eigvals)[::-1]
 
     @cache_readonly
@@ -1763,10 +1884,20 @@ class RegressionResults(base.LikelihoodModelResults):
 
     # TODO: make these properties reset bse
     def _HCCM(self, scale):
-        H = np.dot(self.model.pinv_wexog,
-                   scale[:, None] * self.model.pinv_wexog.T)
+        if getattr(self.model, 'pinv_wexog', None) is not None:
+            H = np.dot(self.model.pinv_wexog,
+                       scale[:, None] * self.model.pinv_wexog.T)
+        else:
+            # pinv_wexog is not available, e.g. after fit with "cholesky"
+            meat = _sparse.gram(self.model.wexog, scale)
+            H = chain_dot(self.normalized_cov_params, meat,
+                          self.normalized_cov_params)
         return H
 
+    def _hat_matrix_diag(self):
+        # diagonal of the hat matrix of the whitened design
+        return _sparse.quad_diag(self.model.wexog, self.normalized_cov_params)
+
     @cache_readonly
     def cov_HC0(self):
         """
@@ -1793,10 +1924,7 @@ class RegressionResults(base.LikelihoodModelResults):
         See statsmodels.RegressionResults
         """
 
-        # probably could be optimized
-        h = np.diag(chain_dot(self.model.wexog,
-                              self.normalized_cov_params,
-                              self.model.wexog.T))
+        h = self._hat_matrix_diag()
         self.het_scale = self.wresid**2/(1-h)
         cov_HC2 = self._HCCM(self.het_scale)
         return cov_HC2
@@ -1806,8 +1934,7 @@ class RegressionResults(base.LikelihoodModelResults):
         """
         See statsmodels.RegressionResults
         """
-        h = np.diag(chain_dot(
-            self.model.wexog, self.normalized_cov_params, self.model.wexog.T))
+        h = self._hat_matrix_diag()
         self.het_scale = (self.wresid / (1 - h))**2
         cov_HC3 = self._HCCM(self.het_scale)
         return cov_HC3
@@ -2663,6 +2790,7 @@ class OLSResults(RegressionResults):
         statsmodels.stats.outliers_influence.OLSInfluence
         """
         from statsmodels.stats.outliers_influence import OLSInfluence
+        _sparse.check_dense(self.model.exog, 'get_influence')
         return OLSInfluence(self)
 
     def outlier_test(self, method='bonf', alpha=.05, labels=None,
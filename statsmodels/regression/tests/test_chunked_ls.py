@@ -0,0 +1,164 @@
+"""
+Tests for least squares estimation from chunked data
+"""
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pandas as pd
+import pytest
+
+from statsmodels.regression.chunked_ls import ChunkedOLS, ChunkedWLS
+from statsmodels.regression.linear_model import OLS, WLS
+from statsmodels.tools.sm_exceptions import MissingDataError
+from statsmodels.tools.tools import add_constant
+
+
+def _chunked(size, *arrays):
+    nobs = len(arrays[0])
+    return [tuple(arr[i:i + size] for arr in arrays)
+            for i in range(0, nobs, size)]
+
+
+class CheckChunked(object):
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(987125)
+        nobs = 500
+        exog = add_constant(rs.randn(nobs, 3))
+        endog = (exog.sum(1) +
+                 rs.randn(nobs) * (1 + np.abs(exog[:, 1])))
+        weights = rs.uniform(0.5, 2, size=nobs)
+        cls.exog, cls.endog, cls.weights = exog, endog, weights
+        cls.setup_models()
+
+    def test_attributes(self):
+        res1, res2 = self.res1, self.res2
+        for attr in ['params', 'bse', 'tvalues', 'pvalues', 'rsquared',
+                     'rsquared_adj', 'fvalue', 'f_pvalue', 'llf', 'aic',
+                     'bic', 'ssr', 'scale', 'ess', 'centered_tss',
+                     'uncentered_tss', 'condition_number', 'df_model',
+                     'df_resid', 'nobs']:
+            assert_allclose(getattr(res2, attr), getattr(res1, attr),
+                            rtol=1e-10, err_msg=attr)
+        assert_allclose(res2.conf_int(), res1.conf_int(), rtol=1e-10)
+
+    @pytest.mark.parametrize('cov_type', ['HC0', 'HC1'])
+    def test_hc(self, cov_type):
+        res1 = self.res1.get_robustcov_results(cov_type)
+        res2 = self.res2.get_robustcov_results(cov_type)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        assert_allclose(getattr(self.res2, cov_type + '_se'),
+                        getattr(self.res1, cov_type + '_se'), rtol=1e-10)
+        res2 = self.mod2.fit(cov_type=cov_type)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        assert_allclose(res2.fvalue, res1.fvalue, rtol=1e-10)
+
+    def test_f_test(self):
+        ft1 = self.res1.f_test(np.eye(4)[1:])
+        ft2 = self.res2.f_test(np.eye(4)[1:])
+        assert_allclose(ft2.fvalue, ft1.fvalue, rtol=1e-10)
+        assert_allclose(ft2.pvalue, ft1.pvalue, rtol=1e-10)
+
+    def test_not_available(self):
+        with pytest.raises(NotImplementedError):
+            self.res2.resid
+        with pytest.raises(NotImplementedError):
+            self.res2.cov_HC3
+
+    def test_summary(self):
+        smry = self.res2.summary()
+        assert_equal(len(smry.tables), 2)
+        str(smry)
+
+
+class TestChunkedOLS(CheckChunked):
+
+    @classmethod
+    def setup_models(cls):
+        cls.res1 = OLS(cls.endog, cls.exog).fit()
+        cls.mod2 = ChunkedOLS(_chunked(73, cls.endog, cls.exog))
+        cls.res2 = cls.mod2.fit()
+
+
+class TestChunkedWLS(CheckChunked):
+
+    @classmethod
+    def setup_models(cls):
+        cls.res1 = WLS(cls.endog, cls.exog, weights=cls.weights).fit()
+        chunks = _chunked(73, cls.endog, cls.exog, cls.weights)
+        cls.mod2 = ChunkedWLS(lambda: iter(chunks))
+        cls.res2 = cls.mod2.fit()
+
+
+class TestChunkedOLSPinv(CheckChunked):
+
+    @classmethod
+    def setup_models(cls):
+        cls.res1 = OLS(cls.endog, cls.exog).fit()
+        cls.mod2 = ChunkedOLS(_chunked(200, cls.endog, cls.exog))
+        cls.res2 = cls.mod2.fit(method='pinv')
+
+
+def test_pandas_names():
+    rs = np.random.RandomState(0)
+    exog = pd.DataFrame(add_constant(rs.randn(100, 2)),
+                        columns=['const', 'a', 'b'])
+    endog = pd.Series(exog.sum(1) + rs.randn(100), name='y')
+    res1 = OLS(endog, exog).fit()
+    res2 = ChunkedOLS(_chunked(30, endog, exog)).fit()
+    assert_allclose(res2.params, res1.params, rtol=1e-10)
+    assert_equal(list(res2.params.index), ['const', 'a', 'b'])
+    assert_equal(res2.model.endog_names, 'y')
+    ft2 = res2.f_test('a = b')
+    ft1 = res1.f_test('a = b')
+    assert_allclose(ft2.fvalue, ft1.fvalue, rtol=1e-10)
+
+
+def test_constant_detection():
+    rs = np.random.RandomState(0)
+    x = rs.randn(100, 2)
+    y = x.sum(1) + rs.randn(100)
+    # column constant within the first chunk only
+    x2 = np.column_stack((np.repeat([1., 2.], 50), x))
+    mod = ChunkedOLS(_chunked(50, y, x2))
+    assert_equal(mod.k_constant, OLS(y, x2).k_constant)
+    mod = ChunkedOLS(_chunked(30, y, add_constant(x)))
+    assert_equal(mod.k_constant, 1)
+    assert_equal(mod.data.const_idx, 0)
+    # implicit constant
+    dummies = np.column_stack((x[:, 0] > 0, x[:, 0] <= 0)).astype(float)
+    mod = ChunkedOLS(_chunked(30, y, dummies))
+    assert_equal(mod.k_constant, 1)
+    mod = ChunkedOLS(_chunked(30, y, x))
+    assert_equal(mod.k_constant, 0)
+    mod = ChunkedOLS(_chunked(30, y, x), hasconst=True)
+    assert_equal(mod.k_constant, 1)
+
+
+def test_singular():
+    rs = np.random.RandomState(0)
+    x = add_constant(rs.randn(100, 2))
+    x = np.column_stack((x, x[:, 1] + x[:, 2]))
+    y = x.sum(1) + rs.randn(100)
+    res1 = OLS(y, x).fit()
+    res2 = ChunkedOLS(_chunked(30, y, x)).fit()
+    assert_equal(res2.model.rank, 3)
+    assert_equal(res2.df_model, res1.df_model)
+    assert_allclose(res2.params, res1.params, rtol=1e-8)
+    assert_allclose(res2.bse, res1.bse, rtol=1e-8)
+
+
+def test_errors():
+    rs = np.random.RandomState(0)
+    x = add_constant(rs.randn(100, 2))
+    y = x.sum(1) + rs.randn(100)
+    res = ChunkedOLS(iter(_chunked(30, y, x))).fit()
+    with pytest.raises(ValueError):
+        res.cov_HC0
+    with pytest.raises(ValueError):
+        ChunkedOLS(_chunked(30, y, x, np.ones(100)))
+    with pytest.raises(ValueError):
+        ChunkedOLS([])
+    y[5] = np.nan
+    with pytest.raises(MissingDataError):
+        ChunkedOLS(_chunked(30, y, x))
@@ -11,9 +11,11 @@ from numpy.testing import (assert_almost_equal, assert_,
 import pytest
 from scipy.linalg import toeplitz
 from statsmodels.tools.tools import add_constant, categorical
+from statsmodels.tools.sm_exceptions import ValueWarning
 from statsmodels.regression.linear_model import (OLS, WLS, GLS, yule_walker,
                                                  burg)
 from statsmodels.datasets import longley
+import statsmodels.stats.sandwich_covariance as sw
 from scipy.stats import t as student_t
 
 DECIMAL_4 = 4
@@ -1340,3 +1342,237 @@ def test_sqrt_lasso():
         # Regression test the parameters
         assert_allclose(rslt.params[0:5], expected_params[refit],
                 rtol=1e-5, atol=1e-5)
+
+
+class TestCholeskyFit(object):
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(8736)
+        nobs = 200
+        exog = add_constant(rs.randn(nobs, 4))
+        cls.exog = exog
+        cls.endog = (exog.sum(1) +
+                     rs.randn(nobs) * (1 + np.abs(exog[:, 1])))
+        cls.weights = rs.uniform(0.5, 2, size=nobs)
+
+    @pytest.mark.parametrize('model_class', [OLS, WLS])
+    def test_equivalence_pinv(self, model_class):
+        kwds = {} if model_class is OLS else {'weights': self.weights}
+        res1 = model_class(self.endog, self.exog, **kwds).fit()
+        mod2 = model_class(self.endog, self.exog, **kwds)
+        res2 = mod2.fit(method="cholesky")
+        assert_(not hasattr(mod2, 'pinv_wexog'))
+        assert_allclose(res2.params, res1.params, rtol=1e-10)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        assert_allclose(res2.eigenvals, res1.eigenvals, rtol=1e-10)
+        assert_equal(res2.df_model, res1.df_model)
+        for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+            assert_allclose(getattr(res2, cov_type + '_se'),
+                            getattr(res1, cov_type + '_se'), rtol=1e-10)
+            res2r = mod2.fit(method="cholesky", cov_type=cov_type)
+            res1r = res1.get_robustcov_results(cov_type)
+            assert_allclose(res2r.bse, res1r.bse, rtol=1e-10)
+
+    def test_influence(self):
+        res1 = OLS(self.endog, self.exog).fit()
+        res2 = OLS(self.endog, self.exog).fit(method="cholesky")
+        assert_allclose(res2.get_influence().hat_matrix_diag,
+                        res1.get_influence().hat_matrix_diag, rtol=1e-10)
+
+    def test_rank_deficient(self):
+        exog = np.column_stack((self.exog, self.exog[:, 1] - self.exog[:, 2]))
+        res1 = OLS(self.endog, exog).fit()
+        res2 = OLS(self.endog, exog).fit(method="cholesky")
+        assert_equal(res2.model.rank, 5)
+        assert_equal(res2.df_resid, res1.df_resid)
+        assert_allclose(res2.params, res1.params, rtol=1e-8)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-8)
+
+    @pytest.mark.parametrize('method', ['pinv', 'qr'])
+    def test_cache_design(self, method):
+        mod = OLS(self.endog, self.exog)
+        res1 = mod.fit(method=method)
+        assert_(hasattr(mod, 'pinv_wexog') or hasattr(mod, 'exog_Q'))
+        mod = OLS(self.endog, self.exog)
+        res2 = mod.fit(method=method, cache_design=False)
+        for attr in ['pinv_wexog', 'exog_Q', 'exog_R']:
+            assert_(not hasattr(mod, attr))
+        assert_allclose(res2.params, res1.params, rtol=1e-10)
+        assert_allclose(res2.HC1_se, res1.HC1_se, rtol=1e-10)
+
+
+class TestSparseExog(object):
+
+    @classmethod
+    def setup_class(cls):
+        from scipy import sparse
+        rs = np.random.RandomState(4587)
+        nobs, n_groups = 300, 20
+        groups = rs.randint(0, n_groups, size=nobs)
+        dummies = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                                    shape=(nobs, n_groups))
+        x = rs.randn(nobs, 2)
+        cls.exog = sparse.hstack((x, dummies)).tocsr()
+        cls.endog = (x.sum(1) + rs.randn(n_groups)[groups] +
+                     rs.randn(nobs) * (1 + np.abs(x[:, 0])))
+        cls.weights = rs.uniform(0.5, 2, size=nobs)
+
+    @pytest.mark.parametrize('model_class', [OLS, WLS])
+    def test_equivalence_dense(self, model_class):
+        kwds = {} if model_class is OLS else {'weights': self.weights}
+        res1 = model_class(self.endog, self.exog.toarray(), **kwds).fit()
+        res2 = model_class(self.endog, self.exog, **kwds).fit()
+        assert_equal(res2.model.k_constant, 1)
+        assert_equal(res2.df_model, res1.df_model)
+        assert_allclose(res2.params, res1.params, rtol=1e-10)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        assert_allclose(res2.llf, res1.llf, rtol=1e-10)
+        assert_allclose(res2.rsquared, res1.rsquared, rtol=1e-10)
+        assert_allclose(res2.fittedvalues, res1.fittedvalues, rtol=1e-10)
+        for cov_type in ['HC0', 'HC1', 'HC2', 'HC3']:
+            assert_allclose(getattr(res2, cov_type + '_se'),
+                            getattr(res1, cov_type + '_se'), rtol=1e-10)
+        assert_allclose(res2.predict(self.exog[:5]),
+                        res1.predict(self.exog[:5].toarray()), rtol=1e-10)
+
+    def test_qr(self):
+        assert_raises(ValueError, OLS(self.endog, self.exog).fit,
+                      method="qr")
+
+    @pytest.mark.parametrize('cov_type', ['HC0', 'HC3', 'cluster',
+                                          'cluster2', 'HAC', 'hac-panel',
+                                          'hac-groupsum'])
+    def test_robust_cov(self, cov_type):
+        groups = np.arange(300) // 10
+        time = np.arange(300) % 10
+        cov_kwds = {'cluster': {'groups': groups},
+                    'cluster2': {'groups': np.column_stack((groups, time))},
+                    'HAC': {'maxlags': 2},
+                    'hac-panel': {'groups': groups, 'maxlags': 2},
+                    'hac-groupsum': {'time': time, 'maxlags': 2}
+                    }.get(cov_type)
+        if cov_type == 'cluster2':
+            cov_type = 'cluster'
+        res1 = OLS(self.endog, self.exog.toarray()).fit(cov_type=cov_type,
+                                                        cov_kwds=cov_kwds)
+        res2 = OLS(self.endog, self.exog).fit(cov_type=cov_type,
+                                              cov_kwds=cov_kwds)
+        assert_equal(res2.bse.dtype, np.float64)
+        assert_allclose(res2.bse, res1.bse, rtol=1e-10)
+        assert_allclose(res2.cov_params(), res1.cov_params(), rtol=1e-10,
+                        atol=1e-14)
+
+    def test_sparse_scores(self):
+        # the meat and the group sums of the sandwiches use sparse products
+        from scipy import sparse
+        res = OLS(self.endog, self.exog).fit()
+        xu, _ = sw._get_sandwich_arrays(res)
+        assert_(sparse.issparse(xu))
+        xu_dense = xu.toarray()
+        groups = np.arange(300) // 7
+        assert_allclose(sw.S_white_simple(xu), sw.S_white_simple(xu_dense),
+                        rtol=1e-12)
+        assert_allclose(sw.S_crosssection(xu, groups),
+                        sw.S_crosssection(xu_dense, groups), rtol=1e-12)
+        assert_allclose(sw.S_hac_simple(xu, nlags=3),
+                        sw.S_hac_simple(xu_dense, nlags=3), rtol=1e-12)
+
+    def test_prediction(self):
+        res1 = OLS(self.endog, self.exog.toarray()).fit()
+        res2 = OLS(self.endog, self.exog).fit()
+        pred1 = res1.get_prediction()
+        pred2 = res2.get_prediction()
+        assert_allclose(pred2.predicted_mean, pred1.predicted_mean,
+                        rtol=1e-10)
+        assert_allclose(pred2.se_mean, pred1.se_mean, rtol=1e-10)
+
+    def test_not_implemented(self):
+        res = OLS(self.endog, self.exog).fit()
+        assert_raises(NotImplementedError, res.get_influence)
+        assert_raises(NotImplementedError, res.model.fit_regularized,
+                      alpha=0.1)
+
+
+class TestAbsorb(object):
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(2365)
+        nobs = 400
+        cls.firm = rs.randint(0, 30, size=nobs)
+        # two disconnected sets of years, so that the two factors have two
+        # redundant dummy variables
+        cls.year = rs.randint(0, 5, size=nobs) + 5 * (cls.firm >= 15)
+        cls.x = rs.randn(nobs, 2) + 0.1 * cls.firm[:, None]
+        cls.endog = (cls.x.sum(1) + rs.randn(30)[cls.firm] +
+                     rs.randn(10)[cls.year] + rs.randn(nobs))
+        cls.weights = rs.uniform(0.5, 2, size=nobs)
+        dummies = (cls.firm[:, None] == np.arange(30)).astype(float)
+        dummies_year = (cls.year[:, None] == np.arange(10)).astype(float)
+        cls.exog_dummies = np.column_stack((cls.x, dummies, dummies_year))
+
+    @pytest.mark.parametrize('model_class', [OLS, WLS])
+    @pytest.mark.parametrize('constant', [True, False])
+    def test_equivalence_dummies(self, model_class, constant):
+        kwds = {} if model_class is OLS else {'weights': self.weights}
+        res1 = model_class(self.endog, self.exog_dummies, **kwds).fit()
+        exog = add_constant(self.x) if constant else self.x
+        absorb = np.column_stack((self.firm, self.year))
+        mod2 = model_class(self.endog, exog, absorb=absorb, **kwds)
+        res2 = mod2.fit()
+
+        idx = slice(1, 3) if constant else slice(0, 2)
+        assert_equal(mod2.k_absorb, 38 - constant)
+        assert_equal(res2.df_resid, res1.df_resid)
+        assert_allclose(res2.params[idx], res1.params[:2], rtol=1e-8)
+        assert_allclose(res2.bse[idx], res1.bse[:2], rtol=1e-8)
+        assert_allclose(res2.resid, res1.resid, atol=1e-8)
+        assert_allclose(res2.llf, res1.llf, rtol=1e-10)
+        assert_allclose(res2.aic, res1.aic, rtol=1e-10)
+
+        res3 = model_class(self.endog, exog, absorb=absorb, **kwds).fit(
+            cov_type='cluster', cov_kwds={'groups': self.firm})
+        cov = sw.cov_cluster(res2, self.firm)
+        assert_allclose(res3.bse, np.sqrt(np.diag(cov)), rtol=1e-10)
+
+    def test_missing(self):
+        endog = self.endog.copy()
+        endog[3] = np.nan
+        firm = pandas.Series(self.firm).map(lambda i: 'firm%d' % i)
+        res1 = OLS(endog, self.x, absorb=firm, missing='drop').fit()
+        keep = np.arange(len(endog)) != 3
+        res2 = OLS(endog[keep], self.x[keep], absorb=self.firm[keep]).fit()
+        assert_allclose(res1.params, res2.params, rtol=1e-10)
+        assert_equal(res1.df_resid, res2.df_resid)
+        assert_raises(ValueError, OLS, self.endog[1:], self.x[1:],
+                      absorb=self.firm)
+
+    @pytest.mark.parametrize('nested', [True, False])
+    def test_three_factors(self, nested):
+        rs = np.random.RandomState(987)
+        if nested:
+            # firm x product is nested in firm
+            third = self.firm * 3 + rs.randint(0, 3, size=len(self.firm))
+        else:
+            third = rs.randint(0, 4, size=len(self.firm))
+        third = np.unique(third, return_inverse=True)[1]
+        endog = self.endog + rs.randn(third.max() + 1)[third]
+        dummies = (third[:, None] == np.arange(third.max() + 1)).astype(float)
+        res1 = OLS(endog, np.column_stack((self.exog_dummies, dummies))).fit()
+        absorb = np.column_stack((self.firm, self.year, third))
+        mod2 = OLS(endog, self.x, absorb=absorb)
+        res2 = mod2.fit()
+        assert_equal(mod2.k_absorb, res1.df_model + 1 - 2)
+        assert_equal(res2.df_resid, res1.df_resid)
+        assert_allclose(res2.params, res1.params[:2], rtol=1e-8)
+        assert_allclose(res2.bse, res1.bse[:2], rtol=1e-8)
+
+        # upper bound of the rank if it is not computed
+        from statsmodels.regression._absorb import _Absorber
+        other = rs.randint(0, 4, size=len(self.firm))
+        with pytest.warns(ValueWarning):
+            absorber = _Absorber(np.column_stack((self.firm, self.year,
+                                                  other)),
+                                 max_rank_levels=10)
+        assert_equal(absorber.k_absorb, 30 + 10 + 4 - 2)
@@ -3,7 +3,7 @@ from numpy.testing import assert_allclose
 import pytest
 
 from statsmodels.regression.linear_model import WLS
-from statsmodels.regression._tools import _MinimalWLS
+from statsmodels.regression._tools import _MinimalWLS, _WLSWorkspace
 
 
 class TestMinimalWLS(object):
@@ -60,3 +60,22 @@ class TestMinimalWLS(object):
                         check_endog=True, check_weights=True).fit()
         assert err.type is ValueError
         assert 'weights' in str(err)
+
+
+@pytest.mark.parametrize('method', ['lstsq', 'pinv', 'qr', 'cholesky'])
+def test_wls_workspace(method):
+    rs = np.random.RandomState(1234)
+    exog = rs.randn(200, 5)
+    workspace = _WLSWorkspace(exog)
+    for i in range(3):
+        endog = exog.sum(1) + rs.randn(200)
+        weights = rs.uniform(0.5, 2, size=200)
+        res = WLS(endog, exog, weights=weights).fit()
+        wsres = workspace.fit(endog, weights, method=method)
+        assert_allclose(wsres.params, res.params, rtol=1e-10)
+    assert_allclose(workspace.normalized_cov_params(),
+                    res.normalized_cov_params, rtol=1e-10)
+
+    weights[0] = np.nan
+    with pytest.raises(ValueError):
+        workspace.fit(endog, weights, check_weights=True)
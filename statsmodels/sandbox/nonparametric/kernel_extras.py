@@ -37,7 +37,7 @@ from scipy.stats.mstats import mquantiles
 
 from statsmodels.nonparametric.api import KDEMultivariate, KernelReg
 from statsmodels.nonparametric._kernel_base import \
-    gpke, LeaveOneOut, _get_type_pos, _adjust_shape
+    gpke_blocks, LeaveOneOut, _get_type_pos, _adjust_shape
 
 
 __all__ = ['SingleIndexModel', 'SemiLinear', 'TestFForm']
@@ -72,6 +72,11 @@ class TestFForm(object):
 
             lambda (x,y): np.dot(np.pinv(np.dot(x.T, x)), np.dot(x.T, y))
 
+    Notes
+    -----
+    The residuals of all bootstrap replications are collected first, and the
+    test statistics are computed together in blocks of observations.
+
     References
     ----------
     See Racine, J.: "Consistent Significance Testing for Nonparametric
@@ -104,7 +109,7 @@ class TestFForm(object):
         u1 = fct1 * resid
         u2 = fct2 * resid
         r = fct2 / sqrt5
-        I_dist = np.empty((self.nboot,1))
+        u_boot_hat = np.empty((n, self.nboot))
         for j in range(self.nboot):
             u_boot = u2.copy()
 
@@ -114,8 +119,9 @@ class TestFForm(object):
             Y_boot = m + u_boot
             b_hat = self.estimator(Y_boot, X)
             m_hat = self.fform(X, b_hat)
-            u_boot_hat = Y_boot - m_hat
-            I_dist[j] = self._compute_test_stat(u_boot_hat)
+            u_boot_hat[:, j] = Y_boot - m_hat
+
+        I_dist = self._compute_test_stat(u_boot_hat)[:, None]
 
         self.boots_results = I_dist
         sig = "Not Significant"
@@ -128,30 +134,30 @@ class TestFForm(object):
         return sig
 
     def _compute_test_stat(self, u):
+        """
+        Test statistic for the residuals `u`, or for each column of `u`.
+        """
         n = np.shape(u)[0]
-        XLOO = LeaveOneOut(self.exog)
-        uLOO = LeaveOneOut(u[:,None]).__iter__()
+        exog = _adjust_shape(self.exog, len(self.var_type))
+        u_cols = np.reshape(u, (n, -1))
         I = 0
         S2 = 0
-        for i, X_not_i in enumerate(XLOO):
-            u_j = next(uLOO)
-            u_j = np.squeeze(u_j)
-            # See Bootstrapping procedure on p. 357 in [1]
-            K = gpke(self.bw, data=-X_not_i, data_predict=-self.exog[i, :],
-                     var_type=self.var_type, tosum=False)
-            f_i = (u[i] * u_j * K)
-            assert u_j.shape == K.shape
-            I += f_i.sum()  # See eq. 12.7 on p. 355 in [1]
-            S2 += (f_i**2).sum()  # See Theorem 12.1 on p.356 in [1]
-            assert np.size(I) == 1
-            assert np.size(S2) == 1
+        for index, K in gpke_blocks(self.bw, exog, exog, self.var_type):
+            # See Bootstrapping procedure on p. 357 in [1], the sums are over
+            # j != i
+            K[np.arange(K.shape[0]), np.arange(n)[index]] = 0
+            u_i = u_cols[index]
+            # See eq. 12.7 on p. 355 in [1]
+            I += (u_i * np.dot(K, u_cols)).sum(0)
+            # See Theorem 12.1 on p.356 in [1]
+            S2 += (u_i**2 * np.dot(K**2, u_cols**2)).sum(0)
 
         I *= 1. / (n * (n - 1))
         ix_cont = _get_type_pos(self.var_type)[0]
         hp = self.bw[ix_cont].prod()
         S2 *= 2 * hp / (n * (n - 1))
         T = n * I * np.sqrt(hp / S2)
-        return T
+        return T if np.ndim(u) > 1 else T[0]
 
 
 class SingleIndexModel(KernelReg):
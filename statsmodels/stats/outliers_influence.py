@@ -11,7 +11,9 @@ from collections import defaultdict
 import numpy as np
 
 from statsmodels.regression.linear_model import OLS
+from statsmodels.tools import _sparse
 from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools.parallel import parallel_func
 from statsmodels.stats.multitest import multipletests
 from statsmodels.tools.tools import maybe_unwrap_results
 
@@ -188,6 +190,32 @@ class _BaseInfluenceMixin(object):
     """common methods between OLSInfluence and MLE/GLMInfluence
     """
 
+    def _init_chunks(self, chunksize, n_jobs=1):
+        if chunksize is None:
+            chunksize = max(1, 2**22 // max(self.k_vars, 1))
+        self.chunksize = chunksize
+        self.n_jobs = n_jobs
+
+    def _chunks(self):
+        '''slices of observations that are processed at once'''
+        for start in range(0, self.nobs, self.chunksize):
+            yield slice(start, start + self.chunksize)
+
+    def _map_chunks(self, func):
+        '''call func for the slice of each chunk of observations
+
+        The chunks are processed in threads if n_jobs is not 1. func should
+        write its results into preallocated arrays.
+        '''
+        slices = list(self._chunks())
+        if self.n_jobs == 1 or len(slices) == 1:
+            for sl in slices:
+                func(sl)
+        else:
+            parallel, p_func, n_jobs = parallel_func(
+                func, self.n_jobs, verbose=0, backend='threading')
+            parallel(p_func(sl) for sl in slices)
+
     def plot_influence(self, external=None, alpha=.05, criterion="cooks",
                        size=48, plot_alpha=.75, ax=None, **kwargs):
 
@@ -304,6 +332,13 @@ class MLEInfluence(_BaseInfluenceMixin):
     other arguments are only to override default behavior and are used instead
     of the corresponding attribute of the results class.
     By default resid_pearson is used as resid.
+    chunksize : int, optional
+        Number of observations that are processed at once in the computation
+        of the influence measures. The default limits the temporary
+        nobs x k_vars arrays to about 2**22 elements.
+    n_jobs : int
+        Number of threads that process the chunks of observations if joblib
+        is available. The default 1 processes the chunks sequentially.
 
 
 
@@ -357,7 +392,8 @@ class MLEInfluence(_BaseInfluenceMixin):
     """
 
     def __init__(self, results, resid=None, endog=None, exog=None,
-                 hat_matrix_diag=None, cov_params=None, scale=None):
+                 hat_matrix_diag=None, cov_params=None, scale=None,
+                 chunksize=None, n_jobs=1):
         # I'm not calling super for now, OLS attributes might not be available
         #check which model is allowed
         self.results = results = maybe_unwrap_results(results)
@@ -370,12 +406,63 @@ class MLEInfluence(_BaseInfluenceMixin):
         self.cov_params = (cov_params if cov_params is not None
                            else results.cov_params())
         self.model_class = results.model.__class__
+        self._init_chunks(chunksize, n_jobs)
 
-        self.hessian = self.results.model.hessian(self.results.params)
-        self.score_obs = self.results.model.score_obs(self.results.params)
         if hat_matrix_diag is not None:
             self._hat_matrix_diag = hat_matrix_diag
 
+    @cache_readonly
+    def hessian(self):
+        """(cached attribute) hessian of the loglikelihood at params
+        """
+        return self.results.model.hessian(self.results.params)
+
+    @cache_readonly
+    def score_obs(self):
+        """(cached attribute) score of the loglikelihood for each observation
+        """
+        return self.results.model.score_obs(self.results.params)
+
+    @cache_readonly
+    def _row_factors(self):
+        """observation factors of exog in the derivatives of the model
+
+        If the model provides them, as GLM does, then score_obs, the
+        derivative of the mean and the derivative of score_obs with respect
+        to endog are computed for each chunk of observations as
+        ``factor[:, None] * exog``. Otherwise this is None and the full
+        arrays are computed by the model.
+        """
+        model = self.results.model
+        if not hasattr(model, '_deriv_mean_dparams_factor'):
+            return None
+        params = np.asarray(self.results.params)
+        return dict(score_obs=model.score_factor(params),
+                    dmu_dp=model._deriv_mean_dparams_factor(params),
+                    dsdy=model._deriv_score_obs_dendog_factor(params))
+
+    @cache_readonly
+    def _deriv_arrays(self):
+        """full arrays of the derivatives if there are no row factors"""
+        model = self.results.model
+        params = np.asarray(self.results.params)
+        return dict(dmu_dp=model._deriv_mean_dparams(params),
+                    dsdy=model._deriv_score_obs_dendog(params))
+
+    def _rows(self, name, sl):
+        """rows sl of score_obs, dmu_dp or dsdy as dense array"""
+        factors = self._row_factors
+        if factors is None:
+            if name == 'score_obs':
+                rows = self.score_obs[sl]
+            else:
+                rows = self._deriv_arrays[name][sl]
+            return rows.toarray() if _sparse.issparse(rows) else rows
+        exog = self.results.model.exog[sl]
+        if _sparse.issparse(exog):
+            exog = exog.toarray()
+        return factors[name][sl, None] * exog
+
     @cache_readonly
     def hat_matrix_diag(self):
         """(cached attribute) diagonal of the generalized leverage
@@ -386,10 +473,14 @@ class MLEInfluence(_BaseInfluenceMixin):
         if hasattr(self, '_hat_matrix_diag'):
             return self._hat_matrix_diag
 
-        dmu_dp = self.results.model._deriv_mean_dparams(self.results.params)
-        dsdy = self.results.model._deriv_score_obs_dendog(self.results.params)
-        #dmu_dp = 1 / self.results.model.family.link.deriv(self.results.fittedvalues)
-        h = (dmu_dp * np.linalg.solve(-self.hessian, dsdy.T).T).sum(1)
+        hinv = np.linalg.inv(-self.hessian)
+        h = np.empty(self.nobs)
+
+        def _hat(sl):
+            dsdy = self._rows('dsdy', sl)
+            h[sl] = (self._rows('dmu_dp', sl) * np.dot(dsdy, hinv.T)).sum(1)
+
+        self._map_chunks(_hat)
         return h
 
     @cache_readonly
@@ -399,9 +490,21 @@ class MLEInfluence(_BaseInfluenceMixin):
         This uses one-step approximation of the parameter change to deleting
         one observation.
         """
-        so_noti = self.score_obs.sum(0) - self.score_obs
-        beta_i = np.linalg.solve(self.hessian, so_noti.T).T
-        return beta_i / (1 - self.hat_matrix_diag)[:, None]
+        if self._row_factors is None:
+            score = np.asarray(self.score_obs.sum(0)).ravel()
+        else:
+            score = _sparse.tdot(self.results.model.exog,
+                                 self._row_factors['score_obs'])
+        hinv = np.linalg.inv(self.hessian)
+        factor = 1 - self.hat_matrix_diag
+        beta_i = np.empty((self.nobs, self.k_vars))
+
+        def _d_params(sl):
+            beta_i[sl] = np.dot(score - self._rows('score_obs', sl), hinv.T)
+            beta_i[sl] /= factor[sl, None]
+
+        self._map_chunks(_d_params)
+        return beta_i
 
     @cache_readonly
     def dfbetas(self):
@@ -438,7 +541,15 @@ class MLEInfluence(_BaseInfluenceMixin):
         dependent on the fit keyword use_t.
 
         """
-        cooks_d2 = (self.d_params * np.linalg.solve(self.cov_params, self.d_params.T).T).sum(1)
+        d_params = self.d_params
+        cov_inv = np.linalg.inv(np.asarray(self.cov_params))
+        cooks_d2 = np.empty(self.nobs)
+
+        def _cooks(sl):
+            dp = d_params[sl]
+            cooks_d2[sl] = (dp * np.dot(dp, cov_inv.T)).sum(1)
+
+        self._map_chunks(_cooks)
         cooks_d2 /= self.k_vars
         from scipy import stats
         #alpha = 0.1
@@ -472,10 +583,14 @@ class MLEInfluence(_BaseInfluenceMixin):
         This uses one-step approximation of the parameter change to deleting
         one observation ``d_params`.
         """
-        # results.params might be a pandas.Series
-        params = np.asarray(self.results.params)
-        deriv = self.results.model._deriv_mean_dparams(params)
-        return (deriv * self.d_params).sum(1)
+        d_params = self.d_params
+        d_fitted = np.empty(self.nobs)
+
+        def _d_fitted(sl):
+            d_fitted[sl] = (self._rows('dmu_dp', sl) * d_params[sl]).sum(1)
+
+        self._map_chunks(_d_fitted)
+        return d_fitted
 
     @property
     def d_fittedvalues_scaled(self):
@@ -490,10 +605,18 @@ class MLEInfluence(_BaseInfluenceMixin):
         # this will be relevant for WLS comparing fitted endog versus wendog
         return self.d_fittedvalues / self._get_prediction.se_mean
 
-    def summary_frame(self):
+    def summary_frame(self, measures=None):
         """
         Creates a DataFrame with influence results.
 
+        Parameters
+        ----------
+        measures : list of str, optional
+            Names of the measures to include, a subset of 'dfbetas',
+            'cooks_d', 'standard_resid', 'hat_diag' and 'dffits_internal'.
+            Only the selected measures are computed. By default all of them
+            are included.
+
         Returns
         -------
         frame : pandas DataFrame
@@ -502,7 +625,7 @@ class MLEInfluence(_BaseInfluenceMixin):
 
         Notes
         -----
-        The resultant DataFrame contains six variables in addition to the
+        The resultant DataFrame contains four variables in addition to the
         ``dfbetas``. These are:
 
         * cooks_d : Cook's Distance defined in ``cooks_distance``
@@ -521,13 +644,26 @@ class MLEInfluence(_BaseInfluenceMixin):
         row_labels = data.row_labels
         beta_labels = ['dfb_' + i for i in data.xnames]
 
+        getters = dict(cooks_d=lambda: self.cooks_distance[0],
+                       standard_resid=lambda: self.resid_studentized,
+                       hat_diag=lambda: self.hat_matrix_diag,
+                       dffits_internal=lambda: self.d_fittedvalues_scaled)
+        all_measures = ['dfbetas', 'cooks_d', 'standard_resid', 'hat_diag',
+                        'dffits_internal']
+        if measures is None:
+            measures = all_measures
+        unknown = set(measures).difference(all_measures)
+        if unknown:
+            raise ValueError('unknown measures: %s' %
+                             ', '.join(sorted(unknown)))
+
         # grab the results
-        summary_data = DataFrame(dict(
-                            cooks_d = self.cooks_distance[0],
-                            standard_resid = self.resid_studentized,
-                            hat_diag = self.hat_matrix_diag,
-                            dffits_internal = self.d_fittedvalues_scaled),
-                            index = row_labels)
+        columns = [m for m in all_measures[1:] if m in measures]
+        summary_data = DataFrame(dict((m, getters[m]()) for m in columns),
+                                 columns=columns, index=row_labels)
+        if 'dfbetas' not in measures:
+            return summary_data
+
         #NOTE: if we don't give columns, order of above will be arbitrary
         dfbeta = DataFrame(self.dfbetas, columns=beta_labels,
                             index=row_labels)
@@ -542,20 +678,25 @@ class OLSInfluence(_BaseInfluenceMixin):
     ----------
     results : Regression Results instance
         currently assumes the results are from an OLS regression
+    chunksize : int, optional
+        Number of observations that are processed at once when computing
+        the hat matrix diagonal and the leave-one-observation-out
+        parameter changes. The default limits the temporary nobs x k_vars
+        arrays to about 2**22 elements.
 
     Notes
     -----
     One part of the results can be calculated without any auxiliary regression
     (some of which have the `_internal` postfix in the name. Other statistics
-    require leave-one-observation-out (LOOO) auxiliary regression, and will be
-    slower (mainly results with `_external` postfix in the name).
-    The auxiliary LOOO regression only the required results are stored.
+    are based on leave-one-observation-out (LOOO) estimates (mainly results
+    with `_external` postfix in the name).
 
-    Using the LOO measures is currently only recommended if the data set
-    is not too large. One possible approach for LOOO measures would be to
-    identify possible problem observations with the _internal measures, and
-    then run the leave-one-observation-out only with observations that are
-    possible outliers. (However, this is not yet available in an automized way.)
+    The LOOO estimates are not computed by refitting the model nobs times.
+    Deleting observation i is a rank-one downdate of the cross-product of
+    the design matrix, so that the parameters, the residual variance and the
+    determinant of the parameter covariance of each LOOO regression are
+    available in closed form from the residuals and the diagonal of the hat
+    matrix.
 
     This should be extended to general least squares.
 
@@ -564,7 +705,7 @@ class OLSInfluence(_BaseInfluenceMixin):
 
     '''
 
-    def __init__(self, results):
+    def __init__(self, results, chunksize=None):
         #check which model is allowed
         self.results = maybe_unwrap_results(results)
         self.nobs, self.k_vars = results.model.exog.shape
@@ -576,6 +717,8 @@ class OLSInfluence(_BaseInfluenceMixin):
         #self.sigma_est = np.sqrt(results.mse_resid)
         self.scale = results.mse_resid
 
+        self._init_chunks(chunksize)
+
         self.aux_regression_exog = {}
         self.aux_regression_endog = {}
 
@@ -587,7 +730,18 @@ class OLSInfluence(_BaseInfluenceMixin):
         -----
         temporarily calculated here, this should go to model class
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        model = self.results.model
+        pinv_wexog = getattr(model, 'pinv_wexog', None)
+        hii = np.empty(self.nobs)
+        for sl in self._chunks():
+            if pinv_wexog is None:
+                # model was fit without pinv, e.g. with method="cholesky"
+                xpinv = np.dot(model.wexog[sl],
+                               self.results.normalized_cov_params)
+            else:
+                xpinv = pinv_wexog[:, sl].T
+            hii[sl] = (self.exog[sl] * xpinv).sum(1)
+        return hii
 
     @cache_readonly
     def resid_press(self):
@@ -752,24 +906,58 @@ class OLSInfluence(_BaseInfluenceMixin):
         dffits_threshold = 2 * np.sqrt(self.k_vars * 1. / self.nobs)
         return dffits_, dffits_threshold
 
+    @cache_readonly
+    def _inv_one_minus_hii(self):
+        '''1 / (1 - hii) used in the LOOO results
+
+        nan for observations with leverage one, for which the LOOO regression
+        is not identified.
+        '''
+        hii = self.hat_matrix_diag
+        with np.errstate(divide='ignore', invalid='ignore'):
+            factor = 1. / (1 - hii)
+        factor[hii >= 1 - 1e-12] = np.nan
+        return factor
+
+    def _dfbeta_chunks(self):
+        '''generator of the LOOO parameter changes in chunks of observations
+
+        Removing observation i changes the OLS parameters by ::
+
+            (X'X)^{-1} x_i resid_i / (1 - hii)
+
+        Yields the slice of observations and the corresponding rows of dfbeta.
+        '''
+        ncp = self.results.normalized_cov_params
+        factor = np.asarray(self.resid) * self._inv_one_minus_hii
+        for sl in self._chunks():
+            yield sl, np.dot(self.exog[sl], ncp) * factor[sl, None]
+
     @cache_readonly
     def dfbetas(self):
         '''(cached attribute) dfbetas
 
-        uses results from leave-one-observation-out loop
+        uses closed form leave-one-observation-out results, computed in
+        chunks of observations
         '''
-        dfbetas = self.results.params - self.params_not_obsi#[None,:]
-        dfbetas /= np.sqrt(self.sigma2_not_obsi[:,None])
-        dfbetas /=  np.sqrt(np.diag(self.results.normalized_cov_params))
+        scale = np.sqrt(np.diag(self.results.normalized_cov_params))
+        sigma = np.sqrt(self.sigma2_not_obsi)
+        dfbetas = np.empty((self.nobs, self.k_vars))
+        for sl, dfbeta in self._dfbeta_chunks():
+            dfbeta /= sigma[sl, None]
+            dfbeta /= scale
+            dfbetas[sl] = dfbeta
         return dfbetas
 
     @cache_readonly
     def dfbeta(self):
         '''(cached attribute) dfbetas
 
-        uses results from leave-one-observation-out loop
+        uses closed form leave-one-observation-out results
         '''
-        dfbeta = self.results.params - self.params_not_obsi
+        dfbeta = np.empty((self.nobs, self.k_vars))
+        for sl, dfbeta_chunk in self._dfbeta_chunks():
+            dfbeta[sl] = dfbeta_chunk
         return dfbeta
 
     @cache_readonly
@@ -778,27 +966,34 @@ class OLSInfluence(_BaseInfluenceMixin):
 
         This is 'mse_resid' from each auxiliary regression.
 
-        uses results from leave-one-observation-out loop
+        uses closed form leave-one-observation-out results ::
+
+            (ssr - resid_i**2 / (1 - hii)) / (df_resid - 1)
         '''
-        return np.asarray(self._res_looo['mse_resid'])
+        resid = np.asarray(self.resid)
+        ssr = np.dot(resid, resid)
+        ssr_not_obsi = ssr - resid**2 * self._inv_one_minus_hii
+        return ssr_not_obsi / (self.results.df_resid - 1)
 
     @property
     def params_not_obsi(self):
         '''(cached attribute) parameter estimates for all LOOO regressions
 
-        uses results from leave-one-observation-out loop
+        uses closed form leave-one-observation-out results
         '''
-        return np.asarray(self._res_looo['params'])
+        return np.asarray(self.results.params) - self.dfbeta
 
     @property
     def det_cov_params_not_obsi(self):
         '''(cached attribute) determinant of cov_params of all LOOO regressions
 
-        uses results from leave-one-observation-out loop
-        '''
-        return np.asarray(self._res_looo['det_cov_params'])
-
+        uses closed form leave-one-observation-out results, based on ::
 
+            det(X'X - x_i x_i') = det(X'X) (1 - hii)
+        '''
+        det_ncp = np.linalg.det(self.results.normalized_cov_params)
+        return (self.sigma2_not_obsi**self.k_vars * det_ncp *
+                self._inv_one_minus_hii)
 
     @cache_readonly
     def cov_ratio(self):
@@ -806,7 +1001,7 @@ class OLSInfluence(_BaseInfluenceMixin):
 
         This uses determinant of the estimate of the parameter covariance
         from leave-one-out estimates.
-        requires leave one out loop for observations
+        uses closed form leave-one-observation-out results
 
         '''
         #don't use inplace division / because then we change original
@@ -929,6 +1124,8 @@ class OLSInfluence(_BaseInfluenceMixin):
         regresses endog on exog dropping one observation at a time
 
         this uses a nobs loop, only attributes of the OLS instance are stored.
+        It is not used by the attributes of this class, which use the closed
+        form expressions, and is kept as a reference implementation.
         '''
         from statsmodels.sandbox.tools.cross_val import LeaveOneOut
         get_det_cov_params = lambda res: np.linalg.det(res.cov_params())
@@ -1150,6 +1347,15 @@ class GLMInfluence(MLEInfluence):
     other arguments are only to override default behavior and are used instead
     of the corresponding attribute of the results class.
     By default resid_pearson is used as resid.
+    weights : ndarray, optional
+        Hessian weights of the observations, see `GLM.hessian_factor`. If
+        given, then exog is weighted by the square root of the weights in
+        chunks of observations instead of being passed as a weighted array.
+        This is used by `GLMResults.get_influence`.
+    chunksize : int, optional
+        Number of observations that are processed at once.
+    n_jobs : int
+        Number of threads that process the chunks of observations.
 
 
 
@@ -1186,6 +1392,15 @@ class GLMInfluence(MLEInfluence):
     but no influence measures are currently computed from it.
     """
 
+    def __init__(self, results, resid=None, endog=None, exog=None,
+                 hat_matrix_diag=None, cov_params=None, scale=None,
+                 weights=None, chunksize=None, n_jobs=1):
+        super(GLMInfluence, self).__init__(
+            results, resid=resid, endog=endog, exog=exog,
+            hat_matrix_diag=hat_matrix_diag, cov_params=cov_params,
+            scale=scale, chunksize=chunksize, n_jobs=n_jobs)
+        self.weights = weights
+
     @cache_readonly
     def hat_matrix_diag(self):
         """(cached attribute) diagonal of the hat_matrix for GLM
@@ -1198,7 +1413,7 @@ class GLMInfluence(MLEInfluence):
         if hasattr(self, '_hat_matrix_diag'):
             return self._hat_matrix_diag
         else:
-            return self.results.get_hat_matrix()
+            return self.results.get_hat_matrix_diag(chunksize=self.chunksize)
 
     @cache_readonly
     def d_params(self):
@@ -1208,9 +1423,21 @@ class GLMInfluence(MLEInfluence):
         one observation.
         """
 
-        beta_i = np.linalg.pinv(self.exog) * self.resid_studentized
-        beta_i /= np.sqrt(1 - self.hat_matrix_diag)
-        return beta_i.T
+        # rows of pinv(wexog).T are computed as wexog * pinv(wexog.T wexog)
+        # with wexog = sqrt(weights) * exog
+        exog = self.exog
+        xtx_pinv = np.linalg.pinv(_sparse.gram(exog, self.weights))
+        factor = self.resid_studentized / np.sqrt(1 - self.hat_matrix_diag)
+        if self.weights is not None:
+            factor = factor * np.sqrt(self.weights)
+        beta_i = np.empty((self.nobs, self.k_vars))
+
+        def _d_params(sl):
+            beta_i[sl] = _sparse.dot(exog[sl], xtx_pinv)
+            beta_i[sl] *= factor[sl, None]
+
+        self._map_chunks(_d_params)
+        return beta_i
 
     # same computation as OLS
     @cache_readonly
@@ -1259,7 +1486,14 @@ class GLMInfluence(MLEInfluence):
         # TODO: This will need adjustment for extra params in Poisson
         # use original model exog not transformed influence exog
         exog = self.results.model.exog
-        return (exog * self.d_params).sum(1)
+        d_params = self.d_params
+        d_linpred = np.empty(self.nobs)
+
+        def _d_linpred(sl):
+            d_linpred[sl] = _sparse.row_dot(exog[sl], d_params[sl])
+
+        self._map_chunks(_d_linpred)
+        return d_linpred
 
     @property
     def d_linpred_scaled(self):
@@ -104,6 +104,7 @@ Statistics 90, no. 3 (2008): 414–427.
 from statsmodels.compat.python import range
 import numpy as np
 
+from statsmodels.tools import _sparse
 from statsmodels.tools.grouputils import combine_indices, group_sums
 from statsmodels.stats.moment_helpers import se_cov
 
@@ -166,6 +167,9 @@ def _HCCM(results, scale):
     where pinv(x) = (X'X)^(-1) X
     and scale is (nobs,)
     '''
+    if getattr(results.model, 'pinv_wexog', None) is None:
+        # model was fit without pinv, e.g. with method="cholesky"
+        return _HCCM1(results, scale)
     H = np.dot(results.model.pinv_wexog,
         scale[:,None]*results.model.pinv_wexog.T)
     return H
@@ -241,7 +245,7 @@ def _get_sandwich_arrays(results, cov_type=''):
             xu = results.model.score_obs(results.params)
             hessian_inv = np.linalg.inv(results.model.hessian(results.params))
         else:
-            xu = results.model.wexog * results.wresid[:, None]
+            xu = _sparse.scale_rows(results.model.wexog, results.wresid)
 
             hessian_inv = np.asarray(results.normalized_cov_params)
 
@@ -251,7 +255,8 @@ def _get_sandwich_arrays(results, cov_type=''):
             # assumes that freq_weights are incorporated in score_obs or equivalent
             # assumes xu/score_obs is 2D
             # temporary asarray
-            xu /= np.sqrt(np.asarray(results.model.freq_weights)[:, None])
+            xu = _sparse.scale_rows(
+                xu, 1 / np.sqrt(np.asarray(results.model.freq_weights)))
 
     else:
         raise ValueError('need either tuple of (jac, hessian_inv) or results' +
@@ -280,6 +285,14 @@ def _HCCM1(results, scale):
         robust covariance matrix for the parameter estimates
 
     '''
+    if getattr(results.model, 'pinv_wexog', None) is None:
+        # use (X'X)^(-1) X' scale X (X'X)^(-1) without the nobs x k pinv
+        wexog = results.model.wexog
+        if scale.ndim == 1:
+            meat = np.dot(wexog.T * scale, wexog)
+        else:
+            meat = np.dot(wexog.T, np.dot(scale, wexog))
+        return _HCCM2(results.normalized_cov_params, meat)
     if scale.ndim == 1:
         H = np.dot(results.model.pinv_wexog,
                    scale[:,None]*results.model.pinv_wexog.T)
@@ -394,16 +407,18 @@ def S_hac_simple(x, nlags=None, weights_func=weights_bartlett):
 
     if x.ndim == 1:
         x = x[:,None]
+    if _sparse.issparse(x):
+        x = x.tocsr()
     n_periods = x.shape[0]
     if nlags is None:
         nlags = int(np.floor(4 * (n_periods / 100.)**(2./9.)))
 
     weights = weights_func(nlags)
 
-    S = weights[0] * np.dot(x.T, x)  #weights[0] just for completeness, is 1
+    S = weights[0] * _sparse.gram(x)  #weights[0] just for completeness, is 1
 
     for lag in range(1, nlags+1):
-        s = np.dot(x[lag:].T, x[:-lag])
+        s = _sparse.cross(x[lag:], x[:-lag])
         S += weights[lag] * (s + s.T)
 
     return S
@@ -430,7 +445,7 @@ def S_white_simple(x):
     if x.ndim == 1:
         x = x[:,None]
 
-    return np.dot(x.T, x)
+    return _sparse.gram(x)
 
 
 def S_hac_groupsum(x, time, nlags=None, weights_func=weights_bartlett):
@@ -470,7 +485,10 @@ def S_hac_groupsum(x, time, nlags=None, weights_func=weights_bartlett):
     '''
     #needs groupsums
 
-    x_group_sums = group_sums(x, time).T #TODO: transpose return in grou_sum
+    if _sparse.issparse(x):
+        x_group_sums = _sparse.group_sums(x, time)
+    else:
+        x_group_sums = group_sums(x, time).T #TODO: transpose return in grou_sum
 
     return S_hac_simple(x_group_sums, nlags=nlags, weights_func=weights_func)
 
@@ -484,7 +502,10 @@ def S_crosssection(x, group):
     This is used by cov_cluster and indirectly verified
 
     '''
-    x_group_sums = group_sums(x, group).T  #TODO: why transposed
+    if _sparse.issparse(x):
+        x_group_sums = _sparse.group_sums(x, group)
+    else:
+        x_group_sums = group_sums(x, group).T  #TODO: why transposed
 
     return S_white_simple(x_group_sums)
 
@@ -709,7 +730,7 @@ def lagged_groups(x, lag, groupidx):
     if out0 == []:
         raise ValueError('all groups are empty taking lags')
     #return out0, out_lagged
-    return np.vstack(out0), np.vstack(out_lagged)
+    return _sparse.vstack(out0), _sparse.vstack(out_lagged)
 
 
 
@@ -721,11 +742,13 @@ def S_nw_panel(xw, weights, groupidx):
     no reference for this, just accounting for time indices
     '''
     nlags = len(weights)-1
+    if _sparse.issparse(xw):
+        xw = xw.tocsr()
 
-    S = weights[0] * np.dot(xw.T, xw)  #weights just for completeness
+    S = weights[0] * _sparse.gram(xw)  #weights just for completeness
     for lag in range(1, nlags+1):
         xw0, xwlag = lagged_groups(xw, lag, groupidx)
-        s = np.dot(xw0.T, xwlag)
+        s = _sparse.cross(xw0, xwlag)
         S += weights[lag] * (s + s.T)
     return S
 
@@ -7,8 +7,9 @@ Author: Josef Perktold
 from statsmodels.compat.pandas import testing as pdt
 
 import os.path
+import warnings
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_, assert_allclose
 import pandas as pd
 
 import pytest
@@ -17,7 +18,7 @@ from statsmodels.regression.linear_model import OLS
 from statsmodels.genmod.generalized_linear_model import GLM
 from statsmodels.genmod import families
 
-from statsmodels.stats.outliers_influence import MLEInfluence
+from statsmodels.stats.outliers_influence import MLEInfluence, OLSInfluence
 
 cur_dir = os.path.abspath(os.path.dirname(__file__))
 
@@ -51,6 +52,49 @@ def test_influence_glm_bernoulli():
     assert_allclose(c_bar, results_sas[:, 9], atol=6e-5)
 
 
+@pytest.mark.parametrize('chunksize', [None, 7])
+def test_influence_ols_looo_closed_form(chunksize):
+    np.random.seed(987125)
+    nobs = 50
+    exog = np.column_stack((np.ones(nobs), np.random.randn(nobs, 2)))
+    endog = exog.sum(1) + np.random.standard_t(3, size=nobs)
+    res = OLS(endog, exog).fit()
+
+    infl = OLSInfluence(res, chunksize=chunksize)
+    res_looo = infl._res_looo
+
+    assert_allclose(infl.params_not_obsi, res_looo['params'], rtol=1e-10)
+    assert_allclose(infl.sigma2_not_obsi, res_looo['mse_resid'], rtol=1e-10)
+    assert_allclose(infl.det_cov_params_not_obsi, res_looo['det_cov_params'],
+                    rtol=1e-9)
+    assert_allclose(infl.dfbeta, res.params - res_looo['params'],
+                    rtol=1e-9, atol=1e-12)
+    cov_ratio = res_looo['det_cov_params'] / np.linalg.det(res.cov_params())
+    assert_allclose(infl.cov_ratio, cov_ratio, rtol=1e-9)
+
+    infl_all = OLSInfluence(res, chunksize=nobs)
+    assert_allclose(infl.hat_matrix_diag, infl_all.hat_matrix_diag,
+                    rtol=1e-13)
+    assert_allclose(infl.dfbetas, infl_all.dfbetas, rtol=1e-13)
+
+
+def test_influence_ols_looo_leverage_one():
+    # a dummy variable for a single observation gives hii == 1
+    np.random.seed(987125)
+    nobs = 30
+    exog = np.column_stack((np.ones(nobs), np.random.randn(nobs),
+                            np.arange(nobs) == 3))
+    endog = exog.sum(1) + np.random.randn(nobs)
+    infl = OLSInfluence(OLS(endog, exog).fit())
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        for attr in ['sigma2_not_obsi', 'dfbeta', 'dfbetas',
+                     'det_cov_params_not_obsi', 'cov_ratio']:
+            value = getattr(infl, attr)
+            assert_(np.isnan(value[3]).all(), attr)
+            assert_(np.isfinite(np.delete(value, 3, axis=0)).all(), attr)
+
+
 class InfluenceCompareExact(object):
     # Mixin to compare and test two Influence instances
 
@@ -246,3 +290,86 @@ class TestInfluenceGaussianGLMOLS(InfluenceCompareExact):
         cols = ['cooks_d', 'standard_resid', 'hat_diag', 'dffits_internal']
         assert_allclose(df0[cols].values, df1[cols].values, rtol=1e-5)
         pdt.assert_index_equal(df0.index, df1.index)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_influence_chunks(n_jobs):
+    np.random.seed(543219)
+    nobs = 60
+    exog = np.column_stack((np.ones(nobs), np.random.randn(nobs, 2)))
+    endog = np.random.poisson(np.exp(0.5 + exog[:, 1:].sum(1) * 0.3))
+    res = GLM(endog, exog, family=families.Poisson()).fit()
+
+    infl0 = res.get_influence()
+    infl1 = res.get_influence(chunksize=7, n_jobs=n_jobs)
+    mle0 = MLEInfluence(res)
+    mle1 = MLEInfluence(res, chunksize=7, n_jobs=n_jobs)
+
+    for i0, i1 in [(infl0, infl1), (mle0, mle1)]:
+        assert_allclose(i1.hat_matrix_diag, i0.hat_matrix_diag, rtol=1e-13)
+        assert_allclose(i1.d_params, i0.d_params, rtol=1e-12, atol=1e-15)
+        assert_allclose(i1.cooks_distance[0], i0.cooks_distance[0],
+                        rtol=1e-12)
+        assert_allclose(i1.resid_studentized, i0.resid_studentized,
+                        rtol=1e-13)
+    assert_allclose(mle1.hat_matrix_diag, infl0.hat_matrix_diag, rtol=1e-10)
+
+    # reference computation with the full weighted exog
+    wexog = np.sqrt(res.model.hessian_factor(res.params))[:, None] * exog
+    hat = (wexog * np.linalg.pinv(wexog).T).sum(1)
+    assert_allclose(infl1.hat_matrix_diag, hat, rtol=1e-12)
+    d_params = (np.linalg.pinv(wexog) * infl0.resid_studentized).T
+    d_params /= np.sqrt(1 - hat)[:, None]
+    assert_allclose(infl1.d_params, d_params, rtol=1e-10, atol=1e-15)
+    assert_allclose(infl1.d_linpred, (exog * d_params).sum(1), rtol=1e-10,
+                    atol=1e-15)
+    assert_allclose(mle1.d_fittedvalues, mle0.d_fittedvalues, rtol=1e-12,
+                    atol=1e-15)
+
+
+def test_influence_sparse():
+    from scipy import sparse
+    np.random.seed(543219)
+    nobs, n_groups = 80, 8
+    groups = np.arange(nobs) % n_groups
+    dummies = sparse.csr_matrix((np.ones(nobs), (np.arange(nobs), groups)),
+                                shape=(nobs, n_groups))
+    exog = sparse.hstack((np.random.randn(nobs, 2), dummies)).tocsr()
+    endog = np.random.poisson(np.exp(0.5 + exog[:, :2].toarray().sum(1) *
+                                     0.3))
+    res0 = GLM(endog, exog.toarray(), family=families.Poisson()).fit()
+    res1 = GLM(endog, exog, family=families.Poisson()).fit()
+
+    glm0, glm1 = res0.get_influence(), res1.get_influence(chunksize=7)
+    for infl0, infl1 in [(glm0, glm1),
+                         (MLEInfluence(res0), MLEInfluence(res1))]:
+        for attr in ['hat_matrix_diag', 'd_params', 'resid_studentized',
+                     'd_fittedvalues']:
+            assert_allclose(getattr(infl1, attr), getattr(infl0, attr),
+                            rtol=1e-8, atol=1e-12, err_msg=attr)
+        assert_allclose(infl1.cooks_distance[0], infl0.cooks_distance[0],
+                        rtol=1e-8)
+    assert_allclose(glm1.d_linpred, glm0.d_linpred, rtol=1e-8, atol=1e-12)
+
+
+def test_influence_summary_frame_measures():
+    np.random.seed(543219)
+    nobs = 30
+    exog = np.column_stack((np.ones(nobs), np.random.randn(nobs)))
+    endog = np.random.poisson(np.exp(0.5 + exog[:, 1] * 0.3))
+    res = GLM(endog, exog, family=families.Poisson()).fit()
+    frame_all = res.get_influence().summary_frame()
+
+    infl = res.get_influence()
+    frame = infl.summary_frame(measures=['hat_diag', 'cooks_d'])
+    assert list(frame.columns) == ['cooks_d', 'hat_diag']
+    pdt.assert_frame_equal(frame, frame_all[['cooks_d', 'hat_diag']])
+    # only the selected measures are computed
+    assert 'd_params' not in infl._cache
+    assert 'score_obs' not in infl._cache
+
+    frame = infl.summary_frame(measures=['dfbetas', 'standard_resid'])
+    assert list(frame.columns) == ['dfb_const', 'dfb_x1', 'standard_resid']
+
+    with pytest.raises(ValueError):
+        infl.summary_frame(measures=['cooks'])
@@ -0,0 +1,252 @@
+"""
+Helper functions for design matrices that can be dense ndarrays or
+scipy.sparse matrices.
+
+The functions dispatch on the type of the design matrix so that model code
+can be written once for both cases.  Results that are k x k or of length
+nobs are always returned as dense ndarrays.
+"""
+import numpy as np
+from scipy import sparse
+
+
+def issparse(x):
+    """
+    Return True if `x` is a scipy.sparse matrix.
+    """
+    return sparse.issparse(x)
+
+
+def dot(x, params):
+    """
+    Matrix product x * params of a design matrix and a dense array.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    params : ndarray
+        1d or 2d array with k rows.
+
+    Returns
+    -------
+    ndarray
+    """
+    if sparse.issparse(x):
+        return np.asarray(x.dot(params))
+    return np.dot(x, params)
+
+
+def tdot(x, y):
+    """
+    Matrix product x.T * y of a design matrix and a dense array.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    y : ndarray
+        1d or 2d array with nobs rows.
+
+    Returns
+    -------
+    ndarray
+    """
+    if sparse.issparse(x):
+        return np.asarray(x.T.dot(y))
+    return np.dot(x.T, y)
+
+
+def cross(x, y):
+    """
+    Matrix product x.T * y of two design matrices.
+
+    Parameters
+    ----------
+    x, y : ndarray or sparse matrix
+        Arrays with the same number of rows.
+
+    Returns
+    -------
+    ndarray
+        Dense array with the columns of x as rows and the columns of y as
+        columns.
+    """
+    if sparse.issparse(x) or sparse.issparse(y):
+        prod = sparse.csr_matrix(x).T.dot(sparse.csr_matrix(y))
+        return prod.toarray()
+    return np.dot(x.T, y)
+
+
+def group_sums(x, group):
+    """
+    Sums of the rows of x within groups.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    group : ndarray
+        1d integer array of length nobs with the group labels in
+        range(n_groups).
+
+    Returns
+    -------
+    ndarray or sparse matrix
+        n_groups x k, a CSR matrix if `x` is sparse.  The sums are the
+        product of the transposed group indicator matrix with x.
+    """
+    group = np.asarray(group)
+    nobs = len(group)
+    indicator = sparse.csr_matrix((np.ones(nobs), (group, np.arange(nobs))),
+                                  shape=(group.max() + 1, nobs))
+    if sparse.issparse(x):
+        return indicator.dot(x).tocsr()
+    return np.asarray(indicator.dot(x))
+
+
+def vstack(blocks):
+    """
+    Stack dense arrays or sparse matrices vertically.
+    """
+    if sparse.issparse(blocks[0]):
+        return sparse.vstack(blocks).tocsr()
+    return np.vstack(blocks)
+
+
+def scale_rows(x, factor):
+    """
+    Multiply each row of x by the corresponding element of factor.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    factor : ndarray
+        1d array of length nobs.
+
+    Returns
+    -------
+    ndarray or sparse matrix
+        A CSR matrix if `x` is sparse, otherwise an ndarray.
+    """
+    if sparse.issparse(x):
+        return sparse.diags(factor, 0).dot(x).tocsr()
+    return factor[:, None] * x
+
+
+def gram(x, weights=None):
+    """
+    Weighted cross-product x.T * diag(weights) * x of a design matrix.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    weights : ndarray, optional
+        1d array of length nobs.  If None, the unweighted cross-product
+        is returned.
+
+    Returns
+    -------
+    ndarray
+        Dense k x k array.
+    """
+    if sparse.issparse(x):
+        wx = x if weights is None else scale_rows(x, weights)
+        return x.T.dot(wx).toarray()
+    if weights is None:
+        return np.dot(x.T, x)
+    return np.dot(x.T * weights, x)
+
+
+def quad_diag(x, mat, chunksize=None):
+    """
+    Diagonal of x * mat * x.T without forming the nobs x nobs matrix.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    mat : ndarray
+        k x k array.
+    chunksize : int, optional
+        Number of rows of `x` that are processed at once.  The default
+        limits the temporary dense array to about 2**22 elements.
+
+    Returns
+    -------
+    ndarray
+        1d array of length nobs.
+    """
+    is_sparse = sparse.issparse(x)
+    if is_sparse:
+        x = x.tocsr()
+    nobs, k = x.shape
+    if chunksize is None:
+        chunksize = max(1, 2**22 // max(k, 1))
+    diag = np.empty(nobs)
+    for start in range(0, nobs, chunksize):
+        xc = x[start:start + chunksize]
+        if is_sparse:
+            diag[start:start + chunksize] = np.asarray(
+                xc.multiply(xc.dot(mat)).sum(1)).ravel()
+        else:
+            diag[start:start + chunksize] = (np.dot(xc, mat) * xc).sum(1)
+    return diag
+
+
+def row_dot(x, y):
+    """
+    Inner products of the corresponding rows of x and a dense array y.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        nobs x k design matrix.
+    y : ndarray
+        nobs x k array.
+
+    Returns
+    -------
+    ndarray
+        1d array of length nobs.
+    """
+    if sparse.issparse(x):
+        return np.asarray(x.multiply(y).sum(1)).ravel()
+    return (x * y).sum(1)
+
+
+def matrix_rank(x):
+    """
+    Numerical rank of a design matrix.
+
+    For sparse `x` the rank is the number of eigenvalues of the dense
+    k x k cross-product x.T * x that exceed ``eigvals.max() * k * eps``.
+    The eigenvalues are the squared singular values of x, so the relative
+    tolerance on the singular values is the square root of this, which is
+    larger than the tolerance used by ``np.linalg.matrix_rank``.
+    """
+    if not sparse.issparse(x):
+        return np.linalg.matrix_rank(x)
+    xtx = gram(x)
+    eigvals = np.linalg.eigvalsh(xtx)
+    tol = eigvals.max() * xtx.shape[0] * np.finfo(xtx.dtype).eps
+    return int((eigvals > tol).sum())
+
+
+def check_dense(x, feature):
+    """
+    Raise NotImplementedError if `x` is a sparse matrix.
+
+    Parameters
+    ----------
+    x : ndarray or sparse matrix
+        Design matrix of the model.
+    feature : str
+        Name of the method that requires a dense design matrix, used in
+        the error message.
+    """
+    if sparse.issparse(x):
+        raise NotImplementedError('%s is not available for models with '
+                                  'sparse exog' % feature)
@@ -15,7 +15,7 @@ from statsmodels.tools.sm_exceptions import (ModuleUnavailableWarning,
                                              module_unavailable_doc)
 
 
-def parallel_func(func, n_jobs, verbose=5):
+def parallel_func(func, n_jobs, verbose=5, backend=None):
     """Return parallel instance with delayed function
 
     Util function to use joblib only if available
@@ -28,6 +28,9 @@ def parallel_func(func, n_jobs, verbose=5):
         Number of jobs to run in parallel
     verbose: int
         Verbosity level
+    backend: str or None
+        Parallel backend passed to joblib, e.g. 'threading' or
+        'multiprocessing'. The default None uses the joblib default.
 
     Returns
     -------
@@ -52,7 +55,10 @@ def parallel_func(func, n_jobs, verbose=5):
         except ImportError:
             from sklearn.externals.joblib import Parallel, delayed
 
-        parallel = Parallel(n_jobs, verbose=verbose)
+        if backend is None:
+            parallel = Parallel(n_jobs, verbose=verbose)
+        else:
+            parallel = Parallel(n_jobs, verbose=verbose, backend=backend)
         my_func = delayed(func)
 
         if n_jobs == -1:
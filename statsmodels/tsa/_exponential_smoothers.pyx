@@ -1,6 +1,8 @@
 #!python
 #cython: wraparound=False, boundscheck=False, cdivision=True
 
+from libc.math cimport isfinite, log
+
 import numpy as np
 cimport numpy as np
 
@@ -341,3 +343,218 @@ def _holt_win_mul_add_dam(double[::1] x, np.uint8_t[::1] xi, double[::1] p, doub
         err = y[i] - ((l[i] * phi * b[i]) + s[i])
         sse += err * err
     return sse
+
+
+cdef inline void _trend_deriv(int trend, double l, double b, double phi,
+                              double[::1] dl, double[::1] db, double[::1] out,
+                              Py_ssize_t n_params):
+    """Derivative of the trended level l + phi * b or l * b**phi"""
+    cdef double b_phi, db_phi
+    cdef Py_ssize_t k
+    if trend == 1:
+        for k in range(n_params):
+            out[k] = dl[k] + phi * db[k]
+        out[5] += b
+    elif trend == 2:
+        b_phi = b ** phi
+        db_phi = l * phi * b ** (phi - 1)
+        for k in range(n_params):
+            out[k] = b_phi * dl[k] + db_phi * db[k]
+        out[5] += l * b_phi * log(b)
+    else:
+        for k in range(n_params):
+            out[k] = dl[k]
+
+
+def _holt_win_sse_grad(object x, np.uint8_t[::1] xi, double[::1] p, double[::1] y,
+                       Py_ssize_t m, Py_ssize_t n, double max_seen, int trend, int seasonal):
+    """
+    Sum of squared errors and its gradient for all Holt-Winters models
+
+    The SSE is the same as the one of the kernel of the model, the
+    derivatives of the states with respect to all parameters are updated in
+    the same forward pass as the states.
+
+    Parameters
+    ----------
+    x : ndarray
+        The values of the free parameters.
+    xi : ndarray
+        Indicator of the free parameters in p.
+    p : ndarray
+        All parameters, [alpha, beta, gamma, l0, b0, phi, s0,..,s_(m-1)].
+    y : ndarray
+        The data.
+    m : int
+        The number of seasons, 0 if the model is not seasonal.
+    n : int
+        The number of observations.
+    max_seen : float
+        The SSE returned if the parameters violate the restrictions of the
+        kernel.
+    trend, seasonal : int
+        The type of the components, 0 for none, 1 for additive and 2 for
+        multiplicative.
+
+    Returns
+    -------
+    sse : float
+        Sum of squared errors
+    grad : ndarray
+        The derivatives of sse with respect to the free parameters, zero if
+        the parameters violate the restrictions.  If the sum of squared
+        errors is not finite, max_seen and a zero gradient are returned.
+    """
+    cdef double alpha, beta, gamma, phi, l, b, l_new, b_new, s_lag, s_new
+    cdef double trended, fitted, err, sse, s_i, y_lag
+    cdef Py_ssize_t i, j, k, idx, n_params, n_free, n_seas
+    cdef double[::1] x_arr, dl, db, dl_new, dtrend, dfit, grad, s
+    cdef double[:, ::1] ds
+
+    x_arr = ensure_1d(np.ascontiguousarray(x, dtype=np.double))
+    n_params = p.shape[0]
+    n_free = 0
+    for k in range(n_params):
+        if xi[k]:
+            p[k] = x_arr[n_free]
+            n_free += 1
+    out = np.zeros(n_free)
+    alpha = p[0]
+    beta = p[1]
+    gamma = p[2]
+    phi = p[5]
+
+    if seasonal and trend:
+        if alpha * beta == 0.0 or beta > alpha or gamma > 1 - alpha:
+            return max_seen, out
+    elif seasonal:
+        if alpha == 0.0 or gamma > 1 - alpha:
+            return max_seen, out
+    elif trend:
+        if alpha == 0.0 or beta > alpha:
+            return max_seen, out
+
+    n_seas = max(m, 1)
+    dl = np.zeros(n_params)
+    db = np.zeros(n_params)
+    dl_new = np.empty(n_params)
+    dtrend = np.empty(n_params)
+    dfit = np.empty(n_params)
+    grad = np.zeros(n_params)
+    # seasons are stored in a ring buffer, s_i is in s[i % m]
+    s = np.zeros(n_seas)
+    ds = np.zeros((n_seas, n_params))
+    l = p[3]
+    b = p[4]
+    dl[3] = 1
+    db[4] = 1
+    if seasonal:
+        for j in range(m):
+            s[j] = p[6 + j]
+            ds[j, 6 + j] = 1
+
+    sse = 0.0
+    for i in range(n):
+        if i > 0:
+            y_lag = y[i - 1]
+            j = (i - 1) % n_seas
+            s_lag = s[j]
+            _trend_deriv(trend, l, b, phi, dl, db, dtrend, n_params)
+            if trend == 1:
+                trended = l + phi * b
+            elif trend == 2:
+                trended = l * b ** phi
+            else:
+                trended = l
+            # level
+            if seasonal == 2:
+                l_new = alpha * y_lag / s_lag + (1 - alpha) * trended
+                for k in range(n_params):
+                    dl_new[k] = (-alpha * y_lag / (s_lag * s_lag) * ds[j, k] +
+                                 (1 - alpha) * dtrend[k])
+                dl_new[0] += y_lag / s_lag - trended
+            elif seasonal == 1:
+                l_new = alpha * y_lag - alpha * s_lag + (1 - alpha) * trended
+                for k in range(n_params):
+                    dl_new[k] = -alpha * ds[j, k] + (1 - alpha) * dtrend[k]
+                dl_new[0] += y_lag - s_lag - trended
+            else:
+                l_new = alpha * y_lag + (1 - alpha) * trended
+                for k in range(n_params):
+                    dl_new[k] = (1 - alpha) * dtrend[k]
+                dl_new[0] += y_lag - trended
+            # season, replaces s_(i-1) by s_(i+m-1)
+            if seasonal == 2:
+                s_new = gamma * y_lag / trended + (1 - gamma) * s_lag
+                for k in range(n_params):
+                    ds[j, k] = (-gamma * y_lag / (trended * trended) * dtrend[k] +
+                                (1 - gamma) * ds[j, k])
+                ds[j, 2] += y_lag / trended - s_lag
+                s[j] = s_new
+            elif seasonal == 1:
+                s_new = gamma * y_lag - gamma * trended + (1 - gamma) * s_lag
+                for k in range(n_params):
+                    ds[j, k] = -gamma * dtrend[k] + (1 - gamma) * ds[j, k]
+                ds[j, 2] += y_lag - trended - s_lag
+                s[j] = s_new
+            # slope
+            if trend == 1:
+                b_new = beta * (l_new - l) + (1 - beta) * phi * b
+                for k in range(n_params):
+                    db[k] = (beta * (dl_new[k] - dl[k]) +
+                             (1 - beta) * phi * db[k])
+                db[1] += l_new - l - phi * b
+                db[5] += (1 - beta) * b
+            elif trend == 2:
+                b_new = beta * (l_new / l) + (1 - beta) * b ** phi
+                for k in range(n_params):
+                    db[k] = (beta * (dl_new[k] / l - l_new * dl[k] / (l * l)) +
+                             (1 - beta) * phi * b ** (phi - 1) * db[k])
+                db[1] += l_new / l - b ** phi
+                db[5] += (1 - beta) * b ** phi * log(b)
+            else:
+                b_new = b
+            l = l_new
+            b = b_new
+            for k in range(n_params):
+                dl[k] = dl_new[k]
+
+        # fitted value, the trended level of the kernel with multiplicative
+        # trend and additive seasonal is l * phi * b
+        if trend == 2 and seasonal == 1:
+            fitted = l * phi * b
+            for k in range(n_params):
+                dfit[k] = phi * b * dl[k] + l * phi * db[k]
+            dfit[5] += l * b
+        else:
+            _trend_deriv(trend, l, b, phi, dl, db, dfit, n_params)
+            if trend == 1:
+                fitted = l + phi * b
+            elif trend == 2:
+                fitted = l * b ** phi
+            else:
+                fitted = l
+        if seasonal:
+            j = i % n_seas
+            s_i = s[j]
+            if seasonal == 2:
+                for k in range(n_params):
+                    dfit[k] = s_i * dfit[k] + fitted * ds[j, k]
+                fitted = fitted * s_i
+            else:
+                for k in range(n_params):
+                    dfit[k] = dfit[k] + ds[j, k]
+                fitted = fitted + s_i
+        err = y[i] - fitted
+        sse += err * err
+        for k in range(n_params):
+            grad[k] -= 2 * err * dfit[k]
+
+    if not isfinite(sse):
+        return max_seen, out
+    idx = 0
+    for k in range(n_params):
+        if xi[k]:
+            out[idx] = grad[k]
+            idx += 1
+    return sse, out
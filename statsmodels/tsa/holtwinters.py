@@ -13,6 +13,8 @@ Modified: Kevin Sheppard
 """
 from statsmodels.compat.python import string_types
 
+import itertools
+
 import numpy as np
 import pandas as pd
 from scipy.optimize import basinhopping, brute, minimize
@@ -225,6 +227,136 @@ def _holt_win_mul_add_dam(x, xi, p, y, l, b, s, m, n, max_seen):
     return sqeuclidean((l * phi * b) + s[:-(m - 1)], y)
 
 
+def _initial_values(y, trend, seasonal, m, l0=None, b0=None):
+    """
+    Initial level, slope and seasons, see ExponentialSmoothing.initial_values
+
+    The series are in the last axis of `y`, so that the initial values of
+    many series can be computed at once.
+    """
+    nobs = y.shape[-1]
+    if seasonal in ['mul', 'add']:
+        l0 = y[..., np.arange(nobs) % m == 0].mean(-1) if l0 is None else l0
+        if b0 is None and trend in ['mul', 'add']:
+            lead, lag = y[..., m:m + m], y[..., :m]
+            if trend == 'mul':
+                b0 = np.exp((np.log(lead.mean(-1)) - np.log(lag.mean(-1))) / m)
+            else:
+                b0 = ((lead - lag) / m).mean(-1)
+        l0_ = np.asarray(l0)[..., None]
+        s0 = y[..., :m] / l0_ if seasonal == 'mul' else y[..., :m] - l0_
+    elif trend in ['mul', 'add']:
+        l0 = y[..., 0] if l0 is None else l0
+        if b0 is None:
+            b0 = y[..., 1] / y[..., 0] if trend == 'mul' else y[..., 1] - y[..., 0]
+        s0 = y[..., :0]
+    else:
+        if l0 is None:
+            l0 = y[..., 0]
+        b0 = None
+        s0 = y[..., :0]
+
+    return l0, b0, s0
+
+
+def _boxcox_transform(data, use_boxcox):
+    """
+    Apply the Box-Cox transform selected by the use_boxcox option of fit
+
+    Returns the transformed data and lambda, which is None if no transform
+    is applied.
+    """
+    if use_boxcox == 'log':
+        lamda = 0.0
+        y = boxcox(data, lamda)
+    elif isinstance(use_boxcox, float):
+        lamda = use_boxcox
+        y = boxcox(data, lamda)
+    elif use_boxcox:
+        y, lamda = boxcox(data)
+    else:
+        lamda = None
+        y = data.squeeze()
+    return y, lamda
+
+
+def _brute_grid(bounds, Ns=20):
+    """
+    Grid points of scipy.optimize.brute for finite bounds, one per row
+    """
+    lrange = tuple(slice(low, high, complex(Ns)) for low, high in bounds)
+    if len(lrange) == 1:
+        return np.mgrid[lrange[0]][:, None]
+    grid = np.mgrid[lrange]
+    return grid.reshape(len(lrange), -1).T
+
+
+def _heuristic_starts(p, txi):
+    """
+    Candidate starting values of the smoothing parameters
+
+    The candidates combine several levels of alpha with beta and gamma as
+    fractions of their upper bounds alpha and 1 - alpha, and satisfy the
+    restrictions of the kernels in SMOOTHERS.  Returns the values of the
+    parameters in txi, one candidate per row.
+    """
+    alpha = [0.1, 0.3, 0.5, 0.7, 0.9] if txi[0] else [p[0]]
+    beta = [0.01, 0.1, 0.5] if txi[1] else [None]
+    gamma = [0.05, 0.5] if txi[2] else [None]
+    phi = [0.9, 0.98] if txi[5] else [p[5]]
+    candidates = []
+    for a, b, g, f in itertools.product(alpha, beta, gamma, phi):
+        b = p[1] if b is None else b * a
+        g = p[2] if g is None else g * (1 - a)
+        candidates.append([a, b, g, f])
+    return np.ascontiguousarray(np.array(candidates)[:, txi[[0, 1, 2, 5]]])
+
+
+def _smoothing_constraints(p, xi, trending, seasoning):
+    """
+    Linear inequality constraints of the kernels on the free parameters
+
+    The kernels in SMOOTHERS reject beta > alpha in trended models and
+    gamma > 1 - alpha in seasonal models.  Returns the constraints in the
+    format of scipy.optimize.minimize for the restrictions that involve
+    free parameters.
+    """
+    rows = []
+    if trending:
+        # alpha - beta >= 0
+        rows.append((np.r_[1., -1., 0.], 0.))
+    if seasoning:
+        # 1 - alpha - gamma >= 0
+        rows.append((np.r_[-1., 0., -1.], 1.))
+    constraints = []
+    for coef, const in rows:
+        coef_full = np.zeros(len(xi))
+        coef_full[:3] = coef
+        if not np.any(coef_full[xi]):
+            continue
+        fixed = (coef_full != 0) & ~xi
+        const = const + coef_full[fixed].dot(np.asarray(p)[fixed])
+        coef = coef_full[xi]
+        constraints.append({'type': 'ineq',
+                            'fun': lambda x, c=coef, d=const: c.dot(x) + d,
+                            'jac': lambda x, c=coef: c})
+    return constraints
+
+
+def _search_bounds(xi, m):
+    """
+    Parameters included in the grid search for starting values and bounds
+    """
+    txi = xi & np.array([True, True, True, False, False, True] + [False] * m)
+    txi = txi.astype(np.bool)
+    bounds = np.array([(0.0, 1.0), (0.0, 1.0), (0.0, 1.0),
+                       (0.0, None), (0.0, None), (0.0, 1.0)] + [(None, None), ] * m)
+    return txi, bounds
+
+
+# codes of the components in smoothers._holt_win_sse_grad
+_COMPONENTS = {None: 0, 'add': 1, 'mul': 2}
+
 SMOOTHERS = {('mul', 'add'): smoothers._holt_win_add_mul_dam,
              ('mul', 'mul'): smoothers._holt_win_mul_mul_dam,
              ('mul', None): smoothers._holt_win__mul,
@@ -246,6 +378,118 @@ PY_SMOOTHERS = {('mul', 'add'): _holt_win_add_mul_dam,
                 (None, None): _holt__}
 
 
+def _batch_sse(y, params, trend, seasonal, m):
+    """
+    Sum of squared errors for many series and parameter vectors
+
+    Vectorized version of the kernels in SMOOTHERS.  The recursions run
+    over time in a single loop, with all series and parameter vectors
+    updated at once.
+
+    Parameters
+    ----------
+    y : ndarray
+        Array of series with time in the last axis.  The leading axes
+        must broadcast with the leading axes of params.
+    params : ndarray
+        Array with [alpha, beta, gamma, l0, b0, phi, s0,..,s_(m-1)] in the
+        last axis.
+    trend : {'add', 'mul', None}
+    seasonal : {'add', 'mul', None}
+    m : int
+        The number of seasons, 0 if seasonal is None.
+
+    Returns
+    -------
+    sse : ndarray
+        The broadcast shape of the leading axes of y and params.
+        Parameter vectors that are rejected by the kernels in SMOOTHERS
+        have an sse of np.finfo(np.double).max.
+    """
+    params = np.moveaxis(params, -1, 0)
+    alpha, beta, gamma = params[:3]
+    y = np.moveaxis(y, -1, 0)
+    nobs = y.shape[0]
+    shape = np.broadcast(y[0], alpha).shape
+
+    # parameter restrictions of the kernels
+    trending = trend is not None
+    if seasonal is not None:
+        invalid = gamma > 1 - alpha
+        if trending:
+            invalid |= (alpha * beta == 0) | (beta > alpha)
+        else:
+            invalid |= alpha == 0
+    elif trending:
+        invalid = (alpha == 0) | (beta > alpha)
+    else:
+        invalid = np.zeros_like(alpha, dtype=np.bool)
+    valid = ~np.broadcast_to(invalid, shape)
+
+    # the recursions only run for the valid points, stored in contiguous
+    # 1d arrays since the time loop is dominated by memory access
+    def select(x):
+        return np.broadcast_to(x, shape)[valid]
+
+    alpha, beta, gamma, l, b, phi = map(select, params[:6])
+    # seasons are stored in a ring buffer, s[i] is in s_ring[i % m]
+    if seasonal is not None:
+        s_ring = np.array([select(params[6 + j]) for j in range(m)])
+    y_shape = y.shape[1:]
+    y = y.reshape(nobs, -1)
+    y_index = select(np.arange(y.shape[1]).reshape(y_shape))
+
+    def trended(l, b):
+        if trend == 'add':
+            return l + phi * b
+        elif trend == 'mul':
+            return l * b**phi
+        return l
+
+    def fitted(i):
+        if seasonal == 'add' and trend == 'mul':
+            # same as in _holt_win_mul_add_dam
+            trend_i = l * phi * b
+        else:
+            trend_i = trended(l, b)
+        if seasonal == 'add':
+            return trend_i + s_ring[i % m]
+        elif seasonal == 'mul':
+            return trend_i * s_ring[i % m]
+        return trend_i
+
+    with np.errstate(all='ignore'):
+        y_i = y[0][y_index]
+        sse_valid = (y_i - fitted(0))**2
+        for i in range(1, nobs):
+            y_lag = y_i
+            y_i = y[i][y_index]
+            trend_lag = trended(l, b)
+            if seasonal is not None:
+                s_lag = s_ring[(i - 1) % m]
+            if seasonal == 'mul':
+                l_new = alpha * y_lag / s_lag + (1 - alpha) * trend_lag
+                s_ring[(i - 1) % m] = (gamma * y_lag / trend_lag +
+                                       (1 - gamma) * s_lag)
+            elif seasonal == 'add':
+                l_new = (alpha * y_lag - alpha * s_lag +
+                         (1 - alpha) * trend_lag)
+                s_ring[(i - 1) % m] = (gamma * y_lag - gamma * trend_lag +
+                                       (1 - gamma) * s_lag)
+            else:
+                l_new = alpha * y_lag + (1 - alpha) * trend_lag
+            if trend == 'add':
+                b = beta * (l_new - l) + (1 - beta) * phi * b
+            elif trend == 'mul':
+                b = beta * (l_new / l) + (1 - beta) * b**phi
+            l = l_new
+            sse_valid += (y_i - fitted(i))**2
+
+    sse = np.full(shape, np.finfo(np.double).max)
+    sse[valid] = sse_valid
+    return sse
+
+
 class HoltWintersResults(Results):
     """
     Holt Winter's Exponential Smoothing Results
@@ -542,7 +786,7 @@ class ExponentialSmoothing(TimeSeriesModel):
     def fit(self, smoothing_level=None, smoothing_slope=None, smoothing_seasonal=None,
             damping_slope=None, optimized=True, use_boxcox=False, remove_bias=False,
             use_basinhopping=False, start_params=None, initial_level=None, initial_slope=None,
-            use_brute=True):
+            use_brute=False):
         """
         Fit the model
 
@@ -572,15 +816,18 @@ class ExponentialSmoothing(TimeSeriesModel):
             Using Basin Hopping optimizer to find optimal values
         start_params: array, optional
             Starting values to used when optimizing the fit.  If not provided,
-            starting values are determined using a combination of grid search
-            and reasonable values based on the initial values of the data
+            the smoothing parameters start at the best of a few candidate
+            values, or at the best point of a grid search if use_brute is
+            True, and the initial states start at the initial values of the
+            data.
         initial_level: float, optional
             Value to use when initializing the fitted level.
         initial_slope: float, optional
             Value to use when initializing the fitted slope.
         use_brute: bool, optional
             Search for good starting values using a brute force (grid)
-            optimizer. If False, a naive set of starting values is used.
+            optimizer with 20 points for each smoothing parameter. If False,
+            the best of a few candidate values is used.
 
         Returns
         -------
@@ -595,6 +842,13 @@ class ExponentialSmoothing(TimeSeriesModel):
         functionality of the R library as much as possible whilst still
         being Pythonic.
 
+        The parameters are estimated by minimizing the sum of squared errors
+        with L-BFGS-B, using the analytic gradient of the sum of squared
+        errors with respect to the smoothing parameters and the initial
+        states. In trended or seasonal models the solution is then polished
+        with SLSQP under the restrictions beta <= alpha and
+        gamma <= 1 - alpha, which are not box constraints.
+
         References
         ----------
         [1] Hyndman, Rob J., and George Athanasopoulos. Forecasting: principles
@@ -611,24 +865,10 @@ class ExponentialSmoothing(TimeSeriesModel):
 
         data = self.endog
         damped = self.damped
-        seasoning = self.seasoning
-        trending = self.trending
-        trend = self.trend
-        seasonal = self.seasonal
         m = self.seasonal_periods
         opt = None
         phi = phi if damped else 1.0
-        if use_boxcox == 'log':
-            lamda = 0.0
-            y = boxcox(data, lamda)
-        elif isinstance(use_boxcox, float):
-            lamda = use_boxcox
-            y = boxcox(data, lamda)
-        elif use_boxcox:
-            y, lamda = boxcox(data)
-        else:
-            lamda = None
-            y = data.squeeze()
+        y, lamda = _boxcox_transform(data, use_boxcox)
         if np.ndim(y) != 1:
             raise ValueError('Only 1 dimensional data supported')
         self._y = y
@@ -641,40 +881,33 @@ class ExponentialSmoothing(TimeSeriesModel):
 
         xi = np.zeros_like(p, dtype=np.bool)
         if optimized:
-            init_alpha = alpha if alpha is not None else 0.5 / max(m, 1)
-            init_beta = beta if beta is not None else 0.1 * init_alpha if trending else beta
-            init_gamma = None
-            init_phi = phi if phi is not None else 0.99
-            # Selection of functions to optimize for appropriate parameters
-            if seasoning:
-                init_gamma = gamma if gamma is not None else 0.05 * \
-                                                             (1 - init_alpha)
-                xi = np.array([alpha is None, trending and beta is None, gamma is None,
-                               initial_level is None, trending and initial_slope is None,
-                               phi is None and damped] + [True] * m)
-                func = SMOOTHERS[(seasonal, trend)]
-            elif trending:
-                xi = np.array([alpha is None, beta is None, False,
-                               initial_level is None, initial_slope is None,
-                               phi is None and damped] + [False] * m)
-                func = SMOOTHERS[(None, trend)]
-            else:
-                xi = np.array([alpha is None, False, False,
-                               initial_level is None, False, False] + [False] * m)
-                func = SMOOTHERS[(None, None)]
-            p[:] = [init_alpha, init_beta, init_gamma, l0, b0, init_phi] + s0
+            p[:], xi, func = self._optimization_start(
+                alpha, beta, gamma, phi, initial_level, initial_slope,
+                l0, b0, s0)
             if np.any(xi):
                 # txi [alpha, beta, gamma, l0, b0, phi, s0,..,s_(m-1)]
                 # Have a quick look in the region for a good starting place for alpha etc.
                 # using guesstimates for the levels
-                txi = xi & np.array([True, True, True, False, False, True] + [False] * m)
-                txi = txi.astype(np.bool)
-                bounds = np.array([(0.0, 1.0), (0.0, 1.0), (0.0, 1.0),
-                                   (0.0, None), (0.0, None), (0.0, 1.0)] + [(None, None), ] * m)
+                txi, bounds = _search_bounds(xi, m)
                 args = (txi.astype(np.uint8), p, y, l, b, s, m, self.nobs, max_seen)
-                if start_params is None and np.any(txi) and use_brute:
+                if start_params is None and np.any(txi) and use_brute and txi.sum() > 2:
+                    # same as brute, but the 20**k grid points are evaluated
+                    # in a single vectorized pass
+                    grid = _brute_grid(bounds[txi])
+                    grid_params = np.repeat(p[None, :], len(grid), axis=0)
+                    grid_params[:, txi] = grid
+                    sse = _batch_sse(y, grid_params, self.trend, self.seasonal, m)
+                    best = np.argmin(sse)
+                    p[txi], max_seen = grid[best], sse[best]
+                elif start_params is None and np.any(txi) and use_brute:
                     res = brute(func, bounds[txi], args, Ns=20, full_output=True, finish=None)
                     p[txi], max_seen, _, _ = res
+                elif start_params is None and np.any(txi):
+                    # a few candidates around the usual starting values
+                    candidates = _heuristic_starts(p, txi)
+                    sse = np.array([func(c, *args) for c in candidates])
+                    best = np.argmin(np.where(np.isnan(sse), np.inf, sse))
+                    p[txi], max_seen = candidates[best], sse[best]
                 else:
                     if start_params is not None:
                         start_params = np.atleast_1d(np.squeeze(start_params))
@@ -688,19 +921,37 @@ class ExponentialSmoothing(TimeSeriesModel):
                 # s0 = p[6:]
                 # bounds = np.array([(0.0,1.0),(0.0,1.0),(0.0,1.0),(0.0,None),
                 # (0.0,None),(0.8,1.0)] + [(None,None),]*m)
-                args = (xi.astype(np.uint8), p, y, l, b, s, m, self.nobs, max_seen)
+                # the SSE and its analytic gradient
+                args = (xi.astype(np.uint8), p, y, m, self.nobs, max_seen,
+                        _COMPONENTS[self.trend], _COMPONENTS[self.seasonal])
+                sse_grad = smoothers._holt_win_sse_grad
                 if use_basinhopping:
                     # Take a deeper look in the local minimum we are in to find the best
                     # solution to parameters, maybe hop around to try escape the local
                     # minimum we may be in.
-                    res = basinhopping(func, p[xi],
-                                       minimizer_kwargs={'args': args, 'bounds': bounds[xi]},
+                    res = basinhopping(sse_grad, p[xi],
+                                       minimizer_kwargs={'args': args, 'bounds': bounds[xi],
+                                                         'jac': True},
                                        stepsize=0.01)
                     success = res.lowest_optimization_result.success
                 else:
                     # Take a deeper look in the local minimum we are in to find the best
                     # solution to parameters
-                    res = minimize(func, p[xi], args=args, bounds=bounds[xi])
+                    res = minimize(sse_grad, p[xi], args=args, bounds=bounds[xi],
+                                   jac=True)
+                    constraints = _smoothing_constraints(p, xi, self.trending,
+                                                         self.seasoning)
+                    if constraints:
+                        # L-BFGS-B stalls where the kernels reject beta > alpha
+                        # or gamma > 1 - alpha, polish under these restrictions
+                        slsqp_bounds = [(-np.inf if low is None else low,
+                                         np.inf if high is None else high)
+                                        for low, high in bounds[xi]]
+                        res_con = minimize(sse_grad, res.x, args=args, jac=True,
+                                           bounds=slsqp_bounds, method='SLSQP',
+                                           constraints=constraints)
+                        if np.isfinite(res_con.fun) and res_con.fun < res.fun:
+                            res = res_con
                     success = res.success
 
                 if not success:
@@ -727,6 +978,47 @@ class ExponentialSmoothing(TimeSeriesModel):
         hwfit._results.mle_retvals = opt
         return hwfit
 
+    def _optimization_start(self, alpha, beta, gamma, phi, initial_level,
+                            initial_slope, l0, b0, s0):
+        """
+        Starting parameters, free parameters and SSE kernel used in fit
+
+        Returns
+        -------
+        p : list
+            Starting values of [alpha, beta, gamma, l0, b0, phi, s0, ...]
+        xi : ndarray
+            Boolean array indicating the parameters that are optimized.
+        func : callable
+            The function in SMOOTHERS that computes the SSE.
+        """
+        trending = self.trending
+        damped = self.damped
+        m = self.seasonal_periods
+        init_alpha = alpha if alpha is not None else 0.5 / max(m, 1)
+        init_beta = beta if beta is not None else 0.1 * init_alpha if trending else beta
+        init_gamma = None
+        init_phi = phi if phi is not None else 0.99
+        # Selection of functions to optimize for appropriate parameters
+        if self.seasoning:
+            init_gamma = gamma if gamma is not None else 0.05 * \
+                                                         (1 - init_alpha)
+            xi = np.array([alpha is None, trending and beta is None, gamma is None,
+                           initial_level is None, trending and initial_slope is None,
+                           phi is None and damped] + [True] * m)
+            func = SMOOTHERS[(self.seasonal, self.trend)]
+        elif trending:
+            xi = np.array([alpha is None, beta is None, False,
+                           initial_level is None, initial_slope is None,
+                           phi is None and damped] + [False] * m)
+            func = SMOOTHERS[(None, self.trend)]
+        else:
+            xi = np.array([alpha is None, False, False,
+                           initial_level is None, False, False] + [False] * m)
+            func = SMOOTHERS[(None, None)]
+        p = [init_alpha, init_beta, init_gamma, l0, b0, init_phi] + list(s0)
+        return p, xi, func
+
     def initial_values(self):
         """
         Compute initial values used in the exponential smoothing recursions
@@ -754,35 +1046,9 @@ class ExponentialSmoothing(TimeSeriesModel):
         seasonal component is added the initialization adapts to account for
         the modified structure.
         """
-        y = self._y
-        trend = self.trend
-        seasonal = self.seasonal
-        seasoning = self.seasoning
-        trending = self.trending
-        m = self.seasonal_periods
-        l0 = self._l0
-        b0 = self._b0
-        if seasoning:
-            l0 = y[np.arange(self.nobs) % m == 0].mean() if l0 is None else l0
-            if b0 is None and trending:
-                lead, lag = y[m:m + m], y[:m]
-                if trend == 'mul':
-                    b0 = np.exp((np.log(lead.mean()) - np.log(lag.mean())) / m)
-                else:
-                    b0 = ((lead - lag) / m).mean()
-            s0 = list(y[:m] / l0) if seasonal == 'mul' else list(y[:m] - l0)
-        elif trending:
-            l0 = y[0] if l0 is None else l0
-            if b0 is None:
-                b0 = y[1] / y[0] if trend == 'mul' else y[1] - y[0]
-            s0 = []
-        else:
-            if l0 is None:
-                l0 = y[0]
-            b0 = None
-            s0 = []
-
-        return l0, b0, s0
+        l0, b0, s0 = _initial_values(self._y, self.trend, self.seasonal,
+                                     self.seasonal_periods, self._l0, self._b0)
+        return l0, b0, list(s0)
 
     def _predict(self, h=None, smoothing_level=None, smoothing_slope=None,
                  smoothing_seasonal=None, initial_level=None, initial_slope=None,
@@ -1006,7 +1272,7 @@ class SimpleExpSmoothing(ExponentialSmoothing):
         super(SimpleExpSmoothing, self).__init__(endog)
 
     def fit(self, smoothing_level=None, optimized=True, start_params=None,
-            initial_level=None, use_brute=True):
+            initial_level=None, use_brute=False):
         """
         Fit the model
 
@@ -1019,13 +1285,16 @@ class SimpleExpSmoothing(ExponentialSmoothing):
             Estimate model parameters by maximizing the log-likelihood
         start_params: array, optional
             Starting values to used when optimizing the fit.  If not provided,
-            starting values are determined using a combination of grid search
-            and reasonable values based on the initial values of the data
+            the smoothing parameters start at the best of a few candidate
+            values, or at the best point of a grid search if use_brute is
+            True, and the initial states start at the initial values of the
+            data.
         initial_level: float, optional
             Value to use when initializing the fitted level.
         use_brute: bool, optional
             Search for good starting values using a brute force (grid)
-            optimizer. If False, a naive set of starting values is used.
+            optimizer with 20 points for each smoothing parameter. If False,
+            the best of a few candidate values is used.
 
         Returns
         -------
@@ -1087,7 +1356,7 @@ class Holt(ExponentialSmoothing):
 
     def fit(self, smoothing_level=None, smoothing_slope=None, damping_slope=None,
             optimized=True, start_params=None, initial_level=None,
-            initial_slope=None, use_brute=True):
+            initial_slope=None, use_brute=False):
         """
         Fit the model
 
@@ -1106,15 +1375,18 @@ class Holt(ExponentialSmoothing):
             Estimate model parameters by maximizing the log-likelihood
         start_params: array, optional
             Starting values to used when optimizing the fit.  If not provided,
-            starting values are determined using a combination of grid search
-            and reasonable values based on the initial values of the data
+            the smoothing parameters start at the best of a few candidate
+            values, or at the best point of a grid search if use_brute is
+            True, and the initial states start at the initial values of the
+            data.
         initial_level: float, optional
             Value to use when initializing the fitted level.
         initial_slope: float, optional
             Value to use when initializing the fitted slope.
         use_brute: bool, optional
             Search for good starting values using a brute force (grid)
-            optimizer. If False, a naive set of starting values is used.
+            optimizer with 20 points for each smoothing parameter. If False,
+            the best of a few candidate values is used.
 
         Returns
         -------
@@ -1135,3 +1407,183 @@ class Holt(ExponentialSmoothing):
                                      smoothing_slope=smoothing_slope, damping_slope=damping_slope,
                                      optimized=optimized, start_params=start_params,
                                      initial_level=None, initial_slope=None, use_brute=use_brute)
+
+
+PANEL_PARAM_NAMES = ['smoothing_level', 'smoothing_slope', 'smoothing_seasonal',
+                     'initial_level', 'initial_slope', 'damping_slope']
+
+
+def _fit_panel_series(y, model_kwds, fit_kwds, start_params, steps):
+    # Fit a single series of fit_panel, runs in the worker pool
+    import warnings
+    from statsmodels.tools.sm_exceptions import ConvergenceWarning
+
+    mod = ExponentialSmoothing(y, **model_kwds)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', ConvergenceWarning)
+        res = mod.fit(start_params=start_params, **fit_kwds)
+
+    params = res.params
+    params = [params[name] for name in PANEL_PARAM_NAMES] + \
+        list(params['initial_seasons'])
+    params = np.array([np.nan if v is None else v for v in params],
+                      dtype=np.double)
+    forecast = np.asarray(res.forecast(steps)) if steps > 0 else np.empty(0)
+    opt = res.mle_retvals
+    opt = getattr(opt, 'lowest_optimization_result', opt)
+    converged = getattr(opt, 'success', True)
+    return params, res.sse, res.aic, res.aicc, res.bic, forecast, converged
+
+
+def fit_panel(endog, trend=None, damped=False, seasonal=None,
+              seasonal_periods=None, groups=None, steps=0, n_jobs=1,
+              backend=None, chunksize=None, **kwargs):
+    """
+    Fit ExponentialSmoothing to many series with the same model settings
+
+    Parameters
+    ----------
+    endog : array-like
+        2d array or DataFrame with one column for each series, or a 1d
+        array or Series with the stacked series if `groups` is provided.
+        All series must have the same number of observations.
+    trend : {"add", "mul", "additive", "multiplicative", None}, optional
+        Type of trend component.
+    damped : bool, optional
+        Should the trend component be damped.
+    seasonal : {"add", "mul", "additive", "multiplicative", None}, optional
+        Type of seasonal component.
+    seasonal_periods : int, optional
+        The number of seasons to consider for the holt winters. Required
+        for seasonal models.
+    groups : array-like, optional
+        Labels of the series for data in long format. The observations of
+        each series need to be in time order.
+    steps : int, optional
+        Number of out-of-sample forecasts computed for each series.
+    n_jobs : int, optional
+        Number of jobs that fit the series in parallel if joblib is
+        available. -1 uses all available CPUs.
+    backend : str, optional
+        joblib backend. The default None uses the process based default
+        backend of joblib, since the SSE kernels hold the GIL.
+    chunksize : int, optional
+        Number of series for which the grid search for starting values is
+        evaluated at once. The default limits the arrays of the vectorized
+        recursions to about 2**18 elements.
+    **kwargs
+        Keywords passed to `ExponentialSmoothing.fit`.
+
+    Returns
+    -------
+    Bunch
+        A dict-like object with attributes
+
+        - names : labels of the series
+        - param_names : names of the columns of params
+        - params : nseries x (6 + seasonal_periods) array of estimates.
+          Parameters that are not included in the model are nan.
+        - sse, aic, aicc, bic : arrays with one value for each series
+        - forecasts : nseries x steps array of forecasts
+        - converged : boolean array, False if the optimizer failed to
+          converge for a series
+
+    Notes
+    -----
+    If `use_brute` is True, the grid search for starting values of
+    `ExponentialSmoothing.fit` is done for all series at once with a
+    vectorized version of the SSE kernels. Each series is then fit with the
+    best grid point as `start_params`. In all cases the results are the
+    same as when fitting the series one at a time.
+    """
+    from statsmodels.tools.parallel import parallel_func
+    from statsmodels.tools.tools import Bunch
+
+    if groups is not None:
+        groups = np.asarray(groups)
+        codes, names = pd.factorize(groups)
+        counts = np.bincount(codes)
+        if np.any(counts != counts[0]):
+            raise ValueError('all series need to have the same number of '
+                             'observations')
+        order = np.argsort(codes, kind='mergesort')
+        data = np.asarray(endog, dtype=np.double)[order]
+        data = data.reshape(len(names), counts[0])
+    else:
+        names = getattr(endog, 'columns', None)
+        data = np.asarray(endog, dtype=np.double)
+        if data.ndim != 2:
+            raise ValueError('endog needs to be 2-dimensional unless groups '
+                             'is provided')
+        data = data.T
+        if names is None:
+            names = np.arange(data.shape[0])
+    data = np.ascontiguousarray(data)
+    nseries = data.shape[0]
+
+    model_kwds = dict(trend=trend, damped=damped, seasonal=seasonal,
+                      seasonal_periods=seasonal_periods)
+    mod = ExponentialSmoothing(data[0], **model_kwds)
+    m = mod.seasonal_periods
+    fit_kwds = dict(kwargs)
+    start_params = fit_kwds.pop('start_params', None)
+
+    starts = [start_params] * nseries
+    if (fit_kwds.get('optimized', True) and fit_kwds.get('use_brute', False)
+            and start_params is None):
+        alpha = fit_kwds.get('smoothing_level')
+        beta = fit_kwds.get('smoothing_slope')
+        gamma = fit_kwds.get('smoothing_seasonal')
+        phi = fit_kwds.get('damping_slope')
+        phi = phi if damped else 1.0
+        initial_level = fit_kwds.get('initial_level')
+        initial_slope = fit_kwds.get('initial_slope')
+        use_boxcox = fit_kwds.get('use_boxcox', False)
+
+        y = np.array([_boxcox_transform(yi, use_boxcox)[0] for yi in data])
+        # computed one series at a time, so that the starting values are
+        # identical to those of ExponentialSmoothing.fit
+        init = [_initial_values(yi, mod.trend, mod.seasonal, m,
+                                initial_level, initial_slope) for yi in y]
+        l0, b0, s0 = zip(*init)
+        p, xi, _ = mod._optimization_start(alpha, beta, gamma, phi,
+                                           initial_level, initial_slope,
+                                           np.nan, np.nan, [np.nan] * m)
+        txi, bounds = _search_bounds(xi, m)
+        if np.any(txi):
+            p = np.array([np.nan if v is None else v for v in p],
+                         dtype=np.double)
+            p = np.tile(p, (nseries, 1))
+            p[:, 3] = l0
+            p[:, 4] = [np.nan if b0_i is None else b0_i for b0_i in b0]
+            p[:, 6:] = np.reshape(s0, (nseries, -1))
+
+            grid = _brute_grid(bounds[txi])
+            if chunksize is None:
+                chunksize = max(1, 2**18 // len(grid))
+            for start in range(0, nseries, chunksize):
+                chunk = slice(start, start + chunksize)
+                params = np.repeat(p[chunk, None, :], len(grid), axis=1)
+                params[:, :, txi] = grid
+                sse = _batch_sse(y[chunk, None, :], params, mod.trend,
+                                 mod.seasonal, m)
+                p[chunk, txi] = grid[np.argmin(sse, axis=1)]
+            starts = p[:, xi]
+
+    if n_jobs == 1:
+        res = [_fit_panel_series(yi, model_kwds, fit_kwds, start, steps)
+               for yi, start in zip(data, starts)]
+    else:
+        parallel, p_func, n_jobs = parallel_func(
+            _fit_panel_series, n_jobs, verbose=0, backend=backend)
+        res = parallel(p_func(yi, model_kwds, fit_kwds, start, steps)
+                       for yi, start in zip(data, starts))
+    params, sse, aic, aicc, bic, forecasts, converged = zip(*res)
+
+    param_names = PANEL_PARAM_NAMES + \
+        ['initial_seasons.{0}'.format(i) for i in range(m)]
+    return Bunch(names=names, param_names=param_names,
+                 params=np.array(params), sse=np.array(sse),
+                 aic=np.array(aic), aicc=np.array(aicc), bic=np.array(bic),
+                 forecasts=np.array(forecasts),
+                 converged=np.array(converged))
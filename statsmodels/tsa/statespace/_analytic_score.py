@@ -0,0 +1,336 @@
+"""
+Analytic score of the state space loglikelihood
+
+The score is computed from a single pass of the Kalman filter and smoother,
+given the partial derivatives of the system matrices with respect to the
+parameters, see Koopman and Shephard (1992).
+
+License: Simplified-BSD
+
+References
+----------
+.. [*] Koopman, S. J., and N. Shephard. 1992.
+   "Exact Score for Time Series Models in State Space Form."
+   Biometrika 79 (4): 823-26.
+.. [*] Durbin, James, and Siem Jan Koopman. 2012.
+   Time Series Analysis by State Space Methods: Second Edition.
+   Oxford University Press.
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+
+from .tools import solve_discrete_lyapunov
+
+
+def _contract(partials, stat):
+    # sum_t tr(partials_i[..., t]' stat[..., t]) for each parameter i, where
+    # `partials` may be time-invariant
+    if partials.shape[-1] == 1:
+        return np.tensordot(partials[..., 0], stat.sum(-1), axes=stat.ndim - 1)
+    return np.tensordot(partials, stat, axes=stat.ndim)
+
+
+def _period(matrix, t):
+    # Matrix of period t of a possibly time-invariant matrix
+    return matrix[..., t] if matrix.shape[-1] > 1 else matrix[..., 0]
+
+
+def stationary_initialization_partials(transition, state_intercept,
+                                       selection, state_cov, initial_state,
+                                       initial_state_cov, partials):
+    """
+    Partial derivatives of the stationary initialization
+
+    Parameters
+    ----------
+    transition, state_intercept, selection, state_cov : array
+        System matrices of the first period, without the time axis.
+    initial_state, initial_state_cov : array
+        Unconditional mean and covariance matrix of the state.
+    partials : dict
+        Partial derivatives of the system matrices, see `smoother_score`.
+
+    Returns
+    -------
+    partial_state : array
+        Partial derivatives of the initial state mean, k_params x k_states.
+    partial_state_cov : array
+        Partial derivatives of the initial state covariance matrix,
+        k_params x k_states x k_states.
+
+    Notes
+    -----
+    Differentiating :math:`P = T P T' + R Q R'` shows that the partial
+    derivative of :math:`P` solves a discrete Lyapunov equation with the
+    same transition matrix, which avoids complex step differentiation
+    through the Lyapunov solver.
+    """
+    dT = partials['transition'][..., 0]
+    dc = partials['state_intercept'][..., 0]
+    dR = partials['selection'][..., 0]
+    dQ = partials['state_cov'][..., 0]
+    k_params, k_states = dc.shape
+
+    eye = np.eye(k_states)
+    partial_state = np.linalg.solve(
+        eye - transition, (dc + np.dot(dT, initial_state)).T).T
+
+    TP = np.dot(transition, initial_state_cov)
+    RQ = np.dot(selection, state_cov)
+    partial_state_cov = np.zeros((k_params, k_states, k_states))
+    for i in range(k_params):
+        dTPT = np.dot(dT[i], TP.T)
+        dRQR = np.dot(dR[i], RQ.T)
+        rhs = (dTPT + dTPT.T + dRQR + dRQR.T +
+               np.dot(np.dot(selection, dQ[i]), selection.T))
+        if np.any(rhs != 0):
+            partial_state_cov[i] = solve_discrete_lyapunov(transition, rhs)
+    return partial_state, partial_state_cov
+
+
+def initialization_partials(initialization, transition, state_intercept,
+                            selection, state_cov, initial_state,
+                            initial_state_cov, partials, partial_state,
+                            partial_state_cov, index=None):
+    """
+    Set the partial derivatives of stationary blocks of the initialization
+
+    Parameters
+    ----------
+    initialization : Initialization
+        The initialization of the model.
+    transition, state_intercept, selection, state_cov : array
+        System matrices of the first period, without the time axis.
+    initial_state, initial_state_cov : array
+        Initial state mean and covariance matrix.
+    partials : dict
+        Partial derivatives of the system matrices, see `smoother_score`.
+    partial_state, partial_state_cov : array
+        Partial derivatives of the initial state mean and covariance matrix,
+        in which those of the stationary blocks are set in-place.
+    index : array, optional
+        The states of `initialization`. Default is all states.
+
+    Notes
+    -----
+    Complex step differentiation is not reliable for the stationary blocks,
+    which are computed by solving a discrete Lyapunov equation, and so their
+    partial derivatives are computed by `stationary_initialization_partials`.
+    """
+    if index is None:
+        index = np.arange(initialization.k_states)
+    if initialization.initialization_type == 'stationary':
+        ix1 = np.ix_(index)
+        ix2 = np.ix_(index, index)
+        block_partials = {
+            'transition': partials['transition'][(slice(None),) + ix2],
+            'state_intercept': partials['state_intercept'][:, index],
+            'selection': partials['selection'][:, index],
+            'state_cov': partials['state_cov']}
+        block_state, block_state_cov = stationary_initialization_partials(
+            transition[ix2], state_intercept[ix1], selection[index],
+            state_cov, initial_state[ix1], initial_state_cov[ix2],
+            block_partials)
+        partial_state[:, index] = block_state
+        partial_state_cov[(slice(None),) + ix2] = block_state_cov
+    elif initialization.initialization_type is None:
+        for block_index, block in initialization.blocks.items():
+            initialization_partials(
+                block, transition, state_intercept, selection, state_cov,
+                initial_state, initial_state_cov, partials, partial_state,
+                partial_state_cov, index=index[block_index, ])
+
+
+def smoother_score(res, partials, initial_partials):
+    r"""
+    Score of the loglikelihood from the output of the Kalman smoother
+
+    Parameters
+    ----------
+    res : SmootherResults
+        Output of the Kalman filter and smoother, with all output stored.
+    partials : dict
+        Partial derivatives of the system matrices, keyed by the names of
+        the matrices, each with shape k_params x (shape of the matrix in
+        `Representation`, including the time axis).
+    initial_partials : tuple of array
+        Partial derivatives of the initial state mean, k_params x k_states,
+        and of the initial state covariance matrix,
+        k_params x k_states x k_states.
+
+    Returns
+    -------
+    score : array
+        The derivative of the joint loglikelihood (including all periods)
+        with respect to each parameter.
+
+    Notes
+    -----
+    Writing :math:`u_t` for the smoothing errors, :math:`r_t, N_t` for the
+    scaled smoothed estimator and its covariance matrix, and :math:`\hat
+    \alpha_t, \hat \eta_t` for the smoothed state and state disturbance,
+    the score with respect to the parameter :math:`\theta_i` is, for
+    example for the observation intercept and the state covariance matrix,
+
+    .. math::
+
+        \sum_t \left [ u_t' \dot d_t + \frac{1}{2} tr \{ \dot Q_t
+        R_t' (r_t r_t' - N_t) R_t \} \right ]
+
+    and similarly for the other system matrices: each term is the product of
+    the partial derivative of a system matrix and the conditional
+    expectation, given the data, of the corresponding term in the complete
+    data loglikelihood, less its unconditional expectation. With
+    :math:`L_t = T_t - K_t Z_t`, the unconditional covariances required are
+    :math:`Cov(\alpha_t, r_t) = P_t L_t' N_t`,
+    :math:`Cov(\alpha_t, u_t) = P_t Z_t' F_t^{-1} - P_t L_t' N_t K_t` and
+    :math:`Cov(\eta_t, r_t) = Q_t R_t' N_t`.
+    """
+    nobs = res.nobs
+    design = np.broadcast_to(res.design, res.design.shape[:2] + (nobs,))
+    transition = np.broadcast_to(res.transition,
+                                 res.transition.shape[:2] + (nobs,))
+    selection = np.broadcast_to(res.selection,
+                                res.selection.shape[:2] + (nobs,))
+    state_cov = np.broadcast_to(res.state_cov,
+                                res.state_cov.shape[:2] + (nobs,))
+
+    # Move the time axis first for the stacked matrix products
+    Z = np.moveaxis(design, -1, 0)
+    T = np.moveaxis(transition, -1, 0)
+    R = np.moveaxis(selection, -1, 0)
+    Q = np.moveaxis(state_cov, -1, 0)
+    P = np.moveaxis(res.predicted_state_cov[..., :nobs], -1, 0)
+    K = np.moveaxis(res.kalman_gain, -1, 0)
+    N = np.moveaxis(res.scaled_smoothed_estimator_cov, -1, 0)
+    F_inv = np.linalg.inv(np.moveaxis(res.forecasts_error_cov, -1, 0))
+    r = res.scaled_smoothed_estimator
+    u = res.smoothing_error
+    smoothed_state = res.smoothed_state
+    smoothed_state_disturbance = res.smoothed_state_disturbance
+
+    L = T - np.matmul(K, Z)
+    P_LN = np.matmul(np.matmul(P, L.swapaxes(1, 2)), N)
+    PZ_Finv = np.matmul(np.matmul(P, Z.swapaxes(1, 2)), F_inv)
+    D = F_inv + np.matmul(np.matmul(K.swapaxes(1, 2), N), K)
+    RN = np.matmul(R.swapaxes(1, 2), N)
+
+    # Conditional less unconditional expectations
+    stats = {
+        'obs_intercept': u,
+        'design': (u[:, None, :] * smoothed_state[None, :, :] -
+                   np.moveaxis(PZ_Finv - np.matmul(P_LN, K), 0, -1
+                               ).swapaxes(0, 1)),
+        'obs_cov': 0.5 * (u[:, None, :] * u[None, :, :] -
+                          np.moveaxis(D, 0, -1)),
+        'state_intercept': r,
+        'transition': (r[:, None, :] * smoothed_state[None, :, :] -
+                       np.moveaxis(P_LN, 0, -1).swapaxes(0, 1)),
+        'selection': (r[:, None, :] * smoothed_state_disturbance[None, :, :] -
+                      np.moveaxis(np.matmul(Q, RN), 0, -1).swapaxes(0, 1)),
+    }
+    Rr = np.matmul(R.swapaxes(1, 2), r.T[..., None])[..., 0]
+    stats['state_cov'] = 0.5 * np.moveaxis(
+        Rr[:, :, None] * Rr[:, None, :] - np.matmul(RN, R), 0, -1)
+
+    score = 0
+    for name, stat in stats.items():
+        score = score + _contract(partials[name], stat)
+
+    # Initial state
+    r_0 = np.dot(Z[0].T, u[:, 0]) + np.dot(T[0].T, r[:, 0])
+    N_0 = (np.dot(np.dot(Z[0].T, F_inv[0]), Z[0]) +
+           np.dot(np.dot(L[0].T, N[0]), L[0]))
+    partial_state, partial_state_cov = initial_partials
+    score = score + np.dot(partial_state, r_0)
+    score = score + 0.5 * np.tensordot(partial_state_cov,
+                                       np.outer(r_0, r_0) - N_0, axes=2)
+    return score
+
+
+def forward_score(endog, matrices, partials, initial_state,
+                  initial_state_cov, initial_partials, nobs=None):
+    """
+    Score of the loglikelihood of the first periods by forward recursions
+
+    Parameters
+    ----------
+    endog : array
+        Observations, k_endog x nobs, without missing values.
+    matrices : dict
+        System matrices, keyed by name, with the shapes used by
+        `Representation`.
+    partials : dict
+        Partial derivatives of the system matrices, see `smoother_score`.
+    initial_state, initial_state_cov : array
+        Initial state mean and covariance matrix.
+    initial_partials : tuple of array
+        Partial derivatives of the initial state mean and covariance matrix.
+    nobs : int, optional
+        Number of periods to include. Default is all periods.
+
+    Returns
+    -------
+    score : array
+        The derivative of the loglikelihood of the first `nobs` periods with
+        respect to each parameter.
+
+    Notes
+    -----
+    The partial derivatives of the predicted state and its covariance matrix
+    are propagated jointly for all parameters along with the filter, see
+    Harvey (1989), section 3.4.5. The cost is proportional to the number of
+    periods, and so this is used for the periods that are excluded from the
+    loglikelihood by `loglikelihood_burn`.
+    """
+    if nobs is None:
+        nobs = endog.shape[1]
+    a = initial_state
+    P = initial_state_cov
+    da, dP = initial_partials
+    score = 0
+    for t in range(nobs):
+        Z, d, H, T, c, R, Q = [
+            _period(matrices[name], t) for name in
+            ['design', 'obs_intercept', 'obs_cov', 'transition',
+             'state_intercept', 'selection', 'state_cov']]
+        dZ, dd, dH, dT, dc, dR, dQ = [
+            _period(partials[name], t) for name in
+            ['design', 'obs_intercept', 'obs_cov', 'transition',
+             'state_intercept', 'selection', 'state_cov']]
+
+        v = endog[:, t] - d - np.dot(Z, a)
+        dv = -dd - np.matmul(dZ, a) - np.matmul(Z, da[..., None])[..., 0]
+        ZP = np.dot(Z, P)
+        F = np.dot(ZP, Z.T) + H
+        dZP = np.matmul(dZ, P) + np.matmul(Z, dP)
+        dF = np.matmul(dZP, Z.T) + np.matmul(ZP, dZ.swapaxes(1, 2)) + dH
+        F_inv = np.linalg.inv(F)
+        F_inv_v = np.dot(F_inv, v)
+        dF_inv = -np.matmul(np.matmul(F_inv, dF), F_inv)
+
+        score = score - 0.5 * (
+            np.trace(np.matmul(F_inv, dF), axis1=1, axis2=2) +
+            2 * np.dot(dv, F_inv_v) + np.dot(np.dot(dF_inv, v), v))
+
+        # Filtered state and covariance matrix
+        G = np.dot(ZP.T, F_inv)
+        dG = np.matmul(dZP.swapaxes(1, 2), F_inv) + np.matmul(ZP.T, dF_inv)
+        a_filtered = a + np.dot(G, v)
+        da_filtered = da + np.dot(dG, v) + np.matmul(G, dv[..., None])[..., 0]
+        P_filtered = P - np.dot(G, ZP)
+        dP_filtered = dP - np.matmul(dG, ZP) - np.matmul(G, dZP)
+
+        # Predicted state and covariance matrix
+        RQR = np.dot(np.dot(R, Q), R.T)
+        dRQR = np.matmul(np.matmul(dR, Q), R.T)
+        dRQR = dRQR + dRQR.swapaxes(1, 2) + np.matmul(np.matmul(R, dQ), R.T)
+        a = np.dot(T, a_filtered) + c
+        da = (np.matmul(dT, a_filtered) +
+              np.matmul(T, da_filtered[..., None])[..., 0] + dc)
+        dTPT = np.matmul(np.matmul(dT, P_filtered), T.T)
+        P = np.dot(np.dot(T, P_filtered), T.T) + RQR
+        dP = (dTPT + dTPT.swapaxes(1, 2) +
+              np.matmul(np.matmul(T, dP_filtered), T.T) + dRQR)
+    return score
@@ -0,0 +1,171 @@
+"""
+Batched Kalman Filter
+
+Conventional Kalman filter for a stack of state space models that share
+their dimensions, with all models updated at once in each period.
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+
+
+def _period(matrix, t):
+    # Matrix of period t of a possibly time-invariant stacked matrix
+    return matrix[..., t] if matrix.shape[-1] > 1 else matrix[..., 0]
+
+
+def batch_stationary_initialization(transition, state_intercept, selection,
+                                    state_cov, maxiter=100):
+    """
+    Unconditional mean and covariance of the state for a stack of models
+
+    Parameters
+    ----------
+    transition, state_intercept, selection, state_cov : array
+        System matrices of the first period, with a leading batch axis and
+        without the time axis.
+    maxiter : int, optional
+        Maximum number of doubling iterations. Default is 100.
+
+    Returns
+    -------
+    initial_state : array
+        Unconditional state mean, nbatch x k_states.
+    initial_state_cov : array
+        Unconditional state covariance matrix, nbatch x k_states x k_states.
+
+    Notes
+    -----
+    The covariance matrix is the solution to the discrete Lyapunov equation
+    :math:`P = T P T' + R Q R'`, computed for all models at once with the
+    doubling algorithm, see e.g. Anderson and Moore (1979).
+    """
+    eigvals = np.linalg.eigvals(transition)
+    if not np.max(np.abs(eigvals)) < 1. - 1e-10:
+        raise ValueError('Transition equation is not stationary,'
+                         ' and so stationary initialization cannot'
+                         ' be used.')
+    eye = np.eye(transition.shape[-1])
+    initial_state = np.linalg.solve(eye - transition,
+                                    state_intercept[..., None])[..., 0]
+
+    A = transition
+    P = np.matmul(np.matmul(selection, state_cov), selection.swapaxes(-1, -2))
+    for i in range(maxiter):
+        P = P + np.matmul(np.matmul(A, P), A.swapaxes(-1, -2))
+        A = np.matmul(A, A)
+        if not np.any(np.abs(A) > np.finfo(float).eps):
+            break
+    return initial_state, P
+
+
+def batch_filter(endog, design, obs_intercept, obs_cov, transition,
+                 state_intercept, selection, state_cov, initial_state,
+                 initial_state_cov, loglikelihood_burn=0,
+                 forecasts_error=False):
+    r"""
+    Kalman filter loglikelihood of a stack of state space models
+
+    Parameters
+    ----------
+    endog : array
+        Observations, shaped nbatch x k_endog x nobs. Missing values are
+        indicated by NaN.
+    design, obs_intercept, obs_cov, transition, state_intercept, selection,
+    state_cov : array
+        System matrices with the shapes used by `Representation`, e.g.
+        k_endog x k_states x nobs for the design matrix, with an additional
+        leading batch axis. The last axis can have length 1 for
+        time-invariant matrices.
+    initial_state : array
+        Initial state mean, nbatch x k_states.
+    initial_state_cov : array
+        Initial state covariance matrix, nbatch x k_states x k_states.
+    loglikelihood_burn : int, optional
+        The number of initial periods during which the loglikelihood is not
+        recorded. Default is 0.
+    forecasts_error : bool, optional
+        Whether to also return the forecast errors. Default is False.
+
+    Returns
+    -------
+    loglike : array
+        The joint loglikelihood of each model, nbatch.
+    forecasts_error : array
+        Forecast errors, nbatch x k_endog x nobs, only returned if
+        `forecasts_error` is True. Missing observations have a forecast
+        error of NaN.
+
+    Notes
+    -----
+    Missing observations are handled as in the Cython filters, by removing
+    the corresponding rows of the observation equation. This is done by
+    setting them to zero and using a unit variance, so that the periods of
+    all models can be updated together.
+    """
+    endog = np.asarray(endog, dtype=float)
+    nbatch, k_endog, nobs = endog.shape
+    missing = np.isnan(endog)
+    observed = ~missing
+    nobs_k_endog = observed.sum(1)
+    endog = np.where(missing, 0, endog)
+
+    state_cov_selected = np.matmul(
+        np.matmul(np.moveaxis(selection, -1, 1),
+                  np.moveaxis(state_cov, -1, 1)),
+        np.moveaxis(selection, -1, 1).swapaxes(-1, -2))
+    state_cov_selected = np.moveaxis(state_cov_selected, 1, -1)
+
+    a = np.array(initial_state, dtype=float)
+    P = np.array(initial_state_cov, dtype=float)
+    llf = np.zeros(nbatch)
+    if forecasts_error:
+        errors = np.zeros((nbatch, k_endog, nobs))
+    eye = np.eye(k_endog)
+
+    for t in range(nobs):
+        Z = _period(design, t)
+        d = _period(obs_intercept, t)
+        H = _period(obs_cov, t)
+        obs = observed[..., t]
+        if not obs.all():
+            Z = Z * obs[..., None]
+            H = H * (obs[..., None] & obs[..., None, :])
+            H = H + eye * ~obs[..., None]
+
+        # forecast errors and their covariance matrix
+        ZP = np.matmul(Z, P)
+        v = (endog[..., t] - d - np.matmul(Z, a[..., None])[..., 0]) * obs
+        F = np.matmul(ZP, Z.swapaxes(-1, -2)) + H
+        if k_endog == 1:
+            F_det = F[:, 0, 0]
+            Finv_v = v / F_det[:, None]
+            Finv_ZP = ZP / F_det[:, None, None]
+        else:
+            F_det = np.linalg.det(F)
+            sol = np.linalg.solve(F, np.concatenate([v[..., None], ZP],
+                                                    axis=-1))
+            Finv_v = sol[..., 0]
+            Finv_ZP = sol[..., 1:]
+
+        if t >= loglikelihood_burn:
+            llf -= 0.5 * (nobs_k_endog[:, t] * np.log(2 * np.pi) +
+                          np.log(F_det) + (v * Finv_v).sum(-1))
+        if forecasts_error:
+            errors[..., t] = np.where(obs, v, np.nan)
+
+        # updating step
+        a = a + np.matmul(ZP.swapaxes(-1, -2), Finv_v[..., None])[..., 0]
+        P = P - np.matmul(ZP.swapaxes(-1, -2), Finv_ZP)
+
+        # prediction step
+        T = _period(transition, t)
+        a = np.matmul(T, a[..., None])[..., 0] + _period(state_intercept, t)
+        P = (np.matmul(np.matmul(T, P), T.swapaxes(-1, -2)) +
+             _period(state_cov_selected, t))
+
+    if forecasts_error:
+        return llf, errors
+    return llf
@@ -0,0 +1,127 @@
+"""
+Square-root Kalman filter loglikelihood
+
+The square-root filter propagates a factor of the predicted state covariance
+matrix instead of the matrix itself, so that the covariance matrices stay
+positive semi-definite irrespective of rounding errors. Each period is one QR
+decomposition of an array built from the factors of the predicted state
+covariance and of the disturbance covariance matrices (array algorithm,
+Durbin and Koopman, 2012, Chapter 6.3).
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+
+def square_root_loglikeobs(endog, design, obs_intercept, obs_cov,
+                           transition, state_intercept, selection,
+                           state_cov, initial_state, initial_state_cov):
+    r"""
+    Loglikelihood of each period using the square-root Kalman filter
+
+    Parameters
+    ----------
+    endog : array
+        Observations, k_endog x nobs. Missing values are nan.
+    design, obs_intercept, obs_cov, transition, state_intercept, selection,
+    state_cov : array
+        System matrices with the shapes used by `Representation`. Each may be
+        time-varying.
+    initial_state : array
+        Initial state mean.
+    initial_state_cov : array
+        Initial state covariance matrix.
+
+    Returns
+    -------
+    loglikeobs : array
+        The loglikelihood of each period. Periods in which all observations
+        are missing have a loglikelihood of zero.
+
+    Notes
+    -----
+    With :math:`P_t = \bar P_t \bar P_t'`, :math:`H_t = \bar H_t \bar H_t'`
+    and :math:`Q_t = \bar Q_t \bar Q_t'`, the lower triangular factor of
+
+    .. math::
+
+        \begin{bmatrix}
+        Z_t \bar P_t & \bar H_t & 0 \\
+        T_t \bar P_t & 0 & R_t \bar Q_t
+        \end{bmatrix}
+        =
+        \begin{bmatrix}
+        \bar F_t & 0 & 0 \\
+        \bar K_t & \bar P_{t+1} & 0
+        \end{bmatrix} U
+
+    with orthogonal :math:`U` contains the factor of the forecast error
+    covariance matrix :math:`F_t = \bar F_t \bar F_t'`, the gain
+    :math:`\bar K_t = T_t P_t Z_t' \bar F_t'^{-1}` and the factor of the
+    next predicted state covariance matrix, so that
+
+    .. math::
+
+        a_{t+1} = T_t a_t + c_t + \bar K_t \bar F_t^{-1} v_t
+    """
+    k_endog, nobs = endog.shape
+    k_states = transition.shape[0]
+    loglikeobs = np.zeros(nobs)
+    a = initial_state
+    P_root = _root(initial_state_cov)
+    state_cov_root = None
+    if selection.shape[-1] == 1 and state_cov.shape[-1] == 1:
+        state_cov_root = np.dot(selection[..., 0], _root(state_cov[..., 0]))
+
+    for t in range(nobs):
+        Z = _period(design, t)
+        T = _period(transition, t)
+        RQ_root = state_cov_root
+        if RQ_root is None:
+            RQ_root = np.dot(_period(selection, t),
+                             _root(_period(state_cov, t)))
+        k_posdef = RQ_root.shape[1]
+
+        observed = ~np.isnan(endog[:, t])
+        k_obs = np.sum(observed)
+        Z = Z[observed]
+        H_root = _root(_period(obs_cov, t)[np.ix_(observed, observed)])
+
+        pre = np.zeros((k_obs + k_states, k_states + k_obs + k_posdef))
+        pre[:k_obs, :k_states] = np.dot(Z, P_root)
+        pre[:k_obs, k_states:k_states + k_obs] = H_root
+        pre[k_obs:, :k_states] = np.dot(T, P_root)
+        pre[k_obs:, k_states + k_obs:] = RQ_root
+        post = np.linalg.qr(pre.T, mode='r').T
+        P_root = post[k_obs:, k_obs:]
+
+        a_next = np.dot(T, a) + _period(state_intercept, t)
+        if k_obs > 0:
+            F_root = post[:k_obs, :k_obs]
+            v = (endog[observed, t] - np.dot(Z, a) -
+                 _period(obs_intercept, t)[observed])
+            u = solve_triangular(F_root, v, lower=True)
+            loglikeobs[t] = -0.5 * (
+                k_obs * np.log(2 * np.pi) +
+                2 * np.sum(np.log(np.abs(np.diag(F_root)))) + np.dot(u, u))
+            a_next += np.dot(post[k_obs:, :k_obs], u)
+        a = a_next
+
+    return loglikeobs
+
+
+def _root(matrix):
+    # Factor L with matrix = L L', also for singular covariance matrices
+    try:
+        return np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        eigvals, eigvecs = np.linalg.eigh(matrix)
+        return eigvecs * np.sqrt(np.maximum(eigvals, 0))
+
+
+def _period(matrix, t):
+    # Matrix of period t of a possibly time-invariant matrix
+    return matrix[..., t] if matrix.shape[-1] > 1 else matrix[..., 0]
@@ -0,0 +1,193 @@
+"""
+Steady-state Kalman filter loglikelihood
+
+For time-invariant models without missing observations the predicted state
+covariance matrix does not depend on the data and typically converges after
+a few dozen periods. After convergence the Kalman filter reduces to a linear
+time-invariant recursion for the predicted state, which is evaluated here in
+blocks of periods with matrix products rather than one period at a time.
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+
+
+def _riccati(design, obs_cov, transition, state_cov_selected,
+             initial_state_cov, tolerance, maxiter):
+    # Iterate the predicted state covariance until convergence, using the
+    # same criterion as the Cython filters
+    forecasts_error_cov = []
+    gains = []
+    P = initial_state_cov
+    for t in range(maxiter):
+        ZP = np.dot(design, P)
+        F = np.dot(ZP, design.T) + obs_cov
+        if F.shape[0] == 1:
+            K = ZP.T / F[0, 0]
+        else:
+            K = np.dot(ZP.T, np.linalg.inv(F))
+        forecasts_error_cov.append(F)
+        gains.append(K)
+        P_next = np.dot(np.dot(transition, P - np.dot(K, ZP)), transition.T)
+        P_next = (P_next + P_next.T) / 2 + state_cov_selected
+        if np.abs(np.sum((P_next - P)**2)) < tolerance:
+            return forecasts_error_cov, gains
+        P = P_next
+    return None, None
+
+
+def steady_state_loglikeobs(endog, design, obs_intercept, obs_cov,
+                            transition, state_intercept, selection,
+                            state_cov, initial_state, initial_state_cov,
+                            tolerance=1e-19, maxiter=None, block_size=64):
+    r"""
+    Loglikelihood of each period using the steady-state Kalman filter
+
+    Parameters
+    ----------
+    endog : array
+        Observations, k_endog x nobs, without missing values.
+    design, obs_intercept, obs_cov, transition, state_intercept, selection,
+    state_cov : array
+        System matrices with the shapes used by `Representation`. All but the
+        intercepts must be time-invariant.
+    initial_state : array
+        Initial state mean.
+    initial_state_cov : array
+        Initial state covariance matrix.
+    tolerance : float, optional
+        The tolerance at which the predicted state covariance matrix is
+        considered to have converged. Default is 1e-19.
+    maxiter : int, optional
+        Maximum number of periods before convergence. Default is 1% of the
+        number of observations, but at least 100, since the periods before
+        convergence are evaluated one at a time.
+    block_size : int, optional
+        Number of periods evaluated jointly after convergence. Default is 64.
+
+    Returns
+    -------
+    loglikeobs : array or None
+        The loglikelihood of each period, or None if the predicted state
+        covariance matrix did not converge in `maxiter` periods or the
+        steady-state recursion is not stable.
+
+    Notes
+    -----
+    After convergence in period :math:`t_0`, the predicted state follows
+
+    .. math::
+
+        a_{t+1} = (T - K Z) a_t + K (y_t - d_t) + c_t
+
+    with a constant gain :math:`K = T P Z' F^{-1}`, so that the predicted
+    state in each period of a block is a linear function of the state at the
+    beginning of the block and of the inputs within the block.
+    """
+    k_endog, nobs = endog.shape
+    design = design[..., 0]
+    obs_cov = obs_cov[..., 0]
+    transition = transition[..., 0]
+    selection = selection[..., 0]
+    state_cov_selected = np.dot(np.dot(selection, state_cov[..., 0]),
+                                selection.T)
+    inputs = endog - obs_intercept
+    dtype = np.result_type(inputs, design, obs_cov, transition,
+                           state_intercept, state_cov_selected)
+
+    forecasts_error_cov, gains = _riccati(
+        design, obs_cov, transition, state_cov_selected, initial_state_cov,
+        tolerance, min(max(100, nobs // 100) if maxiter is None else maxiter,
+                       nobs))
+    if forecasts_error_cov is None:
+        return None
+
+    # Periods until convergence
+    nobs_converged = len(gains)
+    forecasts_error = np.zeros((k_endog, nobs), dtype=dtype)
+    a = initial_state
+    for t in range(nobs_converged):
+        forecasts_error[:, t] = inputs[:, t] - np.dot(design, a)
+        a = np.dot(transition,
+                   a + np.dot(gains[t], forecasts_error[:, t]))
+        a = a + _period(state_intercept, t)
+
+    # Steady-state periods
+    nobs_steady = nobs - nobs_converged
+    if nobs_steady > 0:
+        gain = np.dot(transition, gains[-1])
+        L = transition - np.dot(gain, design)
+        if not np.max(np.abs(np.linalg.matrix_power(L, block_size))) <= 1:
+            return None
+        steady = slice(nobs_converged, None)
+        w = np.dot(inputs[:, steady].T, gain.T)
+        if state_intercept.shape[-1] > 1:
+            w += state_intercept[:, steady].T
+        else:
+            w += state_intercept[:, 0]
+        predicted = _linear_recursion(L, design, a, w, block_size)
+        forecasts_error[:, steady] = inputs[:, steady] - predicted.T
+
+    # Loglikelihood of each period
+    F = np.array(forecasts_error_cov)
+    v = forecasts_error[:, :nobs_converged].T
+    logdet = np.zeros(nobs, dtype=dtype)
+    quadratic = np.zeros(nobs, dtype=dtype)
+    sign, logabsdet = np.linalg.slogdet(F)
+    logdet[:nobs_converged] = logabsdet + np.log(sign)
+    quadratic[:nobs_converged] = (
+        v * np.linalg.solve(F, v[..., None])[..., 0]).sum(-1)
+    if nobs_steady > 0:
+        v = forecasts_error[:, steady]
+        logdet[steady] = logdet[nobs_converged - 1]
+        quadratic[steady] = (v * np.linalg.solve(F[-1], v)).sum(0)
+    loglikeobs = -0.5 * (k_endog * np.log(2 * np.pi) + logdet + quadratic)
+    return loglikeobs
+
+
+def _linear_recursion(transition, design, initial, inputs, block_size):
+    # Computes design x_t for t = 0, ..., n - 1, where x_0 = initial and
+    # x_{t+1} = transition x_t + inputs_t. Within blocks of periods, x_t is
+    # a linear function of the state at the beginning of the block and of
+    # the inputs in the block. The states at the beginning of the blocks
+    # follow a recursion of the same form.
+    nobs, k_states = inputs.shape
+    k_endog = design.shape[0]
+    if nobs <= block_size:
+        out = np.zeros((nobs, k_endog), dtype=inputs.dtype)
+        x = initial
+        for t in range(nobs):
+            out[t] = np.dot(design, x)
+            x = np.dot(transition, x) + inputs[t]
+        return out
+
+    powers = [np.eye(k_states)]
+    for i in range(block_size):
+        powers.append(np.dot(transition, powers[-1]))
+    impulse = np.matmul(design, np.array(powers))
+
+    # Contribution of the inputs to the output and to the state at the end
+    # of the block
+    lag = np.arange(block_size)[:, None] - np.arange(block_size) - 1
+    inner = impulse[np.maximum(lag, 0)] * (lag >= 0)[..., None, None]
+    inner = inner.transpose(0, 2, 1, 3).reshape(block_size * k_endog,
+                                                block_size * k_states)
+    end = np.concatenate(powers[block_size - 1::-1], axis=1)
+
+    nblocks = -(-nobs // block_size)
+    w = np.zeros((nblocks * block_size, k_states), dtype=inputs.dtype)
+    w[:nobs] = inputs
+    w = w.reshape(nblocks, block_size * k_states)
+    starts = _linear_recursion(powers[block_size], np.eye(k_states), initial,
+                               np.dot(w, end.T), block_size)
+
+    out = np.dot(w, inner.T) + np.dot(
+        starts, impulse[:block_size].transpose(2, 0, 1).reshape(k_states, -1))
+    return out.reshape(-1, k_endog)[:nobs]
+
+
+def _period(matrix, t):
+    # Matrix of period t of a possibly time-invariant matrix
+    return matrix[..., t] if matrix.shape[-1] > 1 else matrix[..., 0]
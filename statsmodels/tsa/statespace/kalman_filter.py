@@ -15,6 +15,7 @@ from .tools import (validate_vector_shape, validate_matrix_shape,
                     reorder_missing_matrix, reorder_missing_vector)
 from . import tools
 from statsmodels.tools.sm_exceptions import ValueWarning
+from statsmodels.tools.tools import Bunch
 
 # Define constants
 FILTER_CONVENTIONAL = 0x01     # Durbin and Koopman (2012), Chapter 4
@@ -74,6 +75,13 @@ class KalmanFilter(Representation):
     tolerance : float, optional
         The tolerance at which the Kalman filter determines convergence to
         steady-state. Default is 1e-19.
+    steady_state : bool, optional
+        Whether to evaluate the loglikelihood of time-invariant models
+        without missing observations with the steady-state filter once the
+        predicted state covariance matrix has converged. Only `loglike` and
+        `loglikeobs` use the steady-state filter, the output of `filter` and
+        `smooth` is always computed by the Cython filter. See `loglike` for
+        details. Default is False.
     results_class : class, optional
         Default results class to use to save filtering output. Default is
         `FilterResults`. If specified, class must extend from `FilterResults`.
@@ -153,7 +161,8 @@ class KalmanFilter(Representation):
     """
     filter_square_root = OptionWrapper('filter_method', FILTER_SQUARE_ROOT)
     """
-    (bool) Flag for square-root Kalman filtering. Not implemented.
+    (bool) Flag for square-root Kalman filtering. Only used by `loglike` and
+    `loglikeobs`.
     """
     filter_univariate = OptionWrapper('filter_method', FILTER_UNIVARIATE)
     """
@@ -294,7 +303,7 @@ class KalmanFilter(Representation):
 
     def __init__(self, k_endog, k_states, k_posdef=None,
                  loglikelihood_burn=0, tolerance=1e-19, results_class=None,
-                 kalman_filter_classes=None, **kwargs):
+                 kalman_filter_classes=None, steady_state=False, **kwargs):
         super(KalmanFilter, self).__init__(
             k_endog, k_states, k_posdef, **kwargs
         )
@@ -320,6 +329,7 @@ class KalmanFilter(Representation):
         self.set_filter_timing(**kwargs)
 
         self.tolerance = tolerance
+        self.steady_state = steady_state
 
         # Internal flags
         # The _scale internal flag is used because we may want to
@@ -426,6 +436,13 @@ class KalmanFilter(Representation):
 
         FILTER_CONVENTIONAL = 0x01
             Conventional Kalman filter.
+        FILTER_SQUARE_ROOT = 0x08
+            Square-root Kalman filter, which propagates a Cholesky factor of
+            the predicted state covariance matrix. Only the loglikelihood is
+            computed with this method, in Python, and it is set *in
+            addition* to the conventional method, which is used by `filter`
+            and `smooth`. Cannot be combined with the univariate, collapsed
+            or concentrated methods or with diffuse initialization.
         FILTER_UNIVARIATE = 0x10
             Univariate approach to Kalman filtering. Overrides conventional
             method if both are specified.
@@ -867,14 +884,38 @@ class KalmanFilter(Representation):
         -------
         loglike : float
             The joint loglikelihood.
+
+        Notes
+        -----
+        If the `steady_state` attribute is True, the model is time-invariant
+        (except possibly for the intercepts), there are no missing
+        observations and the default filter options are used, then the
+        loglikelihood is computed in Python by the steady-state filter. The
+        predicted state covariance matrix is iterated until it converges
+        according to `tolerance`, after which the remaining periods are
+        evaluated jointly. This is much faster than the Cython filter for
+        long time series. In all other cases, or if the covariance matrix
+        does not converge, the Cython filter is used.
+
+        If the `filter_square_root` flag is set, the loglikelihood is
+        computed in Python by the square-root filter, which is numerically
+        more stable but slower than the Cython filter. Complex-step
+        differentiation is not supported by the square-root filter and uses
+        the Cython filter.
         """
         if self.memory_no_likelihood:
             raise RuntimeError('Cannot compute loglikelihood if'
                                ' MEMORY_NO_LIKELIHOOD option is selected.')
-        kwargs['conserve_memory'] = MEMORY_CONSERVE ^ MEMORY_NO_LIKELIHOOD
-        kfilter = self._filter(**kwargs)
         loglikelihood_burn = kwargs.get('loglikelihood_burn',
                                         self.loglikelihood_burn)
+        if loglikelihood_burn is None:
+            loglikelihood_burn = self.loglikelihood_burn
+        llf_obs = self._python_loglikeobs(**kwargs)
+        if llf_obs is not None:
+            return np.sum(llf_obs[loglikelihood_burn:])
+
+        kwargs['conserve_memory'] = MEMORY_CONSERVE ^ MEMORY_NO_LIKELIHOOD
+        kfilter = self._filter(**kwargs)
         loglike = np.sum(kfilter.loglikelihood[loglikelihood_burn:])
 
         # Need to modify the computed log-likelihood to incorporate the
@@ -902,6 +943,98 @@ class KalmanFilter(Representation):
             loglike += -0.5 * nobs_k_endog * np.log(scale)
         return loglike
 
+    def _python_loglikeobs(self, **kwargs):
+        # Loglikelihood of each period from the square-root or the
+        # steady-state filter, or None if the Cython filter is to be used
+        filter_method = kwargs.get('filter_method')
+        if filter_method is None:
+            filter_method = self.filter_method
+        if filter_method & FILTER_SQUARE_ROOT:
+            return self._square_root_loglikeobs(**kwargs)
+        if self.steady_state:
+            return self._steady_state_loglikeobs(**kwargs)
+        return None
+
+    def _initial_state_moments(self, complex_step=False):
+        # Initial state mean and the diffuse and stationary parts of the
+        # initial state covariance matrix
+        if self.initialization is None:
+            raise RuntimeError('Statespace model not initialized.')
+        dtype = tools.prefix_dtype_map[self.prefix]
+        return self.initialization(
+            model=self,
+            initial_state_mean=np.zeros(self.k_states, dtype=dtype),
+            initial_diffuse_state_cov=np.zeros((self.k_states,) * 2,
+                                               dtype=dtype),
+            initial_stationary_state_cov=np.zeros((self.k_states,) * 2,
+                                                  dtype=dtype),
+            complex_step=complex_step)
+
+    def _square_root_loglikeobs(self, filter_method=None,
+                                inversion_method=None, stability_method=None,
+                                conserve_memory=None, filter_timing=None,
+                                tolerance=None, loglikelihood_burn=None,
+                                complex_step=False):
+        # Returns None for complex-step differentiation, which the QR
+        # decompositions do not support
+        from ._square_root import square_root_loglikeobs
+
+        if filter_method is None:
+            filter_method = self.filter_method
+        if filter_timing is None:
+            filter_timing = self.filter_timing
+        if (filter_method & (FILTER_UNIVARIATE | FILTER_COLLAPSED |
+                             FILTER_CONCENTRATED) or
+                filter_timing != TIMING_INIT_PREDICTED):
+            raise NotImplementedError('The square-root filter cannot be'
+                                      ' combined with univariate, collapsed'
+                                      ' or concentrated filtering or with'
+                                      ' filtered initial values.')
+        if complex_step or self.prefix != 'd' or self.endog is None:
+            return None
+        initial_state, initial_diffuse_state_cov, initial_state_cov = (
+            self._initial_state_moments())
+        if np.any(initial_diffuse_state_cov != 0):
+            raise NotImplementedError('The square-root filter does not'
+                                      ' support diffuse initialization.')
+
+        return square_root_loglikeobs(
+            self.endog, self._design, self._obs_intercept, self._obs_cov,
+            self._transition, self._state_intercept, self._selection,
+            self._state_cov, initial_state, initial_state_cov)
+
+    def _steady_state_loglikeobs(self, filter_method=None,
+                                 inversion_method=None, stability_method=None,
+                                 conserve_memory=None, filter_timing=None,
+                                 tolerance=None, loglikelihood_burn=None,
+                                 complex_step=False):
+        # Returns None if the steady-state filter cannot be used
+        from ._steady_state import steady_state_loglikeobs
+
+        options = [filter_method, stability_method, filter_timing]
+        if (any(option is not None for option in options) or
+                self.filter_method != FILTER_CONVENTIONAL or
+                self.filter_timing != TIMING_INIT_PREDICTED or
+                self.prefix not in ['d', 'z']):
+            return None
+        names = ['design', 'obs_cov', 'transition', 'selection', 'state_cov']
+        if any(getattr(self, '_' + name).shape[-1] > 1 for name in names):
+            return None
+        if self.endog is None or np.any(np.isnan(self.endog)):
+            return None
+        initial_state, initial_diffuse_state_cov, initial_state_cov = (
+            self._initial_state_moments(complex_step=complex_step))
+        if np.any(initial_diffuse_state_cov != 0):
+            return None
+
+        if tolerance is None:
+            tolerance = self.tolerance
+        return steady_state_loglikeobs(
+            self.endog, self._design, self._obs_intercept, self._obs_cov,
+            self._transition, self._state_intercept, self._selection,
+            self._state_cov, initial_state, initial_state_cov,
+            tolerance=tolerance)
+
     def loglikeobs(self, **kwargs):
         r"""
         Calculate the loglikelihood for each observation associated with the
@@ -918,6 +1051,9 @@ class KalmanFilter(Representation):
         If `loglikelihood_burn` is positive, then the entries in the returned
         loglikelihood vector are set to be zero for those initial time periods.
 
+        The square-root and steady-state filters are used as described in
+        `loglike`.
+
         Returns
         -------
         loglike : array of float
@@ -926,12 +1062,19 @@ class KalmanFilter(Representation):
         if self.memory_no_likelihood:
             raise RuntimeError('Cannot compute loglikelihood if'
                                ' MEMORY_NO_LIKELIHOOD option is selected.')
+        loglikelihood_burn = kwargs.get('loglikelihood_burn',
+                                        self.loglikelihood_burn)
+        if loglikelihood_burn is None:
+            loglikelihood_burn = self.loglikelihood_burn
+        llf_obs = self._python_loglikeobs(**kwargs)
+        if llf_obs is not None:
+            llf_obs[:loglikelihood_burn] = 0
+            return llf_obs
+
         if not self.filter_method & FILTER_CONCENTRATED:
             kwargs['conserve_memory'] = MEMORY_CONSERVE ^ MEMORY_NO_LIKELIHOOD
         kfilter = self._filter(**kwargs)
         llf_obs = np.array(kfilter.loglikelihood, copy=True)
-        loglikelihood_burn = kwargs.get('loglikelihood_burn',
-                                        self.loglikelihood_burn)
 
         # If the scale was concentrated out of the log-likelihood function,
         # then the llf_obs above is:
@@ -1899,13 +2042,11 @@ class FilterResults(FrozenRepresentation):
 
         Out-of-sample prediction first applies the Kalman filter to missing
         data for the number of periods desired to obtain the predicted states.
+        If the prediction range is entirely out-of-sample, the forecasts are
+        instead computed from the last filtered state and its covariance
+        matrix, so that only the forecast periods are iterated and stored. This
+        is also available if memory conservation has been used.
         """
-        # Cannot predict if we do not have appropriate arrays
-        if self.memory_no_forecast or self.memory_no_predicted:
-            raise ValueError('Predict is not possible if memory conservation'
-                             ' has been used to avoid storing forecasts or'
-                             ' predicted values.')
-
         # Get the start and the end of the entire prediction range
         if start is None:
             start = 0
@@ -1914,6 +2055,17 @@ class FilterResults(FrozenRepresentation):
         if end is None:
             end = self.nobs
 
+        # Out-of-sample forecasts only require the last filtered state (after
+        # any diffuse periods)
+        forecast_only = start >= self.nobs and self.nobs_diffuse < self.nobs
+
+        # Cannot predict if we do not have appropriate arrays
+        if not forecast_only and (self.memory_no_forecast or
+                                  self.memory_no_predicted):
+            raise ValueError('Predict is not possible if memory conservation'
+                             ' has been used to avoid storing forecasts or'
+                             ' predicted values.')
+
         # Prediction and forecasting is performed by iterating the Kalman
         # Kalman filter through the entire range [0, end]
         # Then, everything is returned corresponding to the range [start, end].
@@ -1986,6 +2138,7 @@ class FilterResults(FrozenRepresentation):
         exception = ('Forecasting for models with time-varying %s matrix'
                      ' requires an updated time-varying matrix for the'
                      ' period to be forecasted.')
+        forecast_representation = {}
         if nforecast > 0:
             for name, shape in self.shapes.items():
                 if name == 'obs':
@@ -2002,13 +2155,23 @@ class FilterResults(FrozenRepresentation):
                                               shape[0], nforecast)
                         if mat.ndim < 2 or not mat.shape[1] == nforecast:
                             raise ValueError(exception % name)
-                        representation[name] = np.c_[representation[name], mat]
                     else:
                         validate_matrix_shape(name, mat.shape, shape[0],
                                               shape[1], nforecast)
                         if mat.ndim < 3 or not mat.shape[2] == nforecast:
                             raise ValueError(exception % name)
-                        representation[name] = np.c_[representation[name], mat]
+                    forecast_representation[name] = mat
+
+        if forecast_only:
+            for name, mat in representation.items():
+                if name not in forecast_representation:
+                    forecast_representation[name] = mat[..., :1]
+            results = self._forecast(nforecast, forecast_representation)
+            return PredictionResults(results, start, end, 0, 0, nforecast,
+                                     results_start=self.nobs)
+
+        for name, mat in forecast_representation.items():
+            representation[name] = np.c_[representation[name], mat]
 
         # Update the matrices from kwargs for dynamic prediction in the case
         # that `end` is less than `nobs` and `dynamic` is less than `end`. In
@@ -2067,6 +2230,58 @@ class FilterResults(FrozenRepresentation):
         return PredictionResults(results, start, end, nstatic, ndynamic,
                                  nforecast)
 
+    def _forecast(self, nforecast, representation):
+        # Iterates the forecasting recursions from the last filtered state
+        # and its covariance matrix. The representation matrices are either
+        # time-invariant or given for the forecast periods only.
+        def period(name, t):
+            mat = representation[name]
+            return mat[..., 0] if mat.shape[-1] == 1 else mat[..., t]
+
+        dtype = self.predicted_state.dtype
+        k_endog, k_states = self.k_endog, self.k_states
+        out = Bunch(
+            endog=np.zeros((k_endog, nforecast)) * np.nan,
+            forecasts=np.zeros((k_endog, nforecast), dtype=dtype),
+            forecasts_error=np.zeros((k_endog, nforecast)) * np.nan,
+            forecasts_error_cov=np.zeros((k_endog, k_endog, nforecast),
+                                         dtype=dtype),
+            predicted_state=np.zeros((k_states, nforecast + 1), dtype=dtype),
+            predicted_state_cov=np.zeros((k_states, k_states, nforecast + 1),
+                                         dtype=dtype),
+            **representation)
+
+        # Predicted state for the first forecast period, from the filtered
+        # state of the last period of the sample
+        transition = self.transition[..., -1]
+        selection = self.selection[..., -1]
+        a = (np.dot(transition, self.filtered_state[:, -1]) +
+             self.state_intercept[..., -1])
+        P = (np.dot(np.dot(transition, self.filtered_state_cov[:, :, -1]),
+                    transition.T) +
+             np.dot(np.dot(selection, self.state_cov[..., -1]), selection.T))
+        out.predicted_state[:, 0] = a
+        out.predicted_state_cov[:, :, 0] = P
+        for t in range(nforecast):
+            design = period('design', t)
+            out.forecasts[:, t] = np.dot(design, a) + period('obs_intercept', t)
+            out.forecasts_error_cov[:, :, t] = (
+                np.dot(np.dot(design, P), design.T) + period('obs_cov', t))
+
+            transition = period('transition', t)
+            selection = period('selection', t)
+            a = np.dot(transition, a) + period('state_intercept', t)
+            P = (np.dot(np.dot(transition, P), transition.T) +
+                 np.dot(np.dot(selection, period('state_cov', t)),
+                        selection.T))
+            out.predicted_state[:, t + 1] = a
+            out.predicted_state_cov[:, :, t + 1] = P
+
+        # Without observations, the filtered values are the predicted values
+        out.filtered_state = out.predicted_state[:, :-1]
+        out.filtered_state_cov = out.predicted_state_cov[:, :, :-1]
+        return out
+
     def _predict(self, nstatic, ndynamic, nforecast, model):
         # Note: this doesn't use self, and can either be a static method or
         #       moved outside the class altogether.
@@ -2137,6 +2352,9 @@ class PredictionResults(FilterResults):
     nforecast : int
         Number of in-sample forecasts (these always follow the dynamic
         predictions directly).
+    results_start : int, optional
+        Zero-indexed observation number of the first period in `results`.
+        Default is 0.
 
     Attributes
     ----------
@@ -2209,9 +2427,11 @@ class PredictionResults(FilterResults):
         'forecasts', 'forecasts_error', 'forecasts_error_cov'
     ]
 
-    def __init__(self, results, start, end, nstatic, ndynamic, nforecast):
+    def __init__(self, results, start, end, nstatic, ndynamic, nforecast,
+                 results_start=0):
         # Save the filter results object
         self.results = results
+        self.results_start = results_start
 
         # Save prediction ranges
         self.npredictions = start - end
@@ -2235,11 +2455,13 @@ class PredictionResults(FilterResults):
 
         # Cache the attribute
         if not hasattr(self, _attr):
+            start = self.start - self.results_start
+            end = self.end - self.results_start
             if attr == 'endog' or attr in self.filter_attributes:
                 # Get a copy
                 value = getattr(self.results, attr).copy()
                 # Subset to the correct time frame
-                value = value[..., self.start:self.end]
+                value = value[..., start:end]
             elif attr in self.representation_attributes:
                 value = getattr(self.results, attr).copy()
                 # If a time-invariant matrix, return it. Otherwise, subset to
@@ -2247,7 +2469,7 @@ class PredictionResults(FilterResults):
                 if value.shape[-1] == 1:
                     value = value[..., 0]
                 else:
-                    value = value[..., self.start:self.end]
+                    value = value[..., start:end]
             else:
                 raise AttributeError("'%s' object has no attribute '%s'" %
                                      (self.__class__.__name__, attr))
@@ -15,6 +15,7 @@ from scipy.stats import norm
 from statsmodels.compat.python import long
 
 from statsmodels.tools.tools import pinv_extended, Bunch
+from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.sm_exceptions import PrecisionWarning
 from statsmodels.tools.numdiff import (_get_epsilon, approx_hess_cs,
                                        approx_fprime_cs, approx_fprime)
@@ -29,8 +30,8 @@ from statsmodels.genmod.families.links import identity
 import statsmodels.tsa.base.tsa_model as tsbase
 
 from .simulation_smoother import SimulationSmoother
-from .kalman_smoother import SmootherResults
-from .kalman_filter import INVERT_UNIVARIATE, SOLVE_LU
+from .kalman_smoother import SMOOTHER_ALL, SmootherResults
+from .kalman_filter import FILTER_CONVENTIONAL, INVERT_UNIVARIATE, SOLVE_LU
 
 if bytes != str:
     # PY3
@@ -62,6 +63,14 @@ def _handle_args(names, defaults, *args, **kwargs):
     return tuple(output_args) + (kwargs,)
 
 
+def _concat(data, new_data):
+    # Append new observations along the time axis, keeping pandas objects if
+    # both datasets are pandas objects
+    if _is_using_pandas(data, None) and _is_using_pandas(new_data, None):
+        return pd.concat([data, new_data])
+    return np.concatenate([np.asarray(data), np.asarray(new_data)])
+
+
 class MLEModel(tsbase.TimeSeriesModel):
     r"""
     State space model for maximum likelihood estimation
@@ -291,6 +300,40 @@ class MLEModel(tsbase.TimeSeriesModel):
         """
         self.ssm.set_smoother_output(smoother_output, **kwargs)
 
+    def clone(self, endog, exog=None, **kwargs):
+        """
+        Clone state space model with new data and optionally new specification
+
+        Parameters
+        ----------
+        endog : array_like
+            The observed time-series process :math:`y`
+        exog : array_like, optional
+            Array of exogenous regressors.
+        kwargs
+            Keyword arguments to pass to the new model class to change the
+            model specification.
+
+        Returns
+        -------
+        model : MLEModel subclass
+
+        Notes
+        -----
+        This method must be implemented by subclasses, usually by calling
+        `_clone_from_init_kwds`, if all of the arguments of the model are
+        recorded in `_init_keys`.
+        """
+        raise NotImplementedError('This method is not implemented for this'
+                                  ' model.')
+
+    def _clone_from_init_kwds(self, endog, **kwargs):
+        # Cannot make this the default, because there is extra work required
+        # for subclasses to make _get_init_kwds useful.
+        use_kwargs = self._get_init_kwds()
+        use_kwargs.update(kwargs)
+        return self.__class__(endog, **use_kwargs)
+
     def initialize_known(self, initial_state, initial_state_cov):
         self.ssm.initialize_known(initial_state, initial_state_cov)
 
@@ -408,13 +451,17 @@ class MLEModel(tsbase.TimeSeriesModel):
         return_params : boolean, optional
             Whether or not to return only the array of maximizing parameters.
             Default is False.
-        optim_score : {'harvey', 'approx'} or None, optional
-            The method by which the score vector is calculated. 'harvey' uses
-            the method from Harvey (1989), 'approx' uses either finite
-            difference or complex step differentiation depending upon the
-            value of `optim_complex_step`, and None uses the built-in gradient
-            approximation of the optimizer. Default is None. This keyword is
-            only relevant if the optimization method uses the score.
+        optim_score : {'analytic', 'harvey', 'approx'} or None, optional
+            The method by which the score vector is calculated. 'analytic'
+            uses the Kalman smoother as in Koopman and Shephard (1992),
+            'harvey' uses the method from Harvey (1989), 'approx' uses either
+            finite difference or complex step differentiation depending upon
+            the value of `optim_complex_step`, and None uses the built-in
+            gradient approximation of the optimizer if `method` is 'lbfgs'
+            and otherwise the default of `score`, which is 'analytic' if it
+            is available for the model and 'approx' otherwise. Default is
+            None. This keyword is only relevant if the optimization method
+            uses the score.
         optim_complex_step : bool, optional
             Whether or not to use complex step differentiation when
             approximating the score; if False, finite difference approximation
@@ -446,8 +493,6 @@ class MLEModel(tsbase.TimeSeriesModel):
         if optim_score is None and method == 'lbfgs':
             kwargs.setdefault('approx_grad', True)
             kwargs.setdefault('epsilon', 1e-5)
-        elif optim_score is None:
-            optim_score = 'approx'
 
         # Check for complex step differentiation
         if optim_complex_step is None:
@@ -703,6 +748,139 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return self.ssm.loglikeobs(complex_step=complex_step, **kwargs)
 
+    def loglike_batch(self, params, endog=None, transformed=True,
+                      forecasts_error=False):
+        """
+        Loglikelihood evaluation for a batch of parameters and datasets
+
+        Parameters
+        ----------
+        params : array_like
+            Array of parameters, nbatch x k_params, at which to evaluate the
+            loglikelihood function. A 1-dim array is used for all datasets.
+        endog : array_like, optional
+            Stack of datasets, nbatch x nobs x k_endog (or nbatch x nobs if
+            k_endog is 1), that replace the data of the model. They must have
+            been transformed in the same way as the data of the model (e.g.
+            differenced if `simple_differencing` was used). Default is to
+            use the data of the model for all parameters.
+        transformed : boolean, optional
+            Whether or not `params` is already transformed. Default is True.
+        forecasts_error : boolean, optional
+            Whether to also return the one-step-ahead forecast errors.
+            Default is False.
+
+        Returns
+        -------
+        loglike : array
+            The joint loglikelihood of each dataset, nbatch.
+        forecasts_error : array
+            Forecast errors, nbatch x k_endog x nobs, only returned if
+            `forecasts_error` is True.
+
+        Notes
+        -----
+        The system matrices are constructed by `update` for each row of
+        `params`, after which the conventional Kalman filter is run for all
+        datasets at once. Only the loglikelihood and the forecast errors are
+        stored. This is much faster than calling `loglike` repeatedly, e.g.
+        when evaluating a grid of parameters or a large number of simulated
+        datasets.
+
+        Exact diffuse initialization and concentrating the scale out of the
+        likelihood are not supported.
+
+        See Also
+        --------
+        loglike
+        """
+        from ._batch_kalman_filter import (batch_filter,
+                                           batch_stationary_initialization)
+
+        params = np.array(params, ndmin=1)
+        if endog is not None:
+            endog = np.asarray(endog, dtype=float)
+            if endog.ndim == 2 and self.k_endog == 1:
+                endog = endog[..., None]
+            if endog.shape[1:] != (self.nobs, self.k_endog):
+                raise ValueError('Invalid dimensions for endog. Requires'
+                                 ' shape (nbatch, %d, %d), got %s' %
+                                 (self.nobs, self.k_endog, str(endog.shape)))
+            endog = endog.transpose(0, 2, 1)
+            if params.ndim == 2 and len(endog) != len(params):
+                raise ValueError('The number of parameter sets and datasets'
+                                 ' must be equal, got %d and %d.'
+                                 % (len(params), len(endog)))
+        nbatch = (len(params) if params.ndim == 2 else
+                  1 if endog is None else len(endog))
+        if endog is None:
+            endog = np.broadcast_to(self.ssm.endog,
+                                    (nbatch,) + self.ssm.endog.shape)
+
+        if self.ssm.filter_concentrated:
+            raise NotImplementedError('Batch evaluation of the loglikelihood'
+                                      ' is not available when the scale is'
+                                      ' concentrated out.')
+        initialization = self.ssm.initialization
+        if initialization is None:
+            raise RuntimeError('Statespace model not initialized.')
+        stationary = initialization.initialization_type == 'stationary'
+
+        # Construct the system matrices for each set of parameters; a single
+        # set of parameters only requires a single update
+        names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                 'state_intercept', 'selection', 'state_cov']
+        matrices = dict((name, []) for name in names)
+        initial_state = []
+        initial_state_cov = []
+        for p in np.array(params, ndmin=2):
+            if not transformed:
+                p = self.transform_params(p)
+            self.update(p, transformed=True)
+            for name in names:
+                matrices[name].append(getattr(self.ssm, '_' + name).copy())
+            if stationary:
+                continue
+            init = initialization(model=self.ssm)
+            if np.any(init[1] != 0):
+                raise NotImplementedError('Batch evaluation of the'
+                                          ' loglikelihood is not available'
+                                          ' with exact diffuse'
+                                          ' initialization.')
+            initial_state.append(init[0])
+            initial_state_cov.append(init[2])
+
+        for name in names:
+            # Matrices can be time-varying for only some of the parameters
+            ntime = max(m.shape[-1] for m in matrices[name])
+            if any(m.shape[-1] != ntime for m in matrices[name]):
+                matrices[name] = [np.broadcast_to(m, m.shape[:-1] + (ntime,))
+                                  for m in matrices[name]]
+            matrices[name] = np.array(matrices[name])
+        if stationary:
+            initial_state, initial_state_cov = (
+                batch_stationary_initialization(
+                    *[matrices[name][..., 0] for name in
+                      ['transition', 'state_intercept', 'selection',
+                       'state_cov']]))
+        else:
+            initial_state = np.array(initial_state)
+            initial_state_cov = np.array(initial_state_cov)
+        if params.ndim == 1:
+            for name in names:
+                matrices[name] = np.broadcast_to(
+                    matrices[name], (nbatch,) + matrices[name].shape[1:])
+            initial_state = np.broadcast_to(
+                initial_state, (nbatch,) + initial_state.shape[1:])
+            initial_state_cov = np.broadcast_to(
+                initial_state_cov, (nbatch,) + initial_state_cov.shape[1:])
+
+        return batch_filter(
+            endog, initial_state=initial_state,
+            initial_state_cov=initial_state_cov,
+            loglikelihood_burn=self.ssm.loglikelihood_burn,
+            forecasts_error=forecasts_error, **matrices)
+
     def simulation_smoother(self, simulation_output=None, **kwargs):
         r"""
         Retrieve a simulation smoother for the state space model.
@@ -1028,9 +1206,120 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         return -partials / 2.
 
+    def _system_partials(self, params):
+        # Partial derivatives of the system matrices and of the initial state
+        # mean and covariance matrix, by complex step differentiation of
+        # `update`, which does not require running the Kalman filter
+        from ._analytic_score import initialization_partials
+
+        names = ['design', 'obs_intercept', 'obs_cov', 'transition',
+                 'state_intercept', 'selection', 'state_cov']
+        n = len(params)
+        epsilon = _get_epsilon(params, 2., None, n)
+        k_states = self.k_states
+        initialization = self.ssm.initialization
+        stationary = initialization.initialization_type == 'stationary'
+
+        partials = dict((name, []) for name in names)
+        partial_state = np.zeros((n, k_states))
+        partial_state_cov = np.zeros((n, k_states, k_states))
+        for i in range(n):
+            params_i = params.astype(complex)
+            params_i[i] += 1j * epsilon[i]
+            self.update(params_i, transformed=True, complex_step=True)
+            for name in names:
+                partials[name].append(
+                    getattr(self.ssm, '_' + name).imag / epsilon[i])
+            if not stationary:
+                init = initialization(
+                    model=self.ssm,
+                    initial_state_mean=np.zeros(k_states, dtype=complex),
+                    initial_diffuse_state_cov=np.zeros((k_states,) * 2,
+                                                       dtype=complex),
+                    initial_stationary_state_cov=np.zeros((k_states,) * 2,
+                                                          dtype=complex),
+                    complex_step=True)
+                partial_state[i] = init[0].imag / epsilon[i]
+                partial_state_cov[i] = init[2].imag / epsilon[i]
+        partials = dict((name, np.array(partials[name])) for name in names)
+
+        self.update(params, transformed=True)
+        initial_state, _, initial_state_cov = initialization(model=self.ssm)
+        initialization_partials(
+            initialization, *[getattr(self.ssm, '_' + name)[..., 0]
+                              for name in ['transition', 'state_intercept',
+                                           'selection', 'state_cov']],
+            initial_state=initial_state, initial_state_cov=initial_state_cov,
+            partials=partials, partial_state=partial_state,
+            partial_state_cov=partial_state_cov)
+        return (partials, (partial_state, partial_state_cov),
+                initial_state, initial_state_cov)
+
+    @property
+    def _analytic_score_available(self):
+        # The analytic score requires the conventional Kalman filter and
+        # smoother without missing observations or diffuse initialization
+        def diffuse(init):
+            if init.initialization_type is None:
+                return any(diffuse(block) for block in init.blocks.values())
+            return init.initialization_type == 'diffuse'
+
+        ssm = self.ssm
+        return not (ssm.filter_method != FILTER_CONVENTIONAL or
+                    ssm.filter_timing != 0 or ssm._complex_endog or
+                    ssm.initialization is None or
+                    not ssm.initialization.initialized or
+                    diffuse(ssm.initialization) or
+                    np.any(np.isnan(ssm.endog)))
+
+    def _score_analytic(self, params, **kwargs):
+        """
+        Score computed from the Kalman smoother
+
+        Notes
+        -----
+        The partial derivatives of the system matrices are computed by
+        complex step differentiation of `update`, after which the score
+        follows from a single pass of the Kalman filter and smoother, see
+        Koopman and Shephard (1992). The periods excluded by
+        `loglikelihood_burn` are removed using the forward recursions for
+        the partial derivatives of the filter output (Harvey, 1989, section
+        3.4.5).
+
+        References
+        ----------
+        Koopman, S. J., and N. Shephard. 1992.
+        "Exact Score for Time Series Models in State Space Form."
+        Biometrika 79 (4): 823-26.
+        """
+        from ._analytic_score import forward_score, smoother_score
+
+        if not self._analytic_score_available:
+            raise NotImplementedError('The analytic score is only available'
+                                      ' for the conventional Kalman filter'
+                                      ' without missing observations or'
+                                      ' exact diffuse initialization.')
+        params = np.array(params, ndmin=1)
+        partials, initial_partials, initial_state, initial_state_cov = (
+            self._system_partials(params))
+        kwargs.setdefault('conserve_memory', 0)
+        res = self.ssm.smooth(smoother_output=SMOOTHER_ALL, **kwargs)
+        score = smoother_score(res, partials, initial_partials)
+
+        loglikelihood_burn = kwargs.get('loglikelihood_burn',
+                                        self.ssm.loglikelihood_burn)
+        if loglikelihood_burn:
+            matrices = dict((name, getattr(self.ssm, '_' + name))
+                            for name in partials)
+            score -= forward_score(
+                self.ssm.endog, matrices, partials, initial_state,
+                initial_state_cov, initial_partials,
+                nobs=min(loglikelihood_burn, self.nobs))
+        return score
+
     _score_param_names = ['transformed', 'score_method',
                           'approx_complex_step', 'approx_centered']
-    _score_param_defaults = [True, 'approx', None, False]
+    _score_param_defaults = [True, None, None, False]
 
     def score(self, params, *args, **kwargs):
         """
@@ -1052,8 +1341,13 @@ class MLEModel(tsbase.TimeSeriesModel):
 
         Notes
         -----
-        This is a numerical approximation, calculated using first-order complex
-        step differentiation on the `loglike` method.
+        The score method can be given as `method` (or `score_method`), one
+        of 'analytic', 'harvey' or 'approx'. The default uses the analytic
+        score, computed from a single pass of the Kalman filter and
+        smoother, if it is available for the model (in particular, without
+        missing observations or exact diffuse initialization), and otherwise
+        a numerical approximation, calculated using first-order complex step
+        differentiation on the `loglike` method.
 
         Both args and kwargs are necessary because the optimizer from
         `fit` must call this function and only supports passing arguments via
@@ -1076,10 +1370,26 @@ class MLEModel(tsbase.TimeSeriesModel):
             raise ValueError('Cannot use complex step derivatives when data'
                              ' or parameters are complex.')
 
+        default = method is None
+        if default:
+            method = ('analytic' if approx_complex_step and not kwargs and
+                      self._analytic_score_available else 'approx')
+
         if not transformed:
             transform_score = self.transform_jacobian(params)
             params = self.transform_params(params)
 
+        if method == 'analytic':
+            try:
+                score = self._score_analytic(params, **kwargs)
+            except (ValueError, np.linalg.LinAlgError):
+                # Unlike the filter, `Initialization` validates e.g. the
+                # stationarity of the transition matrix, so by default fall
+                # back to the numerical approximation for invalid parameters
+                if not default:
+                    raise
+                method = 'approx'
+
         if method == 'harvey':
             score = self._score_harvey(
                 params, approx_complex_step=approx_complex_step, **kwargs)
@@ -1088,7 +1398,7 @@ class MLEModel(tsbase.TimeSeriesModel):
         elif method == 'approx':
             score = self._score_finite_difference(
                 params, approx_centered=approx_centered, **kwargs)
-        else:
+        elif not method == 'analytic':
             raise NotImplementedError('Invalid score method.')
 
         if not transformed:
@@ -2480,6 +2790,89 @@ class MLEResults(tsbase.TimeSeriesModelResults):
             end = steps
         return self.predict(start=self.nobs, end=end, **kwargs)
 
+    def _get_extension_model(self, endog, exog=None, **kwargs):
+        # Model for the new observations only, which continues the Kalman
+        # filter from the last predicted state of these results
+        if self.filter_results.filter_concentrated:
+            raise NotImplementedError('Appending observations without'
+                                      ' refitting is not available for models'
+                                      ' in which the scale is concentrated'
+                                      ' out of the likelihood.')
+        kwargs.setdefault('loglikelihood_burn', 0)
+        mod = self.model.clone(endog, exog=exog, **kwargs)
+        mod.ssm.initialize_known(
+            self.filter_results.predicted_state[:, -1],
+            self.filter_results.predicted_state_cov[:, :, -1])
+        return mod
+
+    def append(self, endog, exog=None, refit=False, fit_kwargs=None,
+               **kwargs):
+        """
+        Update the results with new observations
+
+        Parameters
+        ----------
+        endog : array_like
+            New observations from the modeled time-series process, following
+            the observations of this results object.
+        exog : array_like, optional
+            New observations of exogenous regressors, if applicable.
+        refit : boolean, optional
+            Whether to re-fit the parameters, using the observations of this
+            results object together with the new observations. Default is
+            False, in which case the parameters of this results object are
+            used and only the new observations are filtered.
+        fit_kwargs : dict, optional
+            Keyword arguments to pass to `fit` (if `refit=True`) or `filter`.
+            These may include e.g. `conserve_memory` to limit the output
+            that is stored.
+        **kwargs
+            Keyword arguments to pass to `clone` to construct the new model.
+
+        Returns
+        -------
+        results
+            Updated results object.
+
+        Notes
+        -----
+        If `refit=False`, the Kalman filter is continued from the last
+        predicted state and its covariance matrix, so that the cost only
+        depends on the number of new observations. The returned results
+        object then only contains the new observations, e.g. in
+        `fittedvalues` and `llf`, but its forecasts are the same as those of
+        a model of the full dataset. Its covariance matrix of the parameters
+        is taken from this results object.
+
+        If `refit=True`, a new model is fit to the observations of this
+        results object together with the new observations, starting from the
+        parameters of this results object.
+
+        This requires the model to implement `clone`.
+        """
+        if fit_kwargs is None:
+            fit_kwargs = {}
+
+        if refit:
+            endog = _concat(self.model.data.orig_endog, endog)
+            if exog is not None:
+                exog = _concat(self.model.data.orig_exog, exog)
+            mod = self.model.clone(endog, exog=exog, **kwargs)
+            fit_kwargs.setdefault('start_params', self.params)
+            return mod.fit(**fit_kwargs)
+
+        mod = self._get_extension_model(endog, exog=exog, **kwargs)
+        fit_kwargs.setdefault('cov_type', 'custom')
+        if fit_kwargs['cov_type'] == 'custom':
+            description = ('Parameters and standard errors were estimated'
+                           ' using previous observations and were then'
+                           ' applied to the new observations.')
+            fit_kwargs.setdefault('cov_kwds', {
+                'custom_cov_type': self.cov_type,
+                'custom_cov_params': self.cov_params_default,
+                'custom_description': description})
+        return mod.filter(self.params, **fit_kwargs)
+
     def simulate(self, nsimulations, measurement_shocks=None,
                  state_shocks=None, initial_state=None):
         r"""
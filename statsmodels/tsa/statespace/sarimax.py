@@ -98,6 +98,11 @@ class SARIMAX(MLEModel):
         out of the likelihood. This reduces the number of parameters estimated
         by maximum likelihood by one, but standard errors will then not
         be available for the scale parameter.
+    trend_offset : int, optional
+        The offset at which to start time trend values. Default is 1, so that
+        if `trend='t'` the trend is equal to 1, 2, ..., nobs. Typically this
+        is only set when the model is created by extending a previous
+        dataset.
     **kwargs
         Keyword arguments may be used to provide default values for state space
         matrices or for Kalman filtering options. See `Representation`, and
@@ -301,7 +306,7 @@ class SARIMAX(MLEModel):
                  mle_regression=True, simple_differencing=False,
                  enforce_stationarity=True, enforce_invertibility=True,
                  hamilton_representation=False, concentrate_scale=False,
-                 **kwargs):
+                 trend_offset=1, **kwargs):
 
         # Model parameters
         self.seasonal_periods = seasonal_order[3]
@@ -313,6 +318,7 @@ class SARIMAX(MLEModel):
         self.enforce_invertibility = enforce_invertibility
         self.hamilton_representation = hamilton_representation
         self.concentrate_scale = concentrate_scale
+        self.trend_offset = trend_offset
 
         # Save given orders
         self.order = order
@@ -546,8 +552,8 @@ class SARIMAX(MLEModel):
                             'measurement_error', 'time_varying_regression',
                             'mle_regression', 'simple_differencing',
                             'enforce_stationarity', 'enforce_invertibility',
-                            'hamilton_representation',
-                            'concentrate_scale'] + list(kwargs.keys())
+                            'hamilton_representation', 'concentrate_scale',
+                            'trend_offset'] + list(kwargs.keys())
         # TODO: I think the kwargs or not attached, need to recover from ???
 
         # Initialize the state
@@ -563,6 +569,9 @@ class SARIMAX(MLEModel):
 
         return kwds
 
+    def clone(self, endog, exog=None, **kwargs):
+        return self._clone_from_init_kwds(endog, exog=exog, **kwargs)
+
     def prepare_data(self):
         endog, exog = super(SARIMAX, self).prepare_data()
 
@@ -598,7 +607,8 @@ class SARIMAX(MLEModel):
 
         # Cache the arrays for calculating the intercept from the trend
         # components
-        time_trend = np.arange(1, self.nobs + 1)
+        time_trend = np.arange(self.trend_offset,
+                               self.nobs + self.trend_offset)
         self._trend_data = np.zeros((self.nobs, self.k_trend))
         i = 0
         for k in self.polynomial_trend.nonzero()[0]:
@@ -1842,6 +1852,17 @@ class SARIMAXResults(MLEResults):
         """
         return self._params_seasonal_ma
 
+    def _get_extension_model(self, endog, exog=None, **kwargs):
+        if (self.model.simple_differencing and
+                self.model.orig_k_diff + self.model.orig_k_seasonal_diff > 0):
+            raise NotImplementedError('Appending observations without'
+                                      ' refitting is not available for models'
+                                      ' with simple differencing.')
+        # Continue the time trend after the observations of these results
+        kwargs.setdefault('trend_offset', self.model.trend_offset + self.nobs)
+        return super(SARIMAXResults, self)._get_extension_model(
+            endog, exog=exog, **kwargs)
+
     def get_prediction(self, start=None, end=None, dynamic=False, index=None,
                        exog=None, **kwargs):
         """
@@ -1894,8 +1915,18 @@ class SARIMAXResults(MLEResults):
 
         # Handle exogenous parameters
         if _out_of_sample and (self.model.k_exog + self.model.k_trend > 0):
-            # Create a new faux SARIMAX model for the extended dataset
-            nobs = self.model.data.orig_endog.shape[0] + _out_of_sample
+            # Create a new faux SARIMAX model for the forecast periods, which
+            # must include the sample if simple differencing is used
+            model_kwargs = self._init_kwds.copy()
+            simple_differencing = (
+                self.model.simple_differencing and
+                self.model.orig_k_diff + self.model.orig_k_seasonal_diff > 0)
+            if simple_differencing:
+                nobs = self.model.data.orig_endog.shape[0] + _out_of_sample
+            else:
+                nobs = _out_of_sample
+                model_kwargs['trend_offset'] = (self.model.trend_offset +
+                                                self.nobs)
             endog = np.zeros((nobs, self.model.k_endog))
 
             if self.model.k_exog > 0:
@@ -1911,9 +1942,9 @@ class SARIMAXResults(MLEResults):
                                      ' appropriate shape. Required %s, got %s.'
                                      % (str(required_exog_shape),
                                         str(exog.shape)))
-                exog = np.c_[self.model.data.orig_exog.T, exog.T].T
+                if simple_differencing:
+                    exog = np.c_[self.model.data.orig_exog.T, exog.T].T
 
-            model_kwargs = self._init_kwds.copy()
             model_kwargs['exog'] = exog
             model = SARIMAX(endog, **model_kwargs)
             model.update(self.params)
@@ -1924,7 +1955,8 @@ class SARIMAXResults(MLEResults):
                 if name == 'obs':
                     continue
                 mat = getattr(model.ssm, name)
-                if mat.shape[-1] > 1:
+                if (mat.shape[-1] > 1 or
+                        getattr(self.filter_results, name).shape[-1] > 1):
                     if len(mat.shape) == 2:
                         kwargs[name] = mat[:, -_out_of_sample:]
                     else:
@@ -614,6 +614,9 @@ class UnobservedComponents(MLEModel):
         # Initialize the state
         self.initialize_default()
 
+    def clone(self, endog, exog=None, **kwargs):
+        return self._clone_from_init_kwds(endog, exog=exog, **kwargs)
+
     def _get_init_kwds(self):
         # Get keywords based on model attributes
         kwds = super(UnobservedComponents, self)._get_init_kwds()
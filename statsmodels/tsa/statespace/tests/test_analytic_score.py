@@ -0,0 +1,122 @@
+"""
+Tests for the analytic score of the state space loglikelihood
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal, assert_raises
+
+from statsmodels.tsa.statespace import (
+    dynamic_factor, sarimax, structural, varmax)
+from statsmodels.tsa.statespace._analytic_score import (
+    forward_score, smoother_score)
+
+
+def get_endog(nobs=200):
+    np.random.seed(1234)
+    return np.cumsum(np.random.normal(size=nobs)) * 0.1 + np.random.normal(
+        size=nobs)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(order=(2, 0, 1)),
+    dict(order=(1, 0, 1), trend='ct'),
+    dict(order=(1, 0, 0), measurement_error=True),
+    dict(order=(1, 1, 1)),
+    dict(order=(1, 0, 1), seasonal_order=(1, 0, 0, 4)),
+    dict(order=(1, 0, 0), exog=True)])
+def test_sarimax(kwargs):
+    endog = get_endog()
+    if kwargs.pop('exog', False):
+        kwargs['exog'] = np.random.normal(size=(len(endog), 1))
+    mod = sarimax.SARIMAX(endog, tolerance=0, **kwargs)
+    assert_equal(mod._analytic_score_available, True)
+    params = mod.start_params
+
+    desired = mod.score(params, method='approx')
+    assert_allclose(mod.score(params, method='analytic'), desired, rtol=1e-6)
+    assert_allclose(mod.score(params), desired, rtol=1e-6)
+
+    unconstrained = mod.untransform_params(params)
+    assert_allclose(mod.score(unconstrained, transformed=False),
+                    mod.score(unconstrained, transformed=False,
+                              method='approx'), rtol=1e-6)
+
+
+def test_varmax():
+    np.random.seed(1234)
+    endog = np.random.normal(size=(200, 2))
+    mod = varmax.VARMAX(endog, order=(1, 0), measurement_error=True,
+                        tolerance=0)
+    params = mod.start_params
+    assert_allclose(mod.score(params, method='analytic'),
+                    mod.score(params, method='approx'), rtol=1e-6)
+
+
+def test_dynamic_factor():
+    np.random.seed(1234)
+    endog = np.random.normal(size=(200, 3))
+    mod = dynamic_factor.DynamicFactor(endog, k_factors=1, factor_order=1,
+                                       tolerance=0)
+    params = mod.start_params
+    assert_allclose(mod.score(params, method='analytic'),
+                    mod.score(params, method='approx'), rtol=1e-6)
+
+
+def test_loglikelihood_burn():
+    # Approximate diffuse initialization with a burn-in period
+    mod = structural.UnobservedComponents(get_endog(), 'lltrend',
+                                          loglikelihood_burn=2)
+    params = mod.start_params
+    assert_allclose(mod.score(params, method='analytic'),
+                    mod.score(params, method='approx'), rtol=1e-6)
+
+
+def test_forward_score():
+    # The forward recursions give the score of the first periods, and the
+    # score of the full sample from the smoother
+    mod = sarimax.SARIMAX(get_endog(), order=(1, 0, 1), trend='c')
+    params = mod.start_params
+    partials, initial_partials, initial_state, initial_state_cov = (
+        mod._system_partials(params))
+    res = mod.ssm.smooth()
+    matrices = dict((name, getattr(mod.ssm, '_' + name))
+                    for name in partials)
+
+    desired = smoother_score(res, partials, initial_partials)
+    actual = forward_score(mod.ssm.endog, matrices, partials, initial_state,
+                           initial_state_cov, initial_partials)
+    assert_allclose(actual, desired, rtol=1e-8)
+
+    mod_burn = sarimax.SARIMAX(get_endog(), order=(1, 0, 1), trend='c',
+                               loglikelihood_burn=190)
+    actual = forward_score(mod.ssm.endog, matrices, partials, initial_state,
+                           initial_state_cov, initial_partials, nobs=190)
+    assert_allclose(desired - actual,
+                    mod_burn.score(params, method='approx'), rtol=1e-6)
+
+
+def test_unavailable():
+    endog = get_endog()
+    params = [0.5, 1.]
+
+    # Missing observations
+    endog_missing = endog.copy()
+    endog_missing[10] = np.nan
+    mod = sarimax.SARIMAX(endog_missing, order=(1, 0, 0))
+    assert_equal(mod._analytic_score_available, False)
+    assert_raises(NotImplementedError, mod.score, params, method='analytic')
+    assert_allclose(mod.score(params), mod.score(params, method='approx'))
+
+    # Exact diffuse initialization
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0))
+    mod.ssm.initialize_diffuse()
+    assert_equal(mod._analytic_score_available, False)
+
+    # Univariate filter
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0))
+    mod.ssm.filter_univariate = True
+    assert_equal(mod._analytic_score_available, False)
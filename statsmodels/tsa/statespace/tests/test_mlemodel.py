@@ -894,3 +894,58 @@ def test_lutkepohl_information_criteria():
     bic = res.info_criteria('bic') - 6 * np.log(res.nobs_effective)
     assert_allclose(aic, true['estat_aic'])
     assert_allclose(bic, true['estat_bic'])
+
+
+def test_loglike_batch():
+    # Batch evaluation against repeated calls to `loglike`
+    np.random.seed(1234)
+    endog = np.cumsum(np.random.normal(size=100))
+    endog[[10, 50]] = np.nan
+    exog = np.random.normal(size=(100, 1))
+
+    specs = [dict(order=(2, 0, 1), trend='c'),
+             dict(order=(1, 1, 1), seasonal_order=(1, 0, 0, 4)),
+             dict(order=(1, 0, 0), exog=exog, enforce_stationarity=False)]
+    for spec in specs:
+        mod = sarimax.SARIMAX(endog, **spec)
+        params = (mod.start_params +
+                  0.05 * np.random.normal(size=(4, mod.k_params)))
+        llf = [mod.loglike(p) for p in params]
+        assert_allclose(mod.loglike_batch(params), llf, rtol=1e-9)
+        llf, forecasts_error = mod.loglike_batch(params,
+                                                 forecasts_error=True)
+        res = mod.filter(params[-1])
+        assert_allclose(forecasts_error[-1], res.forecasts_error, atol=1e-7)
+
+    # Untransformed parameters
+    mod = sarimax.SARIMAX(np.random.normal(size=100), order=(1, 0, 1))
+    unconstrained = np.random.normal(size=(3, 3))
+    assert_allclose(mod.loglike_batch(unconstrained, transformed=False),
+                    [mod.loglike(p, transformed=False)
+                     for p in unconstrained])
+
+    # Multivariate, with partially missing observations
+    endog = np.random.normal(size=(50, 2))
+    endog[5, 0] = endog[20] = np.nan
+    mod = varmax.VARMAX(endog, order=(1, 0))
+    params = mod.start_params[None, :] * [[1.], [0.9]]
+    assert_allclose(mod.loglike_batch(params),
+                    [mod.loglike(p) for p in params])
+
+
+def test_loglike_batch_endog():
+    # A single set of parameters for a stack of datasets
+    np.random.seed(1234)
+    endog = np.random.normal(size=(5, 80))
+    params = [0.5, 0.2, 1.5]
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 1))
+    llf = [sarimax.SARIMAX(y, order=(1, 0, 1)).loglike(params)
+           for y in endog]
+    assert_allclose(mod.loglike_batch(params, endog=endog), llf)
+    assert_allclose(mod.loglike_batch([params] * 5, endog=endog), llf)
+
+    assert_raises(ValueError, mod.loglike_batch, [params] * 4, endog=endog)
+    assert_raises(ValueError, mod.loglike_batch, params, endog=endog[:, 1:])
+
+    mod = sarimax.SARIMAX(endog[0], order=(1, 0, 1), concentrate_scale=True)
+    assert_raises(NotImplementedError, mod.loglike_batch, params[:2])
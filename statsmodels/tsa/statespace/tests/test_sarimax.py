@@ -15,6 +15,8 @@ import os
 
 import warnings
 from statsmodels.tsa.statespace import sarimax, tools
+from statsmodels.tsa.statespace.kalman_filter import (
+    MEMORY_NO_FILTERED, MEMORY_NO_PREDICTED)
 from statsmodels.tsa import arima_model as arima
 from .results import results_sarimax
 from statsmodels.tools import add_constant
@@ -2321,3 +2323,100 @@ def check_concentrated_scale(filter_univariate=False):
 def test_concentrated_scale():
     check_concentrated_scale(filter_univariate=False)
     check_concentrated_scale(filter_univariate=True)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(order=(1, 1, 1), trend='ct'),
+    dict(order=(1, 0, 0), exog=True)])
+def test_append(kwargs):
+    # Continuing the filter with new observations gives the same results as
+    # filtering the full dataset
+    np.random.seed(1234)
+    nobs = 120
+    index = pd.period_range(start='2000-01', periods=nobs, freq='M')
+    endog = pd.Series(np.cumsum(np.random.normal(size=nobs)) * 0.2 +
+                      np.random.normal(size=nobs), index=index)
+    exog = None
+    if kwargs.pop('exog', False):
+        exog = pd.Series(np.random.normal(size=nobs), index=index)
+    exog_fcast = None if exog is None else np.ones((3, 1))
+    params = [0.1, 0.01, 0.5, 0.2, 1.] if 'trend' in kwargs else [1, 0.5, 1.]
+
+    mod = sarimax.SARIMAX(endog[:100], exog=None if exog is None else
+                          exog[:100], **kwargs)
+    res = mod.filter(params)
+    res_full = sarimax.SARIMAX(endog, exog=exog, **kwargs).filter(params)
+
+    res_append = res.append(endog[100:],
+                            exog=None if exog is None else exog[100:])
+    assert_equal(res_append.nobs, 20)
+    assert_allclose(res_append.llf, res_full.llf_obs[100:].sum())
+    assert_allclose(res_append.fittedvalues, res_full.fittedvalues[100:])
+    assert_allclose(res_append.forecast(3, exog=exog_fcast),
+                    res_full.forecast(3, exog=exog_fcast))
+    assert_equal(res_append.forecast(3, exog=exog_fcast).index.equals(
+        res_full.forecast(3, exog=exog_fcast).index), True)
+    assert_allclose(res_append.bse, res.bse)
+
+    # Memory conservation options are passed to the filter
+    res_append = res.append(endog[100:],
+                            exog=None if exog is None else exog[100:],
+                            fit_kwargs=dict(conserve_memory=MEMORY_NO_FILTERED |
+                                                           MEMORY_NO_PREDICTED))
+    assert_allclose(res_append.llf, res_full.llf_obs[100:].sum())
+    assert_equal(res_append.filter_results.predicted_state_cov.shape[-1], 3)
+
+    # Refitting uses the full dataset
+    res_refit = res.append(endog[100:],
+                           exog=None if exog is None else exog[100:],
+                           refit=True, fit_kwargs=dict(disp=False))
+    assert_equal(res_refit.nobs, nobs)
+    assert_allclose(res_refit.params,
+                    res_full.model.fit(params, disp=False).params)
+
+
+def test_append_invalid():
+    endog = np.arange(10.)
+    res = sarimax.SARIMAX(endog, order=(1, 0, 0),
+                          concentrate_scale=True).filter([0.5])
+    assert_raises(NotImplementedError, res.append, endog)
+
+    res = sarimax.SARIMAX(endog, order=(1, 1, 0),
+                          simple_differencing=True).filter([0.5, 1.])
+    assert_raises(NotImplementedError, res.append, endog)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(order=(2, 1, 1)),
+    dict(order=(1, 0, 1), trend='ct'),
+    dict(order=(1, 0, 0), exog=True),
+    dict(order=(1, 0, 0), exog=True, mle_regression=False)])
+def test_forecast_conserve_memory(kwargs):
+    # Out-of-sample forecasts only iterate the forecast periods, starting from
+    # the last filtered state, which is also available with memory
+    # conservation
+    np.random.seed(1234)
+    endog = np.cumsum(np.random.normal(size=200))
+    exog_fcast = {}
+    if kwargs.get('exog', False):
+        kwargs['exog'] = np.random.normal(size=(200, 1))
+        exog_fcast['exog'] = np.ones((5, 1))
+    mod = sarimax.SARIMAX(endog, **kwargs)
+    params = mod.start_params
+    res = mod.filter(params)
+
+    # Compare with the forecasts from filtering with missing observations
+    endog_missing = np.r_[endog, [np.nan] * 5]
+    if 'exog' in kwargs:
+        kwargs['exog'] = np.r_[kwargs['exog'], exog_fcast['exog']]
+    res_missing = sarimax.SARIMAX(endog_missing, **kwargs).filter(params)
+
+    for conserve_memory in [0, MEMORY_NO_FILTERED | MEMORY_NO_PREDICTED]:
+        res = mod.filter(params, conserve_memory=conserve_memory)
+        fcast = res.get_forecast(5, **exog_fcast)
+        assert_allclose(fcast.predicted_mean,
+                        res_missing.forecasts[0, -5:])
+        assert_allclose(fcast.var_pred_mean,
+                        res_missing.forecasts_error_cov[0, 0, -5:])
+        assert_equal(fcast.prediction_results.results.forecasts.shape,
+                     (1, 5))
@@ -0,0 +1,136 @@
+"""
+Tests for the square-root evaluation of the loglikelihood function
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+from statsmodels.tsa.statespace import sarimax, varmax
+from statsmodels.tsa.statespace._square_root import _root
+
+
+def test_root():
+    x = np.array([[2., 1., 0], [1., 2., 0], [0, 0, 0]])
+    for matrix in [x[:2, :2], x, np.zeros((0, 0))]:
+        root = _root(matrix)
+        assert_allclose(np.dot(root, root.T), matrix, atol=1e-14)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(order=(2, 0, 1)),
+    dict(order=(1, 1, 1)),
+    dict(order=(1, 0, 1), trend='ct', measurement_error=True),
+    dict(order=(1, 0, 0), seasonal_order=(1, 0, 0, 4)),
+    dict(order=(0, 1, 2), loglikelihood_burn=5)])
+@pytest.mark.parametrize('missing', [False, True])
+def test_sarimax(kwargs, missing):
+    np.random.seed(1234)
+    endog = np.cumsum(np.random.normal(size=500)) * 0.1
+    endog += np.random.normal(size=500)
+    if missing:
+        endog[[3, 50, 51, 300]] = np.nan
+
+    mod = sarimax.SARIMAX(endog, **kwargs)
+    mod_sr = sarimax.SARIMAX(endog, filter_square_root=True, **kwargs)
+    params = mod.start_params
+
+    # the Cython filter keeps the predicted state covariance matrix fixed
+    # once it has converged and loses precision with the approximate diffuse
+    # initialization of integrated models, see test_accuracy
+    assert_allclose(mod_sr.loglikeobs(params), mod.loglikeobs(params),
+                    rtol=1e-6, atol=1e-12)
+    assert_allclose(mod_sr.loglike(params), mod.loglike(params), rtol=1e-8)
+    # complex-step derivatives use the Cython filter
+    assert_allclose(mod_sr.score(params), mod.score(params), rtol=1e-5)
+
+
+def test_time_varying():
+    # time-varying design matrix of a regression with mle_regression=False
+    np.random.seed(1234)
+    exog = np.random.normal(size=(300, 2))
+    endog = np.dot(exog, [1, -0.5]) + np.random.normal(size=300)
+    kwargs = dict(order=(1, 0, 0), exog=exog, mle_regression=False)
+    mod = sarimax.SARIMAX(endog, **kwargs)
+    mod_sr = sarimax.SARIMAX(endog, filter_square_root=True, **kwargs)
+    params = [0.5, 1.]
+    mod_sr.update(params)
+    assert_equal(mod_sr.ssm._design.shape[-1], 300)
+    assert_allclose(mod_sr.loglikeobs(params), mod.loglikeobs(params),
+                    rtol=1e-6)
+
+
+@pytest.mark.skipif(np.finfo(np.longdouble).eps >= 1e-16,
+                    reason='long double has the precision of double')
+@pytest.mark.parametrize('order', [(2, 0, 1), (1, 1, 1), (0, 1, 2)])
+def test_accuracy(order):
+    # Conventional filter in extended precision as reference
+    np.random.seed(1234)
+    endog = np.cumsum(np.random.normal(size=500)) * 0.1
+    endog += np.random.normal(size=500)
+    mod = sarimax.SARIMAX(endog, order=order, filter_square_root=True)
+    params = mod.start_params
+    mod.update(params)
+    ssm = mod.ssm
+    initial_state, _, initial_state_cov = ssm._initial_state_moments()
+
+    ld = np.longdouble
+    design = ssm._design[..., 0].astype(ld)
+    transition = ssm._transition[..., 0].astype(ld)
+    selection = ssm._selection[..., 0].astype(ld)
+    state_cov = np.dot(np.dot(selection, ssm._state_cov[..., 0]), selection.T)
+    a = initial_state.astype(ld)
+    P = initial_state_cov.astype(ld)
+    desired = np.zeros(500, dtype=ld)
+    for t in range(500):
+        v = endog[t] - np.dot(design, a)[0]
+        F = np.dot(np.dot(design, P), design.T)[0, 0]
+        K = np.dot(np.dot(transition, P), design.T) / F
+        desired[t] = -0.5 * (np.log(2 * np.pi) + np.log(F) + v**2 / F)
+        a = np.dot(transition, a) + K[:, 0] * v
+        P = (np.dot(np.dot(transition, P), transition.T) -
+             np.dot(K, K.T) * F + state_cov)
+    desired[:ssm.loglikelihood_burn] = 0
+    assert_allclose(mod.loglikeobs(params), desired.astype(float),
+                    rtol=1e-13)
+
+
+def test_varmax():
+    np.random.seed(1234)
+    endog = np.random.normal(size=(300, 2))
+    endog[10, 0] = np.nan
+    endog[20] = np.nan
+    mod = varmax.VARMAX(endog, order=(1, 0), measurement_error=True)
+    mod_sr = varmax.VARMAX(endog, order=(1, 0), measurement_error=True,
+                           filter_square_root=True)
+    params = mod.start_params
+    assert_allclose(mod_sr.loglikeobs(params), mod.loglikeobs(params),
+                    rtol=1e-10, atol=1e-12)
+
+
+def test_fit():
+    np.random.seed(1234)
+    endog = np.random.normal(size=200)
+    res = sarimax.SARIMAX(endog, order=(1, 0, 1)).fit(disp=False)
+    res_sr = sarimax.SARIMAX(endog, order=(1, 0, 1),
+                             filter_square_root=True).fit(disp=False)
+    assert_allclose(res_sr.params, res.params, rtol=1e-5)
+    assert_allclose(res_sr.llf, res.llf, rtol=1e-10)
+
+
+def test_not_implemented():
+    endog = np.random.normal(size=50)
+    params = [0.5, 1.]
+
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), filter_square_root=True,
+                          filter_univariate=True)
+    with pytest.raises(NotImplementedError):
+        mod.loglike(params)
+
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), filter_square_root=True,
+                          initialization='diffuse')
+    with pytest.raises(NotImplementedError):
+        mod.loglike(params)
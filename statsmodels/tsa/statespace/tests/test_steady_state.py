@@ -0,0 +1,117 @@
+"""
+Tests for the steady-state evaluation of the loglikelihood function
+
+License: Simplified-BSD
+"""
+from __future__ import division, absolute_import, print_function
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+from statsmodels.tsa.statespace import sarimax, varmax
+from statsmodels.tsa.statespace._steady_state import (
+    _linear_recursion, steady_state_loglikeobs)
+
+
+def test_linear_recursion():
+    np.random.seed(1234)
+    transition = np.array([[0.5, 0.2, 0], [0.1, 0.3, 0.1], [0, 0, 0.8]])
+    design = np.random.normal(size=(2, 3))
+    initial = np.random.normal(size=3)
+    inputs = np.random.normal(size=(1000, 3))
+
+    desired = np.zeros((1000, 2))
+    x = initial
+    for t in range(1000):
+        desired[t] = np.dot(design, x)
+        x = np.dot(transition, x) + inputs[t]
+
+    for block_size in [1000, 64, 7]:
+        actual = _linear_recursion(transition, design, initial, inputs,
+                                   block_size)
+        assert_allclose(actual, desired)
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(order=(2, 0, 1)),
+    dict(order=(1, 1, 1)),
+    dict(order=(1, 0, 1), trend='ct'),
+    dict(order=(1, 0, 0), seasonal_order=(1, 0, 0, 4)),
+    dict(order=(0, 1, 2), loglikelihood_burn=5)])
+def test_sarimax(kwargs):
+    np.random.seed(1234)
+    endog = np.cumsum(np.random.normal(size=3000)) * 0.1
+    endog += np.random.normal(size=3000)
+
+    mod = sarimax.SARIMAX(endog, **kwargs)
+    mod_ss = sarimax.SARIMAX(endog, steady_state=True, **kwargs)
+    params = mod.start_params
+
+    mod_ss.update(params)
+    assert_equal(mod_ss.ssm._steady_state_loglikeobs() is None, False)
+    assert_allclose(mod_ss.loglike(params), mod.loglike(params), rtol=1e-10)
+    assert_allclose(mod_ss.loglike(params, complex_step=True),
+                    mod.loglike(params, complex_step=True), rtol=1e-10)
+    assert_allclose(mod_ss.score(params), mod.score(params), rtol=1e-6)
+
+
+def test_varmax():
+    np.random.seed(1234)
+    endog = np.random.normal(size=(1000, 2))
+    mod = varmax.VARMAX(endog, order=(1, 0))
+    mod_ss = varmax.VARMAX(endog, order=(1, 0), steady_state=True)
+    params = mod.start_params
+    assert_allclose(mod_ss.loglike(params), mod.loglike(params))
+
+
+def test_loglikeobs():
+    # Compare with the loglikelihood of each period from the Cython filter
+    np.random.seed(1234)
+    endog = np.random.normal(size=500)
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 1))
+    params = [0.5, 0.2, 1.2]
+    mod.update(params)
+    ssm = mod.ssm
+    initial_state, _, initial_state_cov = ssm.initialization(model=ssm)
+    actual = steady_state_loglikeobs(
+        ssm.endog, ssm._design, ssm._obs_intercept, ssm._obs_cov,
+        ssm._transition, ssm._state_intercept, ssm._selection,
+        ssm._state_cov, initial_state, initial_state_cov)
+    assert_allclose(actual, mod.loglikeobs(params))
+
+    # loglikeobs uses the steady-state filter as well
+    mod_ss = sarimax.SARIMAX(endog, order=(1, 0, 1), steady_state=True,
+                             loglikelihood_burn=3)
+    desired = actual.copy()
+    desired[:3] = 0
+    assert_allclose(mod_ss.loglikeobs(params), desired)
+
+
+def test_fallback():
+    # The Cython filter is used if the steady-state filter is not available
+    np.random.seed(1234)
+    endog = np.random.normal(size=200)
+    params = [0.5, 1.]
+
+    # Missing observations
+    endog_missing = endog.copy()
+    endog_missing[10] = np.nan
+    mod = sarimax.SARIMAX(endog_missing, order=(1, 0, 0), steady_state=True)
+    mod.update(params)
+    assert_equal(mod.ssm._steady_state_loglikeobs(), None)
+
+    # Non-default filter method
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), steady_state=True)
+    mod.ssm.filter_univariate = True
+    mod.update(params)
+    assert_equal(mod.ssm._steady_state_loglikeobs(), None)
+    assert_allclose(
+        mod.loglike(params),
+        sarimax.SARIMAX(endog, order=(1, 0, 0)).loglike(params))
+
+    # No convergence within the allowed number of periods
+    mod = sarimax.SARIMAX(endog, order=(1, 0, 0), steady_state=True,
+                          tolerance=0)
+    mod.update(params)
+    assert_equal(mod.ssm._steady_state_loglikeobs(), None)
@@ -7,6 +7,8 @@ from statsmodels.compat.python import (iteritems, range, lrange, string_types,
 from statsmodels.compat.numpy import lstsq
 from statsmodels.compat.scipy import _next_regular
 
+import time
+
 import numpy as np
 import pandas as pd
 from numpy.linalg import LinAlgError
@@ -1470,8 +1472,43 @@ def _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params=None):
         return
 
 
+def _fit_arma_order(y, order, model_kw, trend, fit_kw, ic,
+                    start_params=None):
+    # Fits a single candidate order, returning the information criteria, the
+    # parameter estimates and the fit time. Warm start parameters that fail
+    # fall back to the default start parameters.
+    start = time.time()
+    res = None
+    if start_params is not None:
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw, start_params)
+    if res is None:
+        res = _safe_arma_fit(y, order, model_kw, trend, fit_kw)
+    fit_time = time.time() - start
+    if res is None:
+        return [np.nan] * len(ic), None, fit_time
+    return [getattr(res, criteria) for criteria in ic], res.params, fit_time
+
+
+def _warm_start_params(order, fitted):
+    # Start parameters from the estimates of the best fitting smaller order
+    # that differs by one lag, with zeros for the additional lag
+    ar, ma = order
+    smaller = [nested for nested in [(ar - 1, ma), (ar, ma - 1)]
+               if fitted.get(nested, (None, None))[1] is not None]
+    if not smaller:
+        return None
+    nested = min(smaller, key=lambda nested: fitted[nested][0][0])
+    params = fitted[nested][1]
+    k_trend = len(params) - sum(nested)
+    ar_params = params[k_trend:k_trend + nested[0]]
+    ma_params = params[k_trend + nested[0]:]
+    return np.r_[params[:k_trend], ar_params, np.zeros(ar - nested[0]),
+                 ma_params, np.zeros(ma - nested[1])]
+
+
 def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
-                         model_kw=None, fit_kw=None):
+                         model_kw=None, fit_kw=None, n_jobs=1,
+                         warm_start=False, stepwise=False):
     """
     Returns information criteria for many ARMA models
 
@@ -1492,13 +1529,31 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
         Keyword arguments to be passed to the ``ARMA`` model
     fit_kw : dict
         Keyword arguments to be passed to ``ARMA.fit``.
+    n_jobs : int
+        Number of jobs to fit the candidate orders in parallel on a process
+        pool, using joblib if it is available. -1 uses all CPUs. Default is
+        1, which fits the models sequentially.
+    warm_start : bool
+        If True, the fit of each order starts from the estimates of the best
+        fitting smaller order that differs by one lag, with a zero for the
+        additional lag. The orders are then fit in order of the total number
+        of lags. Default is False.
+    stepwise : bool
+        If True, only a subset of the orders is fit, using a stepwise search
+        that starts from the orders (2, 2), (0, 0), (1, 0) and (0, 1) and
+        moves to the best of the neighbouring orders, which differ by one AR
+        and/or one MA lag, until the first criterion in `ic` does not
+        improve, see Hyndman and Khandakar (2008). Default is False.
 
     Returns
     -------
     obj : Results object
         Each ic is an attribute with a DataFrame for the results. The AR order
         used is the row index. The ma order used is the column index. The
-        minimum orders are available as ``ic_min_order``.
+        minimum orders are available as ``ic_min_order``. The attribute
+        ``table`` is a DataFrame with the information criteria and the fit
+        time in seconds of each order that was fit, indexed by the AR and
+        MA orders. With `stepwise`, orders that were not fit are NaN.
 
     Examples
     --------
@@ -1526,6 +1581,12 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     therefore a little slow. An implementation using approximate estimates
     will be provided in the future. In the meantime, consider passing
     {method : 'css'} to fit_kw.
+
+    References
+    ----------
+    .. [*] Hyndman, R. J., and Y. Khandakar. 2008. "Automatic Time Series
+       Forecasting: The forecast Package for R." Journal of Statistical
+       Software 27 (3): 1-22.
     """
     from pandas import DataFrame
 
@@ -1540,27 +1601,81 @@ def arma_order_select_ic(y, max_ar=4, max_ma=2, ic='bic', trend='c',
     model_kw = {} if model_kw is None else model_kw
     fit_kw = {} if fit_kw is None else fit_kw
     y_arr = np.asarray(y)
-    for ar in ar_range:
-        for ma in ma_range:
-            if ar == 0 and ma == 0 and trend == 'nc':
-                results[:, ar, ma] = np.nan
-                continue
 
-            mod = _safe_arma_fit(y_arr, (ar, ma), model_kw, trend, fit_kw)
-            if mod is None:
-                results[:, ar, ma] = np.nan
-                continue
+    if n_jobs == 1:
+        parallel, p_func = list, _fit_arma_order
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_fit_arma_order, n_jobs,
+                                                 verbose=0)
+
+    # Maps each order that was fit to its (criteria, params, fit time)
+    fitted = {}
+
+    def fit_orders(orders):
+        orders = [order for order in orders if order not in fitted]
+        if warm_start:
+            # Fit in waves of orders with the same total number of lags, so
+            # that the smaller orders are available for the warm start
+            waves = [[order for order in orders if sum(order) == k]
+                     for k in sorted(set(sum(order) for order in orders))]
+        else:
+            waves = [orders]
+        for wave in waves:
+            out = parallel(
+                p_func(y_arr, order, model_kw, trend, fit_kw, ic,
+                       _warm_start_params(order, fitted)
+                       if warm_start else None)
+                for order in wave)
+            fitted.update(zip(wave, out))
+
+    candidates = [(ar, ma) for ar in ar_range for ma in ma_range
+                  if not (ar == 0 and ma == 0 and trend == 'nc')]
+    if stepwise:
+        def best_order():
+            orders = [order for order in fitted
+                      if not np.isnan(fitted[order][0][0])]
+            if not orders:
+                return None
+            return min(orders, key=lambda order: fitted[order][0][0])
+
+        fit_orders([order for order in [(2, 2), (0, 0), (1, 0), (0, 1)]
+                    if order in candidates])
+        best = best_order()
+        while best is not None:
+            neighbours = [(best[0] + i, best[1] + j)
+                          for i, j in [(-1, 0), (1, 0), (0, -1), (0, 1),
+                                       (-1, -1), (1, 1), (-1, 1), (1, -1)]]
+            neighbours = [order for order in neighbours
+                          if order in candidates and order not in fitted]
+            if not neighbours:
+                break
+            fit_orders(neighbours)
+            previous, best = best, best_order()
+            if best == previous:
+                break
+    else:
+        fit_orders(candidates)
 
-            for i, criteria in enumerate(ic):
-                results[i, ar, ma] = getattr(mod, criteria)
+    results = np.zeros((len(ic), max_ar + 1, max_ma + 1))
+    results[:] = np.nan
+    for (ar, ma), (criteria, _, _) in iteritems(fitted):
+        results[:, ar, ma] = criteria
 
     dfs = [DataFrame(res, columns=ma_range, index=ar_range) for res in results]
 
     res = dict(zip(ic, dfs))
 
+    orders = sorted(fitted)
+    table = DataFrame([fitted[order][0] + [fitted[order][2]]
+                       for order in orders], columns=list(ic) + ['fit_time'],
+                      index=pd.MultiIndex.from_tuples(orders,
+                                                      names=['ar', 'ma']))
+    res['table'] = table
+
     # add the minimums to the results dict
     min_res = {}
-    for i, result in iteritems(res):
+    for i, result in iteritems(dict(zip(ic, dfs))):
         mins = np.where(result.min().min() == result)
         min_res.update({i + '_min_order': (mins[0][0], mins[1][0])})
     res.update(min_res)
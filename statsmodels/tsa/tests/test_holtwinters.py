@@ -10,11 +10,14 @@ import warnings
 import numpy as np
 import pandas as pd
 import pytest
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import assert_almost_equal, assert_allclose, assert_equal
 
 from statsmodels.tools.sm_exceptions import EstimationWarning
+import statsmodels.tsa._exponential_smoothers as smoothers
 from statsmodels.tsa.holtwinters import (ExponentialSmoothing,
-                                         SimpleExpSmoothing, Holt, SMOOTHERS, PY_SMOOTHERS)
+                                         SimpleExpSmoothing, Holt, SMOOTHERS, PY_SMOOTHERS,
+                                         _COMPONENTS, _batch_sse, _initial_values,
+                                         fit_panel)
 
 base, _ = os.path.split(os.path.abspath(__file__))
 housing_data = pd.read_csv(os.path.join(base, 'results', 'housing-data.csv'))
@@ -415,3 +418,169 @@ def test_direct_holt_add():
     assert_allclose(b, res.slope)
     assert_allclose(f, res.level.iloc[-1] + res.slope.iloc[-1] * np.array([1, 2, 3, 4, 5]))
     assert_allclose(f, res.forecast(5))
+
+
+@pytest.mark.parametrize('trend', TRENDS)
+@pytest.mark.parametrize('seasonal', SEASONALS)
+def test_batch_sse(trend, seasonal, reset_randomstate):
+    # _batch_sse reimplements the recursions of SMOOTHERS and has to agree
+    # with them for each candidate, including the rejected ones
+    y = np.squeeze(np.asarray(housing_data))
+    nobs = y.shape[0]
+    m = 12 if seasonal else 0
+    l0, b0, s0 = _initial_values(y, trend, seasonal, m)
+    params = np.empty((40, 6 + m))
+    params[:, 0] = np.random.uniform(0.05, 0.8, size=40)
+    params[:, 1] = params[:, 0] * np.random.uniform(0, 1, size=40)
+    params[:, 2] = (1 - params[:, 0]) * np.random.uniform(0, 1, size=40)
+    # violate the restrictions of the kernels in the last candidates
+    params[30:, :3] = np.random.uniform(0, 1, size=(10, 3))
+    params[35:, 0] = 0
+    params[:, 3] = l0
+    params[:, 4] = b0 if trend else 0
+    params[:, 5] = np.random.uniform(0.8, 1, size=40)
+    params[:, 6:] = s0
+    sse = _batch_sse(y, params, trend, seasonal, m)
+
+    func = SMOOTHERS[(seasonal, trend)]
+    l = np.zeros(nobs)
+    b = np.zeros(nobs)
+    s = np.zeros(nobs + m - 1)
+    xi = np.zeros(6 + m, dtype=np.uint8)
+    max_seen = np.finfo(np.double).max
+    expected = [func(np.empty(0), xi, p, y, l, b, s, m, nobs, max_seen)
+                for p in params]
+    assert_allclose(sse, expected, rtol=1e-12)
+    assert (sse[:30] != max_seen).all()
+    if trend or seasonal:
+        assert (sse[35:] == max_seen).all()
+
+    # several series broadcast against the candidates
+    y2 = np.stack([y, 1.1 * y])
+    sse2 = _batch_sse(y2[:, None], params, trend, seasonal, m)
+    assert_equal(sse2.shape, (2, 40))
+    assert_allclose(sse2[0], sse, rtol=1e-12)
+    expected = [func(np.empty(0), xi, p, 1.1 * y, l, b, s, m, nobs, max_seen)
+                for p in params]
+    assert_allclose(sse2[1], expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('trend', TRENDS)
+@pytest.mark.parametrize('seasonal', SEASONALS)
+@pytest.mark.parametrize('fix_level', [False, True])
+def test_sse_grad(trend, seasonal, fix_level):
+    # the analytic gradient against central differences of SMOOTHERS
+    y = np.squeeze(np.asarray(housing_data)).astype(np.double)
+    nobs = y.shape[0]
+    m = 12 if seasonal else 0
+    l0, b0, s0 = _initial_values(y, trend, seasonal, m)
+    p = np.r_[0.3, 0.1, 0.2, l0, b0 if trend else 0, 0.95, s0]
+    xi = np.ones(6 + m, dtype=np.uint8)
+    if not trend:
+        xi[[1, 4, 5]] = 0
+    if not seasonal:
+        xi[2] = 0
+    if fix_level:
+        xi[3] = 0
+    x = p[xi.astype(np.bool)]
+    max_seen = np.finfo(np.double).max
+    sse, grad = smoothers._holt_win_sse_grad(x, xi, p.copy(), y, m, nobs, max_seen,
+                                             _COMPONENTS[trend], _COMPONENTS[seasonal])
+
+    func = SMOOTHERS[(seasonal, trend)]
+    l = np.zeros(nobs)
+    b = np.zeros(nobs)
+    s = np.zeros(nobs + m - 1)
+    assert_allclose(sse, func(x.copy(), xi, p.copy(), y, l, b, s, m, nobs, max_seen),
+                    rtol=1e-12)
+    steps = np.diag(1e-6 * np.maximum(np.abs(x), 1e-2))
+    numeric = [(func(x + e, xi, p.copy(), y, l, b, s, m, nobs, max_seen) -
+                func(x - e, xi, p.copy(), y, l, b, s, m, nobs, max_seen)) / (2 * e.sum())
+               for e in steps]
+    assert_allclose(grad, numeric, rtol=1e-5, atol=1e-6 * np.abs(numeric).max())
+
+    # rejected parameters are a flat region at max_seen
+    p_bad = p.copy()
+    p_bad[:2] = 0.1, 0.5
+    if trend or seasonal:
+        p_bad[2] = 0.95
+        x_bad = p_bad[xi.astype(np.bool)]
+        sse, grad = smoothers._holt_win_sse_grad(x_bad, xi, p_bad, y, m, nobs, max_seen,
+                                                 _COMPONENTS[trend], _COMPONENTS[seasonal])
+        assert_equal(sse, max_seen)
+        assert_equal(grad, np.zeros_like(x_bad))
+
+
+def _panel_data():
+    y = np.squeeze(np.asarray(housing_data))[:360]
+    return pd.DataFrame(y.reshape(3, 120).T, columns=['a', 'b', 'c'])
+
+
+@pytest.mark.parametrize('trend, seasonal, damped',
+                         [(None, None, False), ('add', None, True),
+                          ('mul', 'add', False), ('add', 'mul', True)])
+@pytest.mark.parametrize('use_brute', [False, True])
+def test_fit_panel(trend, seasonal, damped, use_brute):
+    data = _panel_data()
+    seasonal_periods = 12 if seasonal else None
+    res = fit_panel(data, trend=trend, seasonal=seasonal, damped=damped,
+                    seasonal_periods=seasonal_periods, steps=6,
+                    use_brute=use_brute)
+    assert_equal(list(res.names), list(data.columns))
+    assert res.params.shape == (3, len(res.param_names))
+    assert res.forecasts.shape == (3, 6)
+    for i, col in enumerate(data):
+        y = np.ascontiguousarray(data[col])
+        mod = ExponentialSmoothing(y, trend=trend, seasonal=seasonal,
+                                   damped=damped,
+                                   seasonal_periods=seasonal_periods)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            res_i = mod.fit(use_brute=use_brute)
+        assert_allclose(res.sse[i], res_i.sse, rtol=1e-10)
+        assert_allclose(res.aicc[i], res_i.aicc, rtol=1e-10)
+        assert_allclose(res.params[i, 0], res_i.params['smoothing_level'],
+                        rtol=1e-10)
+        assert_allclose(res.forecasts[i], res_i.forecast(6), rtol=1e-10)
+
+
+def test_fit_panel_long():
+    data = _panel_data()
+    res = fit_panel(data, trend='add', seasonal='add', seasonal_periods=12,
+                    steps=3)
+    long_data = data.melt()
+    long_data = long_data.iloc[np.random.RandomState(0).permutation(360)]
+    long_data = long_data.sort_index(kind='mergesort')
+    res_long = fit_panel(long_data['value'], groups=long_data['variable'],
+                         trend='add', seasonal='add', seasonal_periods=12,
+                         steps=3, n_jobs=2, backend='threading')
+    assert_equal(list(res_long.names), list(res.names))
+    assert_allclose(res_long.params, res.params)
+    assert_allclose(res_long.forecasts, res.forecasts)
+
+    with pytest.raises(ValueError):
+        fit_panel(long_data['value'].iloc[1:],
+                  groups=long_data['variable'].iloc[1:])
+    with pytest.raises(ValueError):
+        fit_panel(data['a'])
+
+
+def test_brute_start_vectorized():
+    from scipy.optimize import brute
+
+    mod = ExponentialSmoothing(housing_data, trend='add', seasonal='add')
+    res = mod.fit(use_brute=True)
+
+    y = np.squeeze(np.asarray(housing_data))
+    nobs = y.shape[0]
+    l0, b0, s0 = mod.initial_values()
+    xi = np.array([True, True, True, False, False, False] + [False] * 12)
+    p = np.array([0.0, 0.0, 0.0, l0, b0, 1.0] + s0)
+    args = (xi.astype(np.uint8), p, y, np.zeros(nobs), np.zeros(nobs),
+            np.zeros(nobs + 11), 12, nobs, np.finfo(np.double).max)
+    func = SMOOTHERS[('add', 'add')]
+    start = brute(func, [(0, 1)] * 3, args, Ns=20, finish=None)
+    res_brute = mod.fit(start_params=np.r_[start, l0, b0, s0])
+    assert_allclose(res.params_formatted['param'],
+                    res_brute.params_formatted['param'], rtol=1e-12)
+    assert_allclose(res.sse, res_brute.sse, rtol=1e-12)
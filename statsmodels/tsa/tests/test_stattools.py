@@ -638,6 +638,40 @@ def test_arma_order_select_ic():
     assert_equal(res.aic_min_order, (1, 2))
 
 
+@pytest.mark.slow
+def test_arma_order_select_ic_search():
+    from statsmodels.tsa.arima_process import arma_generate_sample
+
+    np.random.seed(2014)
+    y = arma_generate_sample([1, -.75, .25], [.65, .35], 250)
+    res = arma_order_select_ic(y, max_ar=3, max_ma=2, ic=['aic', 'bic'],
+                               trend='nc')
+    assert_equal(res.table.shape, (11, 3))
+    assert_equal(list(res.table.columns), ['aic', 'bic', 'fit_time'])
+    assert_(np.all(res.table['fit_time'] > 0))
+    assert_almost_equal(res.table['aic'].unstack().values,
+                        res.aic.values[:, :], 5)
+
+    res_warm = arma_order_select_ic(y, max_ar=3, max_ma=2, ic=['aic', 'bic'],
+                                    trend='nc', warm_start=True)
+    # the optimizer can stop at a slightly different local optimum
+    assert_allclose(res_warm.aic.values, res.aic.values, rtol=1e-3)
+    assert_equal(res_warm.aic_min_order, res.aic_min_order)
+
+    res_parallel = arma_order_select_ic(y, max_ar=3, max_ma=2, ic='aic',
+                                        trend='nc', n_jobs=2)
+    assert_almost_equal(res_parallel.aic.values, res.aic.values, 5)
+
+    # The stepwise search only fits a subset of the orders
+    res_step = arma_order_select_ic(y, max_ar=3, max_ma=2, ic=['aic', 'bic'],
+                                    trend='nc', stepwise=True)
+    assert_(len(res_step.table) < len(res.table))
+    assert_equal(res_step.aic_min_order, res.aic_min_order)
+    fitted = ~np.isnan(res_step.aic.values)
+    assert_almost_equal(res_step.aic.values[fitted],
+                        res.aic.values[fitted], 5)
+
+
 def test_arma_order_select_ic_failure():
     # this should trigger an SVD convergence failure, smoke test that it
     # returns, likely platform dependent failure...
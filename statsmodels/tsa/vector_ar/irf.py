@@ -288,7 +288,7 @@ class IRAnalysis(BaseIRAnalysis):
         return covs
 
     def errband_mc(self, orth=False, svar=False, repl=1000,
-                   signif=0.05, seed=None, burn=100):
+                   signif=0.05, seed=None, burn=100, n_jobs=1):
         """
         IRF Monte Carlo integrated error bands
         """
@@ -297,11 +297,11 @@ class IRAnalysis(BaseIRAnalysis):
         if svar:
             return model.sirf_errband_mc(orth=orth, repl=repl, T=periods,
                                          signif=signif, seed=seed,
-                                         burn=burn, cum=False)
+                                         burn=burn, cum=False, n_jobs=n_jobs)
         else:
             return model.irf_errband_mc(orth=orth, repl=repl, T=periods,
                                         signif=signif, seed=seed,
-                                        burn=burn, cum=False)
+                                        burn=burn, cum=False, n_jobs=n_jobs)
 
     def err_band_sz1(self, orth=False, svar=False, repl=1000,
                      signif=0.05, seed=None, burn=100, component=None):
@@ -632,14 +632,15 @@ class IRAnalysis(BaseIRAnalysis):
         return covs
 
     def cum_errband_mc(self, orth=False, repl=1000,
-                       signif=0.05, seed=None, burn=100):
+                       signif=0.05, seed=None, burn=100, n_jobs=1):
         """
         IRF Monte Carlo integrated error bands of cumulative effect
         """
         model = self.model
         periods = self.periods
         return model.irf_errband_mc(orth=orth, repl=repl,
-                                    T=periods, signif=signif, seed=seed, burn=burn, cum=True)
+                                    T=periods, signif=signif, seed=seed, burn=burn, cum=True,
+                                    n_jobs=n_jobs)
 
     def lr_effect_cov(self, orth=False):
         """
@@ -628,7 +628,8 @@ class SVARResults(SVARProcess, VARResults):
         return IRAnalysis(self, P=P, periods=periods, svar=True)
 
     def sirf_errband_mc(self, orth=False, repl=1000, T=10,
-                        signif=0.05, seed=None, burn=100, cum=False):
+                        signif=0.05, seed=None, burn=100, cum=False,
+                        n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -643,12 +644,15 @@ class SVARResults(SVARProcess, VARResults):
             number of impulse response periods
         signif: float (0 < signif <1)
             Significance level for error bars, defaults to 95% CI
-        seed: int
-            np.random.seed for replications
+        seed: int, RandomState or Generator
+            Seed or random number generator for the replications
         burn: int
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int, default 1
+            Number of jobs that estimate the replications after the first
+            10 in parallel if joblib is available. -1 uses all CPUs.
 
         Notes
         -----
@@ -660,12 +664,10 @@ class SVARResults(SVARProcess, VARResults):
 
         """
         neqs = self.neqs
-        mean = self.mean()
         k_ar = self.k_ar
         coefs = self.coefs
         sigma_u = self.sigma_u
         intercept = self.intercept
-        df_model = self.df_model
         nobs = self.nobs
 
         ma_coll = np.zeros((repl, T+1, neqs, neqs))
@@ -679,34 +681,41 @@ class SVARResults(SVARProcess, VARResults):
 
         g_list = []
 
-        def agg(impulses):
-            if cum:
-                return impulses.cumsum(axis=0)
-            return impulses
+        # discard first hundred to correct for starting bias
+        sims = util.varsim(coefs, intercept, sigma_u, seed=seed,
+                           steps=nobs + burn, nsimulations=repl)
+        sims = sims[:, burn:]
 
         opt_A = A[A_mask]
         opt_B = B[B_mask]
-        for i in range(repl):
-            # discard first hundred to correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, seed=seed,
-                              steps=nobs + burn)
-            sim = sim[burn:]
-
-            smod = SVAR(sim, svar_type=s_type, A=A_pass, B=B_pass)
-            if i == 10:
-                # Use first 10 to update starting val for remainder of fits
-                mean_AB = np.mean(g_list, axis=0)
-                split = len(A[A_mask])
-                opt_A = mean_AB[:split]
-                opt_B = mean_AB[split:]
-
-            sres = smod.fit(maxlags=k_ar, A_guess=opt_A, B_guess=opt_B)
-
-            if i < 10:
-                # save estimates for starting val if in first 10
-                g_list.append(np.append(sres.A[A_mask].tolist(),
-                                        sres.B[B_mask].tolist()))
-            ma_coll[i] = agg(sres.svar_ma_rep(maxn=T))
+        args = (s_type, A_pass, B_pass, k_ar)
+        n_start = min(10, repl)
+        for i in range(n_start):
+            sres = _svar_resim_fit(sims[i], *args, A_guess=opt_A,
+                                   B_guess=opt_B)
+            # save estimates for starting val if in first 10
+            g_list.append(np.append(sres.A[A_mask].tolist(),
+                                    sres.B[B_mask].tolist()))
+            ma_coll[i] = _svar_resim_ma(sres, T, cum)
+
+        if repl > n_start:
+            # Use first 10 to update starting val for remainder of fits
+            mean_AB = np.mean(g_list, axis=0)
+            split = len(A[A_mask])
+            opt_A = mean_AB[:split]
+            opt_B = mean_AB[split:]
+            if n_jobs == 1:
+                ma_rest = [_svar_resim(sim, *args, T=T, cum=cum,
+                                       A_guess=opt_A, B_guess=opt_B)
+                           for sim in sims[n_start:]]
+            else:
+                from statsmodels.tools.parallel import parallel_func
+                parallel, p_func, n_jobs = parallel_func(_svar_resim, n_jobs,
+                                                         verbose=0)
+                ma_rest = parallel(p_func(sim, *args, T=T, cum=cum,
+                                          A_guess=opt_A, B_guess=opt_B)
+                                   for sim in sims[n_start:])
+            ma_coll[n_start:] = ma_rest
 
         ma_sort = np.sort(ma_coll, axis=0)  # sort to get quantiles
         index = (int(round(signif / 2 * repl) - 1),
@@ -714,3 +723,22 @@ class SVARResults(SVARProcess, VARResults):
         lower = ma_sort[index[0], :, :, :]
         upper = ma_sort[index[1], :, :, :]
         return lower, upper
+
+
+def _svar_resim_fit(sim, svar_type, A, B, k_ar, A_guess=None, B_guess=None):
+    # Fit the SVAR of a replication of sirf_errband_mc
+    smod = SVAR(sim, svar_type=svar_type, A=A, B=B)
+    return smod.fit(maxlags=k_ar, A_guess=A_guess, B_guess=B_guess)
+
+
+def _svar_resim_ma(sres, T, cum):
+    impulses = sres.svar_ma_rep(maxn=T)
+    return impulses.cumsum(axis=0) if cum else impulses
+
+
+def _svar_resim(sim, svar_type, A, B, k_ar, T=10, cum=False, A_guess=None,
+                B_guess=None):
+    # Impulse responses of a replication of sirf_errband_mc
+    sres = _svar_resim_fit(sim, svar_type, A, B, k_ar, A_guess=A_guess,
+                           B_guess=B_guess)
+    return _svar_resim_ma(sres, T, cum)
@@ -636,6 +636,42 @@ def test_irf_trend():
     assert_allclose(irf_t.stderr()[1:4], irf.stderr()[1:4], rtol=0.03)
 
 
+@pytest.mark.parametrize('trend', ['nc', 'c', 'ct'])
+@pytest.mark.parametrize('orth', [False, True])
+def test_irf_resim_batch(trend, orth):
+    # batched re-estimation agrees with fitting VAR to each simulation
+    data = get_macrodata().view((float,3), type=np.ndarray)
+    results = VAR(data).fit(2, trend=trend)
+    ma_coll = results.irf_resim(orth=orth, repl=10, T=6, seed=987128,
+                                cum=True)
+
+    sims = util.varsim(results.coefs, results.intercept, results.sigma_u,
+                       steps=results.nobs + 100, seed=987128,
+                       nsimulations=10)
+    for i, sim in enumerate(sims[:, 100:]):
+        res_i = VAR(sim).fit(2, trend=trend)
+        ma = res_i.orth_ma_rep(6) if orth else res_i.ma_rep(6)
+        assert_allclose(ma_coll[i], ma.cumsum(0), rtol=1e-8, atol=1e-12)
+
+
+def test_irf_resim_seed():
+    data = get_macrodata().view((float,3), type=np.ndarray)
+    results = VAR(data).fit(2)
+    ma_coll = results.irf_resim(repl=20, T=5, seed=987128)
+    # replications are independent draws
+    assert np.all(ma_coll[1:, 1:].std(0) > 0)
+
+    ma_coll2 = results.irf_resim(repl=20, T=5,
+                                 seed=np.random.RandomState(987128),
+                                 n_jobs=2)
+    assert_allclose(ma_coll2, ma_coll, rtol=1e-12)
+
+    if hasattr(np.random, 'default_rng'):
+        rng = np.random.default_rng(987128)
+        lower, upper = results.irf_errband_mc(repl=20, T=5, seed=rng)
+        assert np.all(lower <= upper)
+
+
 class TestVARExtras(object):
 
     @classmethod
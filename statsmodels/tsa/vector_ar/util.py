@@ -180,7 +180,23 @@ def acf_to_acorr(acf):
     return acf / np.sqrt(np.outer(diag, diag))
 
 
-def varsim(coefs, intercept, sig_u, steps=100, initvalues=None, seed=None):
+def _random_state(seed):
+    """
+    Return a random number generator for seed
+
+    seed can be None, an integer, a numpy RandomState or a numpy Generator.
+    Instances of RandomState and Generator are returned unchanged.
+    """
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    generator = getattr(np.random, 'Generator', None)
+    if generator is not None and isinstance(seed, generator):
+        return seed
+    return np.random.RandomState(seed=seed)
+
+
+def varsim(coefs, intercept, sig_u, steps=100, initvalues=None, seed=None,
+           nsimulations=None):
     """
     Simulate VAR(p) process, given coefficients and assuming Gaussian noise
 
@@ -205,39 +221,45 @@ def varsim(coefs, intercept, sig_u, steps=100, initvalues=None, seed=None):
         observations to start the autoregressive process.
         If offset is not None, then exog of the model are used if they were
         provided in the model
-    seed : None or integer
-        If seed is not None, then it will be used with for the random
-        variables generated by numpy.random.
+    seed : None, int, RandomState or Generator
+        If seed is an integer, then it will be used to seed a
+        numpy.random.RandomState for the random variables.  A RandomState
+        or Generator instance is used directly.
+    nsimulations : None or int
+        Number of independent simulations.  If None, a single process is
+        simulated.
 
     Returns
     -------
     endog_simulated : nd_array
-        Endog of the simulated VAR process
+        Endog of the simulated VAR process, (steps, neqs) or, if
+        nsimulations is not None, (nsimulations, steps, neqs).
 
     """
-    rs = np.random.RandomState(seed=seed)
+    rs = _random_state(seed)
     rmvnorm = rs.multivariate_normal
     p, k, k = coefs.shape
     if sig_u is None:
         sig_u = np.eye(k)
-    ugen = rmvnorm(np.zeros(len(sig_u)), sig_u, steps)
-    result = np.zeros((steps, k))
+    size = steps if nsimulations is None else (nsimulations, steps)
+    ugen = rmvnorm(np.zeros(len(sig_u)), sig_u, size)
+    result = np.zeros(ugen.shape)
     if intercept is not None:
         # intercept can be 2-D like an offset variable
         if np.ndim(intercept) > 1:
-            if not len(intercept) == len(ugen):
+            if not len(intercept) == steps:
                 raise ValueError('2-D intercept needs to have length `steps`')
         # add intercept/offset also to intial values
         result += intercept
-        result[p:] += ugen[p:]
+        result[..., p:, :] += ugen[..., p:, :]
     else:
-        result[p:] = ugen[p:]
+        result[..., p:, :] = ugen[..., p:, :]
 
-    # add in AR terms
+    # add in AR terms, for all simulations at once
     for t in range(p, steps):
-        ygen = result[t]
+        ygen = result[..., t, :]
         for j in range(p):
-            ygen += np.dot(coefs[j], result[t-j-1])
+            ygen += np.dot(result[..., t-j-1, :], coefs[j].T)
 
     return result
 
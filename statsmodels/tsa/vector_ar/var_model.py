@@ -44,6 +44,8 @@ def ma_rep(coefs, maxn=10):
     Parameters
     ----------
     coefs : ndarray (p x k x k)
+        The coefficients can have additional leading axes, e.g. a stack of
+        coefficients of several VAR(p) processes.
     maxn : int
         Number of MA matrices to compute
 
@@ -62,10 +64,11 @@ def ma_rep(coefs, maxn=10):
     Returns
     -------
     phis : ndarray (maxn + 1 x k x k)
+        With the same leading axes as coefs.
     """
-    p, k, k = coefs.shape
-    phis = np.zeros((maxn+1, k, k))
-    phis[0] = np.eye(k)
+    p, k, k = coefs.shape[-3:]
+    phis = np.zeros(coefs.shape[:-3] + (maxn+1, k, k))
+    phis[..., 0, :, :] = np.eye(k)
 
     # recursively compute Phi matrices
     for i in range(1, maxn + 1):
@@ -73,7 +76,8 @@ def ma_rep(coefs, maxn=10):
             if j > p:
                 break
 
-            phis[i] += np.dot(phis[i-j], coefs[j-1])
+            phis[..., i, :, :] += np.matmul(phis[..., i-j, :, :],
+                                            coefs[..., j-1, :, :])
 
     return phis
 
@@ -369,6 +373,74 @@ def _reordered(self, order):
                       trend='c', names=names_new, dates=self.dates)
 
 
+def _var_lstsq_batch(endog, lags, trend='c', exog=None):
+    """
+    OLS estimates of VAR(p) models for a stack of samples
+
+    Parameters
+    ----------
+    endog : ndarray (nsim x nobs x neqs)
+        Stack of samples of the endogenous variables.
+    lags : int
+    trend : str {'c', 'ct', 'ctt', 'nc'}
+    exog : ndarray, optional
+        Deterministic regressors, aligned with the last rows of endog.
+
+    Returns
+    -------
+    coefs : ndarray (nsim x lags x neqs x neqs)
+    sigma_u : ndarray (nsim x neqs x neqs)
+
+    Notes
+    -----
+    The regressors are the same as in VAR.fit, including the adjustment of
+    the time trend, but all samples are estimated with one stacked solve of
+    the normal equations.
+    """
+    nsim, nobs, neqs = endog.shape
+    nobs_fit = nobs - lags
+    time = np.arange(1, nobs_fit + 1) + lags
+    det = [np.ones(nobs_fit), time, time ** 2][:util.get_trendorder(trend)]
+    if exog is not None:
+        exog = np.asarray(exog)
+        det += list(exog.reshape(exog.shape[0], -1)[-nobs_fit:].T)
+    k_det = len(det)
+    z_det = np.column_stack(det) if det else np.empty((nobs_fit, 0))
+
+    z = np.empty((nsim, nobs_fit, k_det + neqs * lags))
+    z[:, :, :k_det] = z_det
+    for j in range(lags):
+        z[:, :, k_det + j * neqs:k_det + (j + 1) * neqs] = \
+            endog[:, lags - j - 1:nobs - j - 1]
+    y = endog[:, lags:]
+
+    # scaling the columns keeps the normal equations well conditioned
+    scale = np.sqrt((z ** 2).sum(1))
+    scale[scale == 0] = 1
+    zs = z / scale[:, None, :]
+    zt = zs.swapaxes(1, 2)
+    params = np.linalg.solve(np.matmul(zt, zs), np.matmul(zt, y))
+    params /= scale[:, :, None]
+    resid = y - np.matmul(z, params)
+    df_resid = nobs_fit - z.shape[2]
+    sigma_u = np.matmul(resid.swapaxes(1, 2), resid) / df_resid
+
+    coefs = params[:, k_det:].reshape(nsim, lags, neqs, neqs).swapaxes(2, 3)
+    return coefs, sigma_u
+
+
+def _irf_resim_batch(sims, lags, trend, exog, T, orth, cum):
+    """
+    Impulse responses of VAR(p) models estimated on a stack of samples
+    """
+    coefs, sigma_u = _var_lstsq_batch(sims, lags, trend=trend, exog=exog)
+    ma_coll = ma_rep(coefs, maxn=T)
+    if orth:
+        chol = np.linalg.cholesky(sigma_u)
+        ma_coll = np.matmul(ma_coll, chol[:, None])
+    return ma_coll.cumsum(axis=1) if cum else ma_coll
+
+
 def orth_ma_rep(results, maxn=10, P=None):
     r"""Compute Orthogonalized MA coefficient matrices using P matrix such
     that :math:`\Sigma_u = PP^\prime`. P defaults to the Cholesky
@@ -1493,7 +1565,8 @@ class VARResults(VARProcess):
 
     # Monte Carlo irf standard errors
     def irf_errband_mc(self, orth=False, repl=1000, T=10,
-                       signif=0.05, seed=None, burn=100, cum=False):
+                       signif=0.05, seed=None, burn=100, cum=False,
+                       n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -1508,12 +1581,15 @@ class VARResults(VARProcess):
             number of impulse response periods
         signif: float (0 < signif <1)
             Significance level for error bars, defaults to 95% CI
-        seed: int
-            np.random.seed for replications
+        seed: int, RandomState or Generator
+            Seed or random number generator for the replications
         burn: int
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int, default 1
+            Number of jobs that estimate chunks of the replications in
+            parallel if joblib is available. -1 uses all CPUs.
 
         Notes
         -----
@@ -1524,7 +1600,8 @@ class VARResults(VARProcess):
         Tuple of lower and upper arrays of ma_rep monte carlo standard errors
         """
         ma_coll = self.irf_resim(orth=orth, repl=repl, T=T,
-                                 seed=seed, burn=burn, cum=cum)
+                                 seed=seed, burn=burn, cum=cum,
+                                 n_jobs=n_jobs)
 
         ma_sort = np.sort(ma_coll, axis=0)  # sort to get quantiles
         # python 2: round returns float
@@ -1535,7 +1612,7 @@ class VARResults(VARProcess):
         return lower, upper
 
     def irf_resim(self, orth=False, repl=1000, T=10,
-                  seed=None, burn=100, cum=False):
+                  seed=None, burn=100, cum=False, n_jobs=1):
         """
         Simulates impulse response function, returning an array of simulations.
         Used for Sims-Zha error band calculation.
@@ -1550,46 +1627,50 @@ class VARResults(VARProcess):
             number of impulse response periods
         signif: float (0 < signif <1)
             Significance level for error bars, defaults to 95% CI
-        seed: int
-            np.random.seed for replications
+        seed: int, RandomState or Generator
+            Seed or random number generator for the replications
         burn: int
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs: int, default 1
+            Number of jobs that estimate chunks of the replications in
+            parallel if joblib is available. -1 uses all CPUs.
 
         Notes
         -----
         Sims, Christoper A., and Tao Zha. 1999. "Error Bands for Impulse Response." Econometrica 67: 1113-1155.
 
+        All replications are simulated as one array and re-estimated with a
+        single stacked least squares solve.  The simulated samples do not
+        depend on n_jobs.
+
         Returns
         -------
         Array of simulated impulse response functions
 
         """
-        neqs = self.neqs
-        # mean = self.mean()
         k_ar = self.k_ar
         coefs = self.coefs
         sigma_u = self.sigma_u
         intercept = self.intercept
-        # df_model = self.df_model
         nobs = self.nobs
 
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        def fill_coll(sim):
-            ret = VAR(sim, exog=self.exog).fit(maxlags=k_ar, trend=self.trend)
-            ret = ret.orth_ma_rep(maxn=T) if orth else ret.ma_rep(maxn=T)
-            return ret.cumsum(axis=0) if cum else ret
-
-        for i in range(repl):
-            # discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u,
-                              seed=seed, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i, :, :, :] = fill_coll(sim)
-
-        return ma_coll
+        # discard first hundred to eliminate correct for starting bias
+        sims = util.varsim(coefs, intercept, sigma_u, seed=seed,
+                           steps=nobs+burn, nsimulations=repl)
+        sims = sims[:, burn:]
+
+        args = (k_ar, self.trend, self.exog, T, orth, cum)
+        if n_jobs == 1:
+            return _irf_resim_batch(sims, *args)
+
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_irf_resim_batch, n_jobs,
+                                                 verbose=0)
+        chunks = np.array_split(sims, min(n_jobs, repl))
+        return np.concatenate(parallel(p_func(chunk, *args)
+                                       for chunk in chunks))
 
     def _omega_forc_cov(self, steps):
         # Approximate MSE matrix \Omega(h) as defined in Lut p97